@@ -6,6 +6,8 @@ Available environment variables:
 * PHOEBE_ENABLE_SYMPY=TRUE/FALSE (whether to attempt to import sympy for constraint algebra: defaults to True if sympy installed, otherwise False)
 * PHOEBE_ENABLE_ONLINE_PASSBANDS=TRUE/FALSE (whether to query for online passbands and download on-the-fly: defaults to True)
 * PHOEBE_PBDIR (directory to search for passbands, in addition to phoebe.list_passband_directories())
+* PHOEBE_ENABLE_PASSBAND_CACHE=TRUE/FALSE (whether to write binary .npy copies of the passband atmosphere tables the first time they are needed and memory-map them on subsequent loads so they can be shared between processes: defaults to True)
+* PHOEBE_PBCACHE_DIR (directory for the binary passband cache: defaults to a 'passbands_cache' directory next to the local passband directory)
 * PHOEBE_DOWNLOAD_PASSBAND_DEFAULTS_GZIPPED=TRUE/FALSE (whether to download gzipped version of passbands by default.  Defaults to False.  Note that gzipped files take longer to load and will increase time for import, but take significantly less disk-space.)
 * PHOEBE_DOWNLOAD_PASSBAND_DEFAULTS_CONTENT (default content, comma separated for list.  Defaults to 'all')
 * PHOEBE_UPDATE_PASSBAND_IGNORE_VERSION=TRUE/FALSE (update passbands that need new content even if the online version is newer than the installed version.  Defaults to False.)
@@ -24,6 +24,7 @@ import os
 import sys
 import glob
 import shutil
+import hashlib
 import json
 import time
 
@@ -76,6 +77,41 @@ _pbdir_env = os.getenv('PHOEBE_PBDIR', None)
 
 _pbdir_env = os.getenv('PHOEBE_PBDIR', None)
 
+# binary (.npy) sidecars of the atmosphere grids are written here the first
+# time a table is requested and memory-mapped on every subsequent load, so
+# that processes (MPI ranks, pool workers) share the same pages read-only
+# instead of each reading its own copy out of the FITS file.
+# NOTE: the default location is next to (not within) the local passband
+# directory, as that directory is assumed to only contain passband files
+# (see uninstall_all_passbands).
+_pbcache_enabled = os.getenv('PHOEBE_ENABLE_PASSBAND_CACHE', 'TRUE').upper() == 'TRUE'
+_pbcache_dir = os.getenv('PHOEBE_PBCACHE_DIR', os.path.normpath(_pbdir_local)+'_cache')
+
+# attribute name, required content, and FITS extension name for each of the
+# (large) grids that are loaded lazily
+_pbgrids = [('_bb_extinct_energy_grid', 'blackbody:ext', 'bbegrid'),
+            ('_bb_extinct_photon_grid', 'blackbody:ext', 'bbpgrid'),
+            ('_ck2004_energy_grid', 'ck2004:Inorm', 'cknegrid'),
+            ('_ck2004_photon_grid', 'ck2004:Inorm', 'cknpgrid'),
+            ('_ck2004_Imu_energy_grid', 'ck2004:Imu', 'ckfegrid'),
+            ('_ck2004_Imu_photon_grid', 'ck2004:Imu', 'ckfpgrid'),
+            ('_ck2004_ld_energy_grid', 'ck2004:ld', 'cklegrid'),
+            ('_ck2004_ld_photon_grid', 'ck2004:ld', 'cklpgrid'),
+            ('_ck2004_ldint_energy_grid', 'ck2004:ldint', 'ckiegrid'),
+            ('_ck2004_ldint_photon_grid', 'ck2004:ldint', 'ckipgrid'),
+            ('_ck2004_extinct_energy_grid', 'ck2004:ext', 'ckxegrid'),
+            ('_ck2004_extinct_photon_grid', 'ck2004:ext', 'ckxpgrid'),
+            ('_phoenix_energy_grid', 'phoenix:Inorm', 'phnegrid'),
+            ('_phoenix_photon_grid', 'phoenix:Inorm', 'phnpgrid'),
+            ('_phoenix_Imu_energy_grid', 'phoenix:Imu', 'phfegrid'),
+            ('_phoenix_Imu_photon_grid', 'phoenix:Imu', 'phfpgrid'),
+            ('_phoenix_ld_energy_grid', 'phoenix:ld', 'phlegrid'),
+            ('_phoenix_ld_photon_grid', 'phoenix:ld', 'phlpgrid'),
+            ('_phoenix_ldint_energy_grid', 'phoenix:ldint', 'phiegrid'),
+            ('_phoenix_ldint_photon_grid', 'phoenix:ldint', 'phipgrid'),
+            ('_phoenix_extinct_energy_grid', 'phoenix:ext', 'phxegrid'),
+            ('_phoenix_extinct_photon_grid', 'phoenix:ext', 'phxpgrid')]
+
 def _dict_without_keys(d, skip_keys=[]):
     return {k:v for k,v in d.items() if k not in skip_keys}
 
@@ -457,6 +493,11 @@ class Passband:
             self.ptf_photon = lambda wl: interpolate.splev(wl, self.ptf_photon_func)
 
             if load_content:
+                # the grids themselves are only read (or memory-mapped from
+                # the binary cache) when first accessed, see __getattr__
+                self._archive = archive
+                self._lazy_grids = {attr: extname for attr, c, extname in _pbgrids if c in self.content}
+
                 if 'extern_planckint:Inorm' in self.content or 'extern_atmx:Inorm' in self.content:
                     atmdir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables/wd'))
                     planck = os.path.join(atmdir+'/atmcofplanck.dat').encode('utf8')
@@ -473,57 +514,61 @@ class Passband:
 
                 if 'blackbody:ext' in self.content:
                     self._bb_extinct_axes = (np.array(list(hdul['bb_teffs'].data['teff'])), np.array(list(hdul['bb_ebvs'].data['ebv'])), np.array(list(hdul['bb_rvs'].data['rv'])))
-                    self._bb_extinct_energy_grid = hdul['bbegrid'].data
-                    self._bb_extinct_photon_grid = hdul['bbpgrid'].data
 
                 if 'ck2004:Inorm' in self.content:
                     self._ck2004_axes = (np.array(list(hdul['ck_teffs'].data['teff'])), np.array(list(hdul['ck_loggs'].data['logg'])), np.array(list(hdul['ck_abuns'].data['abun'])))
-                    self._ck2004_energy_grid = hdul['cknegrid'].data
-                    self._ck2004_photon_grid = hdul['cknpgrid'].data
 
                 if 'ck2004:Imu' in self.content:
                     self._ck2004_intensity_axes = (np.array(list(hdul['ck_teffs'].data['teff'])), np.array(list(hdul['ck_loggs'].data['logg'])), np.array(list(hdul['ck_abuns'].data['abun'])), np.array(list(hdul['ck_mus'].data['mu'])))
-                    self._ck2004_Imu_energy_grid = hdul['ckfegrid'].data
-                    self._ck2004_Imu_photon_grid = hdul['ckfpgrid'].data
-
-                if 'ck2004:ld' in self.content:
-                    self._ck2004_ld_energy_grid = hdul['cklegrid'].data
-                    self._ck2004_ld_photon_grid = hdul['cklpgrid'].data
-
-                if 'ck2004:ldint' in self.content:
-                    self._ck2004_ldint_energy_grid = hdul['ckiegrid'].data
-                    self._ck2004_ldint_photon_grid = hdul['ckipgrid'].data
 
                 if 'ck2004:ext' in self.content:
                     self._ck2004_extinct_axes = (np.array(list(hdul['ck_teffs'].data['teff'])), np.array(list(hdul['ck_loggs'].data['logg'])), np.array(list(hdul['ck_abuns'].data['abun'])), np.array(list(hdul['ck_ebvs'].data['ebv'])), np.array(list(hdul['ck_rvs'].data['rv'])))
-                    self._ck2004_extinct_energy_grid = hdul['ckxegrid'].data
-                    self._ck2004_extinct_photon_grid = hdul['ckxpgrid'].data
 
                 if 'phoenix:Inorm' in self.content:
                     self._phoenix_axes = (np.array(list(hdul['ph_teffs'].data['teff'])), np.array(list(hdul['ph_loggs'].data['logg'])), np.array(list(hdul['ph_abuns'].data['abun'])))
-                    self._phoenix_energy_grid = hdul['phnegrid'].data
-                    self._phoenix_photon_grid = hdul['phnpgrid'].data
 
                 if 'phoenix:Imu' in self.content:
                     self._phoenix_intensity_axes = (np.array(list(hdul['ph_teffs'].data['teff'])), np.array(list(hdul['ph_loggs'].data['logg'])), np.array(list(hdul['ph_abuns'].data['abun'])), np.array(list(hdul['ph_mus'].data['mu'])))
-                    self._phoenix_Imu_energy_grid = hdul['phfegrid'].data
-                    self._phoenix_Imu_photon_grid = hdul['phfpgrid'].data
-
-                if 'phoenix:ld' in self.content:
-                    self._phoenix_ld_energy_grid = hdul['phlegrid'].data
-                    self._phoenix_ld_photon_grid = hdul['phlpgrid'].data
-
-                if 'phoenix:ldint' in self.content:
-                    self._phoenix_ldint_energy_grid = hdul['phiegrid'].data
-                    self._phoenix_ldint_photon_grid = hdul['phipgrid'].data
 
                 if 'phoenix:ext' in self.content:
                     self._phoenix_extinct_axes = (np.array(list(hdul['ph_teffs'].data['teff'])),np.array(list(hdul['ph_loggs'].data['logg'])), np.array(list(hdul['ph_abuns'].data['abun'])), np.array(list(hdul['ph_ebvs'].data['ebv'])), np.array(list(hdul['ph_rvs'].data['rv'])))
-                    self._phoenix_extinct_energy_grid = hdul['phxegrid'].data
-                    self._phoenix_extinct_photon_grid = hdul['phxpgrid'].data
 
         return self
 
+    def __getattr__(self, attr):
+        # NOTE: only called when normal attribute lookup fails, so once a grid
+        # has been loaded it is accessed directly from the instance __dict__.
+        lazy_grids = self.__dict__.get('_lazy_grids', {})
+        if attr not in lazy_grids:
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, attr))
+
+        grid = self._load_grid(lazy_grids[attr])
+        setattr(self, attr, grid)
+        lazy_grids.pop(attr)
+        return grid
+
+    def _load_grid(self, extname):
+        """
+        Loads a single grid table from the passband archive, memory-mapping it
+        from the binary cache (and creating the cache if necessary) when
+        PHOEBE_ENABLE_PASSBAND_CACHE is not disabled.
+        """
+        if _pbcache_enabled:
+            try:
+                fname = os.path.join(_pbcache_path(self._archive), '{}.npy'.format(extname))
+                if not os.path.exists(fname):
+                    logger.debug("writing binary cache of {} to {}".format(self._archive, os.path.dirname(fname)))
+                    _pbcache_write(self._archive, [extname])
+                # NOTE: copy-on-write so that pages are shared between processes
+                # but any in-place changes stay private and never touch the cache
+                return np.load(fname, mmap_mode='c')
+            except (IOError, OSError, ValueError) as err:
+                logger.warning("could not use binary passband cache for {}, falling back on FITS: {}".format(self._archive, err))
+
+        logger.debug("loading {} from {}".format(extname, self._archive))
+        with fits.open(self._archive) as hdul:
+            return np.asarray(hdul[extname].data)
+
     def _planck(self, lam, Teff):
         """
         Computes monochromatic blackbody intensity in W/m^3 using the
@@ -2252,6 +2297,174 @@ class Passband:
             raise ValueError('Atmosphere parameters out of bounds: Teff=%s, logg=%s, abun=%s, mu=%s' % (Teff[nanmask], logg[nanmask], abun[nanmask], mu[nanmask]))
         return retval
 
+    def _Inorm_ldint_grid(self, atm, photon_weighted=False):
+        """
+        Returns the log10(Inorm) and ldint grids of `atm` stacked along the
+        value axis so that both can be interpolated in a single call to
+        libphoebe.interp, or None if the two tables do not share the same
+        axes.  The stacked grid is cached on the passband.
+        """
+        wtype = 'photon' if photon_weighted else 'energy'
+        inorm_grid = getattr(self, '_{}_{}_grid'.format(atm, wtype))
+        ldint_grid = getattr(self, '_{}_ldint_{}_grid'.format(atm, wtype))
+
+        if inorm_grid.shape[:-1] != ldint_grid.shape[:-1]:
+            return None
+
+        cache = self.__dict__.setdefault('_Inorm_ldint_grids', {})
+        key = (atm, photon_weighted)
+        if key not in cache or cache[key][0] is not inorm_grid or cache[key][1] is not ldint_grid:
+            cache[key] = (inorm_grid, ldint_grid, np.ascontiguousarray(np.concatenate((inorm_grid, ldint_grid), axis=-1), dtype=float))
+
+        return cache[key][2]
+
+    def Inorm_Imu_ldint(self, Teff=5772., logg=4.43, abun=0.0, mu=1.0, atm='ck2004', ldatm='ck2004', ld_func='interp', ld_coeffs=None, photon_weighted=False, visible=None):
+        """
+        Computes normal intensities, projected intensities and ldint in a
+        single pass.  This is equivalent to calling
+        <phoebe.atmospheres.passbands.Passband.ldint>,
+        <phoebe.atmospheres.passbands.Passband.Inorm> and
+        <phoebe.atmospheres.passbands.Passband.Imu> in turn, but the request
+        array is only built once, the normal intensities and ldints are
+        interpolated together when `ld_func='interp'` (and `atm==ldatm`), and
+        limb-darkening coefficients are only looked up (and normal
+        intensities only computed) once otherwise.
+
+        Arguments
+        ----------
+        * `Teff` (array)
+        * `logg` (array)
+        * `abun` (array)
+        * `mu` (array)
+        * `atm`
+        * `ldatm`
+        * `ld_func` (string, optional, default='interp') limb darkening
+            function.  One of: linear, sqrt, log, quadratic, power, interp.
+        * `ld_coeffs` (list, optional, default=None): limb darkening coefficients
+            for the corresponding limb darkening function, `ld_func`.
+        * `photon_weighted` (bool, optional, default=False): photon/energy switch
+        * `visible` (boolean array, optional, default=None): if provided, the
+            projected intensities will only be evaluated for the elements where
+            `visible` is True and will be 0 elsewhere.  Normal intensities and
+            ldints are always computed for all elements.
+
+        Returns
+        ----------
+        * (tuple of arrays) normal intensities, projected intensities, ldint.
+
+        Raises
+        ----------
+        * ValueError: if atmosphere parameters are out of bounds for the table.
+            If the ldints are out of bounds, the error message will start
+            with 'Atmosphere parameters out of bounds: ldint'.
+        * ValueError: if `ld_func='interp'` but is not supported by the
+            atmosphere table.
+        * NotImplementedError: if `ld_func` is not supported.
+        """
+        Teff = np.atleast_1d(Teff)
+        logg = np.atleast_1d(logg)
+        abun = np.atleast_1d(abun)
+        mu = np.array(mu, dtype=float, ndmin=1)
+
+        # make sure we're not suffering from rounding issues in mu:
+        mu[np.isclose(mu, 1)] = 1-1e-12
+        mu[np.isclose(mu, 0)] = 1e-12
+
+        if ld_func == 'interp' and atm == ldatm and atm in ['ck2004', 'phoenix'] and '{}:Inorm'.format(atm) in self.content and '{}:Imu'.format(atm) in self.content and '{}:ldint'.format(atm) in self.content:
+            req = np.vstack((Teff, logg, abun)).T
+            axes = getattr(self, '_{}_axes'.format(atm))
+            grid = self._Inorm_ldint_grid(atm, photon_weighted=photon_weighted)
+            if grid is not None:
+                values = libphoebe.interp(req, axes, grid)
+                Inorm, ldint = 10**values[:,0], values[:,1]
+            else:
+                wtype = 'photon' if photon_weighted else 'energy'
+                ldint = libphoebe.interp(req, axes, getattr(self, '_{}_ldint_{}_grid'.format(atm, wtype))).T[0]
+                Inorm = 10**libphoebe.interp(req, axes, getattr(self, '_{}_{}_grid'.format(atm, wtype))).T[0]
+
+            nanmask = np.isnan(ldint)
+            if np.any(nanmask):
+                raise ValueError('Atmosphere parameters out of bounds: ldint, Teff=%s, logg=%s, abun=%s' % (Teff[nanmask], logg[nanmask], abun[nanmask]))
+            nanmask = np.isnan(Inorm)
+            if np.any(nanmask):
+                raise ValueError('Atmosphere parameters out of bounds: atm=%s, ldatm=%s, Teff=%s, logg=%s, abun=%s' % (atm, ldatm, Teff[nanmask], logg[nanmask], abun[nanmask]))
+
+            # reuse the same request array, extended by mu
+            req = np.hstack((req, mu.reshape(-1, 1)))
+            if visible is not None:
+                req = req[visible]
+            if len(req):
+                Imu = 10**libphoebe.interp(req, getattr(self, '_{}_intensity_axes'.format(atm)), getattr(self, '_{}_Imu_{}_grid'.format(atm, 'photon' if photon_weighted else 'energy'))).T[0]
+            else:
+                Imu = np.zeros(0)
+            nanmask = np.isnan(Imu)
+            if np.any(nanmask):
+                raise ValueError('Atmosphere parameters out of bounds: Teff=%s, logg=%s, abun=%s, mu=%s' % (req[nanmask,0], req[nanmask,1], req[nanmask,2], req[nanmask,3]))
+
+            return Inorm, self._scatter_visible(Imu, visible), ldint
+
+        if ld_func != 'interp' and ld_coeffs is None:
+            # look the coefficients up once instead of separately in ldint and Imu
+            ld_coeffs = self.interpolate_ldcoeffs(Teff, logg, abun, ldatm, ld_func, photon_weighted)
+
+        try:
+            ldint = self.ldint(Teff=Teff, logg=logg, abun=abun, ldatm=ldatm, ld_func=ld_func, ld_coeffs=ld_coeffs, photon_weighted=photon_weighted)
+        except ValueError as err:
+            if str(err).split(":")[0] == 'Atmosphere parameters out of bounds':
+                raise ValueError('Atmosphere parameters out of bounds: ldint,{}'.format(":".join(str(err).split(":")[1:])))
+            raise
+
+        Inorm = self.Inorm(Teff=Teff, logg=logg, abun=abun, atm=atm, ldatm=ldatm, ldint=ldint, ld_func=ld_func, ld_coeffs=ld_coeffs, photon_weighted=photon_weighted)
+
+        if visible is not None:
+            Teff, logg, abun, mu = Teff[visible], logg[visible], abun[visible], mu[visible]
+            Inorm_visible = Inorm[visible]
+            ldint_visible = ldint[visible] if hasattr(ldint, '__iter__') else ldint
+            if ld_func != 'interp':
+                ld_coeffs = [c[visible] if hasattr(c, '__iter__') else c for c in ld_coeffs]
+        else:
+            Inorm_visible, ldint_visible = Inorm, ldint
+
+        if ld_func == 'interp':
+            if len(mu):
+                Imu = self.Imu(Teff=Teff, logg=logg, abun=abun, mu=mu, atm=atm, ldatm=ldatm, ldint=ldint_visible, ld_func=ld_func, ld_coeffs=ld_coeffs, photon_weighted=photon_weighted)
+            else:
+                Imu = np.zeros(0)
+            return Inorm, self._scatter_visible(Imu, visible), ldint
+
+        # Imu would otherwise recompute Inorm before applying the limb-darkening law
+        if ld_func == 'linear':
+            Imu = Inorm_visible * self._ldlaw_lin(mu, *ld_coeffs)
+        elif ld_func == 'logarithmic':
+            Imu = Inorm_visible * self._ldlaw_log(mu, *ld_coeffs)
+        elif ld_func == 'square_root':
+            Imu = Inorm_visible * self._ldlaw_sqrt(mu, *ld_coeffs)
+        elif ld_func == 'quadratic':
+            Imu = Inorm_visible * self._ldlaw_quad(mu, *ld_coeffs)
+        elif ld_func == 'power':
+            Imu = Inorm_visible * self._ldlaw_nonlin(mu, *ld_coeffs)
+        else:
+            raise NotImplementedError('ld_func={} not supported'.format(ld_func))
+
+        nanmask = np.isnan(Imu)
+        if np.any(nanmask):
+            raise ValueError('Atmosphere parameters out of bounds: Teff=%s, logg=%s, abun=%s, mu=%s' % (Teff[nanmask], logg[nanmask], abun[nanmask], mu[nanmask]))
+
+        return Inorm, self._scatter_visible(Imu, visible), ldint
+
+    @staticmethod
+    def _scatter_visible(values, visible):
+        """
+        Scatters `values` computed for the elements where `visible` is True
+        back into an array covering all elements (with 0 elsewhere).
+        """
+        if visible is None:
+            return values
+
+        retval = np.zeros(len(visible))
+        retval[visible] = values
+        return retval
+
     def _ldint_ck2004(self, Teff, logg, abun, photon_weighted):
         if not hasattr(Teff, '__iter__'):
             req = np.array(((Teff, logg, abun),))
@@ -2378,6 +2591,59 @@ class Passband:
             raise ValueError('Atmosphere parameters out of bounds: Teff=%s, logg=%s, abun=%s' % (Teff[nanmask], logg[nanmask], abun[nanmask]))
         return retval
 
+def _pbcache_key(archive):
+    """
+    Return the prefix shared by all cache directories of `archive`: the file
+    name (for readability) and a hash of the full path, so that passbands
+    with the same file name in different directories (ie. global and local
+    installations) never share or remove each other's cache.
+    """
+    pathhash = hashlib.sha1(os.path.abspath(archive).encode('utf-8')).hexdigest()[:16]
+    return '{}.{}'.format(os.path.basename(archive), pathhash)
+
+def _pbcache_path(archive):
+    """
+    Return the directory holding the .npy sidecars for `archive`.  The
+    directory name is keyed on the path, size and modification time of the
+    FITS file, so that re-installing or updating the passband (ie. to add
+    content) never reuses stale grids.
+    """
+    stat = os.stat(archive)
+    return os.path.join(_pbcache_dir, '{}.{}.{}'.format(_pbcache_key(archive), stat.st_size, stat.st_mtime_ns))
+
+def _pbcache_write(archive, extnames):
+    """
+    Read `extnames` out of the FITS `archive` (opening it only once) and
+    write each as a native-endian, C-contiguous .npy sidecar.  When the cache
+    directory of the current version of the archive is first created, those
+    of previous versions of the same archive (same path) are removed.
+    """
+    dirname = _pbcache_path(archive)
+    if not os.path.isdir(dirname):
+        os.makedirs(dirname, exist_ok=True)
+        for stale in glob.glob(os.path.join(_pbcache_dir, '{}.*'.format(_pbcache_key(archive)))):
+            if stale != dirname:
+                shutil.rmtree(stale, ignore_errors=True)
+
+    with fits.open(archive) as hdul:
+        for extname in extnames:
+            fname = os.path.join(dirname, '{}.npy'.format(extname))
+            if os.path.exists(fname):
+                continue
+            data = hdul[extname].data
+            # NOTE: libphoebe.interp requires aligned, native-endian doubles,
+            # so storing FITS (big-endian) data as-is would force a copy on
+            # every call.
+            data = np.ascontiguousarray(data, dtype=data.dtype.newbyteorder('='))
+            # write to a temporary file first so that other processes never
+            # see (and memory-map) a partially written sidecar
+            tmpname = '{}.{}.tmp'.format(fname, os.getpid())
+            with open(tmpname, 'wb') as f:
+                np.save(f, data)
+            os.replace(tmpname, fname)
+
+    return dirname
+
 def _timestamp_to_dt(timestamp):
     if timestamp is None:
         return None
@@ -2562,6 +2828,9 @@ def uninstall_all_passbands(local=True):
     pbdir = _pbdir_local if local else _pbdir_global
     for f in os.listdir(pbdir):
         pbpath = os.path.join(pbdir, f)
+        if os.path.isdir(pbpath):
+            # ie. PHOEBE_PBCACHE_DIR set within the passband directory
+            continue
         logger.warning("deleting file: {}".format(pbpath))
         os.remove(pbpath)
 
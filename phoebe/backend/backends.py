@@ -1,5 +1,10 @@
 import os
 import numpy as np
+try:
+    from scipy.integrate import simpson as _simpson
+except ImportError:
+    # scipy < 1.6
+    from scipy.integrate import simps as _simpson
 
 try:
   import commands
@@ -7,12 +12,16 @@ except:
   import subprocess as commands
 
 import tempfile
+import subprocess
+import shutil
 from copy import deepcopy
 import itertools
+import multiprocessing as _multiprocessing
+import atexit
 
 from phoebe.parameters import dataset as _dataset
 from phoebe.parameters import StringParameter, DictParameter, ArrayParameter, ParameterSet
-from phoebe.parameters.parameters import _extract_index_from_string
+from phoebe.parameters.parameters import _extract_index_from_string, _uniqueid
 from phoebe import dynamics
 from phoebe.backend import universe, etvs, horizon_analytic
 from phoebe.atmospheres import passbands
@@ -93,7 +102,44 @@ def _simplify_error_message(msg):
         msg = 'ld_coeffs and ld_func incompatible'
     return msg
 
-def _needs_mesh(b, dataset, kind, component, compute):
+def _analytical_lc_datasets(b, compute, dataset=None, warn=False):
+    """
+    Return the lc datasets for which the fluxes are computed analytically (see
+    <phoebe.backend.universe.System.observe_analytical>) instead of by
+    integrating over the meshes.  This requires lc_method='analytical' and
+    that the meshes would not add anything: all stars must be spheres, and
+    spots, irradiation, and boosting (which all act per-element) must be
+    disabled.  Otherwise all datasets fall back on lc_method='numerical'
+    (with a single warning if `warn`).
+    """
+    compute_ps = b.get_compute(compute, **_skip_filter_checks)
+    datasets = [ds for ds in compute_ps.filter(qualifier='lc_method', value='analytical', **_skip_filter_checks).datasets if ds != '_default']
+    if dataset is not None:
+        datasets = [ds for ds in datasets if ds in (dataset if isinstance(dataset, list) else [dataset])]
+    if not len(datasets):
+        return []
+
+    hier = b.get_hierarchy()
+    reasons = []
+    if len([comp for comp in hier.get_meshables() if hier.get_kind_of(comp) == 'envelope']):
+        reasons.append('contact systems')
+    if len([comp for comp in hier.get_stars() if compute_ps.get_value(qualifier='distortion_method', component=comp, **_skip_filter_checks) != 'sphere']):
+        reasons.append("distortion_method != 'sphere'")
+    if compute_ps.get_value(qualifier='irrad_method', **_skip_filter_checks) != 'none':
+        reasons.append("irrad_method != 'none'")
+    if compute_ps.get_value(qualifier='boosting_method', **_skip_filter_checks) != 'none':
+        reasons.append("boosting_method != 'none'")
+    if len(compute_ps.filter(qualifier='enabled', value=True, **_skip_filter_checks).features):
+        reasons.append('enabled features')
+
+    if len(reasons):
+        if warn:
+            logger.warning("lc_method='analytical' does not support {} (compute='{}'), falling back on lc_method='numerical' for datasets={}".format(", ".join(reasons), compute, datasets))
+        return []
+
+    return datasets
+
+def _needs_mesh(b, dataset, kind, component, compute, analytical_lc_datasets=[]):
     """
     """
     # print "*** _needs_mesh", kind
@@ -105,8 +151,8 @@ def _needs_mesh(b, dataset, kind, component, compute):
     if kind not in ['mesh', 'lc', 'rv', 'lp']:
         return False
 
-    # if kind == 'lc' and compute_kind=='phoebe' and b.get_value(qualifier='lc_method', compute=compute, dataset=dataset, context='compute')=='analytical':
-    #     return False
+    if kind == 'lc' and compute_kind=='phoebe' and dataset in analytical_lc_datasets:
+        return False
 
     if kind == 'rv' and (compute_kind == 'legacy' or b.get_value(qualifier='rv_method', compute=compute, component=component, dataset=dataset, context='compute', **_skip_filter_checks)=='dynamical'):
         return False
@@ -114,6 +160,159 @@ def _needs_mesh(b, dataset, kind, component, compute):
     return True
 
 
+def _fti_oversample_times(times, exptime, fti_oversample, fti_integration='mean'):
+    """
+    Build the oversampled times (and the weights to integrate over each
+    exposure) for finite-time integration.
+
+    NOTE: the dataset times are assumed to be at mid-exposure.
+
+    Arguments
+    ----------
+    * `times` (array): mid-exposure times.
+    * `exptime` (float): exposure time (in the same units as `times`).
+    * `fti_oversample` (int): number of samples per exposure.
+    * `fti_integration` (string, optional, default='mean'): integration rule,
+        one of 'mean', 'simpson', or 'gauss-legendre'.
+
+    Returns
+    ---------
+    * (array, array, array): the sorted unique oversampled times (samples
+        shared by neighbouring exposures are only included once), the indices
+        into those times for each sample of each exposure (shape
+        `(len(times), fti_oversample)`), and the weight of each sample
+        (summing to one).
+    """
+    times = np.asarray(times, dtype=float)
+    fti_oversample = int(fti_oversample)
+
+    if fti_integration == 'gauss-legendre':
+        nodes, weights = np.polynomial.legendre.leggauss(fti_oversample)
+        offsets = nodes * exptime / 2.
+        weights = weights / 2.
+    else:
+        offsets = np.linspace(-exptime/2., exptime/2., fti_oversample)
+        if fti_integration == 'simpson' and fti_oversample > 2:
+            # weights of each sample from integrating the basis vectors
+            weights = _simpson(np.eye(fti_oversample), x=offsets, axis=1) / exptime
+        elif fti_integration in ['mean', 'simpson']:
+            weights = np.full(fti_oversample, 1./fti_oversample)
+        else:
+            raise NotImplementedError("fti_integration='{}' not implemented".format(fti_integration))
+
+    times_oversampled = (times[:, np.newaxis] + offsets[np.newaxis, :]).ravel()
+    if not len(times_oversampled):
+        return times_oversampled, np.zeros((0, fti_oversample), dtype=int), weights
+
+    # merge samples within floating-point precision of each other (ie. the
+    # shared boundaries of back-to-back exposures)
+    order = np.argsort(times_oversampled, kind='stable')
+    times_sorted = times_oversampled[order]
+    tol = 16 * np.finfo(float).eps * np.max(np.abs(times_sorted))
+    is_new = np.concatenate(([True], np.diff(times_sorted) > tol))
+
+    inds = np.empty(len(times_oversampled), dtype=int)
+    inds[order] = np.cumsum(is_new) - 1
+
+    return times_sorted[is_new], inds.reshape(len(times), fti_oversample), weights
+
+# number of phases in the initial uniform grid and in the initial grid across
+# each expected eclipse for phase_grid='adaptive'
+_phase_grid_ninit = 64
+_phase_grid_neclipse = 16
+# maximum number of refinement iterations (each of which halves the width of
+# any interval that has not yet converged)
+_phase_grid_maxiter = 12
+
+def _phase_grid_datasets(b, compute, dataset=None, **kwargs):
+    """
+    Determine which LC datasets should be computed on an adaptive phase grid
+    (see `phase_grid` in <phoebe.parameters.compute.phoebe>) and then
+    interpolated to the requested times.
+
+    This is only possible if the system consists of a single orbit and is not
+    time-dependent (see <phoebe.parameters.HierarchyParameter.is_time_dependent>),
+    in which case the fluxes only depend on the orbital phase.
+    """
+    if dataset is None:
+        datasets = b.filter(qualifier='enabled', compute=compute, value=True, **_skip_filter_checks).datasets
+    else:
+        datasets = b.filter(dataset=dataset, context='dataset', **_skip_filter_checks).datasets
+
+    datasets = [ds for ds in datasets if b.filter(dataset=ds, context='dataset', **_skip_filter_checks).kind == 'lc' and
+                b.get_value(qualifier='phase_grid', dataset=ds, compute=compute, context='compute', phase_grid=kwargs.get('phase_grid', None), default='none', **_skip_filter_checks) == 'adaptive']
+
+    if not len(datasets):
+        return []
+
+    hier = b.hierarchy
+    if len(hier.get_orbits()) != 1:
+        logger.warning("phase_grid='adaptive' is only supported for systems with a single orbit, computing {} at all times".format(datasets))
+        return []
+
+    if hier.is_time_dependent(consider_gaussian_process=False):
+        logger.warning("phase_grid='adaptive' is not supported for time-dependent systems, computing {} at all times".format(datasets))
+        return []
+
+    ltte = b.get_value(qualifier='ltte', compute=compute, context='compute', ltte=kwargs.get('ltte', None), **_skip_filter_checks)
+    if ltte and b.get_value(qualifier='vgamma', context='system', **_skip_filter_checks) != 0:
+        # the light travel time then changes linearly with time
+        logger.warning("phase_grid='adaptive' is not supported with ltte and non-zero vgamma, computing {} at all times".format(datasets))
+        return []
+
+    return datasets
+
+def _phase_grid_eclipses(b, orbit):
+    """
+    Estimate the phases and half-widths (in phase) of the eclipses from the
+    orbital elements and equivalent radii, assuming an edge-on orbit.
+
+    Returns
+    ---------
+    * (list of tuples): (phase, half-width) of each conjunction.
+    """
+    ecc = b.get_value(qualifier='ecc', component=orbit, context='component', **_skip_filter_checks)
+    per0 = b.get_value(qualifier='per0', component=orbit, context='component', unit=u.rad, **_skip_filter_checks)
+    sma = b.get_value(qualifier='sma', component=orbit, context='component', unit=u.solRad, **_skip_filter_checks)
+    requivs = [b.get_value(qualifier='requiv', component=star, context='component', unit=u.solRad, **_skip_filter_checks) for star in b.hierarchy.get_stars_of_children_of(orbit)]
+
+    def _mean_anom(true_anom):
+        ecc_anom = 2*np.arctan(np.sqrt((1-ecc)/(1+ecc))*np.tan(true_anom/2))
+        return ecc_anom - ecc*np.sin(ecc_anom)
+
+    eclipses = []
+    for true_anom in [np.pi/2-per0, 3*np.pi/2-per0]:
+        phase = np.mod((_mean_anom(true_anom) - _mean_anom(np.pi/2-per0))/(2*np.pi) + 0.5, 1.0) - 0.5
+        d = sma*(1-ecc**2)/(1+ecc*np.cos(true_anom))
+        # NOTE: allow some margin for non-spherical stars, the refinement
+        # will handle the actual ingress/egress
+        half_width = np.arcsin(min(1.0, 1.2*np.sum(requivs)/d)) * (d/sma)**2 / (2*np.pi*np.sqrt(1-ecc**2))
+        eclipses.append((phase, min(half_width, 0.25)))
+
+    return eclipses
+
+def _phase_grid_initial(eclipses):
+    """
+    Build the initial (sorted and unique) grid in phase within [-0.5, 0.5),
+    uniform out of eclipse and with `_phase_grid_neclipse` points across each
+    eclipse in `eclipses` (see `_phase_grid_eclipses`).
+    """
+    phases = [np.linspace(-0.5, 0.5, _phase_grid_ninit, endpoint=False)]
+    for phase, half_width in eclipses:
+        phases.append(phase + np.linspace(-half_width, half_width, _phase_grid_neclipse))
+    phases = np.mod(np.concatenate(phases) + 0.5, 1.0) - 0.5
+    return np.unique(phases)
+
+def _phase_grid_midpoints(phases, intervals):
+    """
+    Midpoints of the intervals (indices of their left edges) of the periodic
+    grid of `phases`.  The midpoint of the last interval (which wraps around
+    to the first phase) is returned unwrapped, so that the midpoints are
+    sorted whenever `intervals` is sorted.
+    """
+    rights = np.append(phases[1:], phases[0]+1)
+    return 0.5*(phases[intervals] + rights[intervals])
+
 def _timequalifier_by_kind(kind):
     if kind=='etv':
         return 'time_ephems'
@@ -185,6 +384,8 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
     times = []
     infolists = []
     needed_syns = []
+    # index in times (and infolists) of each time, to avoid searching the list
+    time_inds = {}
 
     # The general format of the datastructures used within PHOEBE are as follows:
     # if by_time:
@@ -209,6 +410,13 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
     else:
         datasets = b.filter(dataset=dataset, context='dataset', **_skip_filter_checks).datasets
 
+    # NOTE: decided once for all datasets (and components), see
+    # PhoebeBackend.run for the warning when falling back on numerical
+    if b.get_compute(compute, **_skip_filter_checks).kind == 'phoebe':
+        analytical_lc_datasets = _analytical_lc_datasets(b, compute, dataset=datasets)
+    else:
+        analytical_lc_datasets = []
+
     for dataset in datasets:
         dataset_ps = b.filter(context='dataset', dataset=dataset, **_skip_filter_checks)
         dataset_compute_ps = b.filter(context='compute', dataset=dataset, compute=compute, **_skip_filter_checks)
@@ -267,8 +475,15 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
                 # that gives this option and different logic for each case.
                 exptime = dataset_ps.get_value(qualifier='exptime', unit=u.d, **_skip_filter_checks)
                 fti_oversample = dataset_compute_ps.get_value(qualifier='fti_oversample', check_visible=False, **kwargs)
-                # NOTE: if changing this, also change in bundle.run_compute
-                this_times = np.array([np.linspace(t-exptime/2., t+exptime/2., fti_oversample) for t in this_times]).flatten()
+                fti_integration = dataset_compute_ps.get_value(qualifier='fti_integration', fti_integration=kwargs.get('fti_integration', None), default='mean', **_skip_filter_checks)
+                # NOTE: bundle.run_compute integrates over the exposures from
+                # the same (deterministic) grid
+                this_times, _, _ = _fti_oversample_times(this_times, exptime, fti_oversample, fti_integration)
+
+            if dataset in kwargs.get('phase_grid_times', {}):
+                # then the synthetics are computed on a grid in phase and
+                # interpolated to this_times by PhoebeBackend.run
+                this_times = kwargs.get('phase_grid_times').get(dataset)
 
             if dataset_kind in ['lp']:
                 # for line profiles and spectra, we only need to compute synthetic
@@ -282,7 +497,7 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
                 info = {'dataset': dataset,
                         'component': component,
                         'kind': dataset_kind,
-                        'needs_mesh': _needs_mesh(b, dataset, dataset_kind, component, compute),
+                        'needs_mesh': _needs_mesh(b, dataset, dataset_kind, component, compute, analytical_lc_datasets=analytical_lc_datasets),
                         }
 
                 if dataset_kind == 'mesh' and include_mesh:
@@ -299,10 +514,11 @@ def _extract_from_bundle(b, compute, dataset=None, times=None,
                 if by_time:
                     for time_ in this_times:
                         # TODO: handle some deltatime allowance here?
-                        if time_ in times:
-                            ind = times.index(time_)
+                        ind = time_inds.get(time_, None)
+                        if ind is not None:
                             infolists[ind].append(info)
                         else:
+                            time_inds[time_] = len(times)
                             times.append(time_)
                             infolists.append([info])
                 else:
@@ -382,6 +598,190 @@ def _create_syns(b, needed_syns):
 
     return ParameterSet(params)
 
+# contexts that are never needed by the workers and so are not kept resident
+# (see the persistent_workers compute option)
+_persistent_exclude_contexts = ['model', 'solution', 'figure', 'distribution']
+
+# state on the master: the token identifying the bundle resident on the workers,
+# the values of that bundle when it was sent (deltas are always relative to
+# these), and the persistent multiprocessing pool (if applicable)
+_persistent_master = {'token': None, 'mode': None, 'bundle_id': None, 'values': {}, 'pool': None, 'nprocs': None}
+# state on each worker: the resident bundle, the original values of any parameters
+# changed by deltas, and the Systems built from the resident bundle in its
+# current state (see _persistent_system_key)
+_persistent_worker = {'token': None, 'b': None, 'orig_values': {}, 'systems': {}}
+
+def _persistent_values(b):
+    values = {}
+    for param in b.exclude(context=_persistent_exclude_contexts, **_skip_filter_checks).to_list():
+        value = param.get_value()
+        values[param.uniqueid] = value.copy() if isinstance(value, np.ndarray) else value
+    return values
+
+def _values_equal(value1, value2):
+    if isinstance(value1, np.ndarray) or isinstance(value2, np.ndarray):
+        return np.shape(value1) == np.shape(value2) and np.array_equal(value1, value2)
+    try:
+        return bool(value1 == value2)
+    except Exception:
+        return False
+
+def _persistent_bundle_packet(b, mode, force_json=False):
+    """
+    Prepare the entry for packet['b'] when workers keep the bundle resident.
+
+    If the workers do not yet hold this bundle (or the bundle has changed
+    structurally since), a new token is created and the serialized bundle is
+    included.  Otherwise only the values that differ from those originally
+    sent are included as deltas (uniqueid: value).
+
+    Arguments
+    -----------
+    * `b` (Bundle): the bundle on the master.
+    * `mode` (string): 'mpi' or 'multiprocessing'.  Switching modes requires
+        sending the full bundle again.
+    * `force_json` (bool, optional, default=False): whether to include the
+        serialized bundle even if the workers should already hold it.
+
+    Returns
+    ---------
+    * (dict, bool): the entry for packet['b'] and whether a new token was created
+    """
+    state = _persistent_master
+    values = _persistent_values(b)
+    if state['token'] is None or state['mode'] != mode or state['bundle_id'] != id(b) or set(values.keys()) != set(state['values'].keys()):
+        logger.debug("persistent workers: sending full bundle")
+        state['token'] = _uniqueid()
+        state['mode'] = mode
+        state['bundle_id'] = id(b)
+        state['values'] = values
+        bpacket = {'token': state['token'], 'deltas': {},
+                   'json': b.exclude(context=_persistent_exclude_contexts, **_skip_filter_checks).to_json(incl_uniqueid=True)}
+        return bpacket, True
+
+    deltas = {uniqueid: value for uniqueid, value in values.items() if not _values_equal(value, state['values'][uniqueid])}
+    logger.debug("persistent workers: sending {} deltas".format(len(deltas)))
+    bpacket = {'token': state['token'], 'deltas': deltas}
+    if force_json:
+        # the json reflects the current values, so these become the reference
+        # for any future deltas
+        bpacket['json'] = b.exclude(context=_persistent_exclude_contexts, **_skip_filter_checks).to_json(incl_uniqueid=True)
+        bpacket['deltas'] = {}
+        state['values'] = values
+    return bpacket, False
+
+def _persistent_worker_init(token, bjson):
+    state = _persistent_worker
+    state['token'] = token
+    state['b'] = phoebe.frontend.bundle.Bundle(bjson)
+    state['orig_values'] = {}
+    state['systems'] = {}
+
+def _persistent_worker_bundle(bpacket):
+    """
+    Apply the packet prepared by _persistent_bundle_packet to the bundle
+    resident on this worker.
+
+    Returns
+    ---------
+    * (Bundle, dict): the resident bundle and the Systems built by previous
+        calls if no values have changed since.
+    """
+    state = _persistent_worker
+    if 'json' in bpacket:
+        _persistent_worker_init(bpacket['token'], bpacket['json'])
+    elif state['token'] != bpacket['token']:
+        raise ValueError("persistent worker does not hold the expected bundle, cannot apply deltas")
+
+    b = state['b']
+    deltas = bpacket['deltas']
+    changed = False
+    # any parameter changed by a previous call but no longer in deltas needs
+    # to be reverted to its original value
+    for uniqueid in set(deltas.keys()).union(state['orig_values'].keys()):
+        param = b.get_parameter(uniqueid=uniqueid, **_skip_filter_checks)
+        if param.__class__.__name__ == 'ConstraintParameter':
+            # constraints are never run on the workers: all constrained
+            # values are sent as deltas themselves
+            continue
+        if uniqueid not in state['orig_values']:
+            state['orig_values'][uniqueid] = param.get_value()
+        value = deltas.get(uniqueid, state['orig_values'][uniqueid])
+        if _values_equal(param.get_value(), value):
+            continue
+        try:
+            param.set_value(value, force=True, run_checks=False, run_constraints=False, ignore_readonly=True, skip_update_choices=True)
+        except ValueError:
+            # the value was already validated on the master (choices may
+            # not yet have been updated in the resident bundle)
+            param._value = value
+        changed = True
+
+    b._delayed_constraints = []
+    if changed:
+        state['systems'] = {}
+    else:
+        for system in state['systems'].values():
+            system.reset(force_recompute_instantaneous=True)
+
+    return b, state['systems']
+
+def _persistent_system_key(b, compute, **kwargs):
+    # a System can only be reused for the same compute options, including
+    # any values overridden by kwargs for this run
+    qualifiers = b.filter(context='compute', compute=compute, **_skip_filter_checks).qualifiers
+    return (compute, tuple(sorted((k, repr(v)) for k,v in kwargs.items() if k in qualifiers)))
+
+def _load_packet_bundle(packet):
+    """
+    Deserialize the bundle in packet['b'] on a worker, or apply the deltas to
+    the resident bundle (in which case a cached System may also be included
+    in the packet).
+    """
+    if isinstance(packet['b'], dict):
+        packet['b'], systems = _persistent_worker_bundle(packet['b'])
+        packet['system'] = systems.get(_persistent_system_key(**packet), None)
+        packet['cache_system'] = True
+    else:
+        packet['b'] = phoebe.frontend.bundle.Bundle(packet['b'])
+    return packet
+
+def _close_persistent_pool():
+    pool = _persistent_master.get('pool')
+    if pool is not None:
+        pool.close()
+        pool.join()
+    _persistent_master['pool'] = None
+    _persistent_master['nprocs'] = None
+
+atexit.register(_close_persistent_pool)
+
+def _get_persistent_pool(b, nprocs):
+    """
+    Get (or create) the multiprocessing pool whose workers hold the bundle
+    resident.
+
+    Returns
+    ---------
+    * (MultiPool, dict): the pool and the entry for packet['b']
+    """
+    state = _persistent_master
+    bpacket, new_token = _persistent_bundle_packet(b, mode='multiprocessing')
+    if state['pool'] is not None and (new_token or state['nprocs'] != nprocs):
+        _close_persistent_pool()
+
+    if state['pool'] is None:
+        if 'json' not in bpacket:
+            bpacket, _ = _persistent_bundle_packet(b, mode='multiprocessing', force_json=True)
+        logger.info("starting persistent multiprocessing pool with {} procs".format(nprocs))
+        state['pool'] = _pool.MultiPool(processes=nprocs,
+                                        initializer=_persistent_worker_init,
+                                        initargs=(bpacket['token'], bpacket['json']))
+        state['nprocs'] = nprocs
+
+    # the json was sent through the initializer of each worker
+    return state['pool'], {'token': bpacket['token'], 'deltas': bpacket['deltas']}
+
 def _make_packet(qualifier, value, time, info, **kwargs):
     """
     where kwargs overrides info
@@ -449,7 +849,10 @@ class BaseBackend(object):
             if len(packet.get('infolists', packet.get('infolist', []))) > kwargs.get('max_computations'):
                 raise ValueError("more than {} computations detected ({} estimated).".format(kwargs.get('max_computations'), len(packet['infolists'])))
 
-        packet['b'] = b.to_json() if mpi.enabled else b
+        if mpi.enabled and self._use_persistent_workers(b, compute, **kwargs):
+            packet['b'], _ = _persistent_bundle_packet(b, mode='mpi')
+        else:
+            packet['b'] = b.to_json() if mpi.enabled else b
         packet['compute'] = compute
         packet['backend'] = self.__class__.__name__
 
@@ -463,6 +866,13 @@ class BaseBackend(object):
         # np.array_split(any_input_array, nprocs)[myrank]
         raise NotImplementedError("_run_chunk is not implemented by the {} backend".format(self.__class__.__name__))
 
+    def _use_persistent_workers(self, b, compute, **kwargs):
+        """
+        Whether workers should keep the bundle resident between calls and only
+        receive changed values (see the persistent_workers compute option).
+        """
+        return b.get_value(qualifier='persistent_workers', compute=compute, context='compute', persistent_workers=kwargs.get('persistent_workers', None), default=False, **_skip_filter_checks)
+
     def _fill_syns(self, new_syns, rpacketlists_per_worker):
         """
         rpacket_per_worker is a list of packetlists as returned by _run_chunk
@@ -486,7 +896,7 @@ class BaseBackend(object):
     def _run_worker(self, packet):
         # the worker receives the bundle serialized, so we need to unpack it
         logger.debug("rank:{}/{} _run_worker".format(mpi.myrank, mpi.nprocs))
-        packet['b'] = phoebe.frontend.bundle.Bundle(packet['b'])
+        packet = _load_packet_bundle(packet)
         # do the computations requested for this worker
         rpacketlists = self._run_chunk(**packet)
         # send the results back to the master (root=0)
@@ -515,11 +925,40 @@ class BaseBackend(object):
             rpacketlists_per_worker = mpi.comm.gather(rpacketlists, root=0)
 
         else:
-            rpacketlists_per_worker = [self._run_chunk(**packet)]
+            nprocs = self._get_multiprocessing_nprocs(b, compute, packet, **kwargs)
+            if nprocs > 1:
+                logger.info("{}: splitting computations over multiprocessing with {} procs".format(self.__class__.__name__, nprocs))
+                if self._use_persistent_workers(b, compute, **kwargs):
+                    # the workers keep the bundle (and System) resident and
+                    # only need the changed values
+                    pool, packet['b'] = _get_persistent_pool(b, nprocs)
+                    args_per_chunk = [(self.__class__.__name__, packet, nprocs, i) for i in range(nprocs)]
+                    rpacketlists_per_worker = list(pool.map(_call_run_chunk, args_per_chunk))
+                else:
+                    # like the MPI case, each worker receives the bundle serialized
+                    # and will create its own System from it
+                    packet['b'] = b.to_json()
+                    args_per_chunk = [(self.__class__.__name__, packet, nprocs, i) for i in range(nprocs)]
+                    pool = _pool.MultiPool(processes=nprocs)
+                    try:
+                        rpacketlists_per_worker = list(pool.map(_call_run_chunk, args_per_chunk))
+                    finally:
+                        pool.close()
+                        pool.join()
+            else:
+                rpacketlists_per_worker = [self._run_chunk(**packet)]
 
         logger.debug("rank:{}/{} calling _fill_syns".format(mpi.myrank, mpi.nprocs))
         return self._fill_syns(new_syns, rpacketlists_per_worker)
 
+    def _get_multiprocessing_nprocs(self, b, compute, packet, **kwargs):
+        """
+        Number of local processes over which to split the packet when not
+        within MPI.  Backends that cannot split their chunk (or do not expose
+        the option) should leave this as 1 to run serially.
+        """
+        return 1
+
 
 class BaseBackendByTime(BaseBackend):
 
@@ -554,7 +993,20 @@ class BaseBackendByTime(BaseBackend):
         return packet, new_syns
 
 
-    def _run_chunk(self, b, compute, times, infolists, **kwargs):
+    def _get_multiprocessing_nprocs(self, b, compute, packet, **kwargs):
+        multiprocess_times = b.get_value(qualifier='multiprocess_times', compute=compute, context='compute', multiprocess_times=kwargs.get('multiprocess_times', None), default=False, **_skip_filter_checks)
+        if not multiprocess_times:
+            return 1
+
+        if b._within_solver or _multiprocessing.current_process().daemon:
+            # solvers already parallelize per-model and daemonic pool workers
+            # are not allowed to spawn their own pool
+            logger.debug("{}: ignoring multiprocess_times within solver or pool worker".format(self.__class__.__name__))
+            return 1
+
+        return max(min(conf.multiprocessing_nprocs, len(packet['times'])), 1)
+
+    def _run_chunk(self, b, compute, times, infolists, nchunks=1, ichunk=0, **kwargs):
         logger.debug("rank:{}/{} _run_chunk".format(mpi.myrank, mpi.nprocs))
 
         worker_setup_kwargs = self._worker_setup(b, compute, times, infolists, **kwargs)
@@ -562,10 +1014,13 @@ class BaseBackendByTime(BaseBackend):
         inds = range(len(times))
 
         if mpi.enabled:
-            # np.array_split(any_input_array, mpi.nprocs)[mpi.myrank]
-            inds = np.array_split(inds, mpi.nprocs)[mpi.myrank]
-            times = np.array_split(times, mpi.nprocs)[mpi.myrank]
-            infolists = np.array_split(infolists, mpi.nprocs)[mpi.myrank]
+            nchunks, ichunk = mpi.nprocs, mpi.myrank
+
+        if nchunks > 1:
+            # np.array_split(any_input_array, nchunks)[ichunk]
+            inds = np.array_split(inds, nchunks)[ichunk]
+            times = np.array_split(times, nchunks)[ichunk]
+            infolists = np.array_split(infolists, nchunks)[ichunk]
 
         packetlists = [] # entry per-time
         for i, time, infolist in _progressbar(zip(inds, times, infolists), total=len(times), show_progressbar=not b._within_solver and kwargs.get('progressbar', False)):
@@ -606,11 +1061,14 @@ class BaseBackendByDataset(BaseBackend):
 
 
     def _run_chunk(self, b, compute, infolist, **kwargs):
-        worker_setup_kwargs = self._worker_setup(b, compute, infolist, **kwargs)
-
         if mpi.enabled:
             # np.array_split(any_input_array, mpi.nprocs)[mpi.myrank]
-            infolist = np.array_split(infolist, mpi.nprocs)[mpi.myrank]
+            # NOTE: this is done before _worker_setup so that backends that
+            # run all their datasets at once (ie. jktebop, photodynam) only
+            # do so for the datasets of this rank
+            infolist = list(np.array_split(infolist, mpi.nprocs)[mpi.myrank])
+
+        worker_setup_kwargs = self._worker_setup(b, compute, infolist, **kwargs)
 
         packetlists = [] # entry per-dataset
         for info in _progressbar(infolist, total=len(infolist), show_progressbar=not b._within_solver and kwargs.get('progressbar', False)):
@@ -622,6 +1080,15 @@ class BaseBackendByDataset(BaseBackend):
 
         return packetlists
 
+def _call_run_chunk(args):
+    # called within a multiprocessing worker: see BaseBackend.run
+    backend_name, packet, nchunks, ichunk = args
+    packet = _load_packet_bundle(packet.copy())
+    # progressbars from each worker would interleave
+    packet['progressbar'] = False
+    backend = globals()[backend_name]()
+    return backend._run_chunk(nchunks=nchunks, ichunk=ichunk, **packet)
+
 def _call_run_single_model(args):
     # NOTE: b should be a deepcopy here to prevent conflicts
     b, samples, sample_kwargs, compute, dataset, times, compute_kwargs, expose_samples, expose_failed, i, allow_retries = args
@@ -926,6 +1393,108 @@ class PhoebeBackend(BaseBackendByTime):
         if len(starrefs)==1 and computeparams.get_value(qualifier='distortion_method', component=starrefs[0], **kwargs) in ['roche', 'none']:
             raise ValueError("distortion_method='{}' not valid for single star".format(computeparams.get_value(qualifier='distortion_method', component=starrefs[0], **kwargs)))
 
+    def run(self, b, compute, dataset=None, times=[], **kwargs):
+        """
+        Any LC datasets with phase_grid='adaptive' are computed on a grid in
+        phase which is refined until linearly interpolating between
+        neighbouring phases is accurate to within phase_grid_tol, and are then
+        interpolated to the requested times.  All other datasets are passed
+        on to the workers unchanged.
+        """
+        # warn (once per run) if lc_method='analytical' is not supported
+        _analytical_lc_datasets(b, compute, dataset=dataset, warn=True)
+
+        phase_grid_datasets = _phase_grid_datasets(b, compute, dataset=dataset, **kwargs)
+        if len(phase_grid_datasets):
+            # times at which the synthetics were requested (including any
+            # oversampling for finite-time integration)
+            infolist, _ = _extract_from_bundle(b, compute, dataset=phase_grid_datasets, times=times, by_time=False, **kwargs)
+            requested_times = {info['dataset']: info['times'] for info in infolist if len(info['times']) > _phase_grid_ninit + 2*_phase_grid_neclipse}
+            phase_grid_datasets = list(requested_times.keys())
+
+        if not len(phase_grid_datasets):
+            return super(PhoebeBackend, self).run(b, compute, dataset=dataset, times=times, **kwargs)
+
+        orbit = b.hierarchy.get_top()
+        period = b.get_value(qualifier='period', component=orbit, context='component', unit=u.d, **_skip_filter_checks)
+        tols = {ds: b.get_value(qualifier='phase_grid_tol', dataset=ds, compute=compute, context='compute', phase_grid_tol=kwargs.get('phase_grid_tol', None), **_skip_filter_checks) for ds in phase_grid_datasets}
+
+        # compute the grid at the cycle nearest to the requested times
+        time_ref = b.to_time(0.0, component=orbit)
+        time_ref += period * np.round((np.median(np.concatenate(list(requested_times.values()))) - time_ref) / period)
+
+        def _phases_to_times(phases):
+            return {ds: time_ref + phases*period for ds in phase_grid_datasets}
+
+        def _fluxes_from_syns(syns):
+            # the grid is sorted in time, but the synthetics may not be
+            fluxes = {}
+            for ds in phase_grid_datasets:
+                syn_times = syns.get_value(qualifier='times', dataset=ds, **_skip_filter_checks)
+                fluxes[ds] = syns.get_value(qualifier='fluxes', dataset=ds, **_skip_filter_checks)[np.argsort(syn_times)]
+            return fluxes
+
+        phases = _phase_grid_initial(_phase_grid_eclipses(b, orbit))
+        logger.info("computing {} on an adaptive phase grid, starting with {} phases".format(phase_grid_datasets, len(phases)))
+
+        # all other datasets are computed along with the initial grid
+        new_syns = super(PhoebeBackend, self).run(b, compute, dataset=dataset, times=times,
+                                                  phase_grid_times=_phases_to_times(phases),
+                                                  **kwargs)
+        fluxes = _fluxes_from_syns(new_syns)
+        flux_scales = {ds: np.median(np.abs(fluxes[ds])) for ds in phase_grid_datasets}
+
+        # NOTE: the midpoint of each interval in need of refinement is computed
+        # and compared to linear interpolation between its edges.  The two
+        # halves of any interval for which the error exceeds the tolerance
+        # are refined again in the next iteration.
+        # NOTE: there is no gain once the grid would be denser than the requested
+        # times, which may happen if phase_grid_tol is below the noise from
+        # the discretization of the meshes
+        max_phases = max([len(this_times) for this_times in requested_times.values()])
+        intervals = np.arange(len(phases))
+        for iteration in range(_phase_grid_maxiter):
+            if len(phases) + len(intervals) > max_phases:
+                logger.warning("adaptive phase grid would exceed the number of requested times before reaching phase_grid_tol, consider increasing phase_grid_tol or ntriangles")
+                break
+
+            mids = _phase_grid_midpoints(phases, intervals)
+            syns = super(PhoebeBackend, self).run(b, compute, dataset=phase_grid_datasets, times=times,
+                                                  phase_grid_times=_phases_to_times(mids),
+                                                  **kwargs)
+            mid_fluxes = _fluxes_from_syns(syns)
+
+            refine = np.zeros(len(mids), dtype=bool)
+            for ds in phase_grid_datasets:
+                rights = np.append(fluxes[ds][1:], fluxes[ds][0])
+                interp_fluxes = 0.5*(fluxes[ds][intervals] + rights[intervals])
+                refine |= np.abs(mid_fluxes[ds] - interp_fluxes) > tols[ds] * flux_scales[ds]
+
+            lefts = phases[intervals]
+            mids = np.mod(mids + 0.5, 1.0) - 0.5
+            phases = np.append(phases, mids)
+            sort = np.argsort(phases)
+            phases = phases[sort]
+            for ds in phase_grid_datasets:
+                fluxes[ds] = np.append(fluxes[ds], mid_fluxes[ds])[sort]
+
+            logger.debug("phase grid iteration {}: {} phases, {} intervals to refine".format(iteration, len(phases), refine.sum()))
+            if not np.any(refine):
+                break
+
+            intervals = np.unique(np.searchsorted(phases, np.append(lefts[refine], mids[refine])))
+        else:
+            logger.warning("adaptive phase grid did not reach phase_grid_tol after {} iterations".format(_phase_grid_maxiter))
+
+        logger.info("interpolating {} from an adaptive phase grid with {} phases".format(phase_grid_datasets, len(phases)))
+        for ds in phase_grid_datasets:
+            this_times = requested_times.get(ds)
+            this_fluxes = np.interp(b.to_phase(this_times, component=orbit), phases, fluxes[ds], period=1.0)
+            new_syns.set_value(qualifier='times', dataset=ds, value=this_times, ignore_readonly=True, **_skip_filter_checks)
+            new_syns.set_value(qualifier='fluxes', dataset=ds, value=this_fluxes, ignore_readonly=True, **_skip_filter_checks)
+
+        return new_syns
+
     def _compute_intrinsic_system_at_t0(self, b, compute,
                                           dynamics_method=None,
                                           hier=None,
@@ -1003,6 +1572,9 @@ class PhoebeBackend(BaseBackendByTime):
 
     def _worker_setup(self, b, compute, times, infolists, **kwargs):
         logger.debug("rank:{}/{} PhoebeBackend._worker_setup: extracting parameters".format(mpi.myrank, mpi.nprocs))
+        if kwargs.get('cache_system', False):
+            # NOTE: this must be determined before any overrides are popped from kwargs
+            system_key = _persistent_system_key(b, compute, **kwargs)
         computeparams = b.get_compute(compute, force_ps=True)
         hier = b.get_hierarchy()
         starrefs  = hier.get_stars()
@@ -1013,7 +1585,13 @@ class PhoebeBackend(BaseBackendByTime):
 
         # b.compute_ld_coeffs(set_value=True) # TODO: only need if irradiation is enabled and only for bolometric
 
-        system = kwargs.get('system', universe.System.from_bundle(b, compute, datasets=b.datasets, **kwargs))
+        system = kwargs.get('system', None)
+        if system is None:
+            system = universe.System.from_bundle(b, compute, datasets=b.datasets, **kwargs)
+            if kwargs.get('cache_system', False):
+                # keep the System resident on this persistent worker so it can
+                # be reused if no values change before the next call
+                _persistent_worker['systems'][system_key] = system
         # pblums_scale computed within run_compute and then passed as kwarg to run (so should be in kwargs sent to each worker)
         pblums_scale = kwargs.get('pblums_scale')
         for dataset in list(pblums_scale.keys()):
@@ -1056,11 +1634,26 @@ class PhoebeBackend(BaseBackendByTime):
             for i,t in enumerate(times):
                 zs[0][i] = vgamma*(t-t0)
 
+        # eclipse times are found for all cycles of each etv dataset at once
+        etv_times = {}
+        for time, infolist in zip(times, infolists):
+            for info in infolist:
+                if info['kind'] == 'etv':
+                    etv_times.setdefault((info['dataset'], info['component']), []).append(time)
+
+        time_ecls = {}
+        for (dataset, component), etv_times_this in etv_times.items():
+            logger.debug("rank:{}/{} PhoebeBackend._worker_setup: computing eclipse times for dataset={} component={}".format(mpi.myrank, mpi.nprocs, dataset, component))
+            etv_tol = computeparams.get_value(qualifier='etv_tol', unit=u.d, dataset=dataset, component=component, **_skip_filter_checks)
+            time_ecls_this = etvs.crossings(b, component, etv_times_this, dynamics_method, ltte, tol=etv_tol, compute=compute)
+            time_ecls[(dataset, component)] = dict(zip(etv_times_this, time_ecls_this))
+
         return dict(system=system,
                     hier=hier,
                     meshablerefs=meshablerefs,
                     starrefs=starrefs,
                     dynamics_method=dynamics_method,
+                    time_ecls=time_ecls,
                     ts=ts, xs=xs, ys=ys, zs=zs,
                     vxs=vxs, vys=vys, vzs=vzs,
                     ethetas=ethetas, elongans=elongans, eincls=eincls)
@@ -1228,9 +1821,15 @@ class PhoebeBackend(BaseBackendByTime):
                                               time, info))
 
             elif kind=='lc':
-                obs = system.observe(info['dataset'],
-                                     kind=kind,
-                                     components=info['component'])
+                if info['needs_mesh']:
+                    obs = system.observe(info['dataset'],
+                                         kind=kind,
+                                         components=info['component'])
+                else:
+                    # then lc_method == 'analytical'
+                    obs = system.observe_analytical(info['dataset'],
+                                                    xi, yi, zi,
+                                                    components=info['component'])
 
                 packetlist.append(_make_packet('fluxes',
                                               obs['flux']*u.W/u.m**2,
@@ -1239,7 +1838,7 @@ class PhoebeBackend(BaseBackendByTime):
             elif kind=='etv':
 
                 # TODO: add support for other etv kinds (barycentric, robust, others?)
-                time_ecl = etvs.crossing(b, info['component'], time, dynamics_method, ltte, tol=computeparams.get_value(qualifier='etv_tol', unit=u.d, dataset=info['dataset'], component=info['component']))
+                time_ecl = kwargs.get('time_ecls')[(info['dataset'], info['component'])][time]
 
                 this_obs = b.filter(dataset=info['dataset'], component=info['component'], context='dataset')
 
@@ -1858,6 +2457,113 @@ class LegacyBackend(BaseBackendByDataset):
         return packetlist
 
 
+def _external_workdir():
+    """
+    Create a private working directory for the input and output files of the
+    external jktebop and photodynam executables.  A RAM-backed filesystem
+    (/dev/shm) is used when available so that these files never hit the disk,
+    otherwise the default location of tempfile is used.  In either case,
+    workers sharing the same current working directory can no longer
+    overwrite each other's files.
+
+    Returns
+    ----------
+    * (string) path to the directory.  The caller is responsible for removing
+        the directory (with all its contents) when finished.
+    """
+    ramdir = '/dev/shm'
+    if not (os.path.isdir(ramdir) and os.access(ramdir, os.W_OK)):
+        ramdir = None
+    return tempfile.mkdtemp(prefix='phoebe_', dir=ramdir)
+
+def _run_external(args, workdir):
+    """
+    Run an external executable within `workdir` (so that all filenames in
+    `args` and in any input files can be short and relative) and return its
+    stdout as a string.
+    """
+    logger.info("running '{}' in {}".format(' '.join(args), workdir))
+    proc = subprocess.run(args, cwd=workdir,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        logger.warning("'{}' exited with code {}: {}".format(args[0], proc.returncode, proc.stderr.decode('utf-8', errors='replace').strip()))
+    return proc.stdout.decode('utf-8', errors='replace')
+
+def _photodynam_input(b, dataset, starrefs, orbitrefs, step_size, orbit_error, time0):
+    """
+    Build the contents of the photodynam input file.  If `dataset` is None,
+    only the dynamics are needed, so dummy values are used for the passband
+    luminosities and limb-darkening.
+    """
+    lines = []
+    lines.append('{} {}'.format(len(starrefs), time0))
+    lines.append('{} {}'.format(step_size, orbit_error))
+    lines.append('')
+    lines.append(' '.join([str(b.get_value(qualifier='mass', component=star,
+            context='component', unit=u.solMass) * c.G.to('AU3 / (Msun d2)').value)
+            for star in starrefs])) # GM
+
+    lines.append(' '.join([str(b.get_value(qualifier='requiv', component=star,
+            context='component', unit=u.AU))
+            for star in starrefs]))
+
+    if dataset is not None:
+        # TODO: this will make two meshing calls, let's create and extract from the dictionary instead, or use set_value=True
+        pblums = [b.get_value(qualifier='pblum', dataset=dataset, component=starref, unit=u.W, check_visible=False) for starref in starrefs]
+
+        u1s, u2s = [], []
+        for star in starrefs:
+            if b.get_value(qualifier='ld_func', component=star, dataset=dataset, context='dataset') == 'quadratic':
+                ld_coeffs = b.get_value(qualifier='ld_coeffs', component=star, dataset=dataset, context='dataset', check_visible=False)
+            else:
+                # TODO: can we still interpolate for quadratic manually using b.compute_ld_coeffs?
+                ld_coeffs = (0,0)
+                logger.warning("ld_func for {} {} must be 'quadratic' for the photodynam backend, but is not: defaulting to quadratic with coeffs of {}".format(star, dataset, ld_coeffs))
+
+            u1s.append(str(ld_coeffs[0]))
+            u2s.append(str(ld_coeffs[1]))
+
+    else:
+        # we only care about the dynamics, so let's just pass dummy values
+        pblums = [1 for star in starrefs]
+        u1s = ['0' for star in starrefs]
+        u2s = ['0' for star in starrefs]
+
+    if -1 in pblums:
+        raise ValueError('pblums must be set in order to run photodynam')
+
+    lines.append(' '.join([str(pbl / (4*np.pi)) for pbl in pblums]))
+
+    lines.append(' '.join(u1s))
+    lines.append(' '.join(u2s))
+
+    lines.append('')
+
+    for orbitref in orbitrefs:
+        a = b.get_value(qualifier='sma', component=orbitref,
+            context='component', unit=u.AU)
+        e = b.get_value(qualifier='ecc', component=orbitref,
+            context='component')
+        i = b.get_value(qualifier='incl', component=orbitref,
+            context='component', unit=u.rad)
+        o = b.get_value(qualifier='per0', component=orbitref,
+            context='component', unit=u.rad)
+        l = b.get_value(qualifier='long_an', component=orbitref,
+            context='component', unit=u.rad)
+
+        # t0 = b.get_value(qualifier='t0_perpass', component=orbitref,
+            # context='component', unit=u.d)
+        # period = b.get_value(qualifier='period', component=orbitref,
+            # context='component', unit=u.d)
+
+        # om = 2 * np.pi * (time0 - t0) / period
+        om = b.get_value(qualifier='mean_anom', component=orbitref,
+                         context='component', unit=u.rad)
+
+        lines.append('{} {} {} {} {} {}'.format(a, e, i, o, l, om))
+
+    return '\n'.join(lines)+'\n'
+
 class PhotodynamBackend(BaseBackendByDataset):
     """
     See <phoebe.parameters.compute.photodynam>.
@@ -1889,13 +2595,61 @@ class PhotodynamBackend(BaseBackendByDataset):
         orbit_error = computeparams.get_value(qualifier='orbiterror', **kwargs)
         time0 = b.get_value(qualifier='t0', context='system', unit=u.d, **kwargs)
 
+        # group the datasets by the input file they require so that photodynam
+        # is only called once per group (for the union of all their times).
+        # Only lc datasets depend on dataset-specific values (pblums and
+        # limb-darkening), all other kinds only need the dynamics and can
+        # therefore be computed alongside any lc.
+        inputs = []
+        times = []
+        input_inds = {}
+        for info in sorted(infolist, key=lambda info: info['kind'] != 'lc'):
+            if info['kind'] == 'lc':
+                inp = _photodynam_input(b, info['dataset'], starrefs, orbitrefs, step_size, orbit_error, time0)
+            elif len(inputs):
+                inp = inputs[0]
+            else:
+                inp = _photodynam_input(b, None, starrefs, orbitrefs, step_size, orbit_error, time0)
+
+            if inp not in inputs:
+                inputs.append(inp)
+                times.append([])
+            ind = inputs.index(inp)
+            times[ind].append(info['times'])
+            input_inds[info['dataset']] = ind
+
+        results = []
+        workdir = _external_workdir()
+        try:
+            for ind, (inp, times_) in enumerate(zip(inputs, times)):
+                times_ = np.unique(np.concatenate(times_))
+
+                inpfilename = 'pd{}.inp'.format(ind)
+                with open(os.path.join(workdir, inpfilename), 'w') as fi:
+                    fi.write(inp)
+
+                # write the report file
+                repfilename = 'pd{}.rep'.format(ind)
+                with open(os.path.join(workdir, repfilename), 'w') as fr:
+                    # t times
+                    # F fluxes
+                    # x light-time corrected positions
+                    # v light-time corrected velocities
+                    fr.write('t F x v \n')   # TODO: don't always get all?
+                    for t in times_:
+                        fr.write('{}\n'.format(t))
+
+                # run photodynam, reading the output directly from stdout
+                out = _run_external(['photodynam', inpfilename, repfilename], workdir)
+                results.append((times_, np.loadtxt(out.splitlines(), ndmin=2, unpack=True)))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
 
         return dict(compute=compute,
                     starrefs=starrefs,
                     orbitrefs=orbitrefs,
-                    step_size=step_size,
-                    orbit_error=orbit_error,
-                    time0=time0)
+                    results=results,
+                    input_inds=input_inds)
 
     def _run_single_dataset(self, b, info, **kwargs):
         """
@@ -1905,103 +2659,10 @@ class PhotodynamBackend(BaseBackendByDataset):
 
         compute = kwargs.get('compute')
         starrefs = kwargs.get('starrefs')
-        orbitrefs = kwargs.get('orbitrefs')
-        step_size = kwargs.get('step_size')
-        orbit_error = kwargs.get('orbit_error')
-        time0 = kwargs.get('time0')
-
-        # write the input file
-        # TODO: need to use TemporaryFiles to be MPI safe
-        fi = open('_tmp_pd_inp', 'w')
-        fi.write('{} {}\n'.format(len(starrefs), time0))
-        fi.write('{} {}\n'.format(step_size, orbit_error))
-        fi.write('\n')
-        fi.write(' '.join([str(b.get_value(qualifier='mass', component=star,
-                context='component', unit=u.solMass) * c.G.to('AU3 / (Msun d2)').value)
-                for star in starrefs])+'\n') # GM
-
-        fi.write(' '.join([str(b.get_value(qualifier='requiv', component=star,
-                context='component', unit=u.AU))
-                for star in starrefs])+'\n')
-
-        if info['kind'] == 'lc':
-            # TODO: this will make two meshing calls, let's create and extract from the dictionary instead, or use set_value=True
-            pblums = [b.get_value(qualifier='pblum', dataset=info['dataset'], component=starref, unit=u.W, check_visible=False) for starref in starrefs]
 
-            u1s, u2s = [], []
-            for star in starrefs:
-                if b.get_value(qualifier='ld_func', component=star, dataset=info['dataset'], context='dataset') == 'quadratic':
-                    ld_coeffs = b.get_value(qualifier='ld_coeffs', component=star, dataset=info['dataset'], context='dataset', check_visible=False)
-                else:
-                    # TODO: can we still interpolate for quadratic manually using b.compute_ld_coeffs?
-                    ld_coeffs = (0,0)
-                    logger.warning("ld_func for {} {} must be 'quadratic' for the photodynam backend, but is not: defaulting to quadratic with coeffs of {}".format(star, info['dataset'], ld_coeffs))
-
-                u1s.append(str(ld_coeffs[0]))
-                u2s.append(str(ld_coeffs[1]))
-
-        else:
-            # we only care about the dynamics, so let's just pass dummy values
-            pblums = [1 for star in starrefs]
-            u1s = ['0' for star in starrefs]
-            u2s = ['0' for star in starrefs]
-
-        if -1 in pblums:
-            raise ValueError('pblums must be set in order to run photodynam')
-
-        fi.write(' '.join([str(pbl / (4*np.pi)) for pbl in pblums])+'\n')
-
-        fi.write(' '.join(u1s)+'\n')
-        fi.write(' '.join(u2s)+'\n')
-
-        fi.write('\n')
-
-        for orbitref in orbitrefs:
-            a = b.get_value(qualifier='sma', component=orbitref,
-                context='component', unit=u.AU)
-            e = b.get_value(qualifier='ecc', component=orbitref,
-                context='component')
-            i = b.get_value(qualifier='incl', component=orbitref,
-                context='component', unit=u.rad)
-            o = b.get_value(qualifier='per0', component=orbitref,
-                context='component', unit=u.rad)
-            l = b.get_value(qualifier='long_an', component=orbitref,
-                context='component', unit=u.rad)
-
-            # t0 = b.get_value(qualifier='t0_perpass', component=orbitref,
-                # context='component', unit=u.d)
-            # period = b.get_value(qualifier='period', component=orbitref,
-                # context='component', unit=u.d)
-
-            # om = 2 * np.pi * (time0 - t0) / period
-            om = b.get_value(qualifier='mean_anom', component=orbitref,
-                             context='component', unit=u.rad)
-
-            fi.write('{} {} {} {} {} {}\n'.format(a, e, i, o, l, om))
-        fi.close()
-
-        # write the report file
-        fr = open('_tmp_pd_rep', 'w')
-        # t times
-        # F fluxes
-        # x light-time corrected positions
-        # v light-time corrected velocities
-        fr.write('t F x v \n')   # TODO: don't always get all?
-
-        ds = b.get_dataset(dataset=info['dataset'])
-        times = ds.get_value(qualifier='compute_times', unit=u.d)
-        if not len(times) and 'times' in ds.qualifiers:
-            times = b.get_value(qualifier='times', component=info['component'], unit=u.d)
-
-        for t in times:
-            fr.write('{}\n'.format(t))
-        fr.close()
-
-        # run photodynam
-        cmd = 'photodynam _tmp_pd_inp _tmp_pd_rep > _tmp_pd_out'
-        logger.info("running photodynam backend: '{}'".format(cmd))
-        out = commands.getoutput(cmd)
-        stuff = np.loadtxt('_tmp_pd_out', unpack=True)
+        # extract the rows for this dataset from the batched photodynam output
+        times, stuff = kwargs.get('results')[kwargs.get('input_inds')[info['dataset']]]
+        stuff = stuff[:, np.searchsorted(times, info['times'])]
 
         # parse output to fill packets
         packetlist = []
@@ -2085,6 +2746,139 @@ _jktebop_ld_func = {'linear': 'lin',
                     'square_root': 'sqrt',
                     'quadratic': 'quad'}
 
+def _jktebop_input(b, dataset, starrefs, pblums, lcinfilename, paramoutfilename,
+                   lcoutfilename, modeloutfilename, rvfilenames={}, **kwargs):
+    """
+    Build the contents of the jktebop input file (for task 3) for `dataset`.
+    `rvfilenames` maps 'rv1' and/or 'rv2' to a tuple of the input and output
+    filenames of the radial velocities to compute within the same call.  All
+    system-wide values are passed as `kwargs` (see
+    <phoebe.backend.backends.JktebopBackend._worker_setup>).
+    """
+    ringsize = kwargs.get('ringsize')
+    irrad_method = kwargs.get('irrad_method')
+    rA = kwargs.get('rA')
+    rB = kwargs.get('rB')
+    sma = kwargs.get('sma')
+    incl = kwargs.get('incl')
+    q = kwargs.get('q')
+    if kwargs.get('distortion_method') == 'sphere':
+        q *= -1
+    ecosw = kwargs.get('ecosw')
+    esinw = kwargs.get('esinw')
+    gravbA = kwargs.get('gravbA')
+    gravbB = kwargs.get('gravbB')
+    period = kwargs.get('period')
+    t0_supconj = kwargs.get('t0_supconj')
+
+    # get dataset-dependent things that we need
+    ldfuncA = b.get_value(qualifier='ld_func', component=starrefs[0], dataset=dataset, context='dataset', **_skip_filter_checks)
+    ldfuncB = b.get_value(qualifier='ld_func', component=starrefs[1], dataset=dataset, context='dataset', **_skip_filter_checks)
+
+    # use check_visible=False to access the ld_coeffs from
+    # compute_ld_coeffs(set_value=True) done in _worker_setup
+    ldcoeffsA = b.get_value(qualifier='ld_coeffs', component=starrefs[0], dataset=dataset, context='dataset', **_skip_filter_checks)
+    ldcoeffsB = b.get_value(qualifier='ld_coeffs', component=starrefs[1], dataset=dataset, context='dataset', **_skip_filter_checks)
+
+    if irrad_method == "biaxial-spheroid":
+        albA = b.get_value(qualifier='irrad_frac_refl_bol', component=starrefs[0], context='component', **_skip_filter_checks)
+        albB = b.get_value(qualifier='irrad_frac_refl_bol', component=starrefs[1], context='component', **_skip_filter_checks)
+    elif irrad_method == 'none':
+        albA = 0.0
+        albB = 0.0
+    else:
+        raise NotImplementedError("irrad_method '{}' not supported".format(irrad_method))
+
+    sbratio = (pblums.get(starrefs[1])/b.get_value(qualifier='requiv', component=starrefs[1], context='component', unit=u.solRad)**2)/(pblums.get(starrefs[0])/b.get_value(qualifier='requiv', component=starrefs[0], context='component', unit=u.solRad)**2)
+
+    # let's make sure we'll be able to make the translation later
+    if ldfuncA not in _jktebop_ld_func.keys() or ldfuncB not in _jktebop_ld_func.keys():
+        # NOTE: this is now handle in b.run_checks, so should never happen
+        # TODO: provide a more useful error statement
+        raise ValueError("jktebop only accepts the following options for ld_func: {}".format(_jktebop_ld_func.keys()))
+
+    lines = []
+
+    # Task 3	This inputs a parameter file (containing estimated parameter
+    # values) and an observed light curve. It fits the light curve using
+    # Levenberg-Marquardt minimisation and produces an output parameter file,
+    # a file of residuals of the observations, and file containing the best
+    # fit to the light curve (as in Task 2). The parameter values have formal
+    # errors (from the covariance matrix found by the minimisation algorithm)
+    # but these are not overall uncertainties. You will need to run other
+    # tasks to get reliable parameter uncertainties.
+    lines.append('{:5} {:11} Task to do (from 1 to 9)   Integ. ring size (deg)'.format(3, ringsize))
+    lines.append('{:5} {:11} Sum of the radii           Ratio of the radii'.format((rA+rB)/sma, rB/rA))
+    lines.append('{:5} {:11} Orbital inclination (deg)  Mass ratio of the system'.format(incl, q))
+
+    # we'll provide ecosw and esinw instead of ecc and long_an
+    # jktebop's readme.txt states that so long as ecc is < 10,
+    # it will be intrepreted as ecosw and esinw (otherwise would
+    # need to be ecc+10 and long_an (deg)
+    lines.append('{:5} {:11} Orbital eccentricity       Periastron longitude deg'.format(ecosw, esinw))
+
+
+    lines.append('{:5} {:11} Gravity darkening (starA)  Grav darkening (starB)'.format(gravbA, gravbB))
+    lines.append('{:5} {:11} Surface brightness ratio   Amount of third light'.format(sbratio, 0.0))
+
+
+    lines.append('{:5} {:11} LD law type for star A     LD law type for star B'.format(_jktebop_ld_func[ldfuncA], _jktebop_ld_func[ldfuncB]))
+    lines.append('{:5} {:11} LD star A (linear coeff)   LD star B (linear coeff)'.format(ldcoeffsA[0], ldcoeffsB[0]))
+    lines.append('{:5} {:11} LD star A (nonlin coeff)   LD star B (nonlin coeff)'.format(ldcoeffsA[1] if len(ldcoeffsA)==2 else 0.0, ldcoeffsB[1] if len(ldcoeffsB)==2 else 0.0))
+
+    lines.append('{:5} {:11} Reflection effect star A   Reflection effect star B'.format(albA, albB))
+    lines.append('{:5} {:11} Phase of primary eclipse   Light scale factor (mag)'.format(0.0, 1.0))
+    lines.append('{:13}      Orbital period of eclipsing binary system (days)'.format(period))
+    lines.append('{:13}      Reference time of primary minimum (HJD)'.format(t0_supconj))
+
+    # All fitting will be done with PHOEBE wrappers, so we need to set
+    # all jktebop options for adjust to False (0)
+    lines.append(' {:d}  {:d}             Adjust RADII SUM or RADII RATIO (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust INCLINATION or MASSRATIO (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust ECCENTRICITY or OMEGA (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust GRAVDARK1 or GRAVDARK2 (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust SURFACEBRIGH2 or THIRDLIGHT (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust LD-lin1 or LD-lin2 (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust LD-nonlin1 or LD-nonlin2 (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust REFLECTION COEFFS 1 and 2 (-1, 0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust PHASESHIFT or SCALE FACTOR (0, 1, 2, 3)'.format(0, 0))
+    lines.append(' {:d}  {:d}             Adjust PERIOD or TZERO (min light) (0, 1, 2, 3)'.format(0, 0))
+
+    lines.append('{}  Name of file containing light curve'.format(lcinfilename))
+    lines.append('{}  Name of output parameter file'.format(paramoutfilename))
+    lines.append('{}  Name of output light curve file'.format(lcoutfilename))
+    lines.append('{}  Name of output model light curve fit file'.format(modeloutfilename))
+
+    # According to jktebop's readme.txt:
+    # FITTING FOR RADIAL VELOCITIES:    the observed RVs should be in separate files
+    # for the two stars and the data should be in the same format as the light curve
+    # data. Then add a line below the main input parameters for each rv file:
+    #   RV1  [infile]  [outfile]  [K]  [Vsys]  [vary(K)]  [vary(Vsys)]
+    #   RV2  [infile]  [outfile]  [K]  [Vsys]  [vary(K)]  [vary(Vsys)]
+    # where RV1 is for primary star velocities, RV2 is for secondary star velocities
+    # [infile] is the input data file, [outfile] is the output data file, [K] is the
+    # velocity amplitude of the star (km/s), [Vsys] is its systemic velocity (km/s),
+    # and [vary(K)] and [vary(Vsys)] are 0 to fix and 1 to fit for these quantities.
+    # The mass ratio parameter is not used for the RVs, only for the light curve.
+    # If you want to fix the systemic velocity for star B to that for star A, simply
+    # set vary(Vsys) for star B to be equal to -1
+    #~ fi.write('rv1 llaqr-rv1.dat llaqr-rv1.out 55.0 -10.0 0 0\n')
+    #~ fi.write('rv2 llaqr-rv2.dat llaqr-rv2.out 55.0 -10.0 0 0\n')
+    for rvkey, (rvinfilename, rvoutfilename) in sorted(rvfilenames.items()):
+        # NOTE: we disable systemic velocity as it will be added in bundle.run_compute
+        K = np.pi * (sma*u.solRad).to(u.km).value * np.sin((incl*u.deg).to(u.rad).value) / (period*u.d).to(u.s).value
+        lines.append('{} {} {} {} {} 0 0'.format(rvkey, rvinfilename, rvoutfilename, K, 0.0))
+
+
+    # According to jktebop's readme.txt:
+    # NUMERICAL INTEGRATION:  long exposure times can be split up into NUMINT points
+    # occupying a total time interval of NINTERVAL (seconds) by including this line:
+    #   NUMI  [numint]  [ninterval]
+
+    # TODO: allow exposure times?
+
+    return '\n'.join(lines)+'\n'
+
 class JktebopBackend(BaseBackendByDataset):
     """
     See <phoebe.parameters.compute.jktebop>.
@@ -2156,263 +2950,124 @@ class JktebopBackend(BaseBackendByDataset):
         period = b.get_value(qualifier='period', component=orbitref, context='component', unit=u.d, **_skip_filter_checks)
         t0_supconj = b.get_value(qualifier='t0_supconj', component=orbitref, context='component', unit=u.d, **_skip_filter_checks)
 
+        system_params = dict(ringsize=ringsize,
+                             distortion_method=distortion_method,
+                             irrad_method=irrad_method,
+                             rA=rA, rB=rB,
+                             sma=sma, incl=incl, q=q,
+                             ecosw=ecosw, esinw=esinw,
+                             gravbA=gravbA, gravbB=gravbB,
+                             period=period, t0_supconj=t0_supconj)
+
+        pblums = kwargs.get('pblums')
+
+        # jktebop computes a single light curve and the radial velocities of
+        # both stars within one call (for task 3), so we group the datasets
+        # into as few calls as possible: each lc dataset needs its own call,
+        # and rv datasets are added to those calls (or new calls if needed)
+        # as 'rv1' (primary) or 'rv2' (secondary).
+        runs = []
+        for info in sorted(infolist, key=lambda info: info['kind'] != 'lc'):
+            if info['kind'] == 'lc':
+                runs.append({'lc': info})
+            elif info['kind'] == 'rv':
+                rvkey = 'rv1' if info['component'] == starrefs[0] else 'rv2'
+                run = [run for run in runs if rvkey not in run]
+                if len(run):
+                    run = run[0]
+                else:
+                    run = {}
+                    runs.append(run)
+                run[rvkey] = info
+            else:
+                raise NotImplementedError("kind {} not yet supported by this backend".format(info['kind']))
+
+        # NOTE: all files are written to (and jktebop is run within) a private
+        # working directory, so the filenames can be short and fixed
+        results = {}
+        workdir = _external_workdir()
+        try:
+            for ind, run in enumerate(runs):
+                fname = lambda suffix: 'jkt{}.{}'.format(ind, suffix)
+
+                # jktebop complains about not enough data to "fit" for task 3
+                # without a light curve (even though we're holding everything
+                # fixed), so if this call is only for rvs we'll pass their times
+                lcinfo = run.get('lc', run.get('rv1', run.get('rv2')))
+                np.savetxt(os.path.join(workdir, fname('lc.in')), np.asarray([lcinfo['times'], np.ones_like(lcinfo['times'])]).T, fmt='%f')
+
+                rvfilenames = {}
+                for rvkey in ['rv1', 'rv2']:
+                    if rvkey in run.keys():
+                        rvfilenames[rvkey] = (fname(rvkey+'.in'), fname(rvkey+'.out'))
+                        np.savetxt(os.path.join(workdir, fname(rvkey+'.in')), np.asarray([run[rvkey]['times'], np.ones_like(run[rvkey]['times'])]).T, fmt='%f')
+
+                with open(os.path.join(workdir, fname('in')), 'w') as fi:
+                    fi.write(_jktebop_input(b, lcinfo['dataset'], starrefs, pblums.get(lcinfo['dataset']),
+                                            fname('lc.in'), fname('param.out'),
+                                            fname('lc.out'), fname('model.out'),
+                                            rvfilenames=rvfilenames,
+                                            **system_params))
+
+                # run jktebop
+                _run_external(['jktebop', fname('in')], workdir)
+
+                # parse output
+                if 'lc' in run.keys():
+                    times, _, _, _, mags, _ = np.loadtxt(os.path.join(workdir, fname('lc.out')), unpack=True)
+
+                    logger.warning("converting from mags from jktebop to flux")
+                    fluxes = 10**((0.0-mags)/2.5)
+                    fluxes /= np.max(fluxes)
+                    results[(run['lc']['dataset'], run['lc']['component'])] = fluxes
+
+                for rvkey in rvfilenames.keys():
+                    times, _, _, _, rvs, _ = np.loadtxt(os.path.join(workdir, fname(rvkey+'.out')), unpack=True)
+                    results[(run[rvkey]['dataset'], run[rvkey]['component'])] = rvs
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
         return dict(compute=compute,
                     starrefs=starrefs,
                     oritref=orbitref,
-                    ringsize=ringsize,
-                    distortion_method=distortion_method,
-                    irrad_method=irrad_method,
-                    rA=rA, rB=rB,
-                    sma=sma, incl=incl, q=q,
-                    ecosw=ecosw, esinw=esinw,
-                    gravbA=gravbA, gravbB=gravbB,
-                    period=period, t0_supconj=t0_supconj,
-                    pblums=kwargs.get('pblums'))
+                    results=results)
 
     def _run_single_dataset(self, b, info, **kwargs):
         """
         """
         logger.debug("rank:{}/{} JktebopBackend._run_single_dataset(info['dataset']={} info['component']={} info.keys={}, **kwargs.keys={})".format(mpi.myrank, mpi.nprocs, info['dataset'], info['component'], info.keys(), kwargs.keys()))
 
-        compute = kwargs.get('compute')
-        starrefs = kwargs.get('starrefs')
-        orbitref = kwargs.get('orbitref')
-        ringsize = kwargs.get('ringsize')
-        distortion_method = kwargs.get('distortion_method')
-        irrad_method = kwargs.get('irrad_method')
-        rA = kwargs.get('rA')
-        rB = kwargs.get('rB')
-        sma = kwargs.get('sma')
-        incl = kwargs.get('incl')
-        q = kwargs.get('q')
-        if distortion_method == 'sphere':
-            q *= -1
-        ecosw = kwargs.get('ecosw')
-        esinw = kwargs.get('esinw')
-        gravbA = kwargs.get('gravbA')
-        gravbB = kwargs.get('gravbB')
-        period = kwargs.get('period')
-        t0_supconj = kwargs.get('t0_supconj')
-
-        # get dataset-dependent things that we need
-        ldfuncA = b.get_value(qualifier='ld_func', component=starrefs[0], dataset=info['dataset'], context='dataset', **_skip_filter_checks)
-        ldfuncB = b.get_value(qualifier='ld_func', component=starrefs[1], dataset=info['dataset'], context='dataset', **_skip_filter_checks)
-
-        # use check_visible=False to access the ld_coeffs from
-        # compute_ld_coeffs(set_value=True) done in _worker_setup
-        ldcoeffsA = b.get_value(qualifier='ld_coeffs', component=starrefs[0], dataset=info['dataset'], context='dataset', **_skip_filter_checks)
-        ldcoeffsB = b.get_value(qualifier='ld_coeffs', component=starrefs[1], dataset=info['dataset'], context='dataset', **_skip_filter_checks)
-
-        if irrad_method == "biaxial-spheroid":
-            albA = b.get_value(qualifier='irrad_frac_refl_bol', component=starrefs[0], context='component', **_skip_filter_checks)
-            albB = b.get_value(qualifier='irrad_frac_refl_bol', component=starrefs[1], context='component', **_skip_filter_checks)
-        elif irrad_method == 'none':
-            albA = 0.0
-            albB = 0.0
-        else:
-            raise NotImplementedError("irrad_method '{}' not supported".format(irrad_method))
-
-        pblums = kwargs.get('pblums').get(info['dataset'])
-        sbratio = (pblums.get(starrefs[1])/b.get_value(qualifier='requiv', component=starrefs[1], context='component', unit=u.solRad)**2)/(pblums.get(starrefs[0])/b.get_value(qualifier='requiv', component=starrefs[0], context='component', unit=u.solRad)**2)
-
-        # let's make sure we'll be able to make the translation later
-        if ldfuncA not in _jktebop_ld_func.keys() or ldfuncB not in _jktebop_ld_func.keys():
-            # NOTE: this is now handle in b.run_checks, so should never happen
-            # TODO: provide a more useful error statement
-            raise ValueError("jktebop only accepts the following options for ld_func: {}".format(ldfuncs.keys()))
-
-        # create the input file for jktebop
-        # uncomment this block, comment out the following block and the os.remove at the end
-        # for testing
-        # tmpfilenamein = 'jktebop.in'
-        # tmpfilenamelcin = 'jktebop.lc.in'
-        # tmpfilenamelcout = 'jktebop.lc.out'
-        # tmpfilenamervin = 'jktebop.rv.in'
-        # tmpfilenamervout = 'jktebop.rv.out'
-        # tmpfilenameparamout = 'jktebop.param.out'
-        # tmpfilenamemodelout = 'jktebop.model.out'
-        # tmpfilenameout = 'jktebop.out'
-        # try:
-        #     os.remove(tmpfilenamein)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenamelcin)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenamelcout)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenamervin)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenamervout)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenameparamout)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenamemodelout)
-        # except: pass
-        # try:
-        #     os.remove(tmpfilenameout)
-        # except: pass
-
-        tmpfilenamein = next(tempfile._get_candidate_names())
-        tmpfilenamelcin = next(tempfile._get_candidate_names())
-        tmpfilenamelcout = next(tempfile._get_candidate_names())
-        if info['kind'] == 'rv':
-            tmpfilenamervin = next(tempfile._get_candidate_names())
-            tmpfilenamervout = next(tempfile._get_candidate_names())
-        tmpfilenameparamout = next(tempfile._get_candidate_names())
-        tmpfilenamemodelout = next(tempfile._get_candidate_names())
-        tmpfilenameout = next(tempfile._get_candidate_names())
-
-
-        fi = open(tmpfilenamein, 'w')
-
-        # Task 3	This inputs a parameter file (containing estimated parameter
-        # values) and an observed light curve. It fits the light curve using
-        # Levenberg-Marquardt minimisation and produces an output parameter file,
-        # a file of residuals of the observations, and file containing the best
-        # fit to the light curve (as in Task 2). The parameter values have formal
-        # errors (from the covariance matrix found by the minimisation algorithm)
-        # but these are not overall uncertainties. You will need to run other
-        # tasks to get reliable parameter uncertainties.
-        fi.write('{:5} {:11} Task to do (from 1 to 9)   Integ. ring size (deg)\n'.format(3, ringsize))
-        fi.write('{:5} {:11} Sum of the radii           Ratio of the radii\n'.format((rA+rB)/sma, rB/rA))
-        fi.write('{:5} {:11} Orbital inclination (deg)  Mass ratio of the system\n'.format(incl, q))
-
-        # we'll provide ecosw and esinw instead of ecc and long_an
-        # jktebop's readme.txt states that so long as ecc is < 10,
-        # it will be intrepreted as ecosw and esinw (otherwise would
-        # need to be ecc+10 and long_an (deg)
-        fi.write('{:5} {:11} Orbital eccentricity       Periastron longitude deg\n'.format(ecosw, esinw))
-
-
-        fi.write('{:5} {:11} Gravity darkening (starA)  Grav darkening (starB)\n'.format(gravbA, gravbB))
-        fi.write('{:5} {:11} Surface brightness ratio   Amount of third light\n'.format(sbratio, 0.0))
-
-
-        fi.write('{:5} {:11} LD law type for star A     LD law type for star B\n'.format(_jktebop_ld_func[ldfuncA], _jktebop_ld_func[ldfuncB]))
-        fi.write('{:5} {:11} LD star A (linear coeff)   LD star B (linear coeff)\n'.format(ldcoeffsA[0], ldcoeffsB[0]))
-        fi.write('{:5} {:11} LD star A (nonlin coeff)   LD star B (nonlin coeff)\n'.format(ldcoeffsA[1] if len(ldcoeffsA)==2 else 0.0, ldcoeffsB[1] if len(ldcoeffsB)==2 else 0.0))
-
-        fi.write('{:5} {:11} Reflection effect star A   Reflection effect star B\n'.format(albA, albB))
-        fi.write('{:5} {:11} Phase of primary eclipse   Light scale factor (mag)\n'.format(0.0, 1.0))
-        fi.write('{:13}      Orbital period of eclipsing binary system (days)\n'.format(period))
-        fi.write('{:13}      Reference time of primary minimum (HJD)\n'.format(t0_supconj))
-
-        # All fitting will be done with PHOEBE wrappers, so we need to set
-        # all jktebop options for adjust to False (0)
-        fi.write(' {:d}  {:d}             Adjust RADII SUM or RADII RATIO (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust INCLINATION or MASSRATIO (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust ECCENTRICITY or OMEGA (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust GRAVDARK1 or GRAVDARK2 (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust SURFACEBRIGH2 or THIRDLIGHT (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust LD-lin1 or LD-lin2 (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust LD-nonlin1 or LD-nonlin2 (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust REFLECTION COEFFS 1 and 2 (-1, 0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust PHASESHIFT or SCALE FACTOR (0, 1, 2, 3)\n'.format(0, 0))
-        fi.write(' {:d}  {:d}             Adjust PERIOD or TZERO (min light) (0, 1, 2, 3)\n'.format(0, 0))
-
-        fi.write('{}  Name of file containing light curve\n'.format(tmpfilenamelcin))
-        fi.write('{}  Name of output parameter file\n'.format(tmpfilenameparamout))
-        fi.write('{}  Name of output light curve file\n'.format(tmpfilenamelcout))
-        fi.write('{}  Name of output model light curve fit file\n'.format(tmpfilenamemodelout))
-
-        # According to jktebop's readme.txt:
-        # FITTING FOR RADIAL VELOCITIES:    the observed RVs should be in separate files
-        # for the two stars and the data should be in the same format as the light curve
-        # data. Then add a line below the main input parameters for each rv file:
-        #   RV1  [infile]  [outfile]  [K]  [Vsys]  [vary(K)]  [vary(Vsys)]
-        #   RV2  [infile]  [outfile]  [K]  [Vsys]  [vary(K)]  [vary(Vsys)]
-        # where RV1 is for primary star velocities, RV2 is for secondary star velocities
-        # [infile] is the input data file, [outfile] is the output data file, [K] is the
-        # velocity amplitude of the star (km/s), [Vsys] is its systemic velocity (km/s),
-        # and [vary(K)] and [vary(Vsys)] are 0 to fix and 1 to fit for these quantities.
-        # The mass ratio parameter is not used for the RVs, only for the light curve.
-        # If you want to fix the systemic velocity for star B to that for star A, simply
-        # set vary(Vsys) for star B to be equal to -1
-        #~ fi.write('rv1 llaqr-rv1.dat llaqr-rv1.out 55.0 -10.0 0 0\n')
-        #~ fi.write('rv2 llaqr-rv2.dat llaqr-rv2.out 55.0 -10.0 0 0\n')
-        if info['kind'] == 'rv':
-            # NOTE: we disable systemic velocity as it will be added in bundle.run_compute
-            K = np.pi * (sma*u.solRad).to(u.km).value * np.sin((incl*u.deg).to(u.rad).value) / (period*u.d).to(u.s).value
-            fi.write('{} {} {} {} {} 0 0\n'.format('rv1' if info['component'] == starrefs[0] else 'rv2', tmpfilenamervin, tmpfilenamervout, K, 0.0))
-
-
-        # According to jktebop's readme.txt:
-        # NUMERICAL INTEGRATION:  long exposure times can be split up into NUMINT points
-        # occupying a total time interval of NINTERVAL (seconds) by including this line:
-        #   NUMI  [numint]  [ninterval]
-
-        # TODO: allow exposure times?
-
-
-        fi.close()
-
-        if info['kind'] == 'lc':
-            np.savetxt(tmpfilenamelcin, np.asarray([info['times'], np.ones_like(info['times'])]).T, fmt='%f')
-        elif info['kind'] == 'rv':
-            # we don't technically need them, but otherwise jktebop complains about not enough data to "fit" for task 3, even though we're holding everything fixed
-            np.savetxt(tmpfilenamelcin, np.asarray([info['times'], np.ones_like(info['times'])]).T, fmt='%f')
-            np.savetxt(tmpfilenamervin, np.asarray([info['times'], np.ones_like(info['times'])]).T, fmt='%f')
-        else:
-            raise NotImplementedError()
-
-        # run jktebop
-        out = commands.getoutput("jktebop {} > {}".format(tmpfilenamein, tmpfilenameout))
-
-
+        # jktebop was already run for all datasets in _worker_setup
+        values = kwargs.get('results')[(info['dataset'], info['component'])]
 
         # fill packets
         packetlist = []
 
         if info['kind'] == 'lc':
-            # parse output
-            times, _, _, _, mags, _ = np.loadtxt(tmpfilenamelcout, unpack=True)
-
-            logger.warning("converting from mags from jktebop to flux")
-            fluxes = 10**((0.0-mags)/2.5)
-            fluxes /= np.max(fluxes)
-
             packetlist.append(_make_packet('times',
                                            info['times']*u.d,
                                            None,
                                            info))
 
             packetlist.append(_make_packet('fluxes',
-                                           fluxes,
+                                           values,
                                            None,
                                            info))
 
         elif info['kind'] == 'rv':
-            times, _, _, _, rvs, _ = np.loadtxt(tmpfilenamervout, unpack=True)
-
             packetlist.append(_make_packet('times',
                                            info['times']*u.d,
                                            None,
                                            info))
 
             packetlist.append(_make_packet('rvs',
-                                           rvs*u.km/u.s,
+                                           values*u.km/u.s,
                                            None,
                                            info))
 
         else:
             raise NotImplementedError()
 
-
-        os.remove(tmpfilenamein)
-        os.remove(tmpfilenamelcin)
-        os.remove(tmpfilenamelcout)
-        if info['kind'] == 'rv':
-            os.remove(tmpfilenamervin)
-            os.remove(tmpfilenamervout)
-        os.remove(tmpfilenameparamout)
-        os.remove(tmpfilenamemodelout)
-        os.remove(tmpfilenameout)
-
         return packetlist
 
 
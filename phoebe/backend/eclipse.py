@@ -16,6 +16,61 @@ def _graham_scan_inside_hull(front, back):
     hull, inside = ceclipse.graham_scan_inside_hull(front[sa], back)
     return hull, inside
 
+def _visible_vertices(mesh, visibility):
+    """
+    Sky-plane coordinates of the (unique) vertices of all triangles that are
+    not hidden, along with the (N, 3) indices into those coordinates for each
+    of these triangles.
+    """
+    triangles = mesh.triangles[visibility > 0.0]
+    used = np.zeros(len(mesh.vertices), dtype=bool)
+    used[triangles] = True
+    lookup = np.cumsum(used) - 1
+    return mesh.vertices[used][:,:2], lookup[triangles]
+
+def _overlap_candidates(tri_sky, bodies):
+    """
+    Flag the triangles whose projection onto the sky-plane could overlap the
+    projection of a triangle belonging to a different body.
+
+    The sky-plane is binned into a grid of square cells at least as large as
+    the projected extent of any triangle, so that the bounding box of each
+    triangle touches at most the (up to) four cells at its corners.  Any two
+    overlapping triangles then share at least one of those cells, and so only
+    triangles in a cell touched by more than one body need to be considered.
+
+    :parameter array tri_sky: (N, 3, 2) sky-plane coordinates of the vertices
+        of each triangle
+    :parameter array bodies: (N,) index of the body of each triangle
+    :return: (N,) boolean array
+    """
+    if not len(tri_sky):
+        return np.zeros(0, dtype=bool)
+
+    lo = tri_sky.min(axis=1)
+    hi = tri_sky.max(axis=1)
+
+    cell = (hi - lo).max()
+    if cell <= 0.0:
+        return np.ones(len(tri_sky), dtype=bool)
+
+    origin = lo.min(axis=0)
+    ilo = np.floor((lo - origin) / cell).astype(np.int64)
+    ihi = np.floor((hi - origin) / cell).astype(np.int64)
+    ny = ihi[:,1].max() + 1
+
+    # (N, 4) flat indices of the cells at the corners of each bounding box
+    cells = np.vstack([ilo[:,0]*ny+ilo[:,1], ihi[:,0]*ny+ilo[:,1],
+                       ilo[:,0]*ny+ihi[:,1], ihi[:,0]*ny+ihi[:,1]]).T
+
+    # count the number of distinct bodies touching each (occupied) cell
+    nbodies = bodies.max() + 1
+    cell_bodies = np.unique(cells * nbodies + bodies[:,np.newaxis])
+    occupied, nbodies_per_cell = np.unique(cell_bodies // nbodies, return_counts=True)
+
+    shared = nbodies_per_cell[np.searchsorted(occupied, cells)] > 1
+    return shared.any(axis=1)
+
 """
 each of these functions needs to take meshes, xs, ys, zs.
 - meshes is a dictionary with keys being the component number of that mesh and
@@ -138,11 +193,17 @@ def only_horizon(meshes, xs, ys, zs, expose_horizon=False):
 
     return {comp_no: mesh.visibilities * (mesh.mus > 0).astype(int) for comp_no, mesh in meshes.items() if mesh is not None}, None, None
 
-def native(meshes, xs, ys, zs, expose_horizon=False, horizon_method='boolean'):
+def native(meshes, xs, ys, zs, expose_horizon=False, horizon_method='boolean',
+           convex=False):
     """
     TODO: add documentation
 
     this is the new eclipse detection method in libphoebe
+
+    If all bodies are `convex` (and `horizon_method` is 'boolean'), only the
+    triangles that could overlap a triangle of another body on the sky-plane
+    (see _overlap_candidates) are passed through libphoebe, all others are
+    visible exactly when facing the observer.
     """
 
     centers_flat = meshes.get_column_flat('centers')
@@ -160,6 +221,39 @@ def native(meshes, xs, ys, zs, expose_horizon=False, horizon_method='boolean'):
     # NOTE: this will need to flip if we change the convention on the z-direction
     viewing_vector = np.array([0., 0., 1.])
 
+    if convex and horizon_method=='boolean' and not expose_horizon:
+        # NOTE: bodies without a mesh (ie. distortion_method='none') return
+        # None and are excluded from the flat columns
+        bodies = meshes.pack_column_flat({c: np.full(len(triangles), i) for i, (c, triangles) in enumerate(meshes.get_column('triangles').items()) if triangles is not None})
+
+        front_facing = np.dot(normals_flat, viewing_vector) > 0
+        candidates = np.zeros(len(triangles_flat), dtype=bool)
+        candidates[front_facing] = _overlap_candidates(vertices_flat[triangles_flat[front_facing]][:,:,:2],
+                                                       bodies[front_facing])
+
+        logger.debug("native: passing {}/{} front-facing triangles through mesh_visibility".format(candidates.sum(), front_facing.sum()))
+
+        tvisibilities = front_facing.astype(float)
+        taweights = np.zeros((len(triangles_flat), 3))
+        taweights[front_facing] = 1./3
+
+        if np.any(candidates):
+            info = libphoebe.mesh_visibility(viewing_vector,
+                                             vertices_flat,
+                                             triangles_flat[candidates],
+                                             normals_flat[candidates],
+                                             tvisibilities=True,
+                                             taweights=True,
+                                             method=_bytes(horizon_method),
+                                             horizon=False)
+
+            tvisibilities[candidates] = info['tvisibilities']
+            taweights[candidates] = info['taweights']
+
+        visibilities = meshes.unpack_column_flat(tvisibilities, computed_type='triangles')
+        weights = meshes.unpack_column_flat(taweights, computed_type='triangles')
+
+        return visibilities, weights, None
 
     # we need to send in ALL vertices but only the visible triangle information
     info = libphoebe.mesh_visibility(viewing_vector,
@@ -253,20 +347,26 @@ def graham(meshes, xs, ys, zs, expose_horizon=False):
             min_size_back = mesh_back.areas.min()
             distance = distance_factor * 2.0/3**0.25*np.sqrt(min_size_back)
 
-            # Select only those triangles that are not hidden
-            tri_back_vis = mesh_back.vertices_per_triangle[visibility_back > 0.0].reshape(-1,9)
-            tri_front_vis = mesh_front.vertices_per_triangle[visibility_front > 0.0].reshape(-1,9)
-
-            back = np.vstack([tri_back_vis[:,0:2], tri_back_vis[:,3:5], tri_back_vis[:,6:8]])
-            front = np.vstack([tri_front_vis[:,0:2], tri_front_vis[:,3:5], tri_front_vis[:,6:8]])
+            # Select only those triangles that are not hidden (and each of
+            # their vertices only once)
+            back, back_tri_inds = _visible_vertices(mesh_back, visibility_back)
+            front, _ = _visible_vertices(mesh_front, visibility_front)
 
             # Star in front ---> star in back
             if not front.shape[0]:
                 continue
 
-            hull, inside = _graham_scan_inside_hull(front, back)
-            hidden = inside.reshape(3,-1).all(axis=0)
-            visible = ~(inside.reshape(3,-1).any(axis=0))
+            # only vertices in the back within the bounding box of the front
+            # star can be inside its hull
+            overlap = np.all((back >= front.min(axis=0)) & (back <= front.max(axis=0)), axis=1)
+
+            inside_vertices = np.zeros(len(back), dtype=bool)
+            if np.any(overlap):
+                hull, inside_vertices[overlap] = _graham_scan_inside_hull(front, back[overlap])
+
+            inside = inside_vertices[back_tri_inds]
+            hidden = inside.all(axis=1)
+            visible = ~(inside.any(axis=1))
 
             # Triangles that are partially hidden are those that are not
             # completely hidden, but do have at least one vertex hidden
@@ -302,3 +402,82 @@ def graham(meshes, xs, ys, zs, expose_horizon=False):
 
 
     return visibilities, None, None
+
+
+def disk_quadrature(nmu=1000):
+    """
+    Radial quadrature over the disk of a sphere of unit radius.
+
+    The nodes are equally spaced in the angle, theta, from the center of the
+    disk as seen by the observer (r = sin(theta), mu = cos(theta)), so that they
+    are dense near the limb, where the intensity changes most quickly, without
+    under-sampling the center of the disk.
+
+    :parameter int nmu: number of quadrature nodes
+    :return: radii (r) and projected cosines (mu) of the nodes, and the
+        projected area of the annulus around each node, dA = 2 r dr (normalized
+        to sum to 1 for the full disk)
+    """
+    dtheta = 0.5*np.pi/nmu
+    theta = (np.arange(nmu) + 0.5)*dtheta
+    rs = np.sin(theta)
+    mus = np.cos(theta)
+    dAs = 2*rs*mus*dtheta
+    return rs, mus, dAs/dAs.sum()
+
+def occulted_arc_fractions(rs, d, p):
+    """
+    Fraction of the circumference of each annulus of radius `rs` (centered at
+    the origin) that is covered by a disk of radius `p` at a sky-plane
+    separation of `d`.  All lengths are in units of the radius of the
+    occulted body.
+
+    :parameter array rs: radii of the annuli
+    :parameter float d: separation between the centers
+    :parameter float p: radius of the occulting disk
+    :return: array with the same shape as `rs`
+    """
+    if d >= 1 + p:
+        return np.zeros_like(rs)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_half_arc = (rs**2 + d**2 - p**2) / (2*rs*max(d, 1e-12))
+    # cos_half_arc <= -1: the annulus is entirely within the occulting disk
+    # cos_half_arc >= 1: the annulus entirely misses the occulting disk
+    return np.arccos(np.clip(cos_half_arc, -1, 1)) / np.pi
+
+def sphere_visible_fractions(xs, ys, zs, rs, quadrature, weights):
+    """
+    Visible fraction of the flux of each limb-darkened sphere, accounting for
+    the (disks of) all spheres closer to the observer.
+
+    NOTE: the arcs covered by multiple occultors are summed (and clipped at 1)
+    per-annulus, which is only exact if the occultors do not overlap each
+    other on the disk of the occulted sphere.
+
+    :parameter array xs: sky-plane x-positions of the centers of each sphere
+    :parameter array ys: sky-plane y-positions of the centers of each sphere
+    :parameter array zs: z-positions (towards the observer) of each sphere
+    :parameter array rs: radii of each sphere (same units as the positions)
+    :parameter tuple quadrature: radii, mus, and projected areas of the annuli
+        as returned by <phoebe.backend.eclipse.disk_quadrature>
+    :parameter list weights: limb-darkened intensity of each sphere at each
+        quadrature node (any normalization)
+    :return: array with the visible fraction of each sphere
+    """
+    rnodes, _, dAs = quadrature
+    nbodies = len(rs)
+    fractions = np.ones(nbodies)
+    for i_back in range(nbodies):
+        covered = np.zeros_like(rnodes)
+        for i_front in range(nbodies):
+            if i_front == i_back or zs[i_front] <= zs[i_back]:
+                continue
+            d = np.hypot(xs[i_front]-xs[i_back], ys[i_front]-ys[i_back]) / rs[i_back]
+            covered += occulted_arc_fractions(rnodes, d, rs[i_front]/rs[i_back])
+
+        if np.any(covered):
+            fluxes = weights[i_back]*dAs
+            fractions[i_back] = 1 - np.sum(fluxes*np.minimum(covered, 1)) / np.sum(fluxes)
+
+    return fractions
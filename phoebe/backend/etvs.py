@@ -1,8 +1,7 @@
 import logging
 import numpy as np
 from phoebe import dynamics
-
-from scipy.optimize import newton
+from phoebe import u
 
 logger = logging.getLogger("ETVS")
 
@@ -12,42 +11,135 @@ def barycentric():
     raise NotImplementedError
 
 
-def crossing(b, component, time, dynamics_method='keplerian', ltte=True, tol=1e-4, maxiter=1000):
+def _keplerian_sibling_elements(b, cind1, cind2, compute=None, ltte=True):
     """
-    tol in days
+    Extract the (nested) Keplerian elements of two stars once, padded to the
+    same number of levels so they can be passed to
+    :func:`phoebe.dynamics.keplerian.dynamics_batch`.
     """
-
-
-    def projected_separation_sq(time, b, dynamics_method, cind1, cind2, ltte=True):
-        """
-        """
-        #print "*** projected_separation_sq", time, dynamics_method, cind1, cind2, ltte
-
-
-        times = np.array([time])
-
-        if dynamics_method in ['nbody', 'rebound']:
-            # TODO: make sure that this takes systemic velocity and corrects positions and velocities (including ltte effects if enabled)
-            ts, xs, ys, zs, vxs, vys, vzs = dynamics.nbody.dynamics_from_bundle(b, times, compute=None, ltte=ltte)
-
-        elif dynamics_method=='bs':
-            ts, xs, ys, zs, vxs, vys, vzs = dynamics.nbody.dynamics_from_bundle_bs(b, times, compute, ltte=ltte)
-
-        elif dynamics_method=='keplerian':
-            # TODO: make sure that this takes systemic velocity and corrects positions and velocities (including ltte effects if enabled)
-            ts, xs, ys, zs, vxs, vys, vzs = dynamics.keplerian.dynamics_from_bundle(b, times, compute=None, ltte=ltte, return_euler=False)
-
+    elements = dynamics.keplerian._elements_from_bundle(b, compute=compute, ltte=ltte)
+
+    keys = ['periods', 'eccs', 'smas', 't0_perpasses', 'per0s', 'long_ans',
+            'incls', 'dpdts', 'deccdts', 'dperdts', 'components']
+    nlevels = max(len(elements['periods'][cind]) for cind in [cind1, cind2])
+
+    batch_elements = {}
+    for key in keys:
+        values = []
+        for cind in [cind1, cind2]:
+            value = list(elements[key][cind])
+            # padded levels have an sma of 0 (and so do not contribute) but
+            # need a finite period
+            pad = {'periods': 1.0, 'components': 'primary'}.get(key, 0.0)
+            values.append(value + [pad]*(nlevels-len(value)))
+        batch_elements[key] = values if key == 'components' else np.array(values)[np.newaxis, ...]
+
+    batch_elements['t0'] = elements['t0']
+    batch_elements['vgamma'] = elements['vgamma']
+    return batch_elements
+
+
+def crossings(b, component, times, dynamics_method='keplerian', ltte=True,
+              tol=1e-4, maxiter=50, compute=None):
+    """
+    Find the times at which the sky-projected separation between `component`
+    and its sibling is at a minimum (ie mid-eclipse for an eclipsing pair),
+    closest to each of `times`.
+
+    The orbital elements (or initial conditions) are only read from the bundle
+    once and the minima for all `times` are then found simultaneously with
+    (vectorized) Newton iterations on the derivative of the squared
+    sky-projected separation.  For keplerian dynamics, the second derivative
+    is computed analytically from the relative (two-body) acceleration of the
+    siblings.  Otherwise, the Gauss-Newton approximation (neglecting the
+    acceleration) is used.
+
+    Arguments
+    -----------
+    * `b` (Bundle): the bundle with a set hierarchy
+    * `component` (string): the star whose eclipses should be timed
+    * `times` (array): initial guesses (ie the ephemeris times) [d]
+    * `dynamics_method` (string, optional, default='keplerian')
+    * `ltte` (bool, optional, default=True): whether to account for light
+        travel time effects.
+    * `tol` (float, optional, default=1e-4): tolerance on the eclipse times [d]
+    * `maxiter` (int, optional, default=50): maximum number of Newton iterations
+    * `compute` (string, optional, default=None): label of the compute options
+
+    Returns
+    ----------
+    * (array) eclipse times with the same shape as `times` [d]
+    """
+    hier = b.hierarchy
+    starrefs = hier.get_stars()
+    cind1 = starrefs.index(component)
+    cind2 = starrefs.index(hier.get_sibling_of(component))
+    period = b.get_value(qualifier='period', component=hier.get_parent_of(component), context='component', unit=u.d, check_visible=False)
+
+    times = np.asarray(times, dtype=float)
+    shape = times.shape
+    times = times.ravel()
+
+    if dynamics_method == 'keplerian':
+        elements = _keplerian_sibling_elements(b, cind1, cind2, compute=compute, ltte=ltte)
+        # the siblings' relative orbit is a two-body Keplerian orbit with
+        # GM = 4 pi^2 a^3 / P^2 (where a is the sum of their smas)
+        sma = elements['smas'][0, 0, 0] + elements['smas'][0, 1, 0]
+        GM = 4*np.pi**2*sma**3/elements['periods'][0, 0, 0]**2
+
+        def relative_motion(ts):
+            _, xs, ys, zs, vxs, vys, vzs = dynamics.keplerian.dynamics_batch(ts, ltte=ltte, **elements)
+            dr = [xs[0,1]-xs[0,0], ys[0,1]-ys[0,0], zs[0,1]-zs[0,0]]
+            dv = [vxs[0,1]-vxs[0,0], vys[0,1]-vys[0,0]]
+            r3 = (dr[0]**2 + dr[1]**2 + dr[2]**2)**1.5
+            da = [-GM*dr[0]/r3, -GM*dr[1]/r3]
+            return dr[:2], dv, da
+
+    elif dynamics_method in ['nbody', 'rebound', 'bs']:
+        if dynamics_method == 'bs':
+            get_dynamics = lambda ts: dynamics.nbody.dynamics_from_bundle_bs(b, ts, compute, ltte=ltte)
         else:
-            raise NotImplementedError
-
-
-        return (xs[cind2][0]-xs[cind1][0])**2 + (ys[cind2][0]-ys[cind1][0])**2
+            nbody_elements = dynamics.nbody._elements_from_bundle(b, compute=compute, ltte=ltte)
+            get_dynamics = lambda ts: dynamics.nbody.dynamics(ts, **nbody_elements)
+
+        def relative_motion(ts):
+            _, xs, ys, zs, vxs, vys, vzs = get_dynamics(ts)
+            dr = [xs[cind2]-xs[cind1], ys[cind2]-ys[cind1]]
+            dv = [vxs[cind2]-vxs[cind1], vys[cind2]-vys[cind1]]
+            return dr, dv, None
+
+    else:
+        raise NotImplementedError("dynamics_method='{}' not supported for etvs".format(dynamics_method))
+
+    # never step more than an eighth of the orbit so that we stay with the
+    # minimum (rather than the maximum) closest to the initial guess
+    max_step = period / 8.
+
+    time_ecls = times.copy()
+    for i in range(maxiter):
+        dr, dv, da = relative_motion(time_ecls)
+        # derivative (and second derivative) of half the squared separation
+        deriv = dr[0]*dv[0] + dr[1]*dv[1]
+        curv = dv[0]**2 + dv[1]**2
+        if da is not None:
+            curv_full = curv + dr[0]*da[0] + dr[1]*da[1]
+            curv = np.where(curv_full > 0, curv_full, curv)
+
+        step = np.clip(deriv / curv, -max_step, max_step)
+        time_ecls -= step
+        if np.all(abs(step) < tol):
+            break
+    else:
+        logger.warning("crossings did not converge to tol={} within {} iterations".format(tol, maxiter))
+
+    return time_ecls.reshape(shape)
 
 
-    # TODO: optimize this by allowing to pass cind1 and cind2 directly (and fallback to this if they aren't)
-    starrefs = b.hierarchy.get_stars()
-    cind1 = starrefs.index(component)
-    cind2 = starrefs.index(b.hierarchy.get_sibling_of(component))
+def crossing(b, component, time, dynamics_method='keplerian', ltte=True, tol=1e-4, maxiter=1000):
+    """
+    tol in days
 
-    # TODO: provide options for tol and maxiter (in the frontend computeoptionsp)?
-    return newton(projected_separation_sq, x0=time, args=(b, dynamics_method, cind1, cind2, ltte), tol=tol, maxiter=maxiter)
+    See :func:`crossings` to compute the eclipse times for many cycles at once.
+    """
+    return crossings(b, component, [time], dynamics_method=dynamics_method,
+                     ltte=ltte, tol=tol, maxiter=maxiter)[0]
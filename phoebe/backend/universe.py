@@ -1,5 +1,6 @@
 import numpy as np
 from scipy.optimize import newton
+from scipy.signal import convolve as _convolve
 from scipy.special import sph_harm as Y
 from math import sqrt, sin, cos, acos, atan2, trunc, pi
 import sys, os
@@ -61,6 +62,45 @@ Feature - general Class of all features: any new type of feature needs to subcla
 def g_rel_to_abs(mass, sma):
     return c.G.si.value*c.M_sun.si.value*mass/(sma*c.R_sun.si.value)**2*100. # 100 for m/s**2 -> cm/s**2
 
+def _get_ldatm(atm, ld_mode, ld_coeffs_source):
+    """
+    Atmosphere table to use for limb-darkening (ldint and ld_coeffs lookups)
+    given the `atm`, `ld_mode`, and `ld_coeffs_source` of a dataset.
+    """
+    if ld_mode == 'interp':
+        return atm
+    elif ld_mode == 'lookup':
+        if ld_coeffs_source == 'auto':
+            if atm in ['blackbody', 'extern_atmx', 'extern_planckint']:
+                return 'ck2004'
+            else:
+                return atm
+        else:
+            return ld_coeffs_source
+    elif ld_mode == 'manual':
+        return 'none'
+    else:
+        raise NotImplementedError
+
+# id of the System currently owning the view-factor matrix and radiosity
+# solution stored within libphoebe (see System._reflection_reuse_kwargs)
+_refl_store_owner = {}
+
+def _rigid_residual(vertices_ref, vertices):
+    """
+    Maximum displacement between two sets of (corresponding) vertices after
+    removing the best-fitting rigid rotation and translation (Kabsch), relative
+    to the extent of the vertices.
+    """
+    ref = vertices_ref - vertices_ref.mean(axis=0)
+    cur = vertices - vertices.mean(axis=0)
+    u_, s_, vt = np.linalg.svd(np.dot(ref.T, cur))
+    d = np.sign(np.linalg.det(np.dot(u_, vt)))
+    rot = np.dot(u_ * np.array([1., 1., d]), vt)
+    residual = np.sqrt(np.max(np.sum((np.dot(ref, rot) - cur)**2, axis=1)))
+    extent = np.sqrt(np.max(np.sum(cur**2, axis=1)))
+    return residual / extent
+
 def _get_classname(kind, distortion_method):
     kind = kind.title()
     if kind == 'Envelope':
@@ -95,12 +135,75 @@ def _estimate_delta(ntriangles, area):
     return np.sqrt(4./np.sqrt(3) * float(area) / float(ntriangles))
 
 
+# number of velocity-histogram bins per wavelength step used by _lp_depth
+_lp_oversample = 4
+
+def _lp_depth(wavelengths, dls, weights, depth):
+    """
+    Compute the weighted average of the line depths, depth(wavelengths-dl),
+    over all (visible) triangles.
+
+    Instead of shifting the intrinsic line for every triangle, the Doppler
+    shifts are binned into a weighted histogram (with linear, cloud-in-cell,
+    assignment to the two nearest bins) with a bin-width of the wavelength
+    step divided by _lp_oversample.  This histogram is then convolved with the
+    intrinsic line depth (which scipy will do by FFT when faster).  For
+    non-uniform wavelength grids (where the bin-width is based on the median
+    wavelength step), the histogram is instead summed directly against the
+    depth at each wavelength.
+    """
+    wavelengths = np.asarray(wavelengths, dtype=float)
+    if np.any(np.diff(wavelengths) < 0):
+        order = np.argsort(wavelengths)
+        avg_depth = np.empty_like(wavelengths)
+        avg_depth[order] = _lp_depth(wavelengths[order], dls, weights, depth)
+        return avg_depth
+
+    weights_sum = np.sum(weights)
+    if len(wavelengths) < 2:
+        return np.array([np.sum(weights*depth(wavelengths[0]-dls))/weights_sum]) if len(wavelengths) else np.array([])
+
+    dwavelengths = np.diff(wavelengths)
+    uniform = np.allclose(dwavelengths, dwavelengths[0], rtol=1e-6, atol=0)
+    step = (dwavelengths[0] if uniform else np.median(dwavelengths[dwavelengths > 0])) / _lp_oversample
+
+    # histogram of the Doppler shifts, dl = dl_min + k * step
+    dl_min = dls.min()
+    k = (dls - dl_min) / step
+    k0 = np.floor(k).astype(int)
+    frac = k - k0
+    hist = np.bincount(k0, weights=weights*(1-frac), minlength=k0.max()+2)
+    hist += np.bincount(k0+1, weights=weights*frac, minlength=k0.max()+2)
+    nbins = len(hist)
+
+    if uniform:
+        # wavelengths[j] - (dl_min + k*step) = wavelengths[0] - dl_min + (j*_lp_oversample - k)*step
+        # so we need the depth on the fine grid m = j*_lp_oversample - k for
+        # m from -(nbins-1) to (len(wavelengths)-1)*_lp_oversample
+        m = np.arange(-(nbins-1), (len(wavelengths)-1)*_lp_oversample+1)
+        depth_fine = depth(wavelengths[0] - dl_min + m*step)
+        avg_depth = _convolve(depth_fine, hist, mode='valid', method='auto')[::_lp_oversample]
+    else:
+        nonzero = hist != 0
+        dl_bins = dl_min + np.arange(nbins)[nonzero]*step
+        hist = hist[nonzero]
+        # evaluate in chunks of wavelengths to limit the size of the
+        # (wavelengths x bins) array
+        chunk_size = max(int(1e6 // len(hist)), 1)
+        avg_depth = np.concatenate([depth(wavelengths[i:i+chunk_size, np.newaxis]-dl_bins[np.newaxis, :]).dot(hist) for i in range(0, len(wavelengths), chunk_size)])
+
+    return avg_depth / weights_sum
+
+
 class System(object):
     def __init__(self, bodies_dict, eclipse_method='graham',
                  horizon_method='boolean',
                  dynamics_method='keplerian',
                  irrad_method='none',
+                 irrad_warm_start=False,
+                 irrad_reuse_tol=0.0,
                  boosting_method='none',
+                 intens_visible_only=False,
                  parent_envelope_of={}):
         """
         :parameter dict bodies_dict: dictionary of component names and Bodies (or subclass of Body)
@@ -111,13 +214,24 @@ class System(object):
         self.horizon_method = horizon_method
         self.dynamics_method = dynamics_method
         self.irrad_method = irrad_method
+        self.irrad_warm_start = irrad_warm_start
+        self.irrad_reuse_tol = irrad_reuse_tol
 
         self.is_first_refl_iteration = True
+        # geometry (and ld) for which libphoebe currently stores the
+        # view-factor matrix and radiosity solution on our behalf
+        self._refl_stored = None
+
+        # limb-darkened profiles of spherical stars (per-dataset) for
+        # observe_analytical
+        self._ld_profiles = {}
+        self._disk_quadrature = eclipse.disk_quadrature()
 
         for body in self._bodies.values():
             body.system = self
             body.dynamics_method = dynamics_method
             body.boosting_method = boosting_method
+            body.intens_visible_only = intens_visible_only
 
         return
 
@@ -158,13 +272,19 @@ class System(object):
             horizon_method = compute_ps.get_value(qualifier='horizon_method', horizon_method=kwargs.get('horizon_method', None), **_skip_filter_checks)
             dynamics_method = compute_ps.get_value(qualifier='dynamics_method', dynamics_method=kwargs.get('dynamics_method', None), **_skip_filter_checks)
             irrad_method = compute_ps.get_value(qualifier='irrad_method', irrad_method=kwargs.get('irrad_method', None), **_skip_filter_checks)
+            irrad_warm_start = compute_ps.get_value(qualifier='irrad_warm_start', irrad_warm_start=kwargs.get('irrad_warm_start', None), default=False, **_skip_filter_checks)
+            irrad_reuse_tol = compute_ps.get_value(qualifier='irrad_reuse_tol', irrad_reuse_tol=kwargs.get('irrad_reuse_tol', None), default=0.0, **_skip_filter_checks)
             boosting_method = compute_ps.get_value(qualifier='boosting_method', boosting_method=kwargs.get('boosting_method', None), **_skip_filter_checks)
+            intens_visible_only = compute_ps.get_value(qualifier='intens_visible_only', intens_visible_only=kwargs.get('intens_visible_only', None), default=False, **_skip_filter_checks)
         else:
             eclipse_method = 'native'
             horizon_method = 'boolean'
             dynamics_method = 'keplerian'
             irrad_method = 'none'
+            irrad_warm_start = False
+            irrad_reuse_tol = 0.0
             boosting_method = 'none'
+            intens_visible_only = False
             compute_ps = None
 
         # NOTE: here we use globals()[Classname] because getattr doesn't work in
@@ -200,7 +320,10 @@ class System(object):
                    horizon_method=horizon_method,
                    dynamics_method=dynamics_method,
                    irrad_method=irrad_method,
+                   irrad_warm_start=irrad_warm_start,
+                   irrad_reuse_tol=irrad_reuse_tol,
                    boosting_method=boosting_method,
+                   intens_visible_only=intens_visible_only,
                    parent_envelope_of=parent_envelope_of)
 
     def items(self):
@@ -365,6 +488,7 @@ class System(object):
 
             ld_func_and_coeffs = [tuple([_bytes(body.ld_func['bol'])] + [np.asarray(body.ld_coeffs['bol'])]) for body in self.bodies]
             logger.debug("irradiation ld_func_and_coeffs: {}".format(ld_func_and_coeffs))
+            refl_kwargs = self._reflection_reuse_kwargs('convex', vertices_per_body, ld_func_and_coeffs)
             fluxes_intrins_and_refl_per_body = libphoebe.mesh_radiosity_problem_nbody_convex(vertices_per_body,
                                                                                        triangles_per_body,
                                                                                        normals_per_body,
@@ -373,7 +497,8 @@ class System(object):
                                                                                        fluxes_intrins_per_body,
                                                                                        ld_func_and_coeffs,
                                                                                        _bytes(self.irrad_method.title()),
-                                                                                       support=_bytes('vertices')
+                                                                                       support=_bytes('vertices'),
+                                                                                       **refl_kwargs
                                                                                        )
 
             fluxes_intrins_and_refl_flat = meshes.pack_column_flat(fluxes_intrins_and_refl_per_body)
@@ -389,6 +514,7 @@ class System(object):
 
             ld_func_and_coeffs = [tuple([_bytes(body.ld_func['bol'])] + [np.asarray(body.ld_coeffs['bol'])]) for body in self.mesh_bodies] # list
             ld_inds_flat = meshes.pack_column_flat({body.comp_no: np.full(fluxes.shape, body.comp_no-1) for body, fluxes in zip(self.mesh_bodies, fluxes_intrins_per_body)}) # np.ndarray
+            refl_kwargs = self._reflection_reuse_kwargs('general', [vertices_flat], ld_func_and_coeffs)
 
             fluxes_intrins_and_refl_flat = libphoebe.mesh_radiosity_problem(vertices_flat,
                                                                             triangles_flat,
@@ -399,7 +525,8 @@ class System(object):
                                                                             ld_func_and_coeffs,
                                                                             ld_inds_flat,
                                                                             _bytes(self.irrad_method.title()),
-                                                                            support=_bytes('vertices')
+                                                                            support=_bytes('vertices'),
+                                                                            **refl_kwargs
                                                                             )
 
 
@@ -425,6 +552,56 @@ class System(object):
 
             self.is_first_refl_iteration = False
 
+    def _reflection_reuse_kwargs(self, case, vertices_per_body, ld_func_and_coeffs):
+        """
+        Determine whether libphoebe should reuse the view-factor matrix
+        and/or warm-start the radiosity solver from its previous solution.
+
+        libphoebe stores a single matrix and solution (per case), so these are
+        only reused if the last call was made by this same system, with the
+        same case, limb-darkening and mesh sizes.  The matrix is only
+        reused if the current vertices differ from those for which it was
+        computed by at most `irrad_reuse_tol` (relative to the size of the
+        system) after removing any rigid rotation and translation, under
+        which all view-factors are invariant.
+
+        :parameter str case: 'convex' or 'general'
+        :parameter list vertices_per_body: list of vertex arrays
+        :parameter list ld_func_and_coeffs: as passed to libphoebe
+        :return: dictionary of kwargs to pass to libphoebe
+        """
+        global _refl_store_owner
+
+        if not self.irrad_warm_start and self.irrad_reuse_tol <= 0:
+            self._refl_stored = None
+            return {}
+
+        ld = [(ld_func, tuple(np.atleast_1d(ld_coeffs))) for ld_func, ld_coeffs in ld_func_and_coeffs]
+        shapes = [v.shape for v in vertices_per_body]
+        vertices = np.concatenate(vertices_per_body)
+
+        stored = self._refl_stored
+        valid = stored is not None and \
+                _refl_store_owner.get(case) == id(self) and \
+                stored['case'] == case and \
+                stored['ld'] == ld and \
+                stored['shapes'] == shapes
+
+        reuse_matrix = False
+        if valid and self.irrad_reuse_tol > 0:
+            residual = _rigid_residual(stored['vertices'], vertices)
+            logger.debug("reflection: relative non-rigid change in geometry since view-factors were computed: {}".format(residual))
+            reuse_matrix = residual <= self.irrad_reuse_tol
+
+        if not reuse_matrix:
+            self._refl_stored = {'case': case, 'ld': ld, 'shapes': shapes,
+                                 'vertices': vertices.copy()}
+            _refl_store_owner[case] = id(self)
+
+        return {'store': True,
+                'reuse_matrix': reuse_matrix,
+                'warm_start': valid and self.irrad_warm_start}
+
     def handle_eclipses(self, expose_horizon=False, **kwargs):
         """
         Detect the triangles at the horizon and the eclipsed triangles, handling
@@ -481,7 +658,8 @@ class System(object):
         ecl_func = getattr(eclipse, eclipse_method)
 
         if eclipse_method=='native':
-            ecl_kwargs = {'horizon_method': horizon_method}
+            ecl_kwargs = {'horizon_method': horizon_method,
+                          'convex': np.all([body.is_convex for body in self.bodies])}
         else:
             ecl_kwargs = {}
 
@@ -508,6 +686,53 @@ class System(object):
         return horizon
 
 
+    def observe_analytical(self, dataset, xs, ys, zs, components=None):
+        """
+        Compute the flux of an lc dataset by integrating the limb-darkened
+        intensity profiles over the visible disks of all (spherical) stars,
+        given only their positions.  This does not require (or touch) the meshes.
+
+        The out-of-eclipse flux of each star is pi R**2 * Inorm * ldint (the
+        same disk-integrated intensity used to compute luminosities), and
+        eclipses remove the flux of the occulted annuli (see
+        <phoebe.backend.eclipse.sphere_visible_fractions>).
+
+        :parameter str dataset: label of the lc dataset
+        :parameter list xs: x-positions (solRad) of each star at this time
+        :parameter list ys: y-positions (solRad) of each star at this time
+        :parameter list zs: z-positions (solRad) of each star at this time
+        :parameter components: components to include (defaults to all)
+        :return: dictionary with the flux
+        """
+        bodies = self.bodies
+        if dataset not in self._ld_profiles.keys():
+            # the spheres have uniform teff and logg, so the profiles only need
+            # to be computed once per dataset
+            self._ld_profiles[dataset] = [body.get_ld_profile(dataset, self._disk_quadrature[1]) for body in bodies]
+        profiles = self._ld_profiles[dataset]
+
+        rs = np.array([body.requiv for body in bodies])
+        if self.eclipse_method in ['none', 'only_horizon']:
+            visible_fractions = np.ones(len(bodies))
+        else:
+            visible_fractions = eclipse.sphere_visible_fractions([xs[body.ind_self] for body in bodies],
+                                                                 [ys[body.ind_self] for body in bodies],
+                                                                 [zs[body.ind_self] for body in bodies],
+                                                                 rs, self._disk_quadrature,
+                                                                 [profile['abs_intensities'] for profile in profiles])
+
+        if isinstance(components, str):
+            components = [components]
+
+        flux = 0.0
+        for body, profile, r, visible_fraction in zip(bodies, profiles, rs, visible_fractions):
+            if components is not None and body.component not in components:
+                continue
+            area = np.pi*(r*c.R_sun.si.value)**2
+            flux += area * profile['abs_normal_intensity'] * profile['ldint'] * profile['ptfarea'] * body.get_pblum_scale(dataset) * visible_fraction
+
+        return {'flux': flux}
+
     def observe(self, dataset, kind, components=None, **kwargs):
         """
         TODO: add documentation
@@ -539,22 +764,23 @@ class System(object):
                 raise NotImplementedError("profile_func='{}' not supported".format(profile_func))
 
             visibilities = meshes.get_column_flat('visibilities', components)
+            if not np.any(visibilities):
+                return {'flux_densities': np.full_like(wavelengths, np.nan)}
 
-            abs_intensities = meshes.get_column_flat('abs_intensities:{}'.format(dataset), components)
+            # only visible triangles contribute to the line profile
+            visible = visibilities > 0
+            abs_intensities = meshes.get_column_flat('abs_intensities:{}'.format(dataset), components)[visible]
             # mus here will be from the tnormals of the triangle and will not
             # be weighted by the visibility of the triangle
-            mus = meshes.get_column_flat('mus', components)
-            areas = meshes.get_column_flat('areas_si', components)
+            mus = meshes.get_column_flat('mus', components)[visible]
+            areas = meshes.get_column_flat('areas_si', components)[visible]
 
-            rvs = (meshes.get_column_flat("rvs:{}".format(dataset), components)*u.solRad/u.d).to(u.m/u.s).value
+            rvs = (meshes.get_column_flat("rvs:{}".format(dataset), components)[visible]*u.solRad/u.d).to(u.m/u.s).value
             dls = rvs*profile_rest/c.c.si.value
 
-            line = func(sv(wavelengths, profile_rest, profile_sv))
-            lines = np.array([np.interp(wavelengths, wavelengths+dl, line) for dl in dls])
-            if not np.any(visibilities):
-                avg_line = np.full_like(wavelengths, np.nan)
-            else:
-                avg_line = np.average(lines, axis=0, weights=abs_intensities*areas*mus*visibilities)
+            weights = abs_intensities*areas*mus*visibilities[visible]
+            depth = lambda wavelengths: 1-func(sv(wavelengths, profile_rest, profile_sv))
+            avg_line = 1-_lp_depth(wavelengths, dls, weights, depth)
 
             return {'flux_densities': avg_line}
 
@@ -1675,6 +1901,75 @@ class Star(Body):
             #logger.warning("no pblum scale found for dataset: {}".format(dataset))
             return 1.0
 
+    def get_ld_profile(self, dataset, mus, **kwargs):
+        """
+        Compute the limb-darkened intensity profile of this star (assumed to be
+        a sphere with uniform teff and logg) at `mus` directly from the
+        passband, without needing a mesh.
+
+        This is used to compute analytical light curves (see
+        <phoebe.backend.universe.System.observe_analytical>).
+
+        :parameter str dataset: label of the dataset
+        :parameter array mus: projected cosines at which to evaluate the profile
+        :return: dictionary with the normal intensity, the (limb-darkened)
+            intensities at `mus`, ldint, and ptfarea (all unscaled by pblum)
+        """
+        logger.debug("{}.get_ld_profile(dataset={})".format(self.component, dataset))
+
+        passband = kwargs.get('passband', self.passband.get(dataset, None))
+        intens_weighting = kwargs.get('intens_weighting', self.intens_weighting.get(dataset, None))
+        atm = kwargs.get('atm', self.atm)
+        extinct = kwargs.get('extinct', self.extinct)
+        Rv = kwargs.get('Rv', self.Rv)
+        ld_mode = kwargs.get('ld_mode', self.ld_mode.get(dataset, None))
+        ld_func = kwargs.get('ld_func', self.ld_func.get(dataset, None))
+        ld_coeffs = kwargs.get('ld_coeffs', self.ld_coeffs.get(dataset, None)) if ld_mode == 'manual' else None
+        ld_coeffs_source = kwargs.get('ld_coeffs_source', self.ld_coeffs_source.get(dataset, 'none')) if ld_mode == 'lookup' else None
+        ldatm = _get_ldatm(atm, ld_mode, ld_coeffs_source)
+
+        pb = passbands.get_passband(passband)
+        if intens_weighting=='photon':
+            ptfarea = pb.ptf_photon_area/pb.h/pb.c
+        else:
+            ptfarea = pb.ptf_area
+
+        # for a sphere, |grad(Omega)| is 1/r**2 (in units of the scale), so the
+        # surface gravity is g_rel_to_abs evaluated at requiv
+        mus = np.asarray(mus, dtype=float)
+        teffs = np.full(len(mus), self.teff)
+        loggs = np.full(len(mus), np.log10(g_rel_to_abs(self.masses[self.ind_self], self.requiv)))
+        abuns = np.full(len(mus), self.abun)
+
+        abs_normal_intensities, abs_intensities, ldint = pb.Inorm_Imu_ldint(Teff=teffs,
+                                                                          logg=loggs,
+                                                                          abun=abuns,
+                                                                          mu=mus,
+                                                                          atm=atm,
+                                                                          ldatm=ldatm,
+                                                                          ld_func=ld_func if ld_mode != 'interp' else ld_mode,
+                                                                          ld_coeffs=ld_coeffs,
+                                                                          photon_weighted=intens_weighting=='photon')
+
+        if extinct != 0.0:
+            # extinction is NOT aspect dependent, so we'll correct both
+            # normal and directional intensities
+            extinct_factors = pb.interpolate_extinct(Teff=teffs[:1],
+                                                     logg=loggs[:1],
+                                                     abun=abuns[:1],
+                                                     extinct=extinct,
+                                                     Rv=Rv,
+                                                     atm=atm,
+                                                     photon_weighted=intens_weighting=='photon')
+            abs_intensities = abs_intensities * extinct_factors
+            abs_normal_intensities = abs_normal_intensities * extinct_factors
+
+        # NOTE: ldint (and for blackbody, Inorm) may be returned as a scalar
+        return {'abs_normal_intensity': np.atleast_1d(abs_normal_intensities)[0],
+                'abs_intensities': abs_intensities,
+                'ldint': np.atleast_1d(ldint)[0],
+                'ptfarea': ptfarea}
+
     def set_ptfarea(self, dataset, ptfarea, **kwargs):
         """
         """
@@ -1739,6 +2034,20 @@ class Star(Body):
         return cols
 
 
+    def _visible_for_computations(self):
+        """
+        Boolean mask of the elements (triangles or vertices, following
+        mesh._compute_at_vertices) that are at least partially visible.  A
+        vertex is considered visible if any triangle it belongs to is visible.
+        """
+        visible_triangles = self.mesh.visibilities > 0
+        if not self.mesh._compute_at_vertices:
+            return visible_triangles
+
+        visible = np.zeros(len(self.mesh.mus_for_computations), dtype=bool)
+        visible[self.mesh.triangles[visible_triangles].ravel()] = True
+        return visible
+
     def _populate_lc(self, dataset, ignore_effects=False, **kwargs):
         """
         Populate columns necessary for an LC dataset
@@ -1766,26 +2075,17 @@ class Star(Body):
             # NOTE: we'll do another check when calling pb.Imu, but we'll also
             # change the value here for the debug logger
             ld_func = 'interp'
-            ldatm = atm
-        elif ld_mode == 'lookup':
-            if ld_coeffs_source == 'auto':
-                if atm == 'blackbody':
-                    ldatm = 'ck2004'
-                elif atm == 'extern_atmx':
-                    ldatm = 'ck2004'
-                elif atm == 'extern_planckint':
-                    ldatm = 'ck2004'
-                else:
-                    ldatm = atm
-            else:
-                ldatm = ld_coeffs_source
-        elif ld_mode == 'manual':
-            ldatm = 'none'
-        else:
-            raise NotImplementedError
+        ldatm = _get_ldatm(atm, ld_mode, ld_coeffs_source)
 
         boosting_method = kwargs.get('boosting_method', self.boosting_method)
 
+        # NOTE: when computing luminosities (ignore_effects) visibilities have
+        # not been determined, so we always need all elements
+        if kwargs.get('intens_visible_only', self.intens_visible_only) and not ignore_effects:
+            visible = self._visible_for_computations()
+        else:
+            visible = None
+
         logger.debug("ld_func={}, ld_coeffs={}, atm={}, ldatm={}".format(ld_func, ld_coeffs, atm, ldatm))
 
         pblum = kwargs.get('pblum', 4*np.pi)
@@ -1807,77 +2107,62 @@ class Star(Body):
 
             self.set_ptfarea(dataset, ptfarea)
 
+            # abs_normal_intensities are the normal emergent passband intensities
+            # and abs_intensities are the projected (limb-darkened) passband
+            # intensities.  These are computed together with ldint so that the
+            # request arrays (and, for ld_mode='interp', the grid lookups) are
+            # shared between all three.
+            # TODO: why do we need to use abs(mus) here?
+            # ! Because the interpolation within Imu will otherwise fail.
+            # ! With intens_visible_only, only [visibilities > 0] elements are
+            # ! passed to Imu and the rest are left at 0.
             try:
-                ldint = pb.ldint(Teff=self.mesh.teffs.for_computations,
-                                 logg=self.mesh.loggs.for_computations,
-                                 abun=self.mesh.abuns.for_computations,
-                                 ldatm=ldatm,
-                                 ld_func=ld_func if ld_mode != 'interp' else ld_mode,
-                                 ld_coeffs=ld_coeffs,
-                                 photon_weighted=intens_weighting=='photon')
+                abs_normal_intensities, abs_intensities, ldint = pb.Inorm_Imu_ldint(Teff=self.mesh.teffs.for_computations,
+                                                                                  logg=self.mesh.loggs.for_computations,
+                                                                                  abun=self.mesh.abuns.for_computations,
+                                                                                  mu=abs(self.mesh.mus_for_computations),
+                                                                                  atm=atm,
+                                                                                  ldatm=ldatm,
+                                                                                  ld_func=ld_func if ld_mode != 'interp' else ld_mode,
+                                                                                  ld_coeffs=ld_coeffs,
+                                                                                  photon_weighted=intens_weighting=='photon',
+                                                                                  visible=visible)
             except ValueError as err:
                 if str(err).split(":")[0] == 'Atmosphere parameters out of bounds':
                     # let's override with a more helpful error message
                     logger.warning(str(err))
-                    if atm=='blackbody':
-                        raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing ld_coeffs_source to a table that covers a sufficient range of values or set ld_mode to 'manual' and manually provide coefficients via ld_coeffs. Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
-                    else:
-                        if ld_mode=='interp':
-                            raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing atm to a table that covers a sufficient range of values.  If necessary, set atm to 'blackbody' and/or ld_mode to 'manual' (in which case coefficients will need to be explicitly provided via ld_coeffs). Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
-                        elif ld_mode == 'lookup':
-                            raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing atm to a table that covers a sufficient range of values.  If necessary, set atm to 'blackbody' and/or ld_mode to 'manual' (in which case coefficients will need to be explicitly provided via ld_coeffs). Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
+                    if str(err).split(":")[1].strip().startswith('ldint'):
+                        if atm=='blackbody':
+                            raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing ld_coeffs_source to a table that covers a sufficient range of values or set ld_mode to 'manual' and manually provide coefficients via ld_coeffs. Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
                         else:
-                            # manual... this means that the atm itself is out of bounds, so the only option is atm=blackbody
-                            raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing atm to a table that covers a sufficient range of values.  If necessary, set atm to 'blackbody', ld_mode to 'manual', and provide coefficients via ld_coeffs. Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
-                else:
-                    raise err
-
-            try:
-                # abs_normal_intensities are the normal emergent passband intensities:
-                abs_normal_intensities = pb.Inorm(Teff=self.mesh.teffs.for_computations,
-                                                  logg=self.mesh.loggs.for_computations,
-                                                  abun=self.mesh.abuns.for_computations,
-                                                  atm=atm,
-                                                  ldatm=ldatm,
-                                                  ldint=ldint,
-                                                  photon_weighted=intens_weighting=='photon')
-            except ValueError as err:
-                if str(err).split(":")[0] == 'Atmosphere parameters out of bounds':
-                    # let's override with a more helpful error message
-                    logger.warning(str(err))
-                    raise ValueError("Could not compute intensities with atm='{}'.  Try changing atm to a table that covers a sufficient range of values (or to 'blackbody' in which case ld_mode will need to be set to 'manual' and coefficients provided via ld_coeffs).  Enable 'warning' logger to see out-of-bounds arrays.".format(atm))
+                            if ld_mode=='interp':
+                                raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing atm to a table that covers a sufficient range of values.  If necessary, set atm to 'blackbody' and/or ld_mode to 'manual' (in which case coefficients will need to be explicitly provided via ld_coeffs). Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
+                            elif ld_mode == 'lookup':
+                                raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing atm to a table that covers a sufficient range of values.  If necessary, set atm to 'blackbody' and/or ld_mode to 'manual' (in which case coefficients will need to be explicitly provided via ld_coeffs). Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
+                            else:
+                                # manual... this means that the atm itself is out of bounds, so the only option is atm=blackbody
+                                raise ValueError("Could not compute ldint with ldatm='{}'.  Try changing atm to a table that covers a sufficient range of values.  If necessary, set atm to 'blackbody', ld_mode to 'manual', and provide coefficients via ld_coeffs. Enable 'warning' logger to see out-of-bound arrays.".format(ldatm))
+                    else:
+                        raise ValueError("Could not compute intensities with atm='{}'.  Try changing atm to a table that covers a sufficient range of values (or to 'blackbody' in which case ld_mode will need to be set to 'manual' and coefficients provided via ld_coeffs).  Enable 'warning' logger to see out-of-bounds arrays.".format(atm))
                 else:
                     raise err
 
-            # abs_intensities are the projected (limb-darkened) passband intensities
-            # TODO: why do we need to use abs(mus) here?
-            # ! Because the interpolation within Imu will otherwise fail.
-            # ! It would be best to pass only [visibilities > 0] elements to Imu.
-            abs_intensities = pb.Imu(Teff=self.mesh.teffs.for_computations,
-                                     logg=self.mesh.loggs.for_computations,
-                                     abun=self.mesh.abuns.for_computations,
-                                     mu=abs(self.mesh.mus_for_computations),
-                                     atm=atm,
-                                     ldatm=ldatm,
-                                     ldint=ldint,
-                                     ld_func=ld_func if ld_mode != 'interp' else ld_mode,
-                                     ld_coeffs=ld_coeffs,
-                                     photon_weighted=intens_weighting=='photon')
-
 
             # Beaming/boosting
             if boosting_method == 'none' or ignore_effects:
                 boost_factors = 1.0
             elif boosting_method == 'linear':
                 logger.debug("calling pb.bindex for boosting_method='linear'")
-                bindex = pb.bindex(Teff=self.mesh.teffs.for_computations,
-                                   logg=self.mesh.loggs.for_computations,
-                                   abun=self.mesh.abuns.for_computations,
-                                   mu=abs(self.mesh.mus_for_computations),
+                inds = visible if visible is not None else slice(None)
+                bindex = pb.bindex(Teff=self.mesh.teffs.for_computations[inds],
+                                   logg=self.mesh.loggs.for_computations[inds],
+                                   abun=self.mesh.abuns.for_computations[inds],
+                                   mu=abs(self.mesh.mus_for_computations[inds]),
                                    atm=atm,
                                    photon_weighted=intens_weighting=='photon')
 
-                boost_factors = 1.0 + bindex * self.mesh.velocities.for_computations[:,2]/37241.94167601236
+                boost_factors = np.ones(len(abs_intensities))
+                boost_factors[inds] = 1.0 + bindex * self.mesh.velocities.for_computations[inds,2]/37241.94167601236
             else:
                 raise NotImplementedError("boosting_method='{}' not supported".format(self.boosting_method))
 
@@ -2847,6 +3132,16 @@ class Envelope(Body):
         for half in self._halves:
             half.boosting_method = boosting_method
 
+    @property
+    def intens_visible_only(self):
+        return self._intens_visible_only
+
+    @intens_visible_only.setter
+    def intens_visible_only(self, intens_visible_only):
+        self._intens_visible_only = intens_visible_only
+        for half in self._halves:
+            half.intens_visible_only = intens_visible_only
+
     @property
     def halves(self):
         return {half.component: half for half in self._halves}
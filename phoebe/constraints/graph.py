@@ -0,0 +1,269 @@
+import types
+import numpy as np
+
+from phoebe import u
+
+import logging
+logger = logging.getLogger("CONSTRAINTS")
+logger.addHandler(logging.NullHandler())
+
+_constraint_math_funcs = ['sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2', 'sqrt', 'log10']
+
+
+def _scale_to_system(unit, in_solar_units):
+    """
+    scale factor to convert a value in `unit` to the unit system (SI or solar)
+    in which the constraint expression is evaluated
+    """
+    if in_solar_units:
+        return u.to_solar(unit)
+    else:
+        return unit.to_system(u.si)[0].scale
+
+
+class _ConstraintNode(object):
+    """
+    A single compiled constraint within a <phoebe.constraints.graph.ConstraintGraph>.
+
+    If the expression of the constraint cannot be compiled (ie. it depends on
+    array or choice parameters), `code` is None and the constraint will be
+    run through <phoebe.frontend.bundle.Bundle.run_constraint> instead.
+    """
+    def __init__(self, constraint, namespace):
+        self.constraint = constraint
+        self.uniqueid = constraint.uniqueid
+        self.constrained_parameter = constraint.get_constrained_parameter()
+        self.input_params = [var.get_parameter() for var in constraint._vars if var.safe_label in constraint._value]
+
+        self.code = None
+        self.inputs = []
+        self.scale = None
+
+        try:
+            self._compile(constraint, namespace)
+        except Exception as err:
+            logger.debug("could not compile constraint {}, will fallback on run_constraint: {}".format(constraint.twig, err))
+            self.code = None
+
+    def _compile(self, constraint, namespace):
+        if constraint.qualifier is None or self.constrained_parameter.__class__.__name__ != 'FloatParameter':
+            raise TypeError("constrained parameter is not a FloatParameter")
+
+        expr = constraint._value
+        labels = []
+        for var in constraint._vars + constraint._addl_vars:
+            if var.safe_label not in expr or var.safe_label in labels:
+                continue
+
+            param = var.get_parameter()
+            if param.__class__.__name__ == 'FloatParameter':
+                scale = _scale_to_system(param.default_unit, constraint.in_solar_units)
+            elif param.__class__.__name__ == 'IntParameter':
+                scale = None
+            else:
+                raise TypeError("{} is a {}".format(param.twig, param.__class__.__name__))
+
+            labels.append(var.safe_label)
+            self.inputs.append((var.safe_label, param, scale))
+
+        self.scale = _scale_to_system(constraint.default_unit, constraint.in_solar_units)
+        self.unit = constraint.default_unit
+        self.code = compile(expr, constraint.uniqueid, 'eval')
+        self.namespace = namespace
+
+    def evaluate(self):
+        """
+        Evaluate the compiled expression from the current values of the input
+        parameters and return the result in the default units of the
+        constraint.
+        """
+        # use np.float64 so that dividing by zero will result in a np.inf
+        # (same as ConstraintParameter.get_result)
+        values = {label: param.get_value() if scale is None else np.float64(param.get_value() * scale) for label, param, scale in self.inputs}
+        value = eval(self.code, self.namespace, values)
+        if value is None:
+            raise ValueError("constraint returned None")
+        return float(value) / self.scale
+
+
+class ConstraintGraph(object):
+    """
+    Dependency-ordered and compiled representation of all the constraints
+    attached to a <phoebe.frontend.bundle.Bundle>.
+
+    The graph is built (and the expressions compiled) on first use and then
+    re-used until any constraint or parameter is added, removed, or flipped.
+    This allows re-running the constraints affected by a set of changed
+    parameters (in topological order and each at most once) without any
+    filtering of the bundle.
+
+    This is used internally by <phoebe.frontend.bundle.Bundle.run_delayed_constraints>.
+    """
+    def __init__(self, bundle):
+        self._bundle = bundle
+        self.invalidate()
+
+    def __getstate__(self):
+        # compiled code objects cannot be pickled, so the graph will be
+        # rebuilt on first use after copying/unpickling the bundle
+        return {'_bundle': self._bundle}
+
+    def __setstate__(self, state):
+        self._bundle = state['_bundle']
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Force the graph to be rebuilt the next time it is used.
+        """
+        self._nodes = None
+        self._children = {}
+        self._order = []
+        self._params = None
+        self._nparams = 0
+
+    @property
+    def is_stale(self):
+        """
+        Whether the graph needs to be rebuilt before being used.
+        """
+        # any parameter being attached or removed from the bundle will either
+        # append to or replace the list of parameters
+        return self._nodes is None or self._params is not self._bundle._params or self._nparams != len(self._params)
+
+    def _build(self):
+        from phoebe.constraints import builtin
+
+        b = self._bundle
+        self._params = b._params
+        self._nparams = len(b._params)
+
+        namespace = {f: getattr(builtin, f) for f in dir(builtin) if isinstance(getattr(builtin, f), types.FunctionType)}
+        namespace.update({f: getattr(builtin, f) for f in _constraint_math_funcs})
+
+        constraints = b.filter(context='constraint', check_visible=False, check_default=False).to_list()
+        nodes = {}
+        for constraint in constraints:
+            nodes[constraint.uniqueid] = _ConstraintNode(constraint, namespace)
+
+        # NOTE: param._in_constraints may also list constraints for which the
+        # parameter is only an additional variable, so we'll build the
+        # dependencies from the parameters used in each expression instead
+        constrained_by = {node.constrained_parameter.uniqueid: uniqueid for uniqueid, node in nodes.items()}
+        parents = {uniqueid: set() for uniqueid in nodes.keys()}
+        children = {uniqueid: [] for uniqueid in nodes.keys()}
+        for uniqueid, node in nodes.items():
+            for param in node.input_params:
+                parent = constrained_by.get(param.uniqueid, None)
+                if parent is not None and parent != uniqueid:
+                    parents[uniqueid].add(parent)
+                    children[parent].append(uniqueid)
+
+        # Kahn's algorithm, keeping the order of the constraints in the bundle
+        # for any constraints that are independent of each other
+        order = []
+        remaining = [constraint.uniqueid for constraint in constraints]
+        while len(remaining):
+            ready = [uniqueid for uniqueid in remaining if not len(parents[uniqueid].difference(order))]
+            if not len(ready):
+                logger.warning("constraints contain a cyclic dependency between {}".format([nodes[uniqueid].constraint.twig for uniqueid in remaining]))
+                ready = remaining
+            order += ready
+            remaining = [uniqueid for uniqueid in remaining if uniqueid not in ready]
+
+        self._nodes = nodes
+        self._children = children
+        self._order = order
+        logger.debug("built constraint graph with {} constraints ({} compiled)".format(len(nodes), len([n for n in nodes.values() if n.code is not None])))
+
+    def get_affected(self, constraint_uniqueids):
+        """
+        Access the uniqueids of the constraints that need to be run (in order)
+        if the constraints in `constraint_uniqueids` are run.
+
+        Arguments
+        -----------
+        * `constraint_uniqueids` (list): uniqueids of the constraints
+            that are known to be out-of-date.
+
+        Returns
+        ---------
+        * (list) uniqueids of all affected constraints, in topological order.
+        """
+        if self.is_stale or np.any([uniqueid not in self._nodes for uniqueid in constraint_uniqueids]):
+            self._build()
+
+        affected = set()
+        todo = [uniqueid for uniqueid in constraint_uniqueids if uniqueid in self._nodes]
+        while len(todo):
+            uniqueid = todo.pop()
+            if uniqueid in affected:
+                continue
+            affected.add(uniqueid)
+            todo += self._children[uniqueid]
+
+        return [uniqueid for uniqueid in self._order if uniqueid in affected]
+
+    def run(self, constraint_uniqueids):
+        """
+        Run the constraints in `constraint_uniqueids` as well as any constraints
+        depending on their constrained parameters, in topological order.
+
+        Constraints that are downstream of those requested are only re-run if
+        the value of any of their input parameters changed.
+
+        Arguments
+        -----------
+        * `constraint_uniqueids` (list): uniqueids of the constraints to run.
+
+        Returns
+        ---------
+        * (list): list of <phoebe.parameters.Parameter> objects that were
+            (re-)constrained.
+        """
+        b = self._bundle
+        affected = self.get_affected(constraint_uniqueids)
+        requested = set(constraint_uniqueids)
+
+        changed = set()
+        changes = []
+        for uniqueid in affected:
+            node = self._nodes[uniqueid]
+            if uniqueid not in requested and node.code is not None and not np.any([param.uniqueid in changed for param in node.input_params]):
+                continue
+
+            param = node.constrained_parameter
+            orig_value = param.get_value()
+
+            success = False
+            if node.code is not None:
+                try:
+                    result = node.evaluate()
+                    if result != orig_value:
+                        logger.debug("setting '{}'={} from constraint".format(param.twig, result))
+                        param.set_value(result * node.unit, from_constraint=True, force=True, run_checks=False, run_constraints=False)
+                except Exception:
+                    # run_constraint will handle (and log or raise) the error
+                    success = False
+                else:
+                    success = True
+
+            if not success:
+                param = b.run_constraint(uniqueid=uniqueid, return_parameter=True, skip_kwargs_checks=True)
+
+            try:
+                param_changed = bool(np.any(param.get_value() != orig_value))
+            except ValueError:
+                # arrays with different shapes
+                param_changed = True
+
+            if param_changed:
+                changed.add(param.uniqueid)
+            if param not in changes:
+                changes.append(param)
+
+        # any constraints that were delayed while setting values above have
+        # already been run
+        b._delayed_constraints = [uniqueid for uniqueid in b._delayed_constraints if uniqueid not in affected]
+
+        return changes
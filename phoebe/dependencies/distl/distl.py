@@ -4,6 +4,7 @@ from scipy import stats as _stats
 from scipy.stats import norm as _norm
 from scipy import interpolate as _interpolate
 from scipy import integrate as _integrate
+from scipy.special import logsumexp as _logsumexp
 import json as _json
 import sys as _sys
 import importlib as _importlib
@@ -526,6 +527,91 @@ def is_square_matrix(value):
 
 ################################################################################
 
+# KDEs with at least this many samples are evaluated from the samples binned
+# (in the whitened space of the kernel) with bins of _kde_bin_width bandwidths,
+# as long as binning reduces the number of kernels by at least _kde_bin_reduction
+_kde_binned_min_samples = 2000
+_kde_bin_width = 0.05
+_kde_bin_reduction = 4
+
+class _GaussianKDE(_stats.gaussian_kde):
+    """
+    Subclass of scipy.stats.gaussian_kde which evaluates the pdf for large
+    numbers of samples from the samples binned in the whitened space of the
+    kernel, with each bin represented by a single kernel at the weighted
+    centroid of its samples.
+
+    As the centroid is used, the first-order error of replacing each kernel
+    vanishes and the error in the pdf is bounded by
+    0.5 * d * _kde_bin_width**2 times the peak of a single kernel (ie. ~1e-3
+    for univariate distributions).  If the samples are too sparse for binning
+    to reduce the number of kernels by _kde_bin_reduction (ie. for higher
+    dimensions), the exact scipy implementation is used instead.
+
+    The binned kernels are cached and rebuilt whenever the bandwidth changes
+    (see scipy.stats.gaussian_kde.set_bandwidth).
+    """
+    def _compute_covariance(self):
+        super(_GaussianKDE, self)._compute_covariance()
+        self._binned_cache = None
+
+    @property
+    def _binned(self):
+        if self._binned_cache is None:
+            self._binned_cache = False
+            if self.n >= _kde_binned_min_samples:
+                cho_cov = _np.linalg.cholesky(self.covariance)
+                whitened = _np.linalg.solve(cho_cov, self.dataset)
+                bins = _np.floor(whitened / _kde_bin_width).astype(int)
+                # NOTE: equivalent to np.unique(bins, axis=1, return_inverse=True)
+                # (up to the order of the bins), which requires numpy >= 1.13
+                order = _np.lexsort(bins)
+                is_new_bin = _np.concatenate([[True], _np.any(_np.diff(bins[:, order], axis=1) != 0, axis=0)])
+                inverse = _np.empty(self.n, dtype=int)
+                inverse[order] = _np.cumsum(is_new_bin) - 1
+                nbins = inverse.max() + 1
+                if nbins * _kde_bin_reduction <= self.n:
+                    bin_weights = _np.bincount(inverse, weights=self.weights, minlength=nbins)
+                    centroids = _np.array([_np.bincount(inverse, weights=self.weights*z, minlength=nbins) for z in whitened]) / bin_weights
+                    log_norm = 0.5*self.d*_np.log(2*_np.pi) + _np.sum(_np.log(_np.diag(cho_cov)))
+                    self._binned_cache = (cho_cov, centroids, _np.log(bin_weights), log_norm)
+
+        return self._binned_cache
+
+    def _points(self, points):
+        # same handling of the shape of points as scipy.stats.gaussian_kde.evaluate
+        points = _np.atleast_2d(_np.asarray(points, dtype=float))
+        d, m = points.shape
+        if d != self.d:
+            if d == 1 and m == self.d:
+                points = _np.reshape(points, (self.d, 1))
+            else:
+                raise ValueError("points have dimension {}, dataset has dimension {}".format(d, self.d))
+        return points
+
+    def logpdf(self, x):
+        binned = self._binned
+        if binned is False:
+            return super(_GaussianKDE, self).logpdf(x)
+
+        cho_cov, centroids, log_bin_weights, log_norm = binned
+        whitened = _np.linalg.solve(cho_cov, self._points(x))
+        # chunk over the points to limit the memory of the (nbins, npoints) array
+        chunk = max(1, int(1e7 // centroids.shape[1]))
+        result = _np.empty(whitened.shape[1])
+        for i in range(0, whitened.shape[1], chunk):
+            z = whitened[:, i:i+chunk]
+            dist2 = _np.sum((centroids[:, :, _np.newaxis] - z[:, _np.newaxis, :])**2, axis=0)
+            result[i:i+chunk] = _logsumexp(log_bin_weights[:, _np.newaxis] - 0.5*dist2, axis=0)
+        return result - log_norm
+
+    def evaluate(self, points):
+        if self._binned is False:
+            return super(_GaussianKDE, self).evaluate(points)
+        return _np.exp(self.logpdf(points))
+
+    __call__ = evaluate
+
 def _kde_pdf_cdf_ppf_callables(samples, weights):
     kde = _stats.gaussian_kde(samples, weights=weights)
     pdf_callable = kde.pdf
@@ -1060,6 +1146,8 @@ class BaseDistribution(BaseDistlObject):
         """
         # print("*** clearing cache {}".format(self))
         self._dist_constructor_object_cache = None
+        # allows any slices to detect that their cache is out-of-date
+        self._dist_constructor_object_epoch = getattr(self, '_dist_constructor_object_epoch', 0) + 1
         for parent in self._parents_with_constructor_object_cache:
             parent._dist_constructor_object_clear_cache()
 
@@ -2858,6 +2946,29 @@ class BaseMultivariateDistribution(BaseDistribution):
         self.labels_latex = labels_latex
         self.wrap_ats = wrap_ats
 
+    def _dist_constructor_object_clear_cache(self):
+        self._take_dimensions_cache = {}
+        super(BaseMultivariateDistribution, self)._dist_constructor_object_clear_cache()
+
+    def _take_dimensions_cached(self, dimensions):
+        """
+        Cached version of <<class>.take_dimensions> used when computing
+        probabilities from a <DistributionCollection>, so that the underlying
+        distribution object (ie. the KDE of <MVSamples>) is not rebuilt on every
+        call.  The cache is cleared along with the cache of
+        <<class>.dist_constructor_object>.
+        """
+        dimensions = tuple(self._get_dimension_index(d) for d in dimensions)
+        key = (dimensions, repr(self.units), repr(self.wrap_ats))
+        if not hasattr(self, '_take_dimensions_cache'):
+            self._take_dimensions_cache = {}
+        if key not in self._take_dimensions_cache:
+            if len(dimensions) == self.ndimensions and dimensions == tuple(range(self.ndimensions)):
+                self._take_dimensions_cache[key] = self
+            else:
+                self._take_dimensions_cache[key] = self.take_dimensions(list(dimensions))
+        return self._take_dimensions_cache[key]
+
     def __repr__(self):
         descriptors = " ".join(["{}={}".format(k,getattr(self,k)) for k in self._descriptors])
         if self.units is not None:
@@ -3479,6 +3590,18 @@ class BaseMultivariateSliceDistribution(BaseUnivariateDistribution):
         else:
             return self.__repr__()
 
+    @property
+    def dist_constructor_object(self):
+        """
+        See <BaseDistribution.dist_constructor_object>.  The cached object is
+        rebuilt if <<class>.multivariate> has changed since it was created.
+        """
+        epoch = getattr(self.multivariate, '_dist_constructor_object_epoch', 0)
+        if getattr(self, '_multivariate_epoch', None) != epoch:
+            self._dist_constructor_object_cache = None
+            self._multivariate_epoch = epoch
+        return super(BaseMultivariateSliceDistribution, self).dist_constructor_object
+
     def to_dict(self, exclude=[]):
         """
         Return the dictionary representation of the distribution object.
@@ -3994,7 +4117,7 @@ class DistributionCollection(BaseDistlObject):
                     dims_dict[uniqueid].append(dist_orig.dimension)
 
         for uniqueid, dims in dims_dict.items():
-            dists_dict[uniqueid] = dists_dict[uniqueid].take_dimensions(dims)
+            dists_dict[uniqueid] = dists_dict[uniqueid]._take_dimensions_cached(dims)
 
 
         return {dists_dict.get(uniqueid): values_dict.get(uniqueid) if len(values_dict.get(uniqueid)) > 1 else values_dict.get(uniqueid)[0] for uniqueid in values_dict.keys()}
@@ -5689,7 +5812,7 @@ class Samples(BaseUnivariateDistribution):
                 weights = weights[~nans]
 
         super(Samples, self).__init__(unit, label, label_latex, wrap_at,
-                                      _stats.gaussian_kde, ('samples', 'bw_method') if StrictVersion(_scipy_version) < StrictVersion("1.2.0") else ('samples', 'bw_method', 'weights'),
+                                      _GaussianKDE, ('samples', 'bw_method') if StrictVersion(_scipy_version) < StrictVersion("1.2.0") else ('samples', 'bw_method', 'weights'),
                                       samples=samples, weights=weights,
                                       bw_method=bw_method,
                                       uniqueid=uniqueid)
@@ -5722,8 +5845,8 @@ class Samples(BaseUnivariateDistribution):
     def bw_method(self, value):
         if value in [None, 'scott', 'silverman']:
             self._bw_method = value
-            return
-        self._bw_method = is_float(value)
+        else:
+            self._bw_method = is_float(value)
         self._dist_constructor_object_clear_cache()
 
     @property
@@ -7549,7 +7672,7 @@ class MVSamples(BaseMultivariateDistribution):
         # NOTE: the passed samples need to be transposed, so see the override
         # in dist_constructor_args
         super(MVSamples, self).__init__(units, labels, labels_latex, wrap_ats,
-                                        _stats.gaussian_kde, ('samples', 'bw_method') if StrictVersion(_scipy_version) < StrictVersion("1.2.0") else ('samples', 'bw_method', 'weights'),
+                                        _GaussianKDE, ('samples', 'bw_method') if StrictVersion(_scipy_version) < StrictVersion("1.2.0") else ('samples', 'bw_method', 'weights'),
                                         samples=samples, weights=weights, bw_method=bw_method,
                                         uniqueid=uniqueid)
 
@@ -7592,8 +7715,8 @@ class MVSamples(BaseMultivariateDistribution):
     def bw_method(self, value):
         if value in [None, 'scott', 'silverman']:
             self._bw_method = value
-            return
-        self._bw_method = is_float(value)
+        else:
+            self._bw_method = is_float(value)
         self._dist_constructor_object_clear_cache()
 
     @property
@@ -7997,7 +8120,7 @@ class MVSamples(BaseMultivariateDistribution):
 class MVSamplesSlice(BaseMultivariateSliceDistribution):
     @property
     def dist_constructor_func(self):
-        return _stats.gaussian_kde
+        return _GaussianKDE
 
     @property
     def dist_constructor_argnames(self):
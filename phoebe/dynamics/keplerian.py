@@ -39,6 +39,25 @@ def dynamics_from_bundle(b, times, compute=None, return_euler=False, **kwargs):
 
     """
 
+    elements = _elements_from_bundle(b, compute=compute, **kwargs)
+
+    # make sure times is an array and not a list
+    times = np.array(times)
+
+    return  dynamics(times, mass_conservation=True, return_euler=return_euler, **elements)
+
+def _elements_from_bundle(b, compute=None, **kwargs):
+    """
+    Parse the orbital elements of the parent orbit(s) of each star in the bundle
+    into the lists expected by :func:`dynamics` and :func:`dynamics_batch`.
+
+    Returns:
+        dictionary with keys periods, eccs, smas, t0_perpasses, per0s,
+        long_ans, incls, dpdts, deccdts, dperdts, components, t0, vgamma, ltte.
+        Each per-star entry is a list (per star - in order given by
+        b.hierarchy.get_stars()) of lists (per ancestor orbit, starting with
+        the parent orbit).
+    """
     b.run_delayed_constraints()
 
     computeps = b.get_compute(compute=compute, force_ps=True, **_skip_filter_checks)
@@ -47,9 +66,6 @@ def dynamics_from_bundle(b, times, compute=None, return_euler=False, **kwargs):
     else:
         ltte = False
 
-    # make sure times is an array and not a list
-    times = np.array(times)
-
     vgamma = b.get_value(qualifier='vgamma', context='system', unit=u.solRad/u.d, **_skip_filter_checks)
     t0 = b.get_value(qualifier='t0', context='system', unit=u.d, **_skip_filter_checks)
 
@@ -120,10 +136,11 @@ def dynamics_from_bundle(b, times, compute=None, return_euler=False, **kwargs):
         components.append([hier.get_primary_or_secondary(component=comp) for comp in [component]+ancestororbits[:-1]])
 
 
-    return  dynamics(times, periods, eccs, smas, t0_perpasses, per0s, \
-                    long_ans, incls, dpdts, deccdts, dperdts, \
-                    components, t0, vgamma, \
-                    mass_conservation=True, ltte=ltte, return_euler=return_euler)
+    return dict(periods=periods, eccs=eccs, smas=smas,
+                t0_perpasses=t0_perpasses, per0s=per0s,
+                long_ans=long_ans, incls=incls, dpdts=dpdts,
+                deccdts=deccdts, dperdts=dperdts,
+                components=components, t0=t0, vgamma=vgamma, ltte=ltte)
 
 
 
@@ -403,6 +420,162 @@ def dynamics(times, periods, eccs, smas, t0_perpasses, per0s, long_ans, incls,
 
 
 
+def dynamics_batch(times, periods, eccs, smas, t0_perpasses, per0s, long_ans,
+                   incls, dpdts, deccdts, dperdts, components, t0=0.0, vgamma=0.0,
+                   mass_conservation=True, ltte=False, ltte_tol=1.48e-8,
+                   ltte_maxiter=50):
+    """
+    Compute the positions and velocities of each star in their nested
+    Keplerian orbits for many sets of orbital elements at once.
+
+    This is a vectorized equivalent of :func:`dynamics` where all samples,
+    components and times are evaluated in a single pass (looping only over
+    the levels of nesting).
+
+    Each of the orbital elements (periods through dperdts) must be
+    broadcastable to shape (nsamples, ncomponents) or, for nested (hierarchical)
+    systems, (nsamples, ncomponents, nlevels) where the last axis follows the
+    ancestor orbits of each star starting with its parent orbit (as returned
+    by :func:`dynamics_from_bundle`).  Stars that have fewer ancestor orbits
+    than nlevels should be padded with an sma of 0 (and any finite, non-zero
+    period).
+
+    Args:
+        times: (iterable) times at which to compute positions and
+            velocities [days]
+        periods, eccs, smas, t0_perpasses, per0s, long_ans, incls, dpdts,
+            deccdts, dperdts: (array) orbital elements in the same units as
+            :func:`dynamics`.
+        components: (iterable) component ('primary' or 'secondary') of
+            each star within its parent orbit(s), with shape (ncomponents) or
+            (ncomponents, nlevels).  This is shared by all samples.
+        t0: (float or array broadcastable to (nsamples), default=0) time at
+            which all initial values (ie period, per0) are given [days]
+        vgamma: (float or array broadcastable to (nsamples), default=0)
+            systemic velocity [solRad/d]
+        mass_conservation: (bool, optional) whether to require mass
+            conservation if any of the derivatives (dpdt, dperdt, etc)
+            are non-zero [default: True]
+        ltte: (bool, optional) whether to correct for light travel time
+            effects [default: False]
+        ltte_tol: (float, optional) tolerance on the proper time when
+            correcting for light travel time effects [days]
+        ltte_maxiter: (int, optional) maximum number of Newton iterations
+            when correcting for light travel time effects.
+
+    Returns:
+        t, xs, ys, zs, vxs, vys, vzs.
+        t is a numpy array of all times, the remaining are numpy arrays with
+        shape (nsamples, ncomponents, ntimes) for the cartesian positions
+        [solRad] and velocities [solRad/d].
+    """
+    times = np.asarray(times, dtype=float)
+
+    def _as_elements(value):
+        value = np.asarray(value, dtype=float)
+        if value.ndim < 3:
+            value = np.atleast_2d(value)[:,:,np.newaxis]
+        # (nsamples, ncomponents, nlevels, 1) to broadcast against times
+        return value[..., np.newaxis]
+
+    elements = [_as_elements(v) for v in (periods, eccs, smas, t0_perpasses, per0s,
+                                          long_ans, incls, dpdts, deccdts, dperdts)]
+    shape = np.broadcast(*elements).shape
+    periods, eccs, smas, t0_perpasses, per0s, long_ans, incls, dpdts, deccdts, dperdts = [np.broadcast_to(v, shape) for v in elements]
+    nlevels = shape[2]
+
+    components = np.asarray(components)
+    if components.ndim < 2:
+        components = components[:,np.newaxis]
+    secondaries = np.broadcast_to(np.char.find(np.char.lower(components.astype(str)), 'sec') >= 0, shape[1:3])
+
+    # (nsamples, 1, 1) to broadcast against (nsamples, ncomponents, ntimes)
+    t0 = np.asarray(t0, dtype=float).reshape(-1, 1, 1)
+    vgamma = np.asarray(vgamma, dtype=float).reshape(-1, 1, 1)
+
+    def positions_velocities(times):
+        # times must be broadcastable to (nsamples, ncomponents, ntimes)
+        pos = [0.0, 0.0, 0.0]
+        vel = [0.0, 0.0, 0.0]
+        # handle the outer orbits first and then apply those offsets to the
+        # inner-orbit(s)
+        for level in range(nlevels)[::-1]:
+            period, ecc, sma, t0_perpass, per0, long_an, incl, dpdt, deccdt, dperdt = \
+                [v[:,:,level] for v in (periods, eccs, smas, t0_perpasses, per0s,
+                                        long_ans, incls, dpdts, deccdts, dperdts)]
+
+            # see binary_dynamics within dynamics (these are no-ops when the
+            # derivatives are zero)
+            p0 = period
+            period = dpdt*(times-t0) + p0
+            if mass_conservation:
+                sma = sma/p0**2*period**2
+            per0 = dperdt*(times-t0) + per0
+            ecc = deccdt*(times-t0) + ecc
+
+            n = 2*pi/period
+            ma = n*(times-t0_perpass)
+            E, theta = _true_anomaly(ma, ecc)
+            r = sma*(1-ecc*cos(E))
+            l = r*(1+ecc*cos(theta))
+            L = 2*pi*sma**2/period*sqrt(1-ecc**2)
+            rdot = np.where(l!=0, L/np.where(l!=0, l, 1.)*ecc*sin(theta), 0.)
+            thetadot = np.where(r!=0, L/np.where(r!=0, r, 1.)**2, 0.)
+            theta = theta + np.where(secondaries[:,level][np.newaxis,:,np.newaxis], pi, 0.)
+            theta_ = theta+per0
+
+            sin_theta_ = sin(theta_)
+            cos_theta_ = cos(theta_)
+            sin_longan = sin(long_an)
+            cos_longan = cos(long_an)
+            cos_incl = cos(incl)
+
+            x = r*(cos_longan*cos_theta_ - sin_longan*sin_theta_*cos_incl)
+            y = r*(sin_longan*cos_theta_ + cos_longan*sin_theta_*cos_incl)
+            z = r*(sin_theta_*sin(-incl))
+            vx_ = cos_theta_*rdot - sin_theta_*r*thetadot
+            vy_ = sin_theta_*rdot + cos_theta_*r*thetadot
+            vx = cos_longan*vx_ - sin_longan*vy_*cos_incl
+            vy = sin_longan*vx_ + cos_longan*vy_*cos_incl
+            vz = sin(-incl)*vy_
+
+            # NOTE: vgamma is in the direction of positive RV or negative vz
+            # and (as in dynamics) is applied once per level of nesting, but
+            # not for padded levels
+            vgamma_level = np.where(smas[:,:,level]!=0, vgamma, 0.)
+            vz = vz - vgamma_level
+            z = z - vgamma_level * (times-t0)
+
+            pos = [x+pos[0], y+pos[1], z+pos[2]]
+            vel = [vx+vel[0], vy+vel[1], vz+vel[2]]
+
+        return pos, vel
+
+    propertimes = np.broadcast_to(times, shape[:2]+times.shape)
+    if ltte:
+        scale_factor = (c.R_sun/c.c).to(u.d).value
+        # solve t - z(t)*scale_factor = time with Newton iterations, using
+        # dz/dt = vz, for all samples, components and times at once
+        propertimes = propertimes.copy()
+        for i in range(ltte_maxiter):
+            pos, vel = positions_velocities(propertimes)
+            residuals = propertimes - pos[2]*scale_factor - times
+            step = residuals / (1 - vel[2]*scale_factor)
+            propertimes = propertimes - step
+            if np.all(abs(step) < ltte_tol):
+                break
+        else:
+            logger.warning("dynamics_batch: ltte did not converge within {} iterations".format(ltte_maxiter))
+
+    pos, vel = positions_velocities(propertimes)
+
+    xs, ys, zs = [np.broadcast_to(v, shape[:2]+times.shape) for v in pos]
+    vxs, vys, vzs = [np.broadcast_to(v, shape[:2]+times.shape) for v in vel]
+
+    # d, solRad, solRad/d
+    return times, xs, ys, zs, vxs, vys, vzs
+
+
 def _true_anomaly(M,ecc,itermax=8):
     r"""
     Calculation of true and eccentric anomaly in Kepler orbits.
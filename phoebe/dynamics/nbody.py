@@ -2,7 +2,6 @@
 """
 
 import numpy as np
-from scipy.optimize import newton
 
 
 from phoebe import u, c
@@ -76,6 +75,8 @@ def dynamics_from_bundle(b, times, compute=None, return_roche_euler=False, use_k
             [default: 1e-16]
         ltte: (bool, default False) whether to account for light travel time effects.
         gr: (bool, default False) whether to account for general relativity effects.
+        checkpoint: (bool, default True) whether to reuse the simulation
+            between calls with the same initial conditions (see :func:`dynamics`).
 
     Returns:
         t, xs, ys, zs, vxs, vys, vzs.  t is a numpy array of all times,
@@ -85,6 +86,15 @@ def dynamics_from_bundle(b, times, compute=None, return_roche_euler=False, use_k
 
     """
 
+    elements = _elements_from_bundle(b, compute=compute, return_roche_euler=return_roche_euler, use_kepcart=use_kepcart, **kwargs)
+
+    return dynamics(times, return_roche_euler=return_roche_euler, **elements)
+
+def _elements_from_bundle(b, compute=None, return_roche_euler=False, use_kepcart=False, **kwargs):
+    """
+    Parse the initial conditions and integration options in the bundle into
+    the keyword arguments expected by :func:`dynamics` (other than times).
+    """
     b.run_delayed_constraints()
 
     hier = b.hierarchy
@@ -125,44 +135,141 @@ def dynamics_from_bundle(b, times, compute=None, return_roche_euler=False, use_k
     # mean_anoms = [mean_anom(t0, t0_perpass, period) for t0_perpass, period in zip(t0_perpasses, periods)]
     mean_anoms = [b.get_value(qualifier='mean_anom', unit=u.rad, component=component, context='component', **_skip_filter_checks) for component in orbitrefs]
 
-    return dynamics(times, masses, smas, eccs, incls, per0s, long_ans, \
-                    mean_anoms, rotperiods, t0, vgamma, stepsize, ltte, gr,
-                    integrator, use_kepcart=use_kepcart, return_roche_euler=return_roche_euler)
-
-
-def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
-        rotperiods=None, t0=0.0, vgamma=0.0, stepsize=0.01, ltte=False, gr=False,
-        integrator='ias15', return_roche_euler=False, use_kepcart=False):
-
-    if not _can_rebound:
-        raise ImportError("rebound is not installed")
-
-    if gr and not _can_reboundx:
-        raise ImportError("reboundx is not installed (required for gr effects)")
-
-    def particle_ltte(sim, particle_N, t_obs):
-        c_AU_d = c.c.to(u.AU/u.d).value
-
-        def residual(t):
-            # print "*** ltte trying t:", t
-            if sim.t != t:
-                sim.integrate(t, exact_finish_time=True)
-            ltte_dt = sim.particles[particle_N].z / c_AU_d
-            t_barycenter = t - ltte_dt
-            # print "***** ", t_barycenter-t_obs
+    return dict(masses=masses, smas=smas, eccs=eccs, incls=incls, per0s=per0s,
+                long_ans=long_ans, mean_anoms=mean_anoms, rotperiods=rotperiods,
+                t0=t0, vgamma=vgamma, stepsize=stepsize, ltte=ltte, gr=gr,
+                integrator=integrator, use_kepcart=use_kepcart,
+                checkpoint=kwargs.get('checkpoint', True))
 
-            return t_barycenter - t_obs
 
-        t_barycenter = newton(residual, t_obs)
+# number of dense-output nodes per (shortest) orbital period when interpolating
+# positions and velocities to the light-travel-time corrected times
+_dense_nodes_per_period = 100
 
-        if sim.t != t_barycenter:
-            sim.integrate(t_barycenter)
+# checkpointed simulations (and the states they have passed through), keyed by
+# their initial conditions, see _get_checkpoint
+_checkpoints = {}
+_checkpoints_max = 2
 
-        return sim.particles[particle_N]
+class _DenseOutput(object):
+    """
+    Quintic Hermite interpolant through the positions, velocities and
+    accelerations of all particles at a set of nodes.
+    """
+    def __init__(self, times, positions, velocities, accelerations, max_spacing=np.inf):
+        """
+        Args:
+            times: (array) sorted node times (N)
+            positions: (array) positions at each node (N, nparticles, 3)
+            velocities: (array) velocities at each node (N, nparticles, 3)
+            accelerations: (array) accelerations at each node (N, nparticles, 3)
+            max_spacing: (float) largest spacing between nodes that may be
+                interpolated over.
+        """
+        self.times = np.asarray(times, dtype=float)
+        self.positions = np.asarray(positions, dtype=float)
+        self.velocities = np.asarray(velocities, dtype=float)
+        self.accelerations = np.asarray(accelerations, dtype=float)
+        self.max_spacing = max_spacing
+
+    def __call__(self, t, j):
+        """
+        Interpolate the position and velocity of particle `j` at times `t`.
+
+        Returns:
+            positions, velocities (both arrays with shape (len(t), 3))
+
+        Raises:
+            ValueError: if any time in `t` is not covered by the nodes.
+        """
+        t = np.atleast_1d(t).astype(float)
+        ts = self.times
+        if len(ts) == 1:
+            if not np.all(t == ts[0]):
+                raise ValueError("requested times are not covered by the dense output")
+            return np.repeat(self.positions[:1, j], len(t), axis=0), np.repeat(self.velocities[:1, j], len(t), axis=0)
+
+        i = np.clip(np.searchsorted(ts, t, side='right') - 1, 0, len(ts) - 2)
+        h = ts[i+1] - ts[i]
+        if np.any(t < ts[i]) or np.any(t > ts[i+1]) or np.any(h > self.max_spacing*(1+1e-9)):
+            raise ValueError("requested times are not covered by the dense output")
+
+        s = ((t - ts[i]) / h)[:, np.newaxis]
+        h = h[:, np.newaxis]
+        p0, p1 = self.positions[i, j], self.positions[i+1, j]
+        v0, v1 = self.velocities[i, j], self.velocities[i+1, j]
+        a0, a1 = self.accelerations[i, j], self.accelerations[i+1, j]
+
+        s2, s3, s4, s5 = s**2, s**3, s**4, s**5
+        pos = (1 - 10*s3 + 15*s4 - 6*s5) * p0 \
+              + h * (s - 6*s3 + 8*s4 - 3*s5) * v0 \
+              + h**2 * (s2/2 - 3*s3/2 + 3*s4/2 - s5/2) * a0 \
+              + (10*s3 - 15*s4 + 6*s5) * p1 \
+              + h * (-4*s3 + 7*s4 - 3*s5) * v1 \
+              + h**2 * (s3/2 - s4 + s5/2) * a1
+        vel = ((-30*s2 + 60*s3 - 30*s4) * p0 \
+               + h * (1 - 18*s2 + 32*s3 - 15*s4) * v0 \
+               + h**2 * (s - 9*s2/2 + 6*s3 - 5*s4/2) * a0 \
+               + (30*s2 - 60*s3 + 30*s4) * p1 \
+               + h * (-12*s2 + 28*s3 - 15*s4) * v1 \
+               + h**2 * (3*s2/2 - 4*s3 + 5*s4/2) * a1) / h
+
+        return pos, vel
+
+    def ltte_times(self, t_obs, j, c_AU_d, t_start=None, tol=1e-12, maxiter=20):
+        """
+        Solve t_barycenter = t_obs + z(t_barycenter) / c for particle `j` by
+        fixed-point iteration on the interpolant (which converges as |vz| << c).
+
+        Args:
+            t_start: (array, optional) initial guess for t_barycenter.  This
+                must be covered by the nodes, so should be the center of the
+                windows from :func:`_ltte_nodes` (the lag of the center of
+                mass can exceed the node spacing).  Defaults to `t_obs`.
+
+        Returns:
+            t_barycenter (array with the same shape as `t_obs`)
+        """
+        t_obs = np.atleast_1d(t_obs).astype(float)
+        t_bary = t_obs.copy() if t_start is None else np.atleast_1d(t_start).astype(float)
+        for _ in range(maxiter):
+            z = self(t_bary, j)[0][:, 2]
+            t_bary_new = t_obs + z / c_AU_d
+            converged = np.all(np.abs(t_bary_new - t_bary) < tol)
+            t_bary = t_bary_new
+            if converged:
+                break
+
+        return t_bary
+
+def _nbody_accelerations(positions, masses):
+    """
+    Newtonian accelerations of all particles (units of G=1, with `masses`
+    given as GM).
 
+    Args:
+        positions: (array) positions of each particle (..., nparticles, 3)
+        masses: (array) GM of each particle
 
-    times = np.asarray(times)
+    Returns:
+        array with the same shape as `positions`
+    """
+    masses = np.asarray(masses, dtype=float)
+    dr = positions[..., np.newaxis, :, :] - positions[..., :, np.newaxis, :]
+    r3 = np.sum(dr**2, axis=-1)**1.5
+    # no self-interaction
+    r3[..., np.arange(len(masses)), np.arange(len(masses))] = np.inf
+    return np.sum(masses[:, np.newaxis] * dr / r3[..., np.newaxis], axis=-2)
+
+def _build_simulation(masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
+                      t0=0.0, vgamma=0.0, stepsize=0.01, gr=False,
+                      integrator='ias15', use_kepcart=False):
+    """
+    Create and initialize the rebound simulation.  See :func:`dynamics`.
 
+    NOTE: the clock of the simulation starts at 0, `t0` is only passed on to
+    bs.kep2cartesian.
+    """
     sim = rebound.Simulation()
 
     if gr:
@@ -171,6 +278,8 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
         # TODO: switch between different GR setups based on masses/hierarchy
         # http://reboundx.readthedocs.io/en/latest/effects.html#general-relativity
         params = rebx.add_gr_full()
+        # the extras must stay alive as long as the simulation
+        sim._phoebe_rebx = rebx
 
     sim.integrator = integrator
     # NOTE: according to rebound docs: "stepsize will change for adaptive integrators such as IAS15"
@@ -235,82 +344,217 @@ def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
         # vgamma is in the direction of positive RV or negative vz
         particle.vz -= vgamma
 
-    xs = [np.zeros(times.shape) for m in masses]
-    ys = [np.zeros(times.shape) for m in masses]
-    zs = [np.zeros(times.shape) for m in masses]
-    vxs = [np.zeros(times.shape) for m in masses]
-    vys = [np.zeros(times.shape) for m in masses]
-    vzs = [np.zeros(times.shape) for m in masses]
+    return sim
 
-    if return_roche_euler:
-        # from instantaneous Keplerian dynamics for Roche meshing
-        ds = [np.zeros(times.shape) for m in masses]
-        Fs = [np.zeros(times.shape) for m in masses]
+def _get_checkpoint(key, build_simulation):
+    """
+    Access (or create) the checkpoint for a set of initial conditions.  Each
+    checkpoint stores the states the simulation has passed through along with
+    the simulations themselves (one integrating forward from the initial
+    conditions, one backward),
+    so that later calls with the same initial conditions only need to
+    integrate to times that have not yet been reached.
+
+    If `key` is None, a new checkpoint is returned but not stored.
+    """
+    if key is not None and key in _checkpoints.keys():
+        logger.debug("reusing checkpointed simulation")
+        return _checkpoints[key]
 
-        ethetas = [np.zeros(times.shape) for m in masses]
-        elongans = [np.zeros(times.shape) for m in masses]
-        eincls = [np.zeros(times.shape) for m in masses]
+    checkpoint = {'sim0': build_simulation(),
+                  'sims': {1: None, -1: None},
+                  'states': {},
+                  'orbits': {}}
 
-    au_to_solrad = (1*u.AU).to(u.solRad).value
+    if key is not None:
+        while len(_checkpoints) >= _checkpoints_max:
+            _checkpoints.pop(next(iter(_checkpoints)))
+        _checkpoints[key] = checkpoint
 
-    for i,time in enumerate(times):
+    return checkpoint
 
-        sim.integrate(time, exact_finish_time=True)
+def _integrate_to_nodes(checkpoint, nodes, orbit_nodes, build_simulation):
+    """
+    Integrate (forward and/or backward from the initial conditions, at the
+    time of checkpoint['sim0']) and store the
+    state of all particles at each of `nodes` (and the instantaneous orbits
+    at each of `orbit_nodes`) in the checkpoint.
+    """
+    states = checkpoint['states']
+    orbits = checkpoint['orbits']
+    t_init = checkpoint['sim0'].t
 
-        # if return_roche:
-            # TODO: do we need to do this after handling LTTE???
-            # orbits = sim.calculate_orbits()
+    orbit_nodes = set(orbit_nodes)
+    missing = [t for t in nodes if t not in states or (t in orbit_nodes and t not in orbits)]
 
-        for j in range(len(masses)):
+    for direction in [1, -1]:
+        sweep = sorted([t for t in missing if (t - t_init)*direction >= 0], reverse=direction<0)
+        if not len(sweep):
+            continue
 
-            if ltte:
-                # then we need to integrate to different times per object
-                particle = particle_ltte(sim, j, time)
-            else:
-                # print "***", time, j, sim.N
-                particle = sim.particles[j]
+        sim = checkpoint['sims'][direction]
+        if sim is None or (sweep[0] - sim.t)*direction < 0:
+            # then we can't continue the existing simulation and need to
+            # start over from the initial conditions
+            sim = build_simulation()
 
-            # NOTE: x and y are flipped because of different coordinate system
-            # conventions.  If we change our coordinate system to have x point
-            # to the left, this will need to be updated to match as well.
-            xs[j][i] = -1 * particle.x * au_to_solrad # solRad
-            ys[j][i] = -1 * particle.y * au_to_solrad # solRad
-            zs[j][i] = particle.z * au_to_solrad  # solRad
-            vxs[j][i] = -1 * particle.vx * au_to_solrad # solRad/d
-            vys[j][i] = -1 * particle.vy * au_to_solrad # solRad/d
-            vzs[j][i] = particle.vz * au_to_solrad # solRad/d
+        for t in sweep:
+            if sim.t != t:
+                sim.integrate(t, exact_finish_time=True)
+
+            states[t] = np.array([[p.x, p.y, p.z, p.vx, p.vy, p.vz] for p in sim.particles])
+
+            if t in orbit_nodes:
+                orbits_t = []
+                for j in range(sim.N):
+                    # NOTE: this won't work for the first particle (as its the
+                    # primary in the simulation)
+                    particle = sim.particles[j+1] if j==0 else sim.particles[j]
+                    # get the orbit based on the primary component defined already
+                    # in the simulation.
+                    orbit = particle.calculate_orbit()
+                    orbits_t.append((orbit.d / orbit.a, orbit.P, orbit.f + orbit.omega, orbit.Omega, orbit.inc))
+                orbits[t] = orbits_t
+
+        checkpoint['sims'][direction] = sim
+
+def _ltte_nodes(times, sim):
+    """
+    Node times (and their maximum spacing) needed to interpolate each
+    particle to its light-travel-time corrected time, along with the center
+    of the window of each time.
+
+    The center of mass moves linearly, so its light-travel-time corrected time
+    (the center of the window) can be solved exactly:
+    t_c = t_obs + (z_com(t_sim) + vz_com (t_c - t_sim)) / c (with z towards
+    the observer and t_sim the time of `sim`).  The barycentric time of any
+    particle then lies within rmax/c of t_c, where rmax bounds the distance of
+    any particle from the center of mass (from the osculating Jacobi orbits
+    at t_sim).  Each of those windows is
+    covered by nodes on a grid (shared between all times) with
+    _dense_nodes_per_period nodes per shortest orbital period.
+
+    Returns:
+        nodes, max_spacing, centers (with the same shape as `times`)
+    """
+    c_AU_d = c.c.to(u.AU/u.d).value
 
-            if return_roche_euler:
-                # TODO: do we want the LTTE-adjust particles?
+    orbits = sim.calculate_orbits() if sim.N > 1 else []
+    periods = [abs(orbit.P) for orbit in orbits if orbit.e < 1]
+    rmax = 1.1 * np.sum([orbit.a*(1+orbit.e) for orbit in orbits if orbit.e < 1])
+    h = min(periods) / _dense_nodes_per_period if len(periods) else np.inf
 
-                # NOTE: this won't work for the first particle (as its the
-                # primary in the simulation)
-                if j==0:
-                    particle = sim.particles[j+1]
-                else:
-                    particle = sim.particles[j]
+    com = sim.calculate_com()
+    centers = times + (com.z + com.vz*(times - sim.t)) / (c_AU_d - com.vz)
+    # the lag of the center of mass changes (by vz/c) over the window itself
+    halfwidth = rmax / c_AU_d * (1 + abs(com.vz) / c_AU_d) + 1e-9
 
-                # get the orbit based on the primary component defined already
-                # in the simulation.
-                orbit = particle.calculate_orbit()
+    if not np.isfinite(h) or rmax == 0:
+        return np.unique(np.concatenate([times, centers])), np.inf, centers
 
-                # for instantaneous separation, we need the current separation
-                # from the sibling component in units of its instantaneous (?) sma
-                ds[j][i] = orbit.d / orbit.a
-                # for syncpar (F), assume that the rotational FREQUENCY will
-                # remain fixed - so we simply need to updated syncpar based
-                # on the INSTANTANEOUS orbital PERIOD.
-                Fs[j][i] = orbit.P / rotperiods[j]
+    kmin = np.floor((centers - halfwidth - sim.t) / h).astype(int)
+    kmax = np.ceil((centers + halfwidth - sim.t) / h).astype(int)
+    ks = np.unique((kmin[:, np.newaxis] + np.arange(np.max(kmax - kmin) + 1)).ravel())
+    return np.unique(np.concatenate([times, sim.t + ks * h])), h, centers
 
-                # TODO: need to add np.pi for secondary component
-                ethetas[j][i] = orbit.f + orbit.omega # true anomaly + periastron
+def dynamics(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
+        rotperiods=None, t0=0.0, vgamma=0.0, stepsize=0.01, ltte=False, gr=False,
+        integrator='ias15', return_roche_euler=False, use_kepcart=False,
+        checkpoint=True):
+    """
+    N-body integration of orbits (with rebound) to give positions and velocities
+    of any given number of stars in hierarchical orbits.
 
-                elongans[j][i] = orbit.Omega
+    The simulation is integrated once from its initial conditions through all
+    requested times (forward and/or backward, in order).  If `ltte`, the
+    states are also recorded at nodes bracketing the light-travel-time
+    corrected times and the correction for each particle is then solved on a
+    quintic Hermite interpolant through these nodes, rather than by
+    re-integrating the simulation.
 
-                eincls[j][i] = orbit.inc
+    Args:
+        checkpoint: (bool, default True) whether to keep the simulation (and the
+            states it has passed through) so that subsequent calls with the same
+            initial conditions can continue from it instead of starting over.
+            Checkpoints are not kept when `gr` is enabled.
 
+    See :func:`dynamics_bs` for the remaining arguments and returns.
+    """
+
+    if not _can_rebound:
+        raise ImportError("rebound is not installed")
+
+    if gr and not _can_reboundx:
+        raise ImportError("reboundx is not installed (required for gr effects)")
+
+    times = np.asarray(times, dtype=float)
+
+    def build_simulation():
+        return _build_simulation(masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
+                                 t0=t0, vgamma=vgamma, stepsize=stepsize, gr=gr,
+                                 integrator=integrator, use_kepcart=use_kepcart)
+
+    if checkpoint and not gr:
+        key = tuple(_ensure_tuple(np.asarray(arg, dtype=float).ravel()) for arg in (masses, smas, eccs, incls, per0s, long_ans, mean_anoms))
+        key += (t0, vgamma, stepsize, integrator, use_kepcart)
+    else:
+        key = None
+
+    cp = _get_checkpoint(key, build_simulation)
+
+    if ltte:
+        # sim0 is never integrated, so is still at its initial time
+        nodes, max_spacing, centers = _ltte_nodes(times, cp['sim0'])
+    else:
+        nodes, max_spacing = np.unique(times), np.inf
+
+    _integrate_to_nodes(cp, nodes, times if return_roche_euler else [], build_simulation)
+
+    nparticles = len(masses)
+    au_to_solrad = (1*u.AU).to(u.solRad).value
+
+    if ltte:
+        c_AU_d = c.c.to(u.AU/u.d).value
+        states = np.array([cp['states'][t] for t in nodes])
+        dense = _DenseOutput(nodes, states[:, :, :3], states[:, :, 3:],
+                             _nbody_accelerations(states[:, :, :3], masses),
+                             max_spacing=max_spacing)
+        pvs = []
+        for j in range(nparticles):
+            # then we need the position of each object at its own barycentric time
+            pos, vel = dense(dense.ltte_times(times, j, c_AU_d, t_start=centers), j)
+            pvs.append(np.hstack([pos, vel]))
+    else:
+        states = np.array([cp['states'][t] for t in times]).reshape(len(times), nparticles, 6)
+        pvs = [states[:, j] for j in range(nparticles)]
+
+    # NOTE: x and y are flipped because of different coordinate system
+    # conventions.  If we change our coordinate system to have x point
+    # to the left, this will need to be updated to match as well.
+    xs = [-1 * pv[:, 0] * au_to_solrad for pv in pvs] # solRad
+    ys = [-1 * pv[:, 1] * au_to_solrad for pv in pvs] # solRad
+    zs = [pv[:, 2] * au_to_solrad for pv in pvs] # solRad
+    vxs = [-1 * pv[:, 3] * au_to_solrad for pv in pvs] # solRad/d
+    vys = [-1 * pv[:, 4] * au_to_solrad for pv in pvs] # solRad/d
+    vzs = [pv[:, 5] * au_to_solrad for pv in pvs] # solRad/d
 
     if return_roche_euler:
+        # from instantaneous Keplerian dynamics for Roche meshing
+        # TODO: do we want the LTTE-adjust particles?
+        orbits = np.array([cp['orbits'][t] for t in times]).reshape(len(times), nparticles, 5)
+
+        # for instantaneous separation, we need the current separation
+        # from the sibling component in units of its instantaneous (?) sma
+        ds = [orbits[:, j, 0] for j in range(nparticles)]
+        # for syncpar (F), assume that the rotational FREQUENCY will
+        # remain fixed - so we simply need to updated syncpar based
+        # on the INSTANTANEOUS orbital PERIOD.
+        Fs = [orbits[:, j, 1] / rotperiods[j] for j in range(nparticles)]
+        # TODO: need to add np.pi for secondary component
+        ethetas = [orbits[:, j, 2] for j in range(nparticles)] # true anomaly + periastron
+        elongans = [orbits[:, j, 3] for j in range(nparticles)]
+        eincls = [orbits[:, j, 4] for j in range(nparticles)]
+
         # d, solRad, solRad/d, rad, unitless (sma), unitless, rad, rad, rad
         return times, xs, ys, zs, vxs, vys, vzs, ds, Fs, ethetas, elongans, eincls
 
@@ -18,7 +18,6 @@ from copy import deepcopy as _deepcopy
 import pickle as _pickle
 from inspect import getsource as _getsource
 
-from scipy.optimize import curve_fit as cfit
 from tqdm import tqdm as _tqdm
 
 # PHOEBE
@@ -35,12 +34,13 @@ from phoebe.parameters import constraint as _constraint
 from phoebe.parameters import feature as _feature
 from phoebe.parameters import figure as _figure
 from phoebe.parameters import server as _server
-from phoebe.parameters.parameters import _uniqueid, _clientid, _return_ps, _extract_index_from_string, _corner_twig, _corner_label, _cached_crimpl_servers
+from phoebe.parameters.parameters import _uniqueid, _clientid, _return_ps, _extract_index_from_string, _corner_twig, _corner_label, _cached_crimpl_servers, _is_binary_file, _open_binary, _set_binary_arrays
 from phoebe.backend import backends, mesh
 from phoebe.backend import universe as _universe
 from phoebe.solverbackends import solverbackends as _solverbackends
 from phoebe.distortions import roche
 from phoebe.frontend import io
+from phoebe.constraints.graph import ConstraintGraph
 from phoebe.atmospheres.passbands import list_installed_passbands, list_online_passbands, get_passband, update_passband, _timestamp_to_dt
 from phoebe import pool as _pool
 from phoebe.dependencies import distl as _distl
@@ -444,6 +444,9 @@ class Bundle(ParameterSet):
     * <phoebe.frontend.bundle.Bundle.remove_solution>
 
     """
+    # NOTE: the index is also used while loading the parameters (ie. parsing
+    # constraints) from ParameterSet.__init__, before self._bundle is set
+    _use_tag_index = True
 
     def __init__(self, params=None, check_version=False):
         """Initialize a new Bundle.
@@ -503,6 +506,7 @@ class Bundle(ParameterSet):
         # handle delayed constraints when interactive mode is off
         self._delayed_constraints = []
         self._failed_constraints = []
+        self._constraint_graph = ConstraintGraph(self)
 
         if not len(params):
             # add position (only 1 allowed and required)
@@ -540,7 +544,8 @@ class Bundle(ParameterSet):
         self._mpllinestylecyclers = {k: _figure.MPLPropCycler('linestyle', _figure._mpllinestyles) for k in ['default', 'component', 'dataset', 'model']}
 
     @classmethod
-    def open(cls, filename, import_from_older=True, import_from_newer=False):
+    def open(cls, filename, import_from_older=True, import_from_newer=False,
+             lazy_load=False):
         """
         For convenience, this function is available at the top-level as
         <phoebe.open> or <phoebe.load> as well as
@@ -548,7 +553,8 @@ class Bundle(ParameterSet):
 
         Open a new bundle.
 
-        Open a bundle from a JSON-formatted PHOEBE 2 file.
+        Open a bundle from a JSON-formatted PHOEBE 2 file (or a binary file
+        saved with `binary=True`, see <phoebe.frontend.bundle.Bundle.save>).
         This is a constructor so should be called as:
 
         ```py
@@ -581,6 +587,16 @@ class Bundle(ParameterSet):
             logger (at warning level or higher) to see messages.  If False, an
             error will be raised.  This is off by default as we cannot guarantee
             support with future changes to the code.
+        * `lazy_load` (bool or list, optional, default=False): whether to defer
+            creating the parameters in the 'model', 'solution', and 'figure'
+            contexts (or in the contexts in the list, if passing a list) until
+            they are first accessed through <phoebe.parameters.ParameterSet.filter>
+            (or any method that filters the bundle, ie. `get_value`).  Parameters
+            are created per model/solution/figure, so only those matching
+            the filter are created.  Note that deferred parameters are
+            not included in `len(b)` or <phoebe.parameters.ParameterSet.to_list>
+            until created.  Files from other versions of PHOEBE are always
+            loaded in full.
 
         Returns
         ---------
@@ -594,7 +610,14 @@ class Bundle(ParameterSet):
         def _ps_dict(ps, include_constrained=True):
             return {p.qualifier: p.get_quantity() if hasattr(p, 'get_quantity') else p.get_value() for p in ps.to_list() if (include_constrained or not p.is_constraint)}
 
-        if io._is_file(filename):
+        # arrays stored separately in the binary format (see Bundle.save)
+        arrays = {}
+
+        binary = _is_binary_file(filename)
+        if binary:
+            logger.debug("importing from binary file {}".format(filename))
+            data, arrays = _open_binary(filename)
+        elif io._is_file(filename):
             f = filename
         elif isinstance(filename, str):
             filename = os.path.expanduser(filename)
@@ -608,11 +631,25 @@ class Bundle(ParameterSet):
 
         if isinstance(filename, list):
             data = filename
-        else:
+        elif not binary:
             data = json.load(f, object_pairs_hook=parse_json)
             f.close()
 
+        if lazy_load:
+            # split off the parameters (and their arrays) that will be deferred
+            lazy_contexts = ['model', 'solution', 'figure'] if lazy_load is True else lazy_load
+            loaded_data, loaded_arrays, lazy_data, lazy_arrays = [], {}, [], {}
+            for i, param_dict in enumerate(data):
+                data_i, arrays_i = (lazy_data, lazy_arrays) if param_dict.get('context', None) in lazy_contexts else (loaded_data, loaded_arrays)
+                if i in arrays.keys():
+                    arrays_i[len(data_i)] = arrays[i]
+                data_i.append(param_dict)
+            data, arrays = loaded_data, loaded_arrays
+
         b = cls(data)
+        _set_binary_arrays(b._params, arrays)
+        if lazy_load:
+            b._defer_params(lazy_data, lazy_arrays)
 
         version = b.get_value(qualifier='phoebe_version', check_default=False, check_visible=False)
         phoebe_version_import = StrictVersion(version.split('.dev')[0])
@@ -635,6 +672,9 @@ class Bundle(ParameterSet):
         elif not import_from_older:
             raise RuntimeError("The file/bundle is from an older version of PHOEBE ({}) than installed ({}). Attempt importing by passing import_from_older=True.".format(phoebe_version_import, phoebe_version_this))
 
+        # any necessary migrations need access to all parameters
+        b._load_lazy_params()
+
         # temporarily disable interactive_checks, check_default, and check_visible
         conf_interactive_checks = conf.interactive_checks
         if conf_interactive_checks:
@@ -1333,7 +1373,7 @@ class Bundle(ParameterSet):
 
         return b
 
-    def save(self, filename, compact=False, incl_uniqueid=True):
+    def save(self, filename, compact=False, incl_uniqueid=True, binary=False):
         """
         Save the bundle to a JSON-formatted ASCII file.  This will run failed
         and delayed constraints and raise an error if they fail.
@@ -1347,6 +1387,10 @@ class Bundle(ParameterSet):
         * `filename` (string): relative or full path to the file
         * `compact` (bool, optional, default=False): whether to use compact
             file-formatting (may be quicker to save/load, but not as easily readable)
+        * `binary` (bool, optional, default=False): whether to save to a binary
+            (zip) archive in which the values of large arrays (models, meshes,
+            samples, etc) are stored separately and memory-mapped when
+            re-opening the bundle.  See <phoebe.parameters.ParameterSet.save>.
 
         Returns
         -------------
@@ -1358,8 +1402,9 @@ class Bundle(ParameterSet):
         # NOTE: PS.save will handle os.path.expanduser
         self.run_delayed_constraints()
         self.run_failed_constraints()
+        self._load_lazy_params()
         return super(Bundle, self).save(filename, incl_uniqueid=incl_uniqueid,
-                                        compact=compact)
+                                        compact=compact, binary=binary)
 
     def export_legacy(self, filename, compute=None, skip_checks=False):
         """
@@ -7798,13 +7843,12 @@ class Bundle(ParameterSet):
         * (list): list of changed <phoebe.parameters.Parameter> objects.
 
         """
-        changes = []
         delayed_constraints = self._delayed_constraints
         self._delayed_constraints = []
-        for constraint_id in delayed_constraints:
-            param = self.run_constraint(uniqueid=constraint_id, return_parameter=True, skip_kwargs_checks=True)
-            if param not in changes:
-                changes.append(param)
+        # the constraint graph re-runs the delayed constraints and any
+        # constraints depending on them (in order and without needing to
+        # filter the bundle)
+        changes = self._constraint_graph.run(delayed_constraints)
         if len(self._delayed_constraints):
             # some of the calls above may have delayed even more constraints,
             # we must keep calling recursively until they're all cleared
@@ -11955,27 +11999,25 @@ class Bundle(ParameterSet):
                                     times_ds = self.get_value(qualifier='times', dataset=ds, context='dataset', **_skip_filter_checks)
                                 # exptime = self.get_value(qualifier='exptime', dataset=ds, context='dataset', unit=u.d)
                                 fti_oversample = self.get_value(qualifier='fti_oversample', dataset=ds, compute=compute, context='compute', fti_oversample=kwargs.get('fti_oversample', None), **_skip_filter_checks)
+                                fti_integration = self.get_value(qualifier='fti_integration', dataset=ds, compute=compute, context='compute', fti_integration=kwargs.get('fti_integration', None), default='mean', **_skip_filter_checks)
                                 # NOTE: this is hardcoded for LCs which is the
                                 # only dataset that currently supports oversampling,
                                 # but this will need to be generalized if/when
                                 # we expand that support to other dataset kinds
-                                fluxes = np.zeros(times_ds.shape)
 
                                 # the oversampled times and fluxes will be
                                 # sorted according to times this may cause
                                 # exposures to "overlap" each other, so we'll
-                                # later need to determine which times (and
-                                # therefore fluxes) belong to which datapoint
+                                # rebuild the same grid the backend used (see
+                                # backends._extract_from_bundle) to determine
+                                # which times (and therefore fluxes) belong to
+                                # which datapoint
                                 times_oversampled_sorted = ml_params.get_value(qualifier='times', dataset=ds, **_skip_filter_checks)
                                 fluxes_oversampled = ml_params.get_value(qualifier='fluxes', dataset=ds, **_skip_filter_checks)
 
-                                for i,t in enumerate(times_ds):
-                                    # rebuild the unsorted oversampled times - see backends._extract_from_bundle_by_time
-                                    # TODO: try to optimize this by having these indices returned by the backend itself
-                                    times_oversampled_this = np.linspace(t-exptime/2., t+exptime/2., fti_oversample)
-                                    sample_inds = np.searchsorted(times_oversampled_sorted, times_oversampled_this)
-
-                                    fluxes[i] = np.mean(fluxes_oversampled[sample_inds])
+                                times_oversampled, oversampled_inds, weights = backends._fti_oversample_times(times_ds, exptime, fti_oversample, fti_integration)
+                                sample_inds = np.searchsorted(times_oversampled_sorted, times_oversampled)[oversampled_inds]
+                                fluxes = np.sum(fluxes_oversampled[sample_inds] * weights, axis=1)
 
                                 ml_params.set_value(qualifier='times', dataset=ds, value=times_ds, ignore_readonly=True, **_skip_filter_checks)
                                 ml_params.set_value(qualifier='fluxes', dataset=ds, value=fluxes, ignore_readonly=True, **_skip_filter_checks)
@@ -12002,78 +12044,63 @@ class Bundle(ParameterSet):
                     datasets_dsscaled += this_dsscale_datasets
                     logger.info("rescaling fluxes to data for dataset={}".format(this_dsscale_datasets))
 
-                    ds_fluxess = np.array([])
-                    ds_sigmass = np.array([])
-                    l3_fluxes = np.array([])
-                    l3_fracs = np.array([])
-                    l3_pblum_abs_sums = np.array([])
-                    model_fluxess_interp = np.array([])
+                    ds_obss = [self.get_dataset(dataset, **_skip_filter_checks) for dataset in this_dsscale_datasets]
+                    ds_timess = [ds_obs.get_value(qualifier='times', **_skip_filter_checks) for ds_obs in ds_obss]
+                    nobs = np.cumsum([0] + [len(ds_times) for ds_times in ds_timess])
 
-                    for dataset in this_dsscale_datasets:
-                        ds_obs = self.get_dataset(dataset, **_skip_filter_checks)
-                        ds_times = ds_obs.get_value(qualifier='times')
+                    ds_fluxess = np.empty(nobs[-1])
+                    ds_sigmass = np.empty(nobs[-1])
+                    l3_fluxes = np.empty(nobs[-1])
+                    l3_offsets = np.empty(nobs[-1])
+                    model_fluxess_interp = np.empty(nobs[-1])
+                    # per-dataset l3_flux and l3_offset (from l3_frac), only one of which will be non-zero
+                    l3s_dsscaled = {}
+
+                    for i, (dataset, ds_obs, ds_times) in enumerate(zip(this_dsscale_datasets, ds_obss, ds_timess)):
+                        sl = slice(nobs[i], nobs[i+1])
 
                         l3_mode = ds_obs.get_value(qualifier='l3_mode', **_skip_filter_checks)
                         if l3_mode == 'flux':
-                            l3_flux = ds_obs.get_value(qualifier='l3', unit=u.W/u.m**2, **_skip_filter_checks)
-                            l3_fluxes = np.append(l3_fluxes, np.full_like(ds_times, fill_value=l3_flux))
-                            l3_fracs = np.append(l3_fracs, np.zeros_like(ds_times))
-                            l3_pblum_abs_sums = np.append(l3_pblum_abs_sums, np.zeros_like(ds_times))
+                            l3s_dsscaled[dataset] = (ds_obs.get_value(qualifier='l3', unit=u.W/u.m**2, **_skip_filter_checks), 0.0)
                         else:
                             l3_frac = ds_obs.get_value(qualifier='l3_frac', **_skip_filter_checks)
-                            l3_fluxes = np.append(l3_fluxes, np.zeros_like(ds_times))
-                            l3_fracs = np.append(l3_fracs, np.full_like(ds_times, fill_value=l3_frac))
-                            l3_pblum_abs_sums = np.append(l3_pblum_abs_sums, np.full_like(ds_times, fill_value=np.sum(list(pblums_abs.get(dataset).values()))))
+                            l3s_dsscaled[dataset] = (0.0, l3_frac/(1-l3_frac) * np.sum(list(pblums_abs.get(dataset).values())))
+                        l3_fluxes[sl], l3_offsets[sl] = l3s_dsscaled[dataset]
 
                         ds_fluxes = ds_obs.get_value(qualifier='fluxes', unit=u.W/u.m**2, **_skip_filter_checks)
-                        ds_fluxess = np.append(ds_fluxess, ds_fluxes)
+                        ds_fluxess[sl] = ds_fluxes
                         ds_sigmas = ds_obs.get_value(qualifier='sigmas', **_skip_filter_checks)
                         if len(ds_sigmas):
-                            ds_sigmass = np.append(ds_sigmass, ds_sigmas)
+                            ds_sigmass[sl] = ds_sigmas
                         else:
                             sigma_est = 0.001*ds_fluxes.mean()
                             logger.warning("dataset-scaling: adopting sigmas={} for dataset='{}'".format(sigma_est, dataset))
-                            ds_sigmass = np.append(ds_sigmass, sigma_est*np.ones(len(ds_fluxes)))
+                            ds_sigmass[sl] = sigma_est
 
                         ml_ds = ml_params.filter(dataset=dataset, **_skip_filter_checks)
-                        model_fluxes_interp = ml_ds.get_parameter(qualifier='fluxes', dataset=dataset, **_skip_filter_checks).interp_value(times=ds_times, parent_ps=ml_ds, bundle=self, consider_gaussian_process=False)
-                        model_fluxess_interp = np.append(model_fluxess_interp, model_fluxes_interp)
-
-                    scale_factor_approx = np.median(ds_fluxess / model_fluxess_interp)
+                        model_fluxess_interp[sl] = ml_ds.get_parameter(qualifier='fluxes', dataset=dataset, **_skip_filter_checks).interp_value(times=ds_times, parent_ps=ml_ds, bundle=self, consider_gaussian_process=False)
 
-                    def _scale_fluxes(fluxes, scale_factor, l3_frac, l3_pblum_abs_sum, l3_flux):
-                        # note: l3_frac or l3_flux will be zero, based on which is provided
-                        return scale_factor * (fluxes + l3_frac/(1-l3_frac) * l3_pblum_abs_sum) + l3_flux
+                    def _scale_fluxes(fluxes, scale_factor, l3_flux, l3_offset):
+                        # note: l3_offset (from l3_frac) or l3_flux will be zero, based on which is provided
+                        return scale_factor * (fluxes + l3_offset) + l3_flux
 
-                    def _scale_fluxes_cfit(fluxes, scale_factor):
-                        # use values in this namespace rather than passing directly
-                        return _scale_fluxes(fluxes, scale_factor, l3_fracs, l3_pblum_abs_sums, l3_fluxes)
-
-                    logger.debug("calling curve_fit with estimated scale_factor={}".format(scale_factor_approx))
-                    popt, pcov = cfit(_scale_fluxes_cfit, model_fluxess_interp, ds_fluxess, p0=(scale_factor_approx), sigma=ds_sigmass)
-                    scale_factor = popt[0]
+                    # the scaled fluxes are linear in scale_factor, so the
+                    # weighted least-squares solution can be found directly
+                    scaled_model = model_fluxess_interp + l3_offsets
+                    weights = 1./ds_sigmass**2
+                    scale_factor = np.sum(weights * scaled_model * (ds_fluxess - l3_fluxes)) / np.sum(weights * scaled_model**2)
+                    logger.debug("dataset-scaling: found scale_factor={}".format(scale_factor))
 
                     for flux_param in ml_params.filter(qualifier='fluxes', dataset=this_dsscale_datasets, **_skip_filter_checks).to_list():
                         logger.debug("applying scale_factor={} to fluxes@{}".format(scale_factor, flux_param.dataset))
 
-                        ds_obs = self.get_dataset(dataset=flux_param.dataset, **_skip_filter_checks)
-                        l3_mode = ds_obs.get_value(qualifier='l3_mode', **_skip_filter_checks)
                         # this time we can pass floats instead of arrays since only
                         # one will apply to this single dataset
-                        if l3_mode == 'flux':
-                            l3_flux = ds_obs.get_value(qualifier='l3', unit=u.W/u.m**2, **_skip_filter_checks)
-                            l3_frac = 0.0
-                            l3_pblum_abs_sum = 0.0
-                        else:
-                            l3_frac = ds_obs.get_value(qualifier='l3_frac', **_skip_filter_checks)
-                            l3_flux = 0.0
-                            l3_pblum_abs_sum = np.sum(list(pblums_abs.get(dataset).values()))
-
-                        syn_fluxes = _scale_fluxes(flux_param.get_value(unit=u.W/u.m**2), scale_factor, l3_frac, l3_pblum_abs_sum, l3_flux)
+                        syn_fluxes = _scale_fluxes(flux_param.get_value(unit=u.W/u.m**2), scale_factor, *l3s_dsscaled[flux_param.dataset])
 
                         flux_param.set_value(qualifier='fluxes', value=syn_fluxes, ignore_readonly=True)
 
-                        ml_addl_params += [FloatParameter(qualifier='flux_scale', dataset=dataset, value=scale_factor, readonly=True, default_unit=u.dimensionless_unscaled, description='scaling applied to fluxes (intensities/luminosities) due to dataset-scaling')]
+                        ml_addl_params += [FloatParameter(qualifier='flux_scale', dataset=flux_param.dataset, value=scale_factor, readonly=True, default_unit=u.dimensionless_unscaled, description='scaling applied to fluxes (intensities/luminosities) due to dataset-scaling')]
 
                         for mesh_param in ml_params.filter(kind='mesh', **_skip_filter_checks).to_list():
                             if mesh_param.qualifier in ['intensities', 'abs_intensities', 'normal_intensities', 'abs_normal_intensities', 'pblum_ext']:
@@ -441,6 +441,57 @@ def get_dynesty_object(nlive, niter, ncall, eff,
                                     information=information, bound_iter=bound_iter,
                                     samples_bound=samples_bound, scale=scale)
 
+def ebai_batch(phases, fluxes, sigmas=None, morphology='detached', ebai_method='knn', pool=None):
+    """
+    Run the ebai estimator on many phase-folded light curves at once (outside
+    of a <phoebe.frontend.bundle.Bundle>), for example to triage a large
+    number of candidate eclipsing binaries.
+
+    Each light curve is fitted with the same analytical model used by
+    <phoebe.parameters.solver.estimator.ebai> (in parallel according to
+    <phoebe.multiprocessing_on> or over `pool`, if provided) and all the
+    resulting models are then sent through the pre-trained `ebai` model in a
+    single call.  The `knn` models are only loaded from disk once per session.
+    Within mpirun (and without `pool`), the light curves are fitted in serial
+    by the master and None is returned by all other processors.
+
+    Light curves which fail to be fitted (or, for `ebai_method='mlp'`, which
+    have an eclipse wider than 0.25 in phase) will return nans.
+
+    See also:
+    * <phoebe.parameters.solver.estimator.ebai>
+
+    Arguments
+    ------------
+    * `phases` (list of arrays): phases of each light curve.
+    * `fluxes` (list of arrays): normalized fluxes of each light curve.
+    * `sigmas` (list of arrays, optional, default=None): uncertainties of
+        each light curve.  If None, 0.1% of the fluxes will be assumed (as is
+        done for light curve datasets without sigmas).
+    * `morphology` (string, optional, default='detached'): 'detached' or 'contact'.
+    * `ebai_method` (string, optional, default='knn'): 'knn' or 'mlp' (only
+        applicable to detached systems).
+    * `pool` (optional, default=None): pool (with a `map` method, see
+        <phoebe.pool>) to use when fitting the light curves.  If None, a pool
+        will be created according to <phoebe.multiprocessing_on>.
+
+    Returns
+    ----------
+    * (dict): arrays (with one entry per light curve) of `pshift` (the phase
+        of the primary eclipse) and of each of the proposed values (`teffratio`,
+        `requivsumfrac`, `esinw`, `ecosw`, and `incl` in radians for detached
+        systems or `teffratio`, `incl` in radians, `fillout_factor`, and `q` for
+        contact systems).
+
+    Raises
+    ----------
+    * ValueError: if `morphology` or `ebai_method` are not supported or the
+        lengths of `phases`, `fluxes`, and `sigmas` do not match.
+    * ImportError: if `ebai_method` is 'knn' and scikit-learn is not installed.
+    """
+    from phoebe.solverbackends.solverbackends import _ebai_batch
+    return _ebai_batch(phases, fluxes, sigmas=sigmas, morphology=morphology, ebai_method=ebai_method, pool=pool)
+
 def get_unit_in_system(original_unit, system):
     """
     Convert a unit into a given system (either 'si' or 'solar')
@@ -6920,6 +6920,17 @@ bool LDmodelFromListOfTuples(
           relative precision of radiosity vector in sense of L_infty norm
     max_iter: integer, default 100
           maximal number of iterations in the solver of the radiosity eq.
+    reuse_matrix: boolean, default False
+          reuse the view-factor matrix stored by the previous call (if it
+          was computed for the same support and number of vertices and
+          triangles) instead of recomputing it.
+    warm_start: boolean, default False
+          start the iterations of the solver from the solution stored by
+          the previous call (if of the same model and size) instead of
+          from the intrinsic radiant exitance.
+    store: boolean, default False
+          store the view-factor matrix and the solution for use by
+          subsequent calls. Implied by reuse_matrix and warm_start.
 
   Returns:
     F[]: 1-rank numpy array of radiosities (intrinsic and reflection)
@@ -6930,6 +6941,30 @@ bool LDmodelFromListOfTuples(
     Astrophysical Journal,  356, 613-622, 1990 June
 */
 
+struct Tmesh_radiosity_problem {
+
+  std::string
+    support,        // support for which the matrix was computed
+    model;          // model for which the solution was computed
+
+  int nv, nt;       // number of vertices and triangles
+
+  std::vector<Tview_factor<double>> Fmat;
+
+  std::vector<double> S;  // last solution: radiosity (Wilson) or F_{in} (Horvat)
+
+  Tmesh_radiosity_problem() { clear(); }
+
+  void clear() {
+    support.clear();
+    model.clear();
+    nv = nt = -1;
+    Fmat.clear();
+    S.clear();
+  }
+
+} __radiosity_problem;
+
 static PyObject *mesh_radiosity_problem(
   PyObject *self, PyObject *args, PyObject *keywds) {
 
@@ -6953,10 +6988,17 @@ static PyObject *mesh_radiosity_problem(
     (char*)"epsC",
     (char*)"epsF",
     (char*)"max_iter",
+    (char*)"reuse_matrix",
+    (char*)"warm_start",
+    (char*)"store",
     NULL
   };
 
-  int max_iter = 100;         // default value
+  int
+    max_iter = 100,           // default value
+    reuse_matrix = 0,         // default value
+    warm_start = 0,           // default value
+    store_ = 0;               // default value
 
   double
     epsC = 0.00872654,        // default value
@@ -6967,7 +7009,7 @@ static PyObject *mesh_radiosity_problem(
   PyObject *oLDmod, *omodel, *osupport;
 
   if (!PyArg_ParseTupleAndKeywords(
-      args, keywds,  "O!O!O!O!O!O!O!O!O!O!|ddi", kwlist,
+      args, keywds,  "O!O!O!O!O!O!O!O!O!O!|ddippp", kwlist,
       &PyArray_Type, &oV,         // neccesary
       &PyArray_Type, &oT,
       &PyArray_Type, &oN,
@@ -6980,12 +7022,17 @@ static PyObject *mesh_radiosity_problem(
       &PyString_Type, &osupport,
       &epsC,                      // optional
       &epsF,
-      &max_iter)){
+      &max_iter,
+      &reuse_matrix,
+      &warm_start,
+      &store_)){
 
     raise_exception(fname + "::Problem reading arguments");
     return NULL;
   }
 
+  bool store = store_ || reuse_matrix || warm_start;
+
   //
   // Storing input data
   //
@@ -7015,25 +7062,45 @@ static PyObject *mesh_radiosity_problem(
   // Determine the LD view-factor matrix
   //
 
-  std::vector<Tview_factor<double>> Fmat;
+  std::vector<Tview_factor<double>> Fmat_local,
+    &Fmat = (store ? __radiosity_problem.Fmat : Fmat_local);
   {
     char *s =  PyString_AsString(osupport);
 
-    switch (fnv1a_32::hash(s)) {
+    bool reuse =
+      reuse_matrix &&
+      __radiosity_problem.support == std::string(s) &&
+      __radiosity_problem.nv == int(V.size()) &&
+      __radiosity_problem.nt == int(Tr.size());
 
-      case "triangles"_hash32:
-        triangle_mesh_radiosity_matrix_triangles(
-          V, Tr, N, A, LDmod, LDidx,  Fmat);
-      break;
+    if (!reuse) {
 
-      case "vertices"_hash32:
-        triangle_mesh_radiosity_matrix_vertices(
-          V, Tr, N, A, LDmod, LDidx,  Fmat);
-      break;
+      Fmat.clear();
 
-      default:
-        raise_exception(fname + "::This support type is not supported");
-      return NULL;
+      switch (fnv1a_32::hash(s)) {
+
+        case "triangles"_hash32:
+          triangle_mesh_radiosity_matrix_triangles(
+            V, Tr, N, A, LDmod, LDidx,  Fmat);
+        break;
+
+        case "vertices"_hash32:
+          triangle_mesh_radiosity_matrix_vertices(
+            V, Tr, N, A, LDmod, LDidx,  Fmat);
+        break;
+
+        default:
+          for (auto && ld: LDmod) delete ld;
+          __radiosity_problem.clear();
+          raise_exception(fname + "::This support type is not supported");
+        return NULL;
+      }
+
+      if (store) {
+        __radiosity_problem.support = std::string(s);
+        __radiosity_problem.nv = V.size();
+        __radiosity_problem.nt = Tr.size();
+      }
     }
   }
 
@@ -7057,15 +7124,21 @@ static PyObject *mesh_radiosity_problem(
 
     char *s = PyString_AsString(omodel);
 
+    // the stored solution is only usable as a starting point for the same model
+    std::vector<double> &S = __radiosity_problem.S;
+
+    if (!warm_start || __radiosity_problem.model != std::string(s)) S.clear();
+
     switch (fnv1a_32::hash(s)) {
 
       case "Wilson"_hash32:
-        success = solve_radiosity_equation_Wilson(Fmat, R, F0, F);
-
+        if (warm_start) F = S;
+        success = solve_radiosity_equation_Wilson(Fmat, R, F0, F, epsF, double(max_iter), bool(warm_start));
+        if (store) S = F;
         break;
 
       case "Horvat"_hash32:
-        success = solve_radiosity_equation_Horvat(Fmat, R, F0, F);
+        success = solve_radiosity_equation_Horvat(Fmat, R, F0, F, epsF, double(max_iter), store ? &S : (std::vector<double> *)0);
         break;
 
       default:
@@ -7073,6 +7146,8 @@ static PyObject *mesh_radiosity_problem(
         return NULL;
     }
 
+    if (store) __radiosity_problem.model = std::string(s);
+
     if (!success)
       raise_exception(fname + "::slow convergence");
   }
@@ -7144,6 +7219,17 @@ static PyObject *mesh_radiosity_problem(
           relative precision of radiosity vector in sense of L_infty norm
     max_iter: integer, default 100
           maximal number of iterations in the solver of the radiosity eq.
+    reuse_matrix: boolean, default False
+          reuse the view-factor matrix stored by the previous call (if it
+          was computed for the same support and the same number of vertices
+          and triangles on each body) instead of recomputing it.
+    warm_start: boolean, default False
+          start the iterations of the solver from the solution stored by
+          the previous call (if of the same model and shape) instead of
+          from the intrinsic radiant exitance.
+    store: boolean, default False
+          store the view-factor matrix and the solution for use by
+          subsequent calls. Implied by reuse_matrix and warm_start.
 
   Returns:
     F = {F_0, F_1, ...} : list of 1-rank numpy array of total radiosities
@@ -7154,6 +7240,32 @@ static PyObject *mesh_radiosity_problem(
     Astrophysical Journal,  356, 613-622, 1990 June
 */
 
+struct Tmesh_radiosity_problem_nbody {
+
+  std::string
+    support,        // support for which the matrix was computed
+    model;          // model for which the solution was computed
+
+  std::vector<int> nv, nt;  // number of vertices and triangles per body
+
+  std::vector<Tview_factor_nbody<double>> Fmat;
+
+  std::vector<std::vector<double>> S; // last solution: radiosity (Wilson) or F_{in} (Horvat)
+
+  Tmesh_radiosity_problem_nbody() { clear(); }
+
+  void clear() {
+    support.clear();
+    model.clear();
+    nv.clear();
+    nt.clear();
+    Fmat.clear();
+    S.clear();
+  }
+
+} __radiosity_problem_nbody;
+
+
 static PyObject *mesh_radiosity_problem_nbody_convex(
   PyObject *self, PyObject *args, PyObject *keywds) {
 
@@ -7176,10 +7288,17 @@ static PyObject *mesh_radiosity_problem_nbody_convex(
     (char*)"epsC",
     (char*)"epsF",
     (char*)"max_iter",
+    (char*)"reuse_matrix",
+    (char*)"warm_start",
+    (char*)"store",
     NULL
   };
 
-  int max_iter = 100;         // default value
+  int
+    max_iter = 100,           // default value
+    reuse_matrix = 0,         // default value
+    warm_start = 0,           // default value
+    store_ = 0;               // default value
 
   double
     epsC = 0.00872654,        // default value
@@ -7188,7 +7307,7 @@ static PyObject *mesh_radiosity_problem_nbody_convex(
   PyObject *oLDmod, *omodel, *oV, *oTr, *oN, *oA, *oR, *oF0, *osupport;
 
   if (!PyArg_ParseTupleAndKeywords(
-        args, keywds,  "O!O!O!O!O!O!O!O!O!|ddi", kwlist,
+        args, keywds,  "O!O!O!O!O!O!O!O!O!|ddippp", kwlist,
         &PyList_Type, &oV,         // neccesary
         &PyList_Type, &oTr,
         &PyList_Type, &oN,
@@ -7200,12 +7319,17 @@ static PyObject *mesh_radiosity_problem_nbody_convex(
         &PyString_Type, &osupport,
         &epsC,                     // optional
         &epsF,
-        &max_iter)
+        &max_iter,
+        &reuse_matrix,
+        &warm_start,
+        &store_)
       ){
     raise_exception(fname + "::Problem reading arguments");
     return NULL;
   }
 
+  bool store = store_ || reuse_matrix || warm_start;
+
   //
   // Storing input data
   //
@@ -7249,26 +7373,52 @@ static PyObject *mesh_radiosity_problem_nbody_convex(
   // Determine the LD view-factor matrix
   //
 
-  std::vector<Tview_factor_nbody<double>> Fmat;
+  std::vector<Tview_factor_nbody<double>> Fmat_local,
+    &Fmat = (store ? __radiosity_problem_nbody.Fmat : Fmat_local);
 
   {
     char *s =  PyString_AsString(osupport);
 
-    switch (fnv1a_32::hash(s)) {
+    std::vector<int> nv(n), nt(n);
+    for (int b = 0; b < n; ++b) {
+      nv[b] = V[b].size();
+      nt[b] = Tr[b].size();
+    }
 
-      case "triangles"_hash32:
-        triangle_mesh_radiosity_matrix_triangles_nbody_convex(
-          V, Tr, N, A, LDmod, Fmat);
-        break;
+    bool reuse =
+      reuse_matrix &&
+      __radiosity_problem_nbody.support == std::string(s) &&
+      __radiosity_problem_nbody.nv == nv &&
+      __radiosity_problem_nbody.nt == nt;
 
-      case "vertices"_hash32:
-        triangle_mesh_radiosity_matrix_vertices_nbody_convex(
-          V, Tr, N, A, LDmod, Fmat);
-        break;
+    if (!reuse) {
 
-      default:
-        raise_exception(fname + "::This support type is not supported");
-        return NULL;
+      Fmat.clear();
+
+      switch (fnv1a_32::hash(s)) {
+
+        case "triangles"_hash32:
+          triangle_mesh_radiosity_matrix_triangles_nbody_convex(
+            V, Tr, N, A, LDmod, Fmat);
+          break;
+
+        case "vertices"_hash32:
+          triangle_mesh_radiosity_matrix_vertices_nbody_convex(
+            V, Tr, N, A, LDmod, Fmat);
+          break;
+
+        default:
+          for (auto && ld: LDmod) delete ld;
+          __radiosity_problem_nbody.clear();
+          raise_exception(fname + "::This support type is not supported");
+          return NULL;
+      }
+
+      if (store) {
+        __radiosity_problem_nbody.support = std::string(s);
+        __radiosity_problem_nbody.nv = nv;
+        __radiosity_problem_nbody.nt = nt;
+      }
     }
   }
 
@@ -7285,14 +7435,21 @@ static PyObject *mesh_radiosity_problem_nbody_convex(
 
     char *s = PyString_AsString(omodel);
 
+    // the stored solution is only usable as a starting point for the same model
+    std::vector<std::vector<double>> &S = __radiosity_problem_nbody.S;
+
+    if (!warm_start || __radiosity_problem_nbody.model != std::string(s)) S.clear();
+
     switch (fnv1a_32::hash(s)) {
 
       case "Wilson"_hash32:
-        success = solve_radiosity_equation_Wilson_nbody(Fmat, R, F0, F);
+        if (warm_start) F = S;
+        success = solve_radiosity_equation_Wilson_nbody(Fmat, R, F0, F, epsF, double(max_iter), bool(warm_start));
+        if (store) S = F;
       break;
 
       case "Horvat"_hash32:
-      	success = solve_radiosity_equation_Horvat_nbody(Fmat, R, F0, F);
+      	success = solve_radiosity_equation_Horvat_nbody(Fmat, R, F0, F, epsF, double(max_iter), store ? &S : (std::vector<std::vector<double>> *)0);
       break;
 
       default:
@@ -7300,6 +7457,8 @@ static PyObject *mesh_radiosity_problem_nbody_convex(
         return NULL;
     }
 
+    if (store) __radiosity_problem_nbody.model = std::string(s);
+
     if (!success) raise_exception(fname + "::slow convergence");
   }
 
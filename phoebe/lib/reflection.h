@@ -1479,6 +1479,8 @@ void triangle_mesh_radiosity_matrix_vertices_nbody_convex(
     M0 - vector of intrisic radiant exitance of triangles/of vertices
     epsM - relative precision of radiosity
     max_iter - maximal number of iterations
+    warm_start - if true and M has the right size, M is used as the
+                 initial condition instead of M0
 
   Output:
     M - vector of radiosity (intrinsic and reflection) of triangles/of vertices
@@ -1493,7 +1495,8 @@ bool solve_radiosity_equation_Wilson(
   std::vector<T> &M0,
   std::vector<T> &M,                    // output
   const T & epsM = 1e-12,
-  const T & max_iter = 100) {
+  const T & max_iter = 100,
+  const bool & warm_start = false) {
 
   int
     Nt = R.size(),        // number of triangles
@@ -1504,7 +1507,10 @@ bool solve_radiosity_equation_Wilson(
     *pM = M0.data(), t, dS, Smax;
 
   // initial condition
-  memcpy(S0, pM, size);
+  if (warm_start && int(M.size()) == Nt)
+    memcpy(S0, M.data(), size);
+  else
+    memcpy(S0, pM, size);
 
   do {
 
@@ -1573,9 +1579,12 @@ Solving the radiosity model proposed by M. Horvat for Phoebe 2b.
     S0 - vector of LD reflected intrisic radiant exitance of triangles/of vertices
     epsF - relative precision of radiosity
     max_iter - maximal number of iterations
+    Fin - if not null and of the right size, used as the initial condition
+          F_{in,0} instead of S0 (warm start)
 
   Output:
     Fout - vector of radiosity (intrinsic and reflection) of triangles/of vertices
+    Fin - if not null, the converged incoming flux F_{in}
 
   Returns:
     true if we reached wanted relative precision, false otherwise
@@ -1589,7 +1598,8 @@ bool solve_radiosity_equation_Horvat(
   std::vector<T> &S0,
   std::vector<T> &Fout,                 // output
   const T & epsF = 1e-12,
-  const T & max_iter = 100) {
+  const T & max_iter = 100,
+  std::vector<T> *Fin = 0) {
 
   int
     Nt = R.size(),        // number of triangles/vertices
@@ -1607,7 +1617,10 @@ bool solve_radiosity_equation_Horvat(
   // with S0 = L_{LD} F0
 
   // initial condition
-  memcpy(S[0], pS0, size);
+  if (Fin && int(Fin->size()) == Nt)
+    memcpy(S[0], Fin->data(), size);
+  else
+    memcpy(S[0], pS0, size);
 
   T t, dS, Smax;
 
@@ -1641,6 +1654,8 @@ bool solve_radiosity_equation_Horvat(
   Fout = F0;
   for (int j = 0; j < Nt; ++j) Fout[j] += R[j]*S[0][j];
 
+  if (Fin) Fin->assign(S[0], S[0] + Nt);
+
   delete [] buf;
 
   return it < max_iter;
@@ -1682,9 +1697,12 @@ bool solve_radiosity_equation_Horvat(
     F0 - vector of intrisic radiant exitance of triangles/of vertices
     epsF - relative precision of radiosity
     max_iter - maximal number of iterations
+    Fin - if not null and of the right size, used as the initial condition
+          (warm start)
 
   Output:
     Fout - vector of radiosity (intrinsic and reflection) of triangles/of vertices
+    Fin - if not null, the converged incoming flux F_{in}
 
   Returns:
     true if we reached wanted relative precision, false otherwise
@@ -1697,7 +1715,8 @@ bool solve_radiosity_equation_Horvat(
   std::vector<T> &F0,
   std::vector<T> &Fout,                // output
   const T & epsF = 1e-12,
-  const T & max_iter = 100) {
+  const T & max_iter = 100,
+  std::vector<T> *Fin = 0) {
 
   //
   // calculate limb-darkened emission
@@ -1707,7 +1726,7 @@ bool solve_radiosity_equation_Horvat(
   std::vector <T> S0(F0.size(), 0);
   for (auto && f: Fmat) S0[f.i] += f.F*F0[f.j];
 
-  return solve_radiosity_equation_Horvat(Fmat, R, F0, S0, Fout, epsF, max_iter);
+  return solve_radiosity_equation_Horvat(Fmat, R, F0, S0, Fout, epsF, max_iter, Fin);
 
 }
 
@@ -1737,6 +1756,8 @@ bool solve_radiosity_equation_Horvat(
     M0 - vector of intrisic radiant exitance of triangles/vertices
     epsM - relative precision of radiosity
     max_iter - maximal number of iterations
+    warm_start - if true and M has the right shape, M is used as the
+                 initial condition instead of M0
 
   Output:
     M - vector of radiosity (intrinsic and reflection) of triangles/of vertices
@@ -1752,7 +1773,8 @@ bool solve_radiosity_equation_Wilson_nbody(
   std::vector<std::vector<T>> &M0,
   std::vector<std::vector<T>> &M,             // output
   const T & epsM = 1e-12,
-  const T & max_iter = 100) {
+  const T & max_iter = 100,
+  const bool & warm_start = false) {
 
   // number of bodies
   int  nb = M0.size();
@@ -1764,7 +1786,10 @@ bool solve_radiosity_equation_Wilson_nbody(
   std::vector<std::vector<T>> M1;
 
   // initial condition of the iteration
-  M = M0;
+  bool same_shape = warm_start && int(M.size()) == nb;
+  for (int i = 0; same_shape && i < nb; ++i) same_shape = int(M[i].size()) == N[i];
+
+  if (!same_shape) M = M0;
 
   T t, dM, Mmax;
 
@@ -1832,9 +1857,12 @@ bool solve_radiosity_equation_Wilson_nbody(
     S0 - vector o LD diffusion of intrisic radiant exitance of triangles/vertices
     epsF - relative precision of radiosity
     max_iter - maximal number of iterations
+    Fin0 - if not null and of the right shape, used as the initial condition
+           F_{in,0} instead of S0 (warm start)
 
   Output:
     Fout - vector of radiosity (intrinsic and reflection) of triangles/of vertices
+    Fin0 - if not null, the converged incoming flux F_{in}
 
   Returns:
     true if we reached wanted relative precision, false otherwise
@@ -1848,7 +1876,8 @@ bool solve_radiosity_equation_Horvat_nbody(
   std::vector<std::vector<T>> &S0,
   std::vector<std::vector<T>> &Fout,           // output
   const T & epsF = 1e-12,
-  const T & max_iter = 100) {
+  const T & max_iter = 100,
+  std::vector<std::vector<T>> *Fin0 = 0) {
 
   // number of bodies
   int nb = F0.size();
@@ -1863,7 +1892,10 @@ bool solve_radiosity_equation_Horvat_nbody(
   // with S0 = L_{LD} F0
 
   // initial condition
-  std::vector<std::vector<T>> Fin(S0), Ftmp;
+  bool same_shape = Fin0 && int(Fin0->size()) == nb;
+  for (int i = 0; same_shape && i < nb; ++i) same_shape = int((*Fin0)[i].size()) == N[i];
+
+  std::vector<std::vector<T>> Fin(same_shape ? *Fin0 : S0), Ftmp;
 
   int it = 0;
 
@@ -1899,6 +1931,8 @@ bool solve_radiosity_equation_Horvat_nbody(
     for (int j = 0, m = N[i]; j < m; ++j)
       Fout[i][j] += R[i][j]*Fin[i][j];
 
+  if (Fin0) *Fin0 = Fin;
+
   return it < max_iter;
 }
 
@@ -1952,7 +1986,8 @@ bool solve_radiosity_equation_Horvat_nbody(
   std::vector<std::vector<T>> &F0,
   std::vector<std::vector<T>> &Fout,           // output
   const T & epsF = 1e-12,
-  const T & max_iter = 100) {
+  const T & max_iter = 100,
+  std::vector<std::vector<T>> *Fin0 = 0) {
 
   //
   // calculate limb-darkened emission of intrisic radiant exitance
@@ -1966,5 +2001,5 @@ bool solve_radiosity_equation_Horvat_nbody(
 
   for (auto && f: Fmat) S0[f.b1][f.i1] += f.F*F0[f.b2][f.i2];
 
-  return solve_radiosity_equation_Horvat_nbody( Fmat, R, F0, S0, Fout, epsF, max_iter);
+  return solve_radiosity_equation_Horvat_nbody( Fmat, R, F0, S0, Fout, epsF, max_iter, Fin0);
 }
@@ -82,7 +82,19 @@ def phoebe(**kwargs):
     * `atm` (string, optional, default='ck2004'): atmosphere tables.
     * `irrad_method` (string, optional, default='horvat'): which method to use
         to handle irradiation.
+    * `irrad_warm_start` (bool, optional, default=False): whether to start the
+        iterations of the radiosity solver from the solution of the previous
+        time-step (only applicable if `irrad_method` is not 'none').
+    * `irrad_reuse_tol` (float, optional, default=0.0): maximum relative
+        (non-rigid) change in the geometry of the meshes since the view-factor
+        matrix was last computed for which that matrix will be reused instead
+        of recomputed.  0 will always recompute the matrix (only applicable
+        if `irrad_method` is not 'none').
     * `boosting_method` (string, optional, default='none'): type of boosting method.
+    * `intens_visible_only` (bool, optional, default=False): whether to only
+        compute projected intensities (and boosting) for elements that are
+        at least partially visible.  Projected intensities of hidden elements
+        will then be 0 in any exposed meshes.
     * `mesh_method` (string, optional, default='marching'): which method to use
         for discretizing the surface.
     * `ntriangles` (int, optional, default=1500): target number of triangles
@@ -93,18 +105,43 @@ def phoebe(**kwargs):
     * `eclipse_method` (string, optional, default='native'): which method to use
         for determinging eclipses.
     * `lc_method` (string, optional, default='numerical'): which method to use
-        for computing light curves.
+        for computing light curves.  'analytical' integrates the limb-darkened
+        intensity profile (from the passband tables) over the visible disk of
+        each star directly from the positions of the stars, without building
+        meshes.  This is only used if all stars have `distortion_method`
+        'sphere', no spots are enabled, and `irrad_method` and
+        `boosting_method` are both 'none', otherwise the light curve falls
+        back on 'numerical'.
     * `fti_method` (string, optional, default='oversample'): method to use for
         handling finite-time of integration (exptime).
     * `fti_oversample` (int, optional, default=5): number of times to sample
         per-datapoint for finite-time integration (only applicable if
         `fti_method` is 'oversample').
+    * `fti_integration` (string, optional, default='mean'): rule used to
+        integrate over the exposure (only applicable if `fti_method` is
+        'oversample').  'simpson' and 'gauss-legendre' weight the
+        `fti_oversample` samples to reach the same accuracy with fewer samples.
+    * `phase_grid` (string, optional, default='none'): whether to compute light
+        curves on an adaptive grid in phase and interpolate to the requested
+        times.  This is only used if the system consists of a single orbit and
+        is not time-dependent (see <phoebe.parameters.HierarchyParameter.is_time_dependent>).
+    * `phase_grid_tol` (float, optional, default=1e-4): maximum error in the
+        interpolated fluxes, relative to the median flux (only applicable if
+        `phase_grid` is 'adaptive').
     * `rv_method` (string, optional, default='flux-weighted'): which method to
         use for computing radial velocities.  If 'dynamical', Rossiter-McLaughlin
         effects will not be computed.
     * `rv_grav` (bool, optional, default=False): whether gravitational redshift
         effects are enabled for RVs (only applicable if `rv_method` is
         'flux-weighted')
+    * `multiprocess_times` (bool, optional, default=False): whether to split
+        the times over a local multiprocessing pool when not within MPI (see
+        <phoebe.multiprocessing_set_nprocs>).  Ignored within solvers.
+    * `persistent_workers` (bool, optional, default=False): whether MPI or
+        multiprocessing workers (see `multiprocess_times`) should keep the
+        bundle and System resident between calls to
+        <phoebe.frontend.bundle.Bundle.run_compute>, receiving only the
+        changed parameter values.
 
     Returns
     --------
@@ -117,6 +154,8 @@ def phoebe(**kwargs):
 
     params += [BoolParameter(qualifier='enabled', copy_for={'context': 'dataset', 'dataset': '*'}, dataset='_default', value=kwargs.get('enabled', True), description='Whether to create synthetics in compute/solver run')]
     params += [BoolParameter(qualifier='enabled', copy_for={'context': 'feature', 'feature': '*'}, feature='_default', value=kwargs.get('enabled', True), description='Whether to enable the feature in compute/solver run')]
+    params += [BoolParameter(qualifier='multiprocess_times', value=kwargs.get('multiprocess_times', False), advanced=True, description='Whether to split the times over a local multiprocessing pool (see phoebe.multiprocessing_set_nprocs) when not within MPI.  Ignored within solvers, which already parallelize per-model.')]
+    params += [BoolParameter(qualifier='persistent_workers', value=kwargs.get('persistent_workers', False), advanced=True, description='Whether MPI or multiprocessing workers (see multiprocess_times) should keep the bundle and System resident between run_compute calls, receiving only the changed parameter values.')]
     params += [BoolParameter(visible_if='ds_has_enabled_feature:gp_*', qualifier='gp_exclude_phases_enabled', value=kwargs.get('gp_exclude_phases_enabled', True), copy_for={'kind': ['lc', 'rv', 'lp'], 'dataset': '*'}, dataset='_default', description='Whether to apply the mask in gp_exclude_phases during gaussian process fitting.')]
     params += [FloatArrayParameter(visible_if='ds_has_enabled_feature:gp_*,gp_exclude_phases_enabled:True', qualifier='gp_exclude_phases', value=kwargs.get('gp_exclude_phases', []), copy_for={'kind': ['lc', 'rv', 'lp'], 'dataset': '*'}, dataset='_default', default_unit=u.dimensionless_unscaled, required_shape=[None, 2], description='List of phase-tuples.  Any observations inside the range set by any of the tuples will be ignored by the gaussian process features.')]
 
@@ -135,7 +174,10 @@ def phoebe(**kwargs):
     # PHYSICS
     # TODO: should either of these be per-dataset... if so: copy_for={'kind': ['rv_dep', 'lc_dep'], 'dataset': '*'}, dataset='_default' and then edit universe.py to pull for the correct dataset (will need to become dataset-dependent dictionary a la ld_func)
     params += [ChoiceParameter(qualifier='irrad_method', value=kwargs.get('irrad_method', 'horvat'), choices=['none', 'wilson', 'horvat'], description='Which method to use to handle all irradiation effects (reflection, redistribution)')]
+    params += [BoolParameter(visible_if='irrad_method:!none', qualifier='irrad_warm_start', value=kwargs.get('irrad_warm_start', False), advanced=True, description='Whether to start the radiosity solver from the solution of the previous time-step')]
+    params += [FloatParameter(visible_if='irrad_method:!none', qualifier='irrad_reuse_tol', value=kwargs.get('irrad_reuse_tol', 0.0), default_unit=u.dimensionless_unscaled, limits=(0,None), advanced=True, description='Maximum relative (non-rigid) change in the geometry of the meshes for which the irradiation view-factor matrix from a previous time-step is reused (0 to always recompute)')]
     params += [ChoiceParameter(qualifier='boosting_method', value=kwargs.get('boosting_method', 'none'), choices=['none'], advanced=True, description='Type of boosting method')]
+    params += [BoolParameter(qualifier='intens_visible_only', value=kwargs.get('intens_visible_only', False), advanced=True, description='Whether to only compute projected intensities (and boosting) for elements that are at least partially visible (projected intensities of hidden elements will be 0 in exposed meshes)')]
 
     # MESH
     # -- these parameters all need to exist per-component --
@@ -178,9 +220,12 @@ def phoebe(**kwargs):
     # copy_for = {'kind': ['rv_dep'], 'component': '*', 'dataset': '*'}
     # means that this should exist for each component/dataset pair with the
     # rv_dep kind
-    # params += [ChoiceParameter(qualifier='lc_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('lc_method', 'numerical'), choices=['numerical', 'analytical'] if conf.devel else ['numerical'], advanced=True, description='Method to use for computing LC fluxes')]
+    params += [ChoiceParameter(qualifier='lc_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('lc_method', 'numerical'), choices=['numerical', 'analytical'], advanced=True, description='Method to use for computing LC fluxes.  numerical: integrate over the triangulated meshes.  analytical: integrate the limb-darkened disks of spherical stars directly (only used if all stars have distortion_method=\'sphere\' and no spots, irradiation, or boosting require meshes, otherwise falls back on numerical)')]
     params += [ChoiceParameter(qualifier='fti_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_method', 'none'), choices=['none', 'oversample'], description='How to handle finite-time integration (when non-zero exptime)')]
     params += [IntParameter(visible_if='fti_method:oversample', qualifier='fti_oversample', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_oversample', 5), limits=(1,None), default_unit=u.dimensionless_unscaled, description='Number of times to sample per-datapoint for finite-time integration')]
+    params += [ChoiceParameter(visible_if='fti_method:oversample', qualifier='fti_integration', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_integration', 'mean'), choices=['mean', 'simpson', 'gauss-legendre'], advanced=True, description='Rule used to integrate over the exposure for finite-time integration.  mean: average of fti_oversample equally-spaced samples.  simpson: Simpson\'s rule over fti_oversample equally-spaced samples.  gauss-legendre: Gauss-Legendre quadrature with fti_oversample nodes (typically requires fewer samples for the same accuracy)')]
+    params += [ChoiceParameter(qualifier='phase_grid', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('phase_grid', 'none'), choices=['none', 'adaptive'], advanced=True, description='Whether to compute the light curve at every requested time or on an adaptive grid in phase (dense in eclipses, sparse out of eclipse) which is then interpolated to the requested times.  adaptive is only used if the system consists of a single orbit and is not time-dependent.')]
+    params += [FloatParameter(visible_if='phase_grid:adaptive', qualifier='phase_grid_tol', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('phase_grid_tol', 1e-4), limits=(0,None), default_unit=u.dimensionless_unscaled, advanced=True, description='Maximum error in the interpolated fluxes (relative to the median flux) for the adaptive phase grid')]
 
     params += [ChoiceParameter(qualifier='rv_method', copy_for={'component': {'kind': 'star'}, 'dataset': {'kind': 'rv'}}, component='_default', dataset='_default', value=kwargs.get('rv_method', 'flux-weighted'), choices=['flux-weighted', 'dynamical'], description='Method to use for computing RVs (must be flux-weighted for Rossiter-McLaughlin effects)')]
     params += [BoolParameter(visible_if='rv_method:flux-weighted', qualifier='rv_grav', copy_for={'component': {'kind': 'star'}, 'dataset': {'kind': 'rv'}}, component='_default', dataset='_default', value=kwargs.get('rv_grav', False), description='Whether gravitational redshift effects are enabled for RVs')]
@@ -259,6 +304,9 @@ def legacy(**kwargs):
     * `fit_oversample` (int, optiona, default=5): Number of times to sample
         per-datapoint for finite-time integration (only applicable when `fit_method`
         is 'oversample')
+    * `fti_integration` (string, optional, default='mean'): rule used to
+        integrate over the exposure (only applicable when `fti_method` is
+        'oversample').
 
     Returns
     --------
@@ -291,6 +339,7 @@ def legacy(**kwargs):
 
     params += [ChoiceParameter(qualifier='fti_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_method', 'none'), choices=['none', 'oversample'], description='How to handle finite-time integration (when non-zero exptime)')]
     params += [IntParameter(visible_if='fti_method:oversample', qualifier='fti_oversample', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_oversample', 5), limits=(1,None), default_unit=u.dimensionless_unscaled, description='Number of times to sample per-datapoint for finite-time integration')]
+    params += [ChoiceParameter(visible_if='fti_method:oversample', qualifier='fti_integration', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_integration', 'mean'), choices=['mean', 'simpson', 'gauss-legendre'], advanced=True, description='Rule used to integrate over the exposure for finite-time integration.  mean: average of fti_oversample equally-spaced samples.  simpson: Simpson\'s rule over fti_oversample equally-spaced samples.  gauss-legendre: Gauss-Legendre quadrature with fti_oversample nodes (typically requires fewer samples for the same accuracy)')]
 
 
     return ParameterSet(params)
@@ -415,6 +464,7 @@ def photodynam(**kwargs):
 
     params += [ChoiceParameter(qualifier='fti_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_method', 'none'), choices=['none', 'oversample'], description='How to handle finite-time integration (when non-zero exptime)')]
     params += [IntParameter(visible_if='fti_method:oversample', qualifier='fti_oversample', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_oversample', 5), limits=(1,None), default_unit=u.dimensionless_unscaled, description='Number of times to sample per-datapoint for finite-time integration')]
+    params += [ChoiceParameter(visible_if='fti_method:oversample', qualifier='fti_integration', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_integration', 'mean'), choices=['mean', 'simpson', 'gauss-legendre'], advanced=True, description='Rule used to integrate over the exposure for finite-time integration.  mean: average of fti_oversample equally-spaced samples.  simpson: Simpson\'s rule over fti_oversample equally-spaced samples.  gauss-legendre: Gauss-Legendre quadrature with fti_oversample nodes (typically requires fewer samples for the same accuracy)')]
 
 
     return ParameterSet(params)
@@ -561,6 +611,7 @@ def jktebop(**kwargs):
 
     params += [ChoiceParameter(qualifier='fti_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_method', 'none'), choices=['none', 'oversample'], description='How to handle finite-time integration (when non-zero exptime)')]
     params += [IntParameter(visible_if='fti_method:oversample', qualifier='fti_oversample', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_oversample', 5), limits=(1,None), default_unit=u.dimensionless_unscaled, description='Number of times to sample per-datapoint for finite-time integration')]
+    params += [ChoiceParameter(visible_if='fti_method:oversample', qualifier='fti_integration', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_integration', 'mean'), choices=['mean', 'simpson', 'gauss-legendre'], advanced=True, description='Rule used to integrate over the exposure for finite-time integration.  mean: average of fti_oversample equally-spaced samples.  simpson: Simpson\'s rule over fti_oversample equally-spaced samples.  gauss-legendre: Gauss-Legendre quadrature with fti_oversample nodes (typically requires fewer samples for the same accuracy)')]
 
     return ParameterSet(params)
 
@@ -691,6 +742,8 @@ def ellc(**kwargs):
         for finite exposure times.
     * `fti_oversample` (int, optional, default=1): number of integration points
         used to account for finite exposure time.  Only used if `fti_method`='oversample'.
+    * `fti_integration` (string, optional, default='mean'): rule used to
+        integrate over the exposure.  Only used if `fti_method`='oversample'.
 
     Returns
     --------
@@ -722,6 +775,7 @@ def ellc(**kwargs):
     # copy for RV datasets once exptime support for RVs in phoebe
     params += [ChoiceParameter(qualifier='fti_method', copy_for = {'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_method', 'none'), choices=['none', 'ellc', 'oversample'], description='How to handle finite-time integration (when non-zero exptime).  ellc: use ellcs native oversampling. oversample: use phoebe\'s oversampling')]
     params += [IntParameter(visible_if='fti_method:ellc|oversample', qualifier='fti_oversample', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_oversample', 5), limits=(1, None), default_unit=u.dimensionless_unscaled, description='number of integration points used to account for finite exposure time.')]
+    params += [ChoiceParameter(visible_if='fti_method:oversample', qualifier='fti_integration', copy_for={'kind': ['lc'], 'dataset': '*'}, dataset='_default', value=kwargs.get('fti_integration', 'mean'), choices=['mean', 'simpson', 'gauss-legendre'], advanced=True, description='Rule used to integrate over the exposure for finite-time integration.  mean: average of fti_oversample equally-spaced samples.  simpson: Simpson\'s rule over fti_oversample equally-spaced samples.  gauss-legendre: Gauss-Legendre quadrature with fti_oversample nodes (typically requires fewer samples for the same accuracy)')]
 
     params += [ChoiceParameter(qualifier='irrad_method', value=kwargs.get('irrad_method', 'lambert'), choices=['lambert', 'none'], description='Which method to use to handle all irradiation effects.  Note that irradiation and rv_method=\'flux-weighted\' cannot be used together.')]
 
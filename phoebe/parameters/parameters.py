@@ -27,6 +27,9 @@ import time
 import types
 import tempfile
 import subprocess
+import struct
+import zipfile
+import uuid
 from collections import OrderedDict
 from fnmatch import fnmatch
 from copy import deepcopy as _deepcopy
@@ -153,6 +156,35 @@ _meta_fields_twig = ['time', 'qualifier', 'feature', 'component',
 _meta_fields_all = _meta_fields_twig + ['twig', 'uniquetwig', 'uniqueid']
 _meta_fields_filter = _meta_fields_all + ['constraint_func', 'value']
 
+# meta-tags that are indexed by the bundle for faster filtering, see
+# ParameterSet._get_tag_index
+_meta_fields_indexed = _meta_fields_twig + ['uniqueid']
+_meta_fields_indexed_attrs = frozenset(['_{}'.format(k) for k in _meta_fields_indexed])
+# prefixes of twigs that are handled as methods in ParameterSet.filter_or_get
+_twig_methods = ['value', 'quantity', 'unit', 'default_unit', 'timederiv', 'description', 'choices', 'result']
+
+# qualifiers of all parameters referenced by any visible_if expression, changing
+# the value of any of these invalidates the cached visibility of all parameters
+# in the bundle, see Parameter.is_visible
+_visible_if_qualifiers = set(['hierarchy', 'enabled'])
+
+def _visible_if_referenced_qualifiers(visible_if):
+    """
+    parse the qualifiers referenced by a visible_if expression (see
+    Parameter._is_visible for the syntax)
+    """
+    qualifiers = []
+    for visible_if_i in visible_if.split('||'):
+        for visible_if_ii in visible_if_i.split(','):
+            qualifier = visible_if_ii.split(']')[-1].split(':')[0]
+            if qualifier.startswith('hierarchy.'):
+                qualifiers.append('hierarchy')
+            elif qualifier == 'ds_has_enabled_feature':
+                qualifiers.append('enabled')
+            elif len(qualifier) and qualifier.lower() != 'false':
+                qualifiers.append(qualifier)
+    return qualifiers
+
 _contexts = ['system', 'component', 'feature',
              'dataset', 'constraint', 'distribution', 'compute', 'model',
              'solver', 'solution', 'figure', 'server', 'setting']
@@ -245,13 +277,15 @@ _forbidden_labels += ['enabled', 'dynamics_method', 'ltte', 'comments',
                       'irrad_method', 'boosting_method', 'mesh_method', 'distortion_method',
                       'ntriangles', 'rv_grav',
                       'mesh_offset', 'mesh_init_phi', 'horizon_method', 'eclipse_method',
-                      'atm', 'lc_method', 'rv_method', 'fti_method', 'fti_oversample',
+                      'atm', 'lc_method', 'rv_method', 'fti_method', 'fti_oversample', 'fti_integration', 'phase_grid', 'phase_grid_tol',
                       'pblum_method', 'requiv_max_limit',
                       'etv_method', 'etv_tol',
                       'gridsize', 'refl_num', 'ie',
                       'stepsize', 'orbiterror', 'ringsize',
                       'exact_grav', 'grid', 'hf',
-                      'sample_from', 'sample_from_combine', 'sample_num', 'sample_mode'
+                      'sample_from', 'sample_from_combine', 'sample_num', 'sample_mode',
+                      'multiprocess_times', 'persistent_workers', 'intens_visible_only',
+                      'irrad_warm_start', 'irrad_reuse_tol'
                       ]
 
 # from solver:
@@ -259,7 +293,7 @@ _forbidden_labels += ['nwalkers', 'niters', 'priors', 'priors_requires', 'init_f
                       'lc_datasets', 'rv_datasets', 'lc_combine',
                       'phase_bin', 'phase_nbins', 'ebai_method',
                       'algorithm', 'duration', 'minimum_n_cycles', 'frequency_factor',
-                      'samples_per_peak', 'nyquist_factor',
+                      'samples_per_peak', 'nyquist_factor', 'chunk_size',
                       't0_near_times', 'sample_periods', 'sample_frequencies', 'objective',
                       'expose_lnlikelihoods', 'expose_lnprobabilities', 'fit_parameters', 'initial_values',
                       'expose_model', 'gtol', 'norm', 'xtol', 'ftol',
@@ -516,6 +550,144 @@ def parameter_from_json(dictionary, bundle=None):
 
     return cls._from_json(bundle, **dictionary)
 
+# binary (zip) file format, see ParameterSet.save(binary=True):
+# * parameters.json: the json representation of all parameters, with the
+#   value of large numeric arrays replaced by {'npy': member}
+# * arrays/*.npy: the arrays themselves, stored without compression so that
+#   they can be memory-mapped directly from the file when opening
+_binary_manifest = 'parameters.json'
+_binary_min_array_size = 100
+
+def _is_binary_file(filename):
+    """
+    whether `filename` points to a file saved with ParameterSet.save(binary=True)
+    """
+    if not isinstance(filename, str) or "{" in filename:
+        return False
+    filename = os.path.expanduser(filename)
+    return os.path.isfile(filename) and zipfile.is_zipfile(filename)
+
+def _get_binary_array(param):
+    """
+    return the value of `param` (in default units) if it should be stored as
+    a separate array in the binary file format, otherwise None
+    """
+    if isinstance(param, FloatArrayParameter) and isinstance(param._value, np.ndarray):
+        # NOTE: nparray objects are left to the manifest as they are already
+        # compact (ie. linspace)
+        value = param.get_value()
+    elif isinstance(param, ArrayParameter) and isinstance(param._value, np.ndarray):
+        value = param._value
+    else:
+        return None
+
+    if value.dtype.kind not in 'biufc' or value.size < _binary_min_array_size:
+        return None
+    return value
+
+def _save_binary(filename, params, incl_uniqueid=False):
+    """
+    write the binary file format for the list of `params`.  Any arrays
+    selected by _get_binary_array are only written as .npy members (and are
+    never converted to lists for the JSON manifest).
+    """
+    filename = os.path.expanduser(filename)
+
+    # NOTE: write to a temporary file first so that any arrays that are still
+    # memory-mapped from an existing file at filename remain valid.  The file
+    # is created with mode 0o666 (less the umask, as when saving to JSON).
+    tmp_filename = '{}.{}.tmp'.format(os.path.abspath(filename), uuid.uuid4().hex)
+    fd = os.open(tmp_filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        json_params = []
+        with os.fdopen(fd, 'wb') as fobj, zipfile.ZipFile(fobj, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for i, param in enumerate(params):
+                value = _get_binary_array(param)
+                if value is None:
+                    json_params.append(param.to_json(incl_uniqueid=incl_uniqueid))
+                    continue
+
+                member = 'arrays/{}.npy'.format(i)
+                with zf.open(member, 'w', force_zip64=True) as f:
+                    np.lib.format.write_array(f, np.ascontiguousarray(value), allow_pickle=False)
+                json_param = param.to_json(incl_uniqueid=incl_uniqueid, exclude=['value'])
+                json_param['value'] = {'npy': member}
+                json_params.append(json_param)
+
+            zf.writestr(_binary_manifest, json.dumps(json_params))
+
+        os.replace(tmp_filename, filename)
+    except:
+        os.remove(tmp_filename)
+        raise
+
+    return filename
+
+def _memmap_binary_array(filename, zf, member):
+    """
+    memory-map (copy-on-write) an array stored in the binary file format,
+    without reading its data
+    """
+    info = zf.getinfo(member)
+    if info.compress_type != zipfile.ZIP_STORED:
+        with zf.open(member, 'r') as f:
+            return np.lib.format.read_array(f, allow_pickle=False)
+
+    with open(filename, 'rb') as f:
+        # skip the local file header of the member (the lengths of the
+        # filename and extra fields here may differ from those in the central
+        # directory)
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+
+    return np.memmap(filename, dtype=dtype, mode='c', offset=offset, shape=shape, order='F' if fortran_order else 'C')
+
+def _open_binary(filename):
+    """
+    read the manifest of the binary file format.
+
+    Returns
+    ---------
+    * (list, dict): the json representation of each parameter (with empty
+        placeholder values for any stored arrays) and a dictionary of the
+        memory-mapped arrays with the index in the list as keys.  Once the
+        parameters are created, pass the arrays to <phoebe.parameters.parameters._set_binary_arrays>.
+    """
+    filename = os.path.expanduser(filename)
+    arrays = {}
+    with zipfile.ZipFile(filename, 'r') as zf:
+        data = json.loads(zf.read(_binary_manifest).decode('utf-8'), object_pairs_hook=parse_json)
+        for i, param_dict in enumerate(data):
+            value = param_dict.get('value', None)
+            if isinstance(value, dict) and 'npy' in value.keys():
+                arrays[i] = _memmap_binary_array(filename, zf, value['npy'])
+                param_dict['value'] = []
+
+    return data, arrays
+
+def _set_binary_arrays(params, arrays):
+    """
+    set the values of `params` from the arrays returned by <phoebe.parameters.parameters._open_binary>.
+
+    The values are set directly (without copying or any checks on the values)
+    so that the data is only read from disk once accessed.
+    """
+    for i, value in arrays.items():
+        param = params[i]
+        if isinstance(param, FloatArrayParameter) and param.default_unit is not None:
+            param._value = u.Quantity(value, param.default_unit, copy=False)
+        else:
+            param._value = np.asarray(value)
+
 def _instance_in(obj, *types):
     for typ in types:
         if isinstance(obj, typ):
@@ -588,6 +760,10 @@ class ParameterSet(object):
     the Parameter or on "twig" notation (a single string using '@' symbols to
     separate these same tags).
     """
+    # whether to index the tags of the parameters to speed up filtering (see
+    # ParameterSet._get_tag_index).  Only worth it for long-lived sets (ie.
+    # the Bundle), so is overridden there.
+    _use_tag_index = False
 
     def __init__(self, params=[]):
         """Initialize a new ParameterSet.
@@ -818,6 +994,12 @@ class ParameterSet(object):
             if key is not None and key not in keys_for_this_field and (include_default or key!='_default'):
                 keys_for_this_field.append(key)
 
+        # include the tags of any deferred parameters without creating them
+        for group in self.__dict__.get('_lazy_params', {}).values():
+            for key in group['tags'].get(tag, []):
+                if key not in keys_for_this_field and (include_default or key!='_default'):
+                    keys_for_this_field.append(key)
+
         return keys_for_this_field
 
     @property
@@ -1781,7 +1963,8 @@ class ParameterSet(object):
     @classmethod
     def open(cls, filename):
         """
-        Open a ParameterSet from a JSON-formatted file.
+        Open a ParameterSet from a JSON-formatted file (or a binary file
+        saved with `binary=True`, see <phoebe.parameters.ParameterSet.save>).
         This is a constructor so should be called as:
 
         ```py
@@ -1802,6 +1985,12 @@ class ParameterSet(object):
         ---------
         * an instantiated <phoebe.parameters.ParameterSet> object
         """
+        if _is_binary_file(filename):
+            data, arrays = _open_binary(filename)
+            ps = cls(data)
+            _set_binary_arrays(ps._params, arrays)
+            return ps
+
         if isinstance(filename, list):
             data = filename
         elif isinstance(filename, str) and "{" in filename:
@@ -1818,7 +2007,7 @@ class ParameterSet(object):
 
         return cls(data)
 
-    def save(self, filename, incl_uniqueid=False, compact=False, sort_by_context=True):
+    def save(self, filename, incl_uniqueid=False, compact=False, sort_by_context=True, binary=False):
         """
         Save the ParameterSet to a JSON-formatted ASCII file.
 
@@ -1834,11 +2023,23 @@ class ParameterSet(object):
             uniqueids when reloading)
         * `compact` (bool, optional, default=False): whether to use compact
             file-formatting (may be quicker to save/load, but not as easily readable)
+        * `binary` (bool, optional, default=False): whether to instead save
+            to a (zip) archive containing the JSON representation of the
+            parameters and the values of any large arrays as separate .npy
+            files.  These arrays are memory-mapped when opening the file
+            (<phoebe.parameters.ParameterSet.open> and <phoebe.frontend.bundle.Bundle.open>
+            detect the format automatically), so that their data is only read
+            from disk when accessed.  `compact` is ignored if `binary` is True.
 
         Returns
         --------
         * (string) filename
         """
+        if binary:
+            self._load_lazy_params()
+            params = self._to_list_sorted_by_context() if sort_by_context else self.to_list()
+            return _save_binary(filename, params, incl_uniqueid=incl_uniqueid)
+
         filename = os.path.expanduser(filename)
         f = open(filename, 'w')
         if compact:
@@ -2427,6 +2628,14 @@ class ParameterSet(object):
         """
         return iter(self.to_dict())
 
+    def _to_list_sorted_by_context(self):
+        params = []
+        for context in _contexts:
+            params += self.filter(context=context,
+                                  check_visible=False,
+                                  check_default=False).to_list()
+        return params
+
     def to_json(self, incl_uniqueid=False, incl_none=False, exclude=[], sort_by_context=True):
         """
         Convert the <phoebe.parameters.ParameterSet> to a json-compatible
@@ -2454,16 +2663,14 @@ class ParameterSet(object):
         -----------
         * (list of dicts)
         """
-        lst = []
+        # any deferred parameters must be included as well
+        self._load_lazy_params()
+
         if sort_by_context:
-            for context in _contexts:
-                lst += [v.to_json(incl_uniqueid=incl_uniqueid, incl_none=incl_none, exclude=exclude)
-                        for v in self.filter(context=context,
-                                             check_visible=False,
-                                             check_default=False).to_list()]
+            return [v.to_json(incl_uniqueid=incl_uniqueid, incl_none=incl_none, exclude=exclude)
+                    for v in self._to_list_sorted_by_context()]
         else:
-            lst = [v.to_json(incl_uniqueid=incl_uniqueid, exclude=exclude) for v in self.to_list()]
-        return lst
+            return [v.to_json(incl_uniqueid=incl_uniqueid, exclude=exclude) for v in self.to_list()]
         # return {k: v.to_json() for k,v in self.to_flat_dict().items()}
 
     def export_arrays(self, fname,
@@ -2795,8 +3002,20 @@ class ParameterSet(object):
                 return_ += self.filter_or_get(**kwargs)
             return return_
 
+        if self._bundle is self and self.__dict__.get('_lazy_params', None):
+            # create any deferred parameters that could match this filter
+            self._load_lazy_params(twig=twig, autocomplete=autocomplete, **kwargs)
+
         params = self.to_list()
 
+        if self._use_tag_index and len(params):
+            # use the index of the bundle to only consider the parameters that
+            # could match the exact (non-wildcard) tags and twig.  All checks
+            # below are still applied, but on a (much) shorter list.
+            positions = self._get_tag_index_positions(twig, autocomplete, kwargs)
+            if positions is not None:
+                params = [params[i] for i in sorted(positions)]
+
         def string_to_time(string):
             try:
                 return float(string)
@@ -2927,6 +3146,184 @@ class ParameterSet(object):
 
         return _return(params, force_ps, method, mindex)
 
+    def _defer_params(self, data, arrays={}):
+        """
+        Defer creating the parameters from their json representations in
+        `data` until they are matched by a filter (see
+        <phoebe.parameters.ParameterSet._load_lazy_params>).
+
+        Parameters are grouped by context and the label in that context (ie.
+        all parameters of a single model are created at once) and the values
+        of all the tags of each group are stored so that filtering can decide
+        which groups need to be created.
+
+        Arguments
+        ----------
+        * `data` (list): json representation of each parameter.
+        * `arrays` (dict, optional): arrays to set for the values of entries
+            in `data`, as returned by <phoebe.parameters.parameters._open_binary>.
+        """
+        lazy_params = self.__dict__.get('_lazy_params', None) or OrderedDict()
+        for i, param_dict in enumerate(data):
+            context = param_dict.get('context', None)
+            group = lazy_params.setdefault((context, param_dict.get(context, None)), {'params': [], 'tags': {}})
+            group['params'].append((param_dict, arrays.get(i, None)))
+            for tag in _meta_fields_indexed:
+                value = param_dict.get(tag, None)
+                if value is not None:
+                    group['tags'].setdefault(tag, set()).add(value.lower() if tag == 'kind' else value)
+
+        self._lazy_params = lazy_params
+
+    def _load_lazy_params(self, twig=None, autocomplete=False, **kwargs):
+        """
+        Create (and attach) the parameters deferred by
+        <phoebe.parameters.ParameterSet._defer_params> in any group that could
+        match the filter in `twig` and `kwargs`.  If not passing any filter,
+        all deferred parameters will be created.
+        """
+        def _matches(values, expressions):
+            return np.any([_fnmatch(value, expression) for value in values for expression in expressions])
+
+        def _group_matches(tags):
+            for k, v in kwargs.items():
+                if k not in _meta_fields_indexed or v is None:
+                    continue
+                expressions = v if isinstance(v, list) or isinstance(v, tuple) else [v]
+                if not len(expressions) or not np.all([isinstance(e, str) for e in expressions]):
+                    continue
+                if k == 'kind':
+                    expressions = [e.lower() for e in expressions]
+                if not _matches(tags.get(k, []), expressions):
+                    return False
+
+            if twig is not None and not autocomplete:
+                values = set().union(*tags.values())
+                for piece in twig.split('@'):
+                    piece = piece.split('[')[0]
+                    if not len(piece) or piece in _twig_methods:
+                        continue
+                    if not _matches(values, [piece]):
+                        return False
+
+            return True
+
+        lazy_params = self.__dict__.get('_lazy_params', None)
+        if not lazy_params:
+            return
+
+        params = []
+        for key in [key for key, group in lazy_params.items() if _group_matches(group['tags'])]:
+            group = lazy_params.pop(key)
+            logger.debug("creating {} deferred parameters in {}={}".format(len(group['params']), key[0], key[1]))
+            for param_dict, array in group['params']:
+                param = parameter_from_json(param_dict, self)
+                param._bundle = self
+                if array is not None:
+                    _set_binary_arrays([param], {0: array})
+                params.append(param)
+
+        # NOTE: extend (instead of replace) the list of parameters so that the
+        # index of the bundle is extended instead of rebuilt
+        self._params += params
+
+    def _get_visible_if_epoch(self):
+        """
+        Access the counter used to invalidate the visibility cached by each
+        <phoebe.parameters.Parameter> (see <phoebe.parameters.Parameter.is_visible>).
+
+        The counter is incremented by <phoebe.parameters.Parameter> whenever
+        the value of a parameter referenced by any `visible_if` expression
+        (or any tag) is changed, and here whenever parameters are attached
+        or removed.
+        """
+        if self.__dict__.get('_visible_if_params', None) is not self._params or self._visible_if_nparams != len(self._params):
+            self._visible_if_params = self._params
+            self._visible_if_nparams = len(self._params)
+            self._visible_if_epoch = self.__dict__.get('_visible_if_epoch', 0) + 1
+        return self._visible_if_epoch
+
+    def _get_tag_index(self):
+        """
+        Access the index from the value of each meta-tag (and of each piece
+        of the twig) to the positions of the matching parameters in
+        `self._params`, building or extending it first if necessary.
+
+        The index is extended when parameters are appended, rebuilt when
+        parameters are removed (which replaces `self._params`), and cleared by
+        <phoebe.parameters.Parameter> whenever a tag of an indexed parameter
+        is changed.
+        """
+        index = self.__dict__.get('_tag_index', None)
+        if index is None or index['params'] is not self._params:
+            index = {'params': self._params,
+                     'n': 0,
+                     'ids': {},
+                     'tags': {k: {} for k in _meta_fields_indexed},
+                     'twig': {}}
+            self._tag_index = index
+
+        tags = index['tags']
+        twiglets = index['twig']
+        for i in range(index['n'], len(self._params)):
+            param = self._params[i]
+            index['ids'][id(param)] = i
+            for k in _meta_fields_indexed:
+                v = getattr(param, k)
+                if v is None:
+                    continue
+                # filtering on kind is case-insensitive
+                tags[k].setdefault(v.lower() if k == 'kind' else v, set()).add(i)
+                if k != 'uniqueid':
+                    twiglets.setdefault(v, set()).add(i)
+        index['n'] = len(self._params)
+
+        return index
+
+    def _get_tag_index_positions(self, twig, autocomplete, kwargs):
+        """
+        Return the set of positions in `self._params` of all parameters that
+        could match the exact-match tags in `kwargs` and the pieces of `twig`,
+        or None if none of the filters can be handled by the index.
+        """
+        def _is_exact(values):
+            return np.all([isinstance(v, str) and '*' not in v and '?' not in v for v in values])
+
+        lookups = []
+        for k, v in kwargs.items():
+            if k not in _meta_fields_indexed or k == 'time' or v is None:
+                continue
+            values = v if isinstance(v, list) else [v]
+            if not _is_exact(values):
+                continue
+            lookups.append((k, [vi.lower() for vi in values] if k == 'kind' else values))
+
+        if isinstance(twig, str) and not autocomplete:
+            try:
+                twig_noindex, twig_index = _extract_index_from_string(twig)
+            except ValueError:
+                twig_index = 'invalid'
+            if twig_index is None:
+                for ti in twig_noindex.split('@'):
+                    if len(ti) and ti not in _twig_methods and _is_exact([ti]):
+                        lookups.append(('twig', [ti]))
+
+        if not len(lookups):
+            return None
+
+        index = self._get_tag_index()
+        positions = None
+        for k, values in lookups:
+            k_index = index['twig'] if k == 'twig' else index['tags'][k]
+            k_positions = set()
+            for v in values:
+                k_positions.update(k_index.get(v, []))
+            positions = k_positions if positions is None else positions.intersection(k_positions)
+            if not len(positions):
+                break
+
+        return positions
+
     def exclude(self, twig=None, check_visible=False, check_default=False, **kwargs):
         """
         Exclude the results from this filter from the current
@@ -6373,6 +6770,27 @@ class Parameter(object):
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __setattr__(self, name, value):
+        if name == '_visible_if' and isinstance(value, str):
+            _visible_if_qualifiers.update(_visible_if_referenced_qualifiers(value))
+
+        bundle = self.__dict__.get('_bundle', None)
+        if bundle is not None:
+            if name in _meta_fields_indexed_attrs:
+                # changing a tag of an indexed parameter requires the index of the
+                # bundle to be rebuilt (see ParameterSet._get_tag_index)
+                index = bundle.__dict__.get('_tag_index', None)
+                if index is not None and id(self) in index['ids']:
+                    bundle._tag_index = None
+
+            if name in _meta_fields_indexed_attrs or name == '_visible_if' or \
+                    (name in ['_value', '_choices'] and self.__dict__.get('_qualifier', None) in _visible_if_qualifiers):
+                # invalidate the visibility cached by all parameters in the
+                # bundle (see Parameter.is_visible)
+                bundle._visible_if_epoch = bundle.__dict__.get('_visible_if_epoch', 0) + 1
+
+        super(Parameter, self).__setattr__(name, value)
+
     def copy(self):
         """
         Deepcopy the <phoebe.parameters.Parameter> (with a new uniqueid).
@@ -7214,7 +7632,21 @@ class Parameter(object):
         --------
         * (bool):  whether this parameter is currently visible
         """
-        return self._is_visible()
+        # NOTE: the result is cached until the value of any parameter referenced
+        # by a visible_if expression (or any tag) changes or parameters are
+        # attached to or removed from the bundle
+        bundle = self._bundle
+        if bundle is None or self._visible_if is None:
+            return self._is_visible()
+
+        epoch = bundle._get_visible_if_epoch()
+        cache = self.__dict__.get('_is_visible_cache', None)
+        if cache is not None and cache[0] is bundle and cache[1] == epoch:
+            return cache[2]
+
+        is_visible = self._is_visible()
+        self._is_visible_cache = (bundle, epoch, is_visible)
+        return is_visible
 
 
     def _is_visible(self, visible_if=None):
@@ -9875,7 +10307,9 @@ class FloatParameter(Parameter):
 
         _orig_quantity = _deepcopy(self.get_quantity())
 
-        if len(self.constrained_by) and not force:
+        # NOTE: constrained_by requires filtering the bundle, so only check if
+        # not forced (ie. when setting from a constraint)
+        if not force and len(self.constrained_by):
             raise ValueError("cannot change the value of a constrained parameter.  This parameter is constrained by '{}'".format(', '.join([p.uniquetwig for p in self.constrained_by])))
 
         # if 'time' in kwargs.keys() and isinstance(self, FloatArrayParameter):
@@ -9940,14 +10374,14 @@ class FloatParameter(Parameter):
         if _orig_quantity is not None and self.__class__.__name__ == 'FloatParameter' and abs(_orig_quantity - value).value < 1e-12:
             logger.debug("value of {} didn't change within 1e-12, skipping triggering of constraints".format(self.twig))
         elif run_constraints:
-            if len(self._in_constraints):
+            if len(self._in_constraints) and logger.isEnabledFor(logging.DEBUG):
                 logger.debug("changing value of {} triggers {} constraints".format(self.twig, [c.twig for c in self.in_constraints]))
             for constraint_id in self._in_constraints:
                 self._bundle.run_constraint(uniqueid=constraint_id, skip_kwargs_checks=True, run_constraints=run_constraints)
         else:
             # then we want to delay running constraints... so we need to track
             # which ones need to be run once requested
-            if len(self._in_constraints):
+            if len(self._in_constraints) and logger.isEnabledFor(logging.DEBUG):
                 logger.debug("changing value of {} triggers delayed constraints {}".format(self.twig, [c.twig for c in self.in_constraints]))
             for constraint_id in self._in_constraints:
                 if constraint_id not in self._bundle._delayed_constraints:
@@ -11718,8 +12152,15 @@ class ConstraintParameter(Parameter):
         # reset the cached version of the PS - will be recomputed on next request
         self._var_params = None
         self._addl_var_params = None
+        self._invalidate_constraint_graph()
         #~ print "***", self.uniquetwig, self.uniqueid
 
+    def _invalidate_constraint_graph(self):
+        # the bundle's compiled constraint graph is no longer up-to-date
+        constraint_graph = getattr(self._bundle, '_constraint_graph', None)
+        if constraint_graph is not None:
+            constraint_graph.invalidate()
+
     def _update_bookkeeping(self):
         # do bookkeeping on parameters
         self._remove_bookkeeping()
@@ -11745,6 +12186,7 @@ class ConstraintParameter(Parameter):
 
     def _remove_bookkeeping(self):
         # logger.debug("ConstraintParameter {} _remove_bookkepping".format(self.twig))
+        self._invalidate_constraint_graph()
         vars = self.vars + self.addl_vars
         for param in vars.to_list():
             if hasattr(param, '_is_constraint') and param._is_constraint == self.uniqueid:
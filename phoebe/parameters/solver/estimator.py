@@ -97,6 +97,11 @@ def lc_periodogram(**kwargs):
         average nyquist frequency used to choose the maximum frequency.  This is
         passed directly to autopower. See
         https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower
+    * `chunk_size` (int, optional, default=100000): maximum number of sampled
+        periods/frequencies to evaluate at once.  The grid is split into chunks
+        which are distributed over all available processors (see
+        <phoebe.multiprocessing_on> or within MPI) and the resulting power
+        spectra are merged.
 
 
     Returns
@@ -128,6 +133,8 @@ def lc_periodogram(**kwargs):
     params += [IntParameter(visible_if='sample_mode:auto,algorithm:ls', qualifier='samples_per_peak', value=kwargs.get('samples_per_peak', 10), advanced=True, limits=(1,None), description='The approximate number of desired samples across the typical peak.  This is passed directly to autopower. See https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower')]
     params += [IntParameter(visible_if='sample_mode:auto,algorithm:ls', qualifier='nyquist_factor', value=kwargs.get('nyquist_factor', 5), advanced=True, limits=(1,None), description='The multiple of the average nyquist frequency used to choose the maximum frequency.  This is passed directly to autopower. See https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower')]
 
+    params += [IntParameter(qualifier='chunk_size', value=kwargs.get('chunk_size', 100000), advanced=True, limits=(1,None), description='Maximum number of sampled periods/frequencies to evaluate at once.  The grid is split into chunks which are distributed over all available processors and then merged.')]
+
     return ParameterSet(params)
 
 def rv_periodogram(**kwargs):
@@ -187,6 +194,11 @@ def rv_periodogram(**kwargs):
         average nyquist frequency used to choose the maximum frequency.  This is
         passed directly to autopower. See
         https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower
+    * `chunk_size` (int, optional, default=100000): maximum number of sampled
+        periods/frequencies to evaluate at once.  The grid is split into chunks
+        which are distributed over all available processors (see
+        <phoebe.multiprocessing_on> or within MPI) and the resulting power
+        spectra are merged.
 
 
 
@@ -212,6 +224,8 @@ def rv_periodogram(**kwargs):
     params += [IntParameter(visible_if='sample_mode:auto,algorithm:ls', qualifier='samples_per_peak', value=kwargs.get('samples_per_peak', 10), advanced=True, limits=(1,None), description='The approximate number of desired samples across the typical peak.  This is passed directly to autopower. See https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower')]
     params += [IntParameter(visible_if='sample_mode:auto,algorithm:ls', qualifier='nyquist_factor', value=kwargs.get('nyquist_factor', 5), advanced=True, limits=(1,None), description='The multiple of the average nyquist frequency used to choose the maximum frequency.  This is passed directly to autopower. See https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower')]
 
+    params += [IntParameter(qualifier='chunk_size', value=kwargs.get('chunk_size', 100000), advanced=True, limits=(1,None), description='Maximum number of sampled periods/frequencies to evaluate at once.  The grid is split into chunks which are distributed over all available processors and then merged.')]
+
     return ParameterSet(params)
 
 
@@ -391,6 +405,9 @@ def ebai(**kwargs):
     all nans and a logger warning if either eclipse from the 2 gaussian model has
     a width greater than 0.25 (in phase-space). Use ebai_method = `knn` instead.
 
+    To run ebai on a large number of light curves outside of a bundle, see
+    <phoebe.helpers.ebai_batch>.
+
     Generally, this will be used as an input to the kind argument in
     <phoebe.frontend.bundle.Bundle.add_solver>.  If attaching through
     <phoebe.frontend.bundle.Bundle.add_solver>, all `**kwargs` will be
@@ -19,7 +19,12 @@ h2o = np.loadtxt(os.path.join(_dir, 'h2o.weights'))
 bounds = np.loadtxt(os.path.join(_dir, 'bounds.data'))
 
 def ebai_forward(fluxes):
-	if len(fluxes) != 201:
+	"""
+	fluxes can either be a single light curve or a 2D array with one light
+	curve per row, in which case one row of outputs is returned per light curve.
+	"""
+	fluxes = np.asarray(fluxes)
+	if fluxes.shape[-1] != 201:
 		raise ValueError("fluxes must have length of 201 (evenly sampled in phase-space)")
 
-	return _rescale(_activate(np.matmul(h2o, _activate(np.matmul(i2h, fluxes)))), bounds=bounds)
+	return _rescale(_activate(np.matmul(_activate(np.matmul(fluxes, i2h.T)), h2o.T)), bounds=bounds)
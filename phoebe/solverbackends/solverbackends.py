@@ -24,6 +24,7 @@ from distutils.version import LooseVersion, StrictVersion
 from copy import deepcopy as _deepcopy
 import multiprocessing
 import pickle
+import uuid
 
 from . import rv_geometry
 from .ebai import ebai_forward
@@ -103,6 +104,57 @@ def _bsolver(b, solver, compute, distributions, wrap_central_values={}):
     return bexcl
 
 
+# bundle (keyed by its token) reused by _lnprobability within this process
+_worker_bundles = {}
+
+def _init_worker_bundle(token, b):
+    _worker_bundles.clear()
+    _worker_bundles[token] = b
+
+def _get_worker_bundle(b):
+    """
+    Return the bundle to use within _lnprobability in this process.
+
+    `b` is either the token of a bundle sent to this process by
+    _init_worker_bundle or a bundle registered by _worker_bundle_pool, which
+    is then kept for all subsequent calls.  Any other bundle is copied, so
+    that the bundle passed in is never changed.
+    """
+    if isinstance(b, str):
+        return _worker_bundles[b]
+
+    token = getattr(b, '_worker_token', None)
+    if token is None:
+        return b.copy()
+
+    if token not in _worker_bundles.keys():
+        _init_worker_bundle(token, b)
+    return _worker_bundles[token]
+
+def _worker_bundle_pool(pool, b, owns_pool=False):
+    """
+    Register the bundle `b` (which must be private to the solver, see _bsolver)
+    to be reused by _lnprobability within each process of `pool` (instead of
+    copying the bundle for every evaluation).
+
+    A MultiPool created by the backend itself (`owns_pool`) is replaced by one
+    that sends the bundle to each worker once when it starts, in which case
+    only the token needs to be passed along with each task.  Any other pool is
+    used as-is.
+
+    Returns the pool to use and the value to pass as `b` to _lnprobability.
+    """
+    token = uuid.uuid4().hex
+    b._worker_token = token
+
+    if owns_pool and isinstance(pool, _pool.MultiPool):
+        processes = pool.size
+        pool.close()
+        pool = _pool.MultiPool(processes=processes, initializer=_init_worker_bundle, initargs=(token, b))
+        return pool, token
+
+    return pool, b
+
 def _lnprobability(sampled_values, b, params_uniqueids, compute,
                   priors, priors_combine,
                   solution,
@@ -134,65 +186,79 @@ def _lnprobability(sampled_values, b, params_uniqueids, compute,
 
         return lnprob
 
-    # copy the bundle to make sure any changes by setting values/running models
-    # doesn't affect the user-copy (or in other processors)
-    b = b.copy()
+    # use the bundle private to this process (copying if necessary) to make
+    # sure any changes by setting values/running models doesn't affect the
+    # user-copy (or in other processors).  Any sampled values are reset before
+    # returning.
+    b = _get_worker_bundle(b)
     # prevent any *_around distributions from adjusting to the changes in
     # face-values
     b._within_solver = True
-    if sampled_values is not False:
-        for uniqueid, value in zip(params_uniqueids, sampled_values):
-            uniqueid, index = _extract_index_from_string(uniqueid)
-            try:
-                if index is not None:
-                    b.get_parameter(uniqueid=uniqueid, **_skip_filter_checks).set_index_value(index=index, value=value, run_checks=False, run_constraints=False)
-                else:
-                    b.set_value(uniqueid=uniqueid, value=value, run_checks=False, run_constraints=False, **_skip_filter_checks)
-            except ValueError as err:
-                logger.warning("received error while setting values: {}. lnprobability=-inf".format(err))
-                return _return(-np.inf, str(err))
 
-    # run delayed constraints and failed constraints would be run within calculate_lnp or run_compute,
-    # but here we can catch the error in advance and return it appropriately
+    original_values = []
     try:
-        b.run_delayed_constraints()
-    except Exception as err:
-        logger.warning("received error while running constraints: {}. lnprobability=-inf".format(err))
-        return _return(-np.inf, str(err))
+        if sampled_values is not False:
+            for uniqueid, value in zip(params_uniqueids, sampled_values):
+                uniqueid, index = _extract_index_from_string(uniqueid)
+                param = b.get_parameter(uniqueid=uniqueid, **_skip_filter_checks)
+                original_values.append((param, _deepcopy(param.get_value())))
+                try:
+                    if index is not None:
+                        param.set_index_value(index=index, value=value, run_checks=False, run_constraints=False)
+                    else:
+                        b.set_value(uniqueid=uniqueid, value=value, run_checks=False, run_constraints=False, **_skip_filter_checks)
+                except ValueError as err:
+                    logger.warning("received error while setting values: {}. lnprobability=-inf".format(err))
+                    return _return(-np.inf, str(err))
 
-    try:
-        b.run_failed_constraints()
-    except Exception as err:
-        logger.warning("received error while running constraints: {}. lnprobability=-inf".format(err))
-        return _return(-np.inf, str(err))
+        # run delayed constraints and failed constraints would be run within calculate_lnp or run_compute,
+        # but here we can catch the error in advance and return it appropriately
+        try:
+            b.run_delayed_constraints()
+        except Exception as err:
+            logger.warning("received error while running constraints: {}. lnprobability=-inf".format(err))
+            return _return(-np.inf, str(err))
 
-    lnpriors = b.calculate_lnp(distribution=priors, combine=priors_combine, include_constrained=True)
-    if not np.isfinite(lnpriors):
-        # no point in calculating the model then
-        return _return(-np.inf, 'lnpriors = -inf')
+        try:
+            b.run_failed_constraints()
+        except Exception as err:
+            logger.warning("received error while running constraints: {}. lnprobability=-inf".format(err))
+            return _return(-np.inf, str(err))
 
-    # print("*** _lnprobability run_compute from rank: {}".format(mpi.myrank))
-    try:
-        # override sample_from that may be set in the compute options
-        compute_kwargs['sample_from'] = []
-        compute_kwargs['progressbar'] = False
-        compute_kwargs['use_server'] = 'none'
-        compute_kwargs['detach'] = False
-        b.run_compute(compute=compute, model=solution, do_create_fig_params=False, **compute_kwargs)
-    except Exception as err:
-        logger.warning("received error from run_compute: {}.  lnprobability=-inf".format(err))
-        return _return(-np.inf, str(err))
+        lnpriors = b.calculate_lnp(distribution=priors, combine=priors_combine, include_constrained=True)
+        if not np.isfinite(lnpriors):
+            # no point in calculating the model then
+            return _return(-np.inf, 'lnpriors = -inf')
 
-    # print("*** _lnprobability returning from rank: {}".format(mpi.myrank))
-    if custom_lnprobability_callable is None:
-        lnprob = lnpriors + b.calculate_lnlikelihood(model=solution, consider_gaussian_process=False)
-    else:
-        lnprob = custom_lnprobability_callable(b, model=solution, lnpriors=lnpriors, priors=priors, priors_combine=priors_combine)
+        # print("*** _lnprobability run_compute from rank: {}".format(mpi.myrank))
+        try:
+            # override sample_from that may be set in the compute options
+            compute_kwargs['sample_from'] = []
+            compute_kwargs['progressbar'] = False
+            compute_kwargs['use_server'] = 'none'
+            compute_kwargs['detach'] = False
+            # the bundle may already contain the model from a previous evaluation
+            compute_kwargs['overwrite'] = True
+            b.run_compute(compute=compute, model=solution, do_create_fig_params=False, **compute_kwargs)
+        except Exception as err:
+            logger.warning("received error from run_compute: {}.  lnprobability=-inf".format(err))
+            return _return(-np.inf, str(err))
+
+        # print("*** _lnprobability returning from rank: {}".format(mpi.myrank))
+        if custom_lnprobability_callable is None:
+            lnprob = lnpriors + b.calculate_lnlikelihood(model=solution, consider_gaussian_process=False)
+        else:
+            lnprob = custom_lnprobability_callable(b, model=solution, lnpriors=lnpriors, priors=priors, priors_combine=priors_combine)
+
+        if np.isnan(lnprob):
+            return _return(-np.inf, 'lnprobability returned nan')
 
-    if np.isnan(lnprob):
-        return _return(-np.inf, 'lnprobability returned nan')
+        return _return(lnprob, 'success')
 
-    return _return(lnprob, 'success')
+    finally:
+        # reset the sampled values in the (reused) bundle
+        for param, value in original_values[::-1]:
+            param.set_value(value, run_checks=False, run_constraints=False)
 
 def _lnprobability_negative(sampled_values, b, params_uniqueids, compute,
                            priors, priors_combine,
@@ -530,7 +596,10 @@ class BaseSolverBackend(object):
         # the worker receives the bundle serialized, so we need to unpack it
         logger.debug("rank:{}/{} _run_worker".format(mpi.myrank, mpi.nprocs))
         # do the computations requested for this worker
-        rpacketlists = self.run_worker(**packet)
+        try:
+            rpacketlists = self.run_worker(**packet)
+        finally:
+            _worker_bundles.clear()
         # send the results back to the master (root=0)
         mpi.comm.gather(rpacketlists, root=0)
 
@@ -543,16 +612,20 @@ class BaseSolverBackend(object):
         logger.debug("rank:{}/{} calling get_packet_and_solution".format(mpi.myrank, mpi.nprocs))
         packet, solution_ps = self.get_packet_and_solution(b, solver, compute=compute, **kwargs)
 
-        if mpi.enabled and self._allow_mpi:
-            # broadcast the packet to ALL workers
-            logger.debug("rank:{}/{} broadcasting to all workers".format(mpi.myrank, mpi.nprocs))
-            mpi.comm.bcast(packet, root=0)
+        try:
+            if mpi.enabled and self._allow_mpi:
+                # broadcast the packet to ALL workers
+                logger.debug("rank:{}/{} broadcasting to all workers".format(mpi.myrank, mpi.nprocs))
+                mpi.comm.bcast(packet, root=0)
 
-            # now even the master can become a worker and take on a chunk
-            rpacketlists_per_worker = [self.run_worker(**packet)]
+                # now even the master can become a worker and take on a chunk
+                rpacketlists_per_worker = [self.run_worker(**packet)]
 
-        else:
-            rpacketlists_per_worker = [self.run_worker(**packet)]
+            else:
+                rpacketlists_per_worker = [self.run_worker(**packet)]
+        finally:
+            # the bundles kept by _lnprobability are only valid for this run
+            _worker_bundles.clear()
 
         logger.debug("rank:{}/{} calling _fill_solution".format(mpi.myrank, mpi.nprocs))
         return self._fill_solution(solution_ps, rpacketlists_per_worker)
@@ -874,6 +947,22 @@ class Rv_GeometryBackend(BaseSolverBackend):
 
 
 
+def _periodogram_power(args):
+    """
+    Evaluate the power of the periodogram for a single chunk of `sample`
+    (periods for bls, frequencies for ls).  This is a module-level function
+    so that chunks can be distributed over any pool.
+    """
+    algorithm, times, y, sigmas, sample, power_kwargs = args
+    if algorithm == 'bls':
+        # NOTE: only the power is kept so that the remaining per-period
+        # arrays returned by astropy do not accumulate over the full grid
+        return np.asarray(_BoxLeastSquares(times, y, dy=sigmas).power(sample, **power_kwargs).power)
+    elif algorithm == 'ls':
+        return np.asarray(_LombScargle(times, y, dy=sigmas).power(sample, **power_kwargs))
+    else:
+        raise NotImplementedError("algorithm='{}' not supported".format(algorithm))
+
 class _PeriodogramBaseBackend(BaseSolverBackend):
     def _get_packet_and_solution(self, b, solver, **kwargs):
         # NOTE: b, solver, compute, backend will be added by get_packet_and_solution
@@ -900,9 +989,26 @@ class _PeriodogramBaseBackend(BaseSolverBackend):
 
     def run_worker(self, b, solver, compute=None, **kwargs):
         if mpi.within_mpirun:
-            raise NotImplementedError("mpi support for periodograms not yet implemented")
-            # TODO: we need to tell the workers to join the pool for time-parallelization?
+            # NOTE: the workers must join the pool right away (creating the
+            # pool itself does not spawn anything), so the master has to close
+            # it whenever it returns, even if it fails before sending any chunk
+            logger.info("periodogram: using MPI pool")
+            mpi_pool = _pool.MPIPool()
+            if not mpi_pool.is_master():
+                # evaluate chunks of the periodogram sent by the master
+                mpi_pool.wait()
+                mpi_pool.close()
+                return
+        else:
+            mpi_pool = None
+
+        try:
+            return self._run_periodogram(b, mpi_pool, **kwargs)
+        finally:
+            if mpi_pool is not None:
+                mpi_pool.close()
 
+    def _run_periodogram(self, b, mpi_pool, **kwargs):
         algorithm = kwargs.get('algorithm')
         component = kwargs.get('component')
 
@@ -910,64 +1016,88 @@ class _PeriodogramBaseBackend(BaseSolverBackend):
 
         sample_mode = kwargs.get('sample_mode')
 
+        sample_periods = kwargs.get('sample_periods')
+        if isinstance(sample_periods, nparray.ndarray):
+            sample_periods = sample_periods.array
+
         if algorithm == 'bls':
-            model = _BoxLeastSquares(times, y, dy=sigmas)
             # https://docs.astropy.org/en/stable/api/astropy.timeseries.BoxLeastSquares.html#astropy.timeseries.BoxLeastSquares.autoperiod
             # https://docs.astropy.org/en/stable/api/astropy.timeseries.BoxLeastSquares.html#astropy.timeseries.BoxLeastSquares.period
             # NOTE: duration will be in days (solar units)
             power_kwargs = {'duration': kwargs.get('duration'), 'objective': kwargs.get('objective')}
-            autopower_kwargs = _deepcopy(power_kwargs)
-            autopower_kwargs['minimum_n_transit'] = kwargs.get('minimum_n_cycles')
-            sample = kwargs.get('sample_periods')
-            if isinstance(sample, nparray.ndarray):
-                sample = sample.array
+            if sample_mode == 'auto':
+                autoperiod_kwargs = {'duration': kwargs.get('duration'), 'minimum_n_transit': kwargs.get('minimum_n_cycles')}
+                logger.info("calling {}.autoperiod({})".format(algorithm, autoperiod_kwargs))
+                sample = np.asarray(_BoxLeastSquares(times, y, dy=sigmas).autoperiod(**autoperiod_kwargs))
+            elif sample_mode == 'manual':
+                sample = np.asarray(sample_periods)
+            else:
+                raise ValueError("sample_mode='{}' not supported".format(sample_mode))
         elif algorithm == 'ls':
-            model = _LombScargle(times, y, dy=sigmas)
-            # https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autopower
+            # https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.autofrequency
             # https://docs.astropy.org/en/stable/api/astropy.timeseries.LombScargle.html#astropy.timeseries.LombScargle.power
             power_kwargs = {}
-            autopower_kwargs = _deepcopy(power_kwargs)
-            autopower_kwargs['samples_per_peak'] = kwargs.get('samples_per_peak')
-            autopower_kwargs['nyquist_factor'] = kwargs.get('nyquist_factor')
-            # require at least 2 full cycles (assuming 2 eclipses or 2 RV crossings per cycle)
-            autopower_kwargs['minimum_frequency'] = 1./((times.max()-times.min())/4)
-            autopower_kwargs['maximum_frequency'] = 1./((times.max()-times.min())/len(times))
-            sample_periods = kwargs.get('sample_periods')
-            if isinstance(sample_periods, nparray.ndarray):
-                sample_periods = sample_periods.array
-            sample = 1./sample_periods
-            sample_sort = sample.argsort()
-            sample = sample[sample_sort]
+            if sample_mode == 'auto':
+                autofrequency_kwargs = {'samples_per_peak': kwargs.get('samples_per_peak'),
+                                        'nyquist_factor': kwargs.get('nyquist_factor'),
+                                        # require at least 2 full cycles (assuming 2 eclipses or 2 RV crossings per cycle)
+                                        'minimum_frequency': 1./((times.max()-times.min())/4),
+                                        'maximum_frequency': 1./((times.max()-times.min())/len(times))}
+                logger.info("calling {}.autofrequency({})".format(algorithm, autofrequency_kwargs))
+                sample = np.asarray(_LombScargle(times, y, dy=sigmas).autofrequency(**autofrequency_kwargs))
+            elif sample_mode == 'manual':
+                sample = np.sort(1./np.asarray(sample_periods))
+            else:
+                raise ValueError("sample_mode='{}' not supported".format(sample_mode))
         else:
             raise NotImplementedError("algorithm='{}' not supported".format(algorithm))
 
-        if sample_mode == 'auto':
-            logger.info("calling {}.autopower({})".format(algorithm, autopower_kwargs))
-            out = model.autopower(**autopower_kwargs)
-            if algorithm in ['bls']:
-                periods = out.period
-                powers = out.power
-            elif algorithm in ['ls']:
-                periods = out[0]
-                powers = out[1]
-            else:
-                raise NotImplementedError("algorithm='{}' not supported".format(algorithm))
-        elif sample_mode == 'manual':
-            logger.info("calling {}.power({}, {})".format(algorithm, sample, power_kwargs))
-            # periodogram = model.power(kwargs.get('sample_periods' if algorithm in ['bls'] else 'sample_frequencies'), **power_kwargs)
-            out = model.power(sample, **power_kwargs)
-            if algorithm in ['bls']:
-                periods = out.period
-                powers = out.power
-            elif algorithm in ['ls']:
-                periods = kwargs.get('sample_periods')[sample_sort]
-                powers = out
-            else:
-                raise NotImplementedError("algorithm='{}' not supported".format(algorithm))
+        if not len(sample):
+            raise ValueError("no periods to sample")
+
+        # split the grid into chunks of at most chunk_size samples (and at
+        # least one chunk per process) which are each evaluated independently
+        # and then merged.
+        if mpi_pool is not None:
+            nprocs = mpi_pool.size
+        else:
+            nprocs = conf.multiprocessing_nprocs
+        nchunks = max(int(np.ceil(len(sample) / kwargs.get('chunk_size'))), min(nprocs, len(sample)), 1)
+        chunks = np.array_split(sample, nchunks)
+
+        if mpi_pool is not None:
+            pool = mpi_pool
+        elif nchunks == 1 or nprocs < 2:
+            logger.info("periodogram: using serial mode")
+            pool = _pool.SerialPool()
         else:
-            raise ValueError("sample_mode='{}' not supported".format(sample_mode))
+            logger.info("periodogram: using multiprocessing pool with {} procs".format(min(nprocs, nchunks)))
+            pool = _pool.MultiPool(processes=min(nprocs, nchunks))
+
+        logger.info("calling {}.power({} samples in {} chunk(s), {})".format(algorithm, len(sample), nchunks, power_kwargs))
+        # NOTE: the powers of each chunk are copied into the full spectrum
+        # (which is exposed in the solution) as they arrive and the peak is
+        # tracked along the way, so that the list of per-chunk arrays is never
+        # concatenated (which would temporarily double the memory)
+        powers = np.empty(len(sample))
+        peak_ind, peak_power = 0, -np.inf
+        try:
+            tasks = [(algorithm, times, y, sigmas, chunk, power_kwargs) for chunk in chunks]
+            offset = 0
+            for chunk_powers in getattr(pool, 'imap', pool.map)(_periodogram_power, tasks):
+                chunk_ind = np.argmax(chunk_powers)
+                if chunk_powers[chunk_ind] > peak_power:
+                    peak_ind, peak_power = offset + chunk_ind, chunk_powers[chunk_ind]
+                powers[offset:offset+len(chunk_powers)] = chunk_powers
+                offset += len(chunk_powers)
+        finally:
+            if pool is not mpi_pool:
+                pool.close()
+                if isinstance(pool, _pool.MultiPool):
+                    pool.join()
+
+        periods = sample if algorithm == 'bls' else 1./sample
 
-        peak_ind = np.argmax(powers)
         # stats = model.compute_stats(periodogram.period[max_power],
         #                             periodogram.duration[max_power],
         #                             periodogram.transit_time[max_power])
@@ -1154,6 +1284,173 @@ class Rv_PeriodogramBackend(_PeriodogramBaseBackend):
 #                  {'qualifier': 'adopt_parameters', 'value': fitted_twigs, 'choices': fitted_twigs},
 #                 ]]
 
+_ebai_phase_bins = 201
+_ebai_qualifiers = {'detached': ['teffratio', 'requivsumfrac', 'esinw', 'ecosw', 'incl'],
+                    'contact': ['teffratio', 'incl', 'fillout_factor', 'q']}
+# NOTE: the pickled knn models are loaded once per process and then reused
+# for all subsequent calls (see _get_ebai_knn_model)
+_ebai_knn_models = {}
+
+def _get_ebai_knn_model(morphology, db_suffix):
+    key = (morphology, db_suffix)
+    if key not in _ebai_knn_models.keys():
+        ebai_model_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'knn', '{}.{}.knn'.format(morphology, db_suffix))
+        logger.debug("ebai: loading knn model from {}".format(ebai_model_file))
+        with open(ebai_model_file, 'rb') as f:
+            _ebai_knn_models[key] = pickle.load(f)
+    return _ebai_knn_models[key]
+
+def _ebai_db_suffix(morphology, ebai_method):
+    return '2g' if morphology == 'contact' or ebai_method == 'mlp' else 'pf'
+
+def _ebai_preprocess(phases, fluxes, sigmas, morphology='detached', ebai_method='knn'):
+    """
+    Fit the (phase-sorted) light curve with a two-gaussian or polyfit model
+    (depending on `morphology` and `ebai_method`) and sample the fitted model
+    at the phases expected by EBAI.
+
+    Returns
+    ---------
+    * (float, array, array, array): the phase-shift to place the primary
+        eclipse at phase zero, the ebai_phases, ebai_fluxes, and widths of
+        the detected eclipses.
+    """
+    lc_geom_dict = ligeor.models.TwoGaussianModel.estimate_eclipse_positions_widths(phases, fluxes)
+
+    ecl_positions = lc_geom_dict.get('ecl_positions')
+    # assume primary is close to zero?
+    pshift = ecl_positions[np.argmin(abs(np.array(ecl_positions)))]
+    phases_shifted = phases-pshift
+    phases_shifted[phases_shifted > 0.5] = phases_shifted[phases_shifted>0.5]-1.
+    phases_shifted[phases_shifted < -0.5] = phases_shifted[phases_shifted<-0.5]+1.
+    s=np.argsort(phases_shifted)
+
+    if _ebai_db_suffix(morphology, ebai_method) == '2g':
+        lcModel = ligeor.models.TwoGaussianModel(phases=phases_shifted[s], fluxes=fluxes[s], sigmas=sigmas[s])
+    else:
+        lcModel = ligeor.models.Polyfit(phases=phases_shifted[s], fluxes=fluxes[s], sigmas=sigmas[s])
+
+    lcModel.fit()
+    ebai_phases = np.linspace(-0.5,0.5,_ebai_phase_bins)
+    ebai_fluxes = lcModel.compute_model(ebai_phases, best_fit=True)
+    ebai_phases[0] = - 0.5
+
+    return pshift, ebai_phases, ebai_fluxes, np.asarray(lc_geom_dict.get('ecl_widths', []))
+
+def _ebai_preprocess_worker(args):
+    phases, fluxes, sigmas, morphology, ebai_method = args
+    try:
+        return _ebai_preprocess(phases, fluxes, sigmas, morphology=morphology, ebai_method=ebai_method)
+    except Exception as err:
+        logger.warning("ebai: preprocessing failed with error: {}".format(_simplify_error_message(err)))
+        return None
+
+def _ebai_predict(ebai_phases, ebai_fluxes, morphology='detached', ebai_method='knn'):
+    """
+    Run the EBAI model on one or more (2D, one row per light curve) sets of
+    `ebai_fluxes`, all sampled at `ebai_phases`.
+
+    Returns
+    ---------
+    * (dict): arrays (one entry per light curve) for each of the estimated
+        quantities, keyed by parameter qualifier (with incl in radians).
+    """
+    ebai_fluxes = np.atleast_2d(ebai_fluxes)
+
+    if ebai_method == 'knn':
+        if not _use_sklearn:
+            raise ImportError('Please install scikit-learn to use the knn method!')
+
+        ebaiModel = _get_ebai_knn_model(morphology, _ebai_db_suffix(morphology, ebai_method))
+        prediction = ebaiModel.predict(ebai_phases, ebai_fluxes, return_absolute=True, transform_data=True, phases_model=ebai_phases)
+        if morphology == 'detached':
+            sini, teffratio, requivsumfrac, sqrte_sinw, sqrte_cosw = prediction.T
+            w = np.arctan2(sqrte_sinw, sqrte_cosw)
+            ecc = (sqrte_sinw/np.sin(w))**2
+            return {'teffratio': teffratio, 'requivsumfrac': requivsumfrac,
+                    'esinw': ecc*np.sin(w), 'ecosw': ecc*np.cos(w),
+                    'incl': np.arcsin(sini)}
+        else:
+            sini, teffratio, ff, q = prediction.T
+            return {'teffratio': teffratio, 'incl': np.arcsin(sini),
+                    'fillout_factor': ff, 'q': q}
+
+    elif ebai_method == 'mlp':
+        ebai_fluxes = ebai_fluxes / ebai_fluxes.max(axis=1)[:, np.newaxis]
+        teffratio, requivsumfrac, esinw, ecosw, sini = ebai_forward(ebai_fluxes).T
+        return {'teffratio': teffratio, 'requivsumfrac': requivsumfrac,
+                'esinw': esinw, 'ecosw': ecosw, 'incl': np.arcsin(sini)}
+
+    else:
+        raise ValueError("ebai_method must be one of 'knn' or 'mlp'")
+
+def _ebai_batch(phases, fluxes, sigmas=None, morphology='detached', ebai_method='knn', pool=None):
+    """
+    See <phoebe.helpers.ebai_batch>.
+    """
+    if morphology not in _ebai_qualifiers.keys():
+        raise ValueError("morphology must be one of {}".format(list(_ebai_qualifiers.keys())))
+    if ebai_method not in ['knn', 'mlp']:
+        raise ValueError("ebai_method must be one of 'knn' or 'mlp'")
+    if morphology == 'contact' and ebai_method == 'mlp':
+        raise ValueError("ebai_method='mlp' is only supported for detached systems")
+    if ebai_method == 'knn' and not _use_sklearn:
+        raise ImportError('Please install scikit-learn to use the knn method!')
+    if sigmas is None:
+        sigmas = [None]*len(fluxes)
+    if len(phases) != len(fluxes) or len(sigmas) != len(fluxes):
+        raise ValueError("phases, fluxes, and sigmas must have the same length")
+
+    tasks = []
+    for phases_i, fluxes_i, sigmas_i in zip(phases, fluxes, sigmas):
+        phases_i = np.asarray(phases_i, dtype=float)
+        fluxes_i = np.asarray(fluxes_i, dtype=float)
+        # NOTE: same as the default sigmas of lc datasets when not provided
+        sigmas_i = 0.001*fluxes_i if sigmas_i is None else np.asarray(sigmas_i, dtype=float)
+        s = np.argsort(phases_i)
+        tasks.append((phases_i[s], fluxes_i[s], sigmas_i[s], morphology, ebai_method))
+
+    if pool is None:
+        if mpi.within_mpirun:
+            if mpi.myrank != 0:
+                # the light curves are all fitted by the master
+                return None
+            logger.info("ebai: mpi support not yet implemented, fitting light curves in serial")
+            use_pool = _pool.SerialPool()
+        elif conf.multiprocessing_nprocs==0 or len(tasks) < 2:
+            use_pool = _pool.SerialPool()
+        else:
+            logger.info("ebai: using multiprocessing pool with {} procs".format(conf.multiprocessing_nprocs))
+            use_pool = _pool.MultiPool(processes=conf._multiprocessing_nprocs)
+    else:
+        use_pool = pool
+
+    try:
+        preprocessed = list(use_pool.map(_ebai_preprocess_worker, tasks))
+    finally:
+        if pool is None:
+            use_pool.close()
+
+    fitted = np.array([p is not None for p in preprocessed], dtype=bool)
+    success = fitted.copy()
+    if ebai_method == 'mlp':
+        success[fitted] = [not np.any(p[3] > 0.25) for p in preprocessed if p is not None]
+        if np.any(fitted & ~success):
+            logger.warning("ebai: eclipse width over 0.25 detected.  Returning nans for {} light curve(s)".format(np.sum(fitted & ~success)))
+
+    ret = {'pshift': np.array([p[0] if p is not None else np.nan for p in preprocessed])}
+    for qualifier in _ebai_qualifiers[morphology]:
+        ret[qualifier] = np.full(len(preprocessed), np.nan)
+
+    if np.any(success):
+        ebai_phases = preprocessed[np.argmax(success)][1]
+        ebai_fluxes = np.array([p[2] for p, s in zip(preprocessed, success) if s])
+        for qualifier, values in _ebai_predict(ebai_phases, ebai_fluxes, morphology=morphology, ebai_method=ebai_method).items():
+            ret[qualifier][success] = values
+
+    return ret
+
+
 class EbaiBackend(BaseSolverBackend):
     """
     See <phoebe.parameters.solver.estimator.ebai>.
@@ -1167,6 +1464,9 @@ class EbaiBackend(BaseSolverBackend):
         if not len(solver_ps.get_value(qualifier='lc_datasets', expand=True, lc_datasets=kwargs.get('lc_datasets', None))):
             raise ValueError("cannot run ebai without any dataset in lc_datasets")
 
+        if solver_ps.get_value(qualifier='ebai_method', ebai_method=kwargs.get('ebai_method', None), **_skip_filter_checks) == 'mlp' and len(b.hierarchy.get_envelopes()):
+            raise ValueError("ebai_method='mlp' is only supported for detached systems")
+
         # TODO: check to make sure fluxes exist, etc
 
 
@@ -1229,77 +1529,32 @@ class EbaiBackend(BaseSolverBackend):
 
         if ebai_method == 'knn' and _use_sklearn == False:
             raise ImportError('Please install scikit-learn to use the knn method!')
-        db_suffix = '2g' if morphology == 'contact' or ebai_method == 'mlp' else 'pf'
-        ebai_phase_bins = 201
-
-        lc_geom_dict = ligeor.models.TwoGaussianModel.estimate_eclipse_positions_widths(phases, fluxes)
-
-        ecl_positions = lc_geom_dict.get('ecl_positions')
-        # assume primary is close to zero?
-        pshift = ecl_positions[np.argmin(abs(np.array(ecl_positions)))]
-        phases_shifted = phases-pshift
-        phases_shifted[phases_shifted > 0.5] = phases_shifted[phases_shifted>0.5]-1.
-        phases_shifted[phases_shifted < -0.5] = phases_shifted[phases_shifted<-0.5]+1.
-        s=np.argsort(phases_shifted)
 
-        if db_suffix == '2g':
-            lcModel = ligeor.models.TwoGaussianModel(phases=phases_shifted[s], fluxes=fluxes[s], sigmas=sigmas[s])
-        else:
-            lcModel = ligeor.models.Polyfit(phases=phases_shifted[s], fluxes=fluxes[s], sigmas=sigmas[s])
-
-        lcModel.fit()
-        ebai_phases = np.linspace(-0.5,0.5,ebai_phase_bins)
-        ebai_fluxes = lcModel.compute_model(ebai_phases, best_fit=True)
-        ebai_phases[0] = - 0.5
+        pshift, ebai_phases, ebai_fluxes, ecl_widths = _ebai_preprocess(phases, fluxes, sigmas, morphology=morphology, ebai_method=ebai_method)
         # update to t0_supconj based on pshift
         t0_supconj = t0_supconj_param.get_value(unit=u.d) + (pshift * orbit_ps.get_value(qualifier='period', unit=u.d, **_skip_filter_checks))
 
-        if ebai_method == 'knn':
-            path = os.path.abspath(__file__)
-            dir_path = os.path.dirname(path)
-            ebai_model_file = '{}/knn/{}.{}.knn'.format(dir_path, morphology, db_suffix)
-
-            with open(ebai_model_file, 'rb') as f:
-                ebaiModel = pickle.load(f)
-
-            prediction = ebaiModel.predict(ebai_phases, ebai_fluxes, return_absolute=True, transform_data = True, phases_model = ebai_phases)
-            if morphology == 'detached':
-                [sini, teffratio, requivsumfrac, sqrte_sinw, sqrte_cosw] = prediction[0]
-                w = np.arctan2(sqrte_sinw, sqrte_cosw)
-                ecc = (sqrte_sinw/np.sin(w))**2
-                esinw = ecc*np.sin(w)
-                ecosw = ecc*np.cos(w)
-
-                fitted_params = [t0_supconj_param, teffratio_param, requivsumfrac_param, esinw_param, ecosw_param, incl_param]
-                fitted_values = [t0_supconj, teffratio, requivsumfrac, esinw, ecosw, np.arcsin(sini)]
-                fitted_units = [u.d.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string(), u.rad.to_string()]
-
-            else:
-                [sini, teffratio, ff, q] = prediction[0]
-                fitted_params = [t0_supconj_param, teffratio_param, incl_param, ff_param, q_param]
-                fitted_values = [t0_supconj, teffratio, np.arcsin(sini), ff, q]
-                fitted_units = [u.d.to_string(), u.dimensionless_unscaled.to_string(), u.rad.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string()]
+        if morphology == 'detached':
+            fitted_params = [t0_supconj_param, teffratio_param, requivsumfrac_param, esinw_param, ecosw_param, incl_param]
         else:
-            if np.max(lc_geom_dict.get('ecl_widths', [])) > 0.25:
-                logger.warning("ebai: eclipse width over 0.25 detected.  Returning all nans")
-                pshift = 0.0
-                t0_supconj = np.nan
-                teffratio = np.nan
-                requivsumfrac = np.nan
-                esinw = np.nan
-                ecosw = np.nan
-                sini = np.nan
-                ebai_phases = []
-                ebai_fluxes = []
-            else:
+            fitted_params = [t0_supconj_param, teffratio_param, incl_param, ff_param, q_param]
+
+        if ebai_method == 'mlp' and len(ecl_widths) and np.max(ecl_widths) > 0.25:
+            logger.warning("ebai: eclipse width over 0.25 detected.  Returning all nans")
+            pshift = 0.0
+            fitted_values = [np.nan] * len(fitted_params)
+            ebai_phases = []
+            ebai_fluxes = []
+        else:
+            if ebai_method == 'mlp':
                 fluxes /= ebai_fluxes.max()
                 ebai_fluxes /= ebai_fluxes.max()
 
-                # run ebai on polyfit sampled fluxes
-                teffratio, requivsumfrac, esinw, ecosw, sini = ebai_forward(ebai_fluxes)
-                fitted_params = [t0_supconj_param, teffratio_param, requivsumfrac_param, esinw_param, ecosw_param, incl_param]
-                fitted_values = [t0_supconj, teffratio, requivsumfrac, esinw, ecosw, np.arcsin(sini)]
-                fitted_units = [u.d.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string(), u.dimensionless_unscaled.to_string(), u.rad.to_string()]
+            prediction = _ebai_predict(ebai_phases, ebai_fluxes, morphology=morphology, ebai_method=ebai_method)
+            # NOTE: fitted_params (after t0_supconj) are in the same order as _ebai_qualifiers
+            fitted_values = [t0_supconj] + [prediction[qualifier][0] for qualifier in _ebai_qualifiers[morphology]]
+
+        fitted_units = [u.d.to_string() if p is t0_supconj_param else u.rad.to_string() if p is incl_param else u.dimensionless_unscaled.to_string() for p in fitted_params]
 
         fitted_uniqueids = [p.uniqueid for p in fitted_params]
         fitted_twigs = [p.twig for p in fitted_params]
@@ -1397,7 +1652,10 @@ class EmceeBackend(BaseSolverBackend):
         # in run_worker (for the workers.... note that the master
         # will enter run_worker through run, not here)
 
-        return self.run_worker(**packet)
+        try:
+            return self.run_worker(**packet)
+        finally:
+            _worker_bundles.clear()
 
     def run_worker(self, b, solver, compute, **kwargs):
 
@@ -1430,6 +1688,8 @@ class EmceeBackend(BaseSolverBackend):
 
         within_mpirun = mpi.within_mpirun
         mpi_enabled = mpi.enabled
+        # only a pool created here may be replaced by _worker_bundle_pool
+        owns_pool = False
 
         # emcee handles workers itself.  So here we'll just take the workers
         # from our own waiting loop in phoebe's __init__.py and subscribe them
@@ -1497,6 +1757,7 @@ class EmceeBackend(BaseSolverBackend):
             logger.info("emcee: using multiprocessing pool with {} procs".format(conf.multiprocessing_nprocs))
 
             pool = _pool.MultiPool(processes=conf._multiprocessing_nprocs)
+            owns_pool = True
             failed_samples_buffer = multiprocessing.Manager().list()
             is_master = True
 
@@ -1623,6 +1884,10 @@ class EmceeBackend(BaseSolverBackend):
 
                 start_iteration = continued_lnprobabilities.shape[0]
 
+            # each process keeps and reuses a single copy of the bundle for all
+            # evaluations of _lnprobability
+            pool, b_worker = _worker_bundle_pool(pool, _bsolver(b, solver, compute, init_from+priors, wrap_central_values), owns_pool=owns_pool)
+
             esargs['pool'] = pool
             esargs['nwalkers'] = nwalkers
             esargs['ndim'] = len(params_uniqueids)
@@ -1631,7 +1896,7 @@ class EmceeBackend(BaseSolverBackend):
             # esargs['moves'] = kwargs.pop('moves', None)
             # esargs['args'] = None
 
-            esargs['kwargs'] = {'b': _bsolver(b, solver, compute, init_from+priors, wrap_central_values),
+            esargs['kwargs'] = {'b': b_worker,
                                 'params_uniqueids': params_uniqueids,
                                 'compute': compute,
                                 'priors': priors,
@@ -1800,7 +2065,10 @@ class DynestyBackend(BaseSolverBackend):
         # here we'll override loading the bundle since it is not needed
         # in run_worker (for the workers.... note that the master
         # will enter run_worker through run, not here)
-        return self.run_worker(**packet)
+        try:
+            return self.run_worker(**packet)
+        finally:
+            _worker_bundles.clear()
 
     def run_worker(self, b, solver, compute, **kwargs):
 
@@ -1843,6 +2111,8 @@ class DynestyBackend(BaseSolverBackend):
 
         within_mpirun = mpi.within_mpirun
         mpi_enabled = mpi.enabled
+        # only a pool created here may be replaced by _worker_bundle_pool
+        owns_pool = False
 
         # dynesty handles workers itself.  So here we'll just take the workers
         # from our own waiting loop in phoebe's __init__.py and subscribe them
@@ -1883,6 +2153,7 @@ class DynestyBackend(BaseSolverBackend):
             logger.info("dynesty: using multiprocessing pool with {} procs".format(conf.multiprocessing_nprocs))
 
             pool = _pool.MultiPool(processes=conf._multiprocessing_nprocs)
+            owns_pool = True
             failed_samples_buffer = multiprocessing.Manager().list()
             is_master = True
 
@@ -1921,7 +2192,11 @@ class DynestyBackend(BaseSolverBackend):
             # NOTE: in dynesty we draw from the priors and pass the prior-transforms,
             # but do NOT include the lnprior term in lnlikelihood, so we pass
             # priors as []
-            lnlikelihood_kwargs = {'b': _bsolver(b, solver, compute, [], wrap_central_values),
+            # each process keeps and reuses a single copy of the bundle for all
+            # evaluations of _lnprobability
+            pool, b_worker = _worker_bundle_pool(pool, _bsolver(b, solver, compute, [], wrap_central_values), owns_pool=owns_pool)
+
+            lnlikelihood_kwargs = {'b': b_worker,
                                    'params_uniqueids': params_uniqueids,
                                    'compute': compute,
                                    'priors': [],
@@ -0,0 +1,67 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+import os
+import tempfile
+import zipfile
+import json
+
+
+def test_binary_format(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0, 1, 201), dataset='lc01')
+    b.add_dataset('mesh', compute_times=[0], columns=['teffs'], dataset='mesh01')
+    b.run_compute(irrad_method='none', model='phoebe01model')
+
+    tmpdir = tempfile.mkdtemp()
+    filename = os.path.join(tmpdir, 'test.bundle')
+    b.save(filename, binary=True)
+
+    # permissions are the same as when saving to JSON, and no temporary files
+    # are left behind
+    json_filename = b.filter(context='model').save(os.path.join(tmpdir, 'test.json'))
+    assert os.stat(filename).st_mode & 0o777 == os.stat(json_filename).st_mode & 0o777
+    assert sorted(os.listdir(tmpdir)) == ['test.bundle', 'test.json']
+
+    # large arrays are only stored as .npy members, not in the manifest
+    with zipfile.ZipFile(filename) as zf:
+        manifest = json.loads(zf.read(phoebe.parameters.parameters._binary_manifest))
+    assert len([p for p in manifest if isinstance(p.get('value'), dict) and 'npy' in p['value']])
+    assert not len([p for p in manifest if isinstance(p.get('value'), list) and len(p['value']) > 200])
+
+    b2 = phoebe.open(filename)
+    assert len(b2) == len(b)
+    for param in b.filter(context=['model', 'dataset'], check_visible=False).to_list():
+        value = param.get_value()
+        if isinstance(value, np.ndarray) and value.dtype.kind == 'f':
+            assert np.allclose(value, b2.get_value(uniqueid=param.uniqueid, check_visible=False))
+
+    # large arrays are memory-mapped instead of read
+    assert isinstance(b2.get_parameter(qualifier='fluxes', model='phoebe01model')._value.base, np.memmap)
+
+    # but can still be changed and saved back to the same file
+    fluxes = b2.get_value(qualifier='fluxes', model='phoebe01model')
+    fluxes[0] = 0.0
+    b2.set_value(qualifier='fluxes', model='phoebe01model', value=fluxes, ignore_readonly=True)
+    b2.save(filename, binary=True)
+    assert b2.get_value(qualifier='fluxes', model='phoebe01model')[0] == 0.0
+    assert phoebe.open(filename).get_value(qualifier='fluxes', model='phoebe01model')[0] == 0.0
+
+    # ParameterSet.open detects the format as well
+    ps = b.filter(context='model').save(os.path.join(tmpdir, 'model.ps'), incl_uniqueid=True, binary=True)
+    ps = phoebe.parameters.ParameterSet.open(ps)
+    assert np.allclose(ps.get_value(qualifier='fluxes'), b.get_value(qualifier='fluxes', model='phoebe01model'))
+
+    samples = np.random.random((20, 10, 3))
+    ps = phoebe.parameters.ParameterSet([phoebe.parameters.ArrayParameter(qualifier='samples', value=samples)])
+    ps = phoebe.parameters.ParameterSet.open(ps.save(os.path.join(tmpdir, 'samples.ps'), sort_by_context=False, binary=True))
+    assert np.all(ps.get_value(qualifier='samples') == samples)
+
+    return b2
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_binary_format(verbose=True)
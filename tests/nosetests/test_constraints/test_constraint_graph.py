@@ -0,0 +1,55 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def _assert_constraints_consistent(b):
+    for constraint in b.filter(context='constraint', check_visible=False).to_list():
+        param = constraint.constrained_parameter
+        if param.__class__.__name__ != 'FloatParameter':
+            continue
+        assert np.allclose(param.get_value(), constraint.get_result().to(param.default_unit).value, rtol=1e-10, atol=0, equal_nan=True)
+
+
+def test_delayed_constraints(verbose=False):
+    b = phoebe.default_binary()
+    b.flip_constraint('mass@primary', solve_for='sma@binary')
+
+    phoebe.interactive_constraints_off()
+    try:
+        for twig, value in [('q@binary@component', 0.7),
+                            ('incl@binary@component', 80),
+                            ('period@binary@component', 2.3),
+                            ('ecc@binary@component', 0.1),
+                            ('mass@primary@component', 1.3)]:
+            b.set_value(twig, value)
+
+        assert len(b._delayed_constraints)
+        b.run_delayed_constraints()
+        assert len(b._delayed_constraints) == 0
+        _assert_constraints_consistent(b)
+
+        # flipping a constraint must rebuild the graph
+        b.flip_constraint('sma@binary', solve_for='mass@primary')
+        b.set_value('sma@binary@component', 8.0)
+        b.run_delayed_constraints()
+        _assert_constraints_consistent(b)
+        assert abs(b.get_value('asini@binary@component') - 8.0*np.sin(80*np.pi/180)) < 1e-10
+
+        # as must adding new components/constraints
+        b.add_dataset('lc', times=[0, 1])
+        b.set_value('q@binary@component', 0.9)
+        b.run_delayed_constraints()
+        _assert_constraints_consistent(b)
+
+    finally:
+        phoebe.interactive_constraints_on()
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_delayed_constraints(verbose=True)
@@ -0,0 +1,61 @@
+"""
+"""
+
+import phoebe
+from phoebe.dependencies import distl
+from scipy import stats
+import numpy as np
+
+
+def test_samples_kde(verbose=False):
+    np.random.seed(0)
+    samples = np.random.normal(size=50000)
+    d = distl.samples(samples)
+    points = np.linspace(-4, 4, 17)
+
+    # the binned kde agrees with the exact (scipy) kde
+    exact = stats.gaussian_kde(samples).logpdf(points)
+    if verbose:
+        print("max logpdf difference: {}".format(np.max(abs(d.logpdf(points)-exact))))
+    assert np.allclose(d.logpdf(points), exact, rtol=0, atol=1e-3)
+
+    # changing the bandwidth or samples rebuilds the kde
+    d.bw_method = 'silverman'
+    assert np.allclose(d.logpdf(points), stats.gaussian_kde(samples, bw_method='silverman').logpdf(points), rtol=0, atol=1e-3)
+    d.samples = samples * 2
+    assert np.allclose(d.logpdf(points), stats.gaussian_kde(samples*2, bw_method='silverman').logpdf(points), rtol=0, atol=1e-3)
+
+    # too few samples falls back on the exact kde
+    d = distl.samples(samples[:500])
+    assert np.allclose(d.logpdf(points), stats.gaussian_kde(samples[:500]).logpdf(points), rtol=1e-12)
+
+    return d
+
+def test_mvsamples_kde(verbose=False):
+    np.random.seed(0)
+    samples = np.random.multivariate_normal([0, 1, 2], [[1, 0.5, 0], [0.5, 1, 0], [0, 0, 2]], size=20000)
+    d = distl.mvsamples(samples, labels=['a', 'b', 'c'])
+    point = [0.1, 1.2, 1.5]
+
+    dc = distl.DistributionCollection(d.slice('a'), d.slice('b'), d.slice('c'))
+    assert np.allclose(dc.logpdf(point), stats.gaussian_kde(samples.T).logpdf(point), atol=1e-3)
+    # taking the same dimensions again reuses the cached distribution
+    assert d._take_dimensions_cached([0, 2]) is d._take_dimensions_cached([0, 2])
+
+    dc = distl.DistributionCollection(d.slice('a'), d.slice('c'))
+    assert np.allclose(dc.logpdf([point[0], point[2]]), stats.gaussian_kde(samples[:, [0, 2]].T).logpdf([point[0], point[2]]), atol=1e-3)
+
+    # changing the samples invalidates the slices and cached dimensions
+    slice_a = d.slice('a')
+    slice_a.logpdf(0.3)
+    d.samples = samples * 2
+    assert np.allclose(slice_a.logpdf(0.3), stats.gaussian_kde(2*samples[:, 0]).logpdf(0.3), atol=1e-3)
+    assert np.allclose(dc.logpdf([point[0], point[2]]), stats.gaussian_kde(2*samples[:, [0, 2]].T).logpdf([point[0], point[2]]), atol=1e-3)
+
+    return d
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    d = test_samples_kde(verbose=True)
+    d = test_mvsamples_kde(verbose=True)
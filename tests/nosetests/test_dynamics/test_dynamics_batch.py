@@ -0,0 +1,54 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def test_batch_v_single(verbose=False):
+    """
+    test keplerian.dynamics_batch against keplerian.dynamics for several
+    sets of orbital elements at once
+    """
+    b = phoebe.default_binary()
+    b.set_value('ecc', 0.3)
+    b.set_value('dpdt', 1e-4)
+
+    times = np.linspace(0, 10, 501)
+    elements = phoebe.dynamics.keplerian._elements_from_bundle(b)
+
+    per0s = np.array([0.0, 0.5, 1.5, 3.0])
+    eccs = np.array([0.0, 0.1, 0.3, 0.6])
+    nsamples = len(per0s)
+    ncomponents = len(elements['components'])
+
+    for ltte in [False, True]:
+        batch_elements = {k: np.array(v) for k,v in elements.items() if k not in ['components', 't0', 'vgamma', 'ltte']}
+        batch_elements = {k: np.repeat(v[np.newaxis,...], nsamples, axis=0) for k,v in batch_elements.items()}
+        batch_elements['per0s'] = np.repeat(per0s[:,np.newaxis,np.newaxis], ncomponents, axis=1)
+        batch_elements['eccs'] = np.repeat(eccs[:,np.newaxis,np.newaxis], ncomponents, axis=1)
+
+        ts, xs, ys, zs, vxs, vys, vzs = phoebe.dynamics.keplerian.dynamics_batch(times, components=elements['components'], t0=elements['t0'], vgamma=elements['vgamma'], ltte=ltte, **batch_elements)
+
+        for i, (per0, ecc) in enumerate(zip(per0s, eccs)):
+            single_elements = elements.copy()
+            single_elements['ltte'] = ltte
+            single_elements['per0s'] = [[per0] for c in range(ncomponents)]
+            single_elements['eccs'] = [[ecc] for c in range(ncomponents)]
+            k_ts, k_xs, k_ys, k_zs, k_vxs, k_vys, k_vzs = phoebe.dynamics.keplerian.dynamics(times, **single_elements)
+
+            for ci in range(ncomponents):
+                if verbose:
+                    print("ltte={} sample={} component={} max diff xs={}".format(ltte, i, ci, abs(xs[i,ci]-k_xs[ci]).max()))
+                # the ltte iterations converge to slightly different (but
+                # within tolerance) proper times
+                atol = 1e-6 if ltte else 1e-8
+                for batch, single in zip([xs, ys, zs, vxs, vys, vzs], [k_xs, k_ys, k_zs, k_vxs, k_vys, k_vzs]):
+                    assert(np.allclose(batch[i,ci], single[ci], rtol=0, atol=atol))
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_batch_v_single(verbose=True)
@@ -0,0 +1,272 @@
+"""
+"""
+
+import phoebe
+from phoebe import u, c
+import numpy as np
+from scipy.optimize import brentq
+import pytest
+
+
+def _circular_orbit(times, masses, sma, vgamma=0.0):
+    """
+    positions, velocities, and accelerations of two bodies (in units of G=1)
+    on a circular orbit inclined to the sky
+    """
+    omega = np.sqrt(np.sum(masses)/sma**3)
+    direction = np.array([0.0, 0.6, 0.8])
+    phases = omega*times[:, np.newaxis]
+    fracs = np.array([-masses[1], masses[0]])/np.sum(masses)
+
+    unit = np.cos(phases)[..., np.newaxis]*np.array([1.0, 0, 0]) + np.sin(phases)[..., np.newaxis]*direction
+    dunit = -np.sin(phases)[..., np.newaxis]*np.array([1.0, 0, 0]) + np.cos(phases)[..., np.newaxis]*direction
+    drift = np.array([0, 0, -vgamma])
+
+    positions = sma*fracs[:, np.newaxis]*unit + times[:, np.newaxis, np.newaxis]*drift
+    velocities = sma*omega*fracs[:, np.newaxis]*dunit + drift
+    accelerations = -omega**2*sma*fracs[:, np.newaxis]*unit
+    return positions, velocities, accelerations
+
+
+def test_dense_output(verbose=False):
+    masses = np.array([1.0, 0.5])
+    sma = 2.0
+    period = 2*np.pi/np.sqrt(np.sum(masses)/sma**3)
+
+    nodes = np.linspace(0, period, 101)
+    positions, velocities, accelerations = _circular_orbit(nodes, masses, sma, vgamma=0.01)
+
+    # the accelerations follow from the positions alone
+    assert np.allclose(phoebe.dynamics.nbody._nbody_accelerations(positions, masses), accelerations, rtol=0, atol=1e-12)
+
+    dense = phoebe.dynamics.nbody._DenseOutput(nodes, positions, velocities, accelerations, max_spacing=nodes[1]-nodes[0])
+
+    times = np.random.RandomState(0).uniform(0, period, 200)
+    exp_positions, exp_velocities, _ = _circular_orbit(times, masses, sma, vgamma=0.01)
+    for j in range(len(masses)):
+        pos, vel = dense(times, j)
+        if verbose:
+            print("max position error: {}, max velocity error: {}".format(abs(pos-exp_positions[:,j]).max(), abs(vel-exp_velocities[:,j]).max()))
+        assert np.allclose(pos, exp_positions[:,j], rtol=0, atol=1e-10)
+        assert np.allclose(vel, exp_velocities[:,j], rtol=0, atol=1e-9)
+
+        # the node values themselves are reproduced exactly
+        assert np.all(dense(nodes, j)[0] == positions[:,j])
+
+        # the light-travel-time corrected times satisfy t_obs = t_bary - z(t_bary)/c
+        c_AU_d = 173.1446
+        t_obs = np.linspace(0.1, 0.9, 11)*period
+        t_bary = dense.ltte_times(t_obs, j, c_AU_d)
+        assert np.allclose(t_bary - dense(t_bary, j)[0][:,2]/c_AU_d, t_obs, rtol=0, atol=1e-11)
+
+    # times outside the nodes (or across gaps) are refused
+    for t in [-0.1, period+0.1]:
+        try:
+            dense([t], 0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError for t={}".format(t))
+
+
+class _Orbit(object):
+    def __init__(self, a, e, P):
+        self.a, self.e, self.P = a, e, P
+
+class _CircularSimulation(object):
+    """
+    the attributes of a rebound.Simulation (at t=0) needed by
+    phoebe.dynamics.nbody._ltte_nodes for the orbit of _circular_orbit
+    """
+    def __init__(self, masses, sma, vgamma):
+        period = 2*np.pi/np.sqrt(np.sum(masses)/sma**3)
+        self.N = len(masses)
+        self.t = 0.0
+        self._orbits = [_Orbit(sma, 0.0, period)]
+        self._com = _Orbit(0.0, 0.0, 0.0)
+        self._com.z, self._com.vz = 0.0, -vgamma
+
+    def calculate_orbits(self):
+        return self._orbits
+
+    def calculate_com(self):
+        return self._com
+
+def test_ltte_nodes(verbose=False):
+    c_AU_d = c.c.to(u.AU/u.d).value
+    # a ~3 day binary (G=1 in AU and d)
+    masses = np.array([1.0, 0.5]) * c.G.to('AU3 / (Msun d2)').value
+    sma = 0.05
+    t_obs = np.linspace(0, 1000, 101)
+
+    for vgamma in [0.0, 30.0, -50.0]:
+        vgamma = (vgamma*u.km/u.s).to(u.AU/u.d).value
+
+        # the lag of the center of mass is much larger than the spacing of the nodes
+        nodes, max_spacing, centers = phoebe.dynamics.nbody._ltte_nodes(t_obs, _CircularSimulation(masses, sma, vgamma))
+        dense = phoebe.dynamics.nbody._DenseOutput(nodes, *_circular_orbit(nodes, masses, sma, vgamma=vgamma), max_spacing=max_spacing)
+
+        for j in range(len(masses)):
+            t_bary = dense.ltte_times(t_obs, j, c_AU_d, t_start=centers)
+            if verbose:
+                print("vgamma: {}, max lag: {}, node spacing: {}".format(vgamma, abs(t_bary-t_obs).max(), max_spacing))
+            assert np.allclose(t_bary - dense(t_bary, j)[0][:,2]/c_AU_d, t_obs, rtol=0, atol=1e-11)
+
+class _Particle(object):
+    pass
+
+class _AnalyticSimulation(_CircularSimulation):
+    """
+    stand-in for the rebound.Simulation returned by
+    phoebe.dynamics.nbody._build_simulation which "integrates" by evaluating
+    _circular_orbit (and counts the number of integrations)
+    """
+    def __init__(self, masses, sma, vgamma):
+        super(_AnalyticSimulation, self).__init__(masses, sma, vgamma)
+        self.masses, self.sma, self.vgamma = masses, sma, vgamma
+        self.particles = [_Particle() for mass in masses]
+        self.nintegrations = 0
+        self._update()
+
+    def _update(self):
+        positions, velocities, _ = _circular_orbit(np.array([self.t]), self.masses, self.sma, self.vgamma)
+        for j, p in enumerate(self.particles):
+            p.x, p.y, p.z = positions[0, j]
+            p.vx, p.vy, p.vz = velocities[0, j]
+
+    def integrate(self, t, exact_finish_time=True):
+        self.nintegrations += 1
+        self.t = t
+        self._update()
+
+def test_dynamics_analytic(verbose=False):
+    c_AU_d = c.c.to(u.AU/u.d).value
+    au_to_solrad = (1*u.AU).to(u.solRad).value
+    masses = np.array([1.0, 0.5]) * c.G.to('AU3 / (Msun d2)').value
+    sma = 0.05
+    elements = dict(masses=masses, smas=[0.0, sma], eccs=[0.0, 0.0], incls=[0.0, 0.0],
+                    per0s=[0.0, 0.0], long_ans=[0.0, 0.0], mean_anoms=[0.0, 0.0])
+    # times before and after the initial conditions, unsorted
+    times = np.random.RandomState(0).uniform(-200, 1000, 60)
+
+    for vgamma in [0.0, -50.0]:
+        vgamma = (vgamma*u.km/u.s).to(u.AU/u.d).value
+
+        sims = []
+        def build_simulation(*args, **kwargs):
+            sims.append(_AnalyticSimulation(masses, sma, vgamma))
+            return sims[-1]
+
+        _can_rebound = phoebe.dynamics.nbody._can_rebound
+        _build_simulation = phoebe.dynamics.nbody._build_simulation
+        phoebe.dynamics.nbody._can_rebound = True
+        phoebe.dynamics.nbody._build_simulation = build_simulation
+        phoebe.dynamics.nbody._checkpoints.clear()
+        try:
+            ts, xs, ys, zs, vxs, vys, vzs = phoebe.dynamics.nbody.dynamics(times, ltte=True, vgamma=vgamma, **elements)
+            nintegrations = sum([sim.nintegrations for sim in sims])
+
+            # a repeated call reuses the checkpointed states without integrating
+            ts, xs2, ys2, zs2, vxs2, vys2, vzs2 = phoebe.dynamics.nbody.dynamics(times, ltte=True, vgamma=vgamma, **elements)
+            assert sum([sim.nintegrations for sim in sims]) == nintegrations
+        finally:
+            phoebe.dynamics.nbody._can_rebound = _can_rebound
+            phoebe.dynamics.nbody._build_simulation = _build_simulation
+            phoebe.dynamics.nbody._checkpoints.clear()
+
+        # one simulation for the checkpoint, one per direction of integration
+        assert len(sims) == 3
+        for j in range(len(masses)):
+            assert np.all(xs2[j] == xs[j]) and np.all(vzs2[j] == vzs[j])
+
+            # the exact barycentric time of each particle: t - z(t)/c = t_obs
+            def z(t):
+                return _circular_orbit(np.array([t]), masses, sma, vgamma)[0][0, j, 2]
+            t_bary = np.array([brentq(lambda t: t - z(t)/c_AU_d - t_obs, t_obs-1, t_obs+1, xtol=1e-14) for t_obs in times])
+            positions, velocities, _ = _circular_orbit(t_bary, masses, sma, vgamma)
+            expected = np.hstack([positions[:, j], velocities[:, j]]) * au_to_solrad * np.array([-1, -1, 1, -1, -1, 1])
+
+            pv = np.array([xs[j], ys[j], zs[j], vxs[j], vys[j], vzs[j]]).T
+            if verbose:
+                print("vgamma: {}, max lag: {}, max position error: {}, max velocity error: {}".format(vgamma, abs(t_bary-times).max(), abs(pv[:,:3]-expected[:,:3]).max(), abs(pv[:,3:]-expected[:,3:]).max()))
+            assert np.allclose(pv[:,:3], expected[:,:3], rtol=0, atol=1e-9)
+            assert np.allclose(pv[:,3:], expected[:,3:], rtol=0, atol=1e-8)
+
+def _dynamics_newton(times, masses, smas, eccs, incls, per0s, long_ans, mean_anoms,
+                     vgamma=0.0, stepsize=0.01, integrator='ias15'):
+    """
+    reference implementation: integrate to each time and solve the
+    light-travel-time correction of each particle with newton by re-integrating
+    (the implementation prior to the dense output)
+    """
+    import rebound
+    from scipy.optimize import newton
+
+    c_AU_d = c.c.to(u.AU/u.d).value
+
+    sim = rebound.Simulation()
+    sim.integrator = integrator
+    sim.dt = stepsize
+    for mass, sma, ecc, incl, per0, long_an, mean_anom in zip(masses, smas, eccs, incls, per0s, long_ans, mean_anoms):
+        if sim.N == 0:
+            sim.add(m=mass)
+        else:
+            sim.add(primary=None, m=mass, a=sma, e=ecc, inc=incl, Omega=long_an, omega=per0, M=mean_anom)
+        sim.move_to_com()
+    for particle in sim.particles:
+        particle.vz -= vgamma
+
+    pvs = np.zeros((len(masses), len(times), 6))
+    for i, time in enumerate(times):
+        sim.integrate(time, exact_finish_time=True)
+        for j in range(len(masses)):
+            def residual(t):
+                if sim.t != t:
+                    sim.integrate(t, exact_finish_time=True)
+                return t - sim.particles[j].z / c_AU_d - time
+            t_bary = newton(residual, time, tol=1e-12)
+            if sim.t != t_bary:
+                sim.integrate(t_bary, exact_finish_time=True)
+            p = sim.particles[j]
+            pvs[j, i] = [-p.x, -p.y, p.z, -p.vx, -p.vy, p.vz]
+
+    return pvs * (1*u.AU).to(u.solRad).value
+
+def test_dynamics_rebound(verbose=False):
+    pytest.importorskip('rebound')
+
+    GM = c.G.to('AU3 / (Msun d2)').value
+    elements = dict(masses=[1.2*GM, 0.8*GM], smas=[0.05, 0.05], eccs=[0.2, 0.2],
+                    incls=[1.4, 1.4], per0s=[0.5, 0.5], long_ans=[0.3, 0.3],
+                    mean_anoms=[0.1, 0.1])
+    times = np.linspace(0, 300, 41)
+
+    for vgamma in [0.0, 50.0]:
+        vgamma = (vgamma*u.km/u.s).to(u.AU/u.d).value
+        expected = _dynamics_newton(times, vgamma=vgamma, **elements)
+        phoebe.dynamics.nbody._checkpoints.clear()
+        ts, xs, ys, zs, vxs, vys, vzs = phoebe.dynamics.nbody.dynamics(times, ltte=True, vgamma=vgamma, **elements)
+        for j in range(2):
+            pv = np.array([xs[j], ys[j], zs[j], vxs[j], vys[j], vzs[j]]).T
+            if verbose:
+                print("vgamma: {}, max position error: {}, max velocity error: {}".format(vgamma, abs(pv[:,:3]-expected[j,:,:3]).max(), abs(pv[:,3:]-expected[j,:,3:]).max()))
+            assert np.allclose(pv[:,:3], expected[j,:,:3], rtol=0, atol=1e-5)
+            assert np.allclose(pv[:,3:], expected[j,:,3:], rtol=0, atol=1e-4)
+
+        # the clock of the simulation starts at 0 regardless of t0 (and a
+        # repeated call reuses the checkpoint)
+        for _ in range(2):
+            ts, xs2, ys2, zs2, vxs2, vys2, vzs2 = phoebe.dynamics.nbody.dynamics(times, ltte=True, vgamma=vgamma, t0=1000, **elements)
+            for j in range(2):
+                assert np.allclose(xs2[j], xs[j], rtol=0, atol=1e-6)
+                assert np.allclose(zs2[j], zs[j], rtol=0, atol=1e-6)
+                assert np.allclose(vzs2[j], vzs[j], rtol=0, atol=1e-5)
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_dense_output(verbose=True)
+    test_ltte_nodes(verbose=True)
+    test_dynamics_analytic(verbose=True)
+    test_dynamics_rebound(verbose=True)
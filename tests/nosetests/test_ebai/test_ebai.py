@@ -0,0 +1,70 @@
+"""
+"""
+
+import phoebe
+from phoebe.solverbackends import solverbackends
+from phoebe.solverbackends.ebai import ebai_forward
+import numpy as np
+
+
+def test_batch(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0,1,101), dataset='lc01')
+    b.set_value_all('ntriangles', 300)
+    b.run_compute(irrad_method='none', progressbar=False)
+    b.set_value(qualifier='fluxes', context='dataset', value=b.get_value(qualifier='fluxes', context='model'))
+
+    ebai_methods = ['knn', 'mlp'] if solverbackends._use_sklearn else ['mlp']
+    times, phases, fluxes, sigmas = solverbackends._get_combined_lc(b, ['lc01'], 'median', phase_component='binary', mask=True, normalize=True, phase_sorted=True, phase_bin=False)
+    rng = np.random.default_rng(0)
+    noisy_fluxes = fluxes + rng.normal(0, 1e-3, len(fluxes))
+
+    for ebai_method in ebai_methods:
+        b.add_solver('estimator.ebai', ebai_method=ebai_method, solver='ebai_{}'.format(ebai_method), overwrite=True)
+        b.run_solver('ebai_{}'.format(ebai_method), solution='ebai_sol', phase_bin=False, overwrite=True)
+        fitted_values = b.get_value(qualifier='fitted_values', solution='ebai_sol')
+
+        # the last light curve cannot be fitted and should return nans
+        res = phoebe.helpers.ebai_batch([phases, phases, phases[:3]],
+                                        [fluxes, noisy_fluxes, fluxes[:3]],
+                                        [sigmas, sigmas, sigmas[:3]],
+                                        ebai_method=ebai_method)
+
+        if verbose:
+            print("ebai_method={} fitted_values={} batch={}".format(ebai_method, fitted_values, res))
+
+        # NOTE: fitted_values also includes t0_supconj
+        for i, qualifier in enumerate(solverbackends._ebai_qualifiers['detached']):
+            assert np.allclose(res[qualifier][0], fitted_values[i+1], equal_nan=True)
+            if np.isfinite(res[qualifier][0]):
+                assert abs(res[qualifier][1] - res[qualifier][0]) < 0.05
+            assert np.isnan(res[qualifier][2])
+
+    # within mpirun, the master fits all light curves in serial and the
+    # workers return immediately
+    within_mpirun, myrank = phoebe.mpi._within_mpirun, phoebe.mpi._myrank
+    phoebe.mpi._within_mpirun = True
+    try:
+        res_mpi = phoebe.helpers.ebai_batch([phases, phases], [fluxes, noisy_fluxes], ebai_method='mlp')
+        phoebe.mpi._myrank = 1
+        assert phoebe.helpers.ebai_batch([phases, phases], [fluxes, noisy_fluxes], ebai_method='mlp') is None
+    finally:
+        phoebe.mpi._within_mpirun, phoebe.mpi._myrank = within_mpirun, myrank
+    res = phoebe.helpers.ebai_batch([phases, phases], [fluxes, noisy_fluxes], ebai_method='mlp')
+    for qualifier in res.keys():
+        assert np.allclose(res_mpi[qualifier], res[qualifier], equal_nan=True)
+
+    if 'knn' in ebai_methods:
+        # knn models are only loaded from disk once
+        assert solverbackends._get_ebai_knn_model('detached', 'pf') is solverbackends._get_ebai_knn_model('detached', 'pf')
+
+    # the mlp network accepts many light curves at once
+    ebai_fluxes = np.array([np.linspace(0.5, 1, 201), np.linspace(1, 0.5, 201)])
+    assert np.allclose(ebai_forward(ebai_fluxes), [ebai_forward(f) for f in ebai_fluxes])
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_batch(verbose=True)
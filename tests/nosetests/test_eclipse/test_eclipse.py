@@ -0,0 +1,62 @@
+"""
+"""
+
+import phoebe
+from phoebe import dynamics
+from phoebe.backend import universe, eclipse
+import numpy as np
+
+
+def test_overlap_candidates(verbose=False):
+    np.random.seed(0)
+    centers = np.vstack([np.random.normal(0.0, 1.0, (200, 2)),
+                         np.random.normal(2.5, 1.0, (200, 2))])
+    tri_sky = centers[:,np.newaxis,:] + np.random.uniform(-0.1, 0.1, (400, 3, 2))
+    bodies = np.repeat([0, 1], 200)
+
+    candidates = eclipse._overlap_candidates(tri_sky, bodies)
+
+    # every pair of triangles of different bodies with overlapping bounding
+    # boxes must be flagged
+    lo, hi = tri_sky.min(axis=1), tri_sky.max(axis=1)
+    overlap = np.all((lo[:200,np.newaxis] <= hi[np.newaxis,200:]) & (lo[np.newaxis,200:] <= hi[:200,np.newaxis]), axis=2)
+    i, j = np.where(overlap)
+
+    if verbose:
+        print("{} candidates, {} required".format(candidates.sum(), len(set(i)) + len(set(j))))
+
+    assert(np.all(candidates[i]))
+    assert(np.all(candidates[200+j]))
+    assert(not np.all(candidates))
+
+    return candidates
+
+def test_native_grazing(verbose=False):
+    b = phoebe.default_binary()
+    b.set_value('incl', component='binary', value=80.0)
+    b.add_dataset('lc', times=[0.03])
+
+    system = universe.System.from_bundle(b, compute='phoebe01', datasets=['lc01'])
+    ts, xs, ys, zs, vxs, vys, vzs, ethetas, elongans, eincls = dynamics.keplerian.dynamics_from_bundle(b, [0.03], compute='phoebe01', return_euler=True)
+    system.update_positions(0.03, *dynamics.dynamics_at_i(xs, ys, zs, vxs, vys, vzs, ethetas, elongans, eincls, i=0))
+
+    meshes = system.meshes
+    visibilities, weights, _ = eclipse.native(meshes, system.xs, system.ys, system.zs, convex=True)
+    visibilities_all, weights_all, _ = eclipse.native(meshes, system.xs, system.ys, system.zs, convex=False)
+
+    for comp in visibilities.keys():
+        if verbose:
+            print("{}: partially visible: {}, max diff: {}".format(comp, np.sum((visibilities[comp] > 0) & (visibilities[comp] < 1)), abs(visibilities[comp]-visibilities_all[comp]).max()))
+
+        # only differences at the level of rounding in libphoebe
+        # (and its artifacts along the limb) are allowed
+        assert(np.sum(abs(visibilities[comp]-visibilities_all[comp]) > 1e-6) <= 2)
+        assert(np.sum(abs(weights[comp]-weights_all[comp]).max(axis=1) > 1e-6) <= 2)
+
+    return system
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    candidates = test_overlap_candidates(verbose=True)
+    system = test_native_grazing(verbose=True)
@@ -0,0 +1,45 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import etvs
+import numpy as np
+
+
+def _brute_force_minimum(b, time_guess, ltte, halfwidth=0.002, npoints=2001):
+    times = np.linspace(time_guess-halfwidth, time_guess+halfwidth, npoints)
+    ts, xs, ys, zs, vxs, vys, vzs = phoebe.dynamics.keplerian.dynamics_from_bundle(b, times, ltte=ltte)
+    separations = (xs[1]-xs[0])**2 + (ys[1]-ys[0])**2
+    return times[np.argmin(separations)], times[1]-times[0]
+
+
+def test_keplerian(verbose=False):
+    b = phoebe.default_binary()
+    b.set_value('ecc', component='binary', value=0.2)
+    b.set_value('per0', component='binary', value=40)
+    b.set_value('incl', component='binary', value=86)
+    b.set_value('vgamma', value=50)
+
+    period = b.get_value('period', component='binary')
+    guesses = np.arange(2000)*period + 0.03
+
+    for ltte in [False, True]:
+        time_ecls = etvs.crossings(b, 'primary', guesses, ltte=ltte, tol=1e-10)
+        assert time_ecls.shape == guesses.shape
+
+        for i in [0, 10, len(guesses)-1]:
+            time_ecl, resolution = _brute_force_minimum(b, time_ecls[i], ltte)
+            if verbose:
+                print("ltte={} cycle={}: {} vs {}".format(ltte, i, time_ecls[i], time_ecl))
+            assert abs(time_ecls[i] - time_ecl) <= resolution
+
+        # the single-time interface agrees
+        assert abs(etvs.crossing(b, 'primary', guesses[10], ltte=ltte, tol=1e-10) - time_ecls[10]) < 1e-8
+
+    return b
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_keplerian(verbose=True)
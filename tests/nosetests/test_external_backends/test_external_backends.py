@@ -0,0 +1,150 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import backends
+import numpy as np
+import os
+
+
+def _fake_run_external(calls):
+    """
+    stand-in for backends._run_external which mimics the files/output of the
+    photodynam and jktebop executables (with fake values that only depend on
+    the times) and records each call
+    """
+    def run_external(args, workdir):
+        calls.append(args)
+        if args[0] == 'photodynam':
+            nbodies = int(open(os.path.join(workdir, args[1])).readline().split()[0])
+            times = np.loadtxt(os.path.join(workdir, args[2]), skiprows=1, ndmin=1)
+            rows = [[t, np.sin(t)] + [np.sin(t+i) for i in range(3*nbodies)] + [np.cos(t+i) for i in range(3*nbodies)] for t in times]
+            return '\n'.join([' '.join([str(v) for v in row]) for row in rows])
+
+        elif args[0] == 'jktebop':
+            lines = open(os.path.join(workdir, args[1])).read().split('\n')
+            lcin, lcout = lines[23].split()[0], lines[25].split()[0]
+            times = np.loadtxt(os.path.join(workdir, lcin), unpack=True)[0]
+            np.savetxt(os.path.join(workdir, lcout), np.array([times, times, times, times, 0.1*np.sin(times), times]).T)
+            for line in lines[27:]:
+                if line.startswith('rv'):
+                    rvin, rvout = line.split()[1:3]
+                    times = np.loadtxt(os.path.join(workdir, rvin), unpack=True)[0]
+                    sign = 1 if line.startswith('rv1') else -1
+                    np.savetxt(os.path.join(workdir, rvout), np.array([times, times, times, times, sign*np.sin(times), times]).T)
+            return ''
+
+        raise ValueError("unexpected executable {}".format(args[0]))
+
+    return run_external
+
+def _run_worker(backend, b, compute, **kwargs):
+    infolist, new_syns = backends._extract_from_bundle(b, compute=compute, by_time=False)
+    setup_kwargs = backend._worker_setup(b, compute, infolist, **kwargs)
+    packets = {}
+    for info in infolist:
+        for packet in backend._run_single_dataset(b, info, **setup_kwargs):
+            packets[(info['dataset'], info['component'], packet['qualifier'])] = packet['value']
+    return packets
+
+def test_photodynam(verbose=False):
+    phoebe.devel_on() # required for the photodynam backend
+    try:
+        b = phoebe.default_binary()
+        b.add_dataset('lc', compute_times=np.linspace(0, 1, 11), dataset='lc01')
+        b.add_dataset('lc', compute_times=np.linspace(0, 1, 5), dataset='lc02')
+        b.add_dataset('rv', compute_times=np.linspace(0, 1, 7), dataset='rv01')
+        b.add_dataset('orb', compute_times=np.linspace(0.5, 1.5, 3), dataset='orb01')
+        b.set_value_all('ld_mode', 'manual')
+        b.set_value_all('ld_func', 'quadratic')
+        b.set_value('ld_coeffs', component='primary', dataset='lc02', value=[0.3, 0.1])
+        b.add_compute('photodynam', compute='pd')
+        b.compute_pblums(compute='phoebe01', dataset=['lc01', 'lc02'], set_value=True)
+    finally:
+        phoebe.devel_off() # reset for future tests
+
+    starrefs = b.hierarchy.get_stars()
+    orbitrefs = b.hierarchy.get_orbits()
+    inp = backends._photodynam_input(b, 'lc02', starrefs, orbitrefs, 0.01, 1e-20, 0.0).split('\n')
+    assert inp[0] == '2 0.0'
+    assert inp[1] == '0.01 1e-20'
+    assert inp[6].split()[0] == '0.3' and inp[7].split()[0] == '0.1'
+    # dynamics only: dummy luminosities and limb-darkening
+    inp = backends._photodynam_input(b, None, starrefs, orbitrefs, 0.01, 1e-20, 0.0).split('\n')
+    assert inp[5].split() == [str(1/(4*np.pi))]*2
+    assert inp[6].split() == ['0', '0']
+
+    calls = []
+    _run_external = backends._run_external
+    backends._run_external = _fake_run_external(calls)
+    try:
+        packets = _run_worker(backends.PhotodynamBackend(), b, 'pd')
+    finally:
+        backends._run_external = _run_external
+
+    # the two lcs require different input files, the rv and orb datasets
+    # only need the dynamics and are computed along with the first lc
+    if verbose:
+        print("photodynam calls: {}".format(calls))
+    assert len(calls) == 2
+
+    for dataset, component in [('lc01', None), ('lc02', None), ('rv01', 'primary'), ('orb01', 'secondary')]:
+        times = b.get_value(qualifier='compute_times', dataset=dataset, context='dataset')
+        assert np.allclose(packets[(dataset, component, 'times')].value, times)
+    assert np.allclose(packets[('rv01', 'primary', 'rvs')].value, -np.cos(np.linspace(0, 1, 7)+2))
+    assert np.allclose(packets[('orb01', 'secondary', 'ws')].value, np.sin(np.linspace(0.5, 1.5, 3)+2+3))
+
+    return b
+
+def test_jktebop(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', compute_times=np.linspace(0, 1, 11), dataset='lc01')
+    b.add_dataset('lc', compute_times=np.linspace(0, 1, 5), dataset='lc02')
+    b.add_dataset('rv', compute_times=np.linspace(0, 1, 7), dataset='rv01')
+    b.add_dataset('rv', compute_times=np.linspace(0, 1, 4), dataset='rv02')
+    b.add_dataset('rv', compute_times=np.linspace(0, 1, 3), dataset='rv03', component=['primary'])
+    b.set_value_all('ld_mode', 'manual')
+    b.set_value_all('ld_func', 'quadratic')
+    b.add_compute('jktebop', compute='jkt', irrad_method='none')
+    pblums = {dataset: {'primary': 1.0, 'secondary': 0.5} for dataset in b.datasets}
+
+    inp = backends._jktebop_input(b, 'lc01', ['primary', 'secondary'], pblums['lc01'],
+                                  'a.lc.in', 'a.param.out', 'a.lc.out', 'a.model.out',
+                                  rvfilenames={'rv2': ('a.rv2.in', 'a.rv2.out')},
+                                  ringsize=5, irrad_method='none', rA=1.0, rB=1.0,
+                                  sma=5.3, incl=90, q=1.0, ecosw=0, esinw=0,
+                                  gravbA=0.32, gravbB=0.32, period=1.0, t0_supconj=0.0).split('\n')
+    assert inp[0].split()[:2] == ['3', '5']
+    assert inp[6].split()[:2] == ['quad', 'quad']
+    assert inp[23].startswith('a.lc.in')
+    assert inp[27].split()[:3] == ['rv2', 'a.rv2.in', 'a.rv2.out']
+    assert inp[28] == ''
+
+    calls = []
+    _run_external = backends._run_external
+    backends._run_external = _fake_run_external(calls)
+    try:
+        packets = _run_worker(backends.JktebopBackend(), b, 'jkt', pblums=pblums)
+    finally:
+        backends._run_external = _run_external
+
+    # one call per lc, with the rvs of both stars added to those calls as long
+    # as possible (rv03 needs a third call with only the primary)
+    if verbose:
+        print("jktebop calls: {}".format(calls))
+    assert len(calls) == 3
+
+    for dataset, component in [('lc01', None), ('lc02', None), ('rv01', 'primary'), ('rv02', 'secondary'), ('rv03', 'primary')]:
+        times = b.get_value(qualifier='compute_times', dataset=dataset, context='dataset')
+        assert np.allclose(packets[(dataset, component, 'times')].value, times)
+        if dataset.startswith('rv'):
+            sign = 1 if component == 'primary' else -1
+            assert np.allclose(packets[(dataset, component, 'rvs')].value, sign*np.sin(times))
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_photodynam(verbose=True)
+    b = test_jktebop(verbose=True)
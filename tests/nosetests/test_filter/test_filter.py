@@ -0,0 +1,91 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def _uniqueids(b, check_visible=False, **kwargs):
+    return b.filter(check_visible=check_visible, check_default=False, **kwargs).uniqueids
+
+def _expected_uniqueids(b, **kwargs):
+    return [p.uniqueid for p in b.to_list() if np.all([getattr(p, k) == v for k, v in kwargs.items()])]
+
+
+def test_tag_index(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0, 1, 5), dataset='lc01')
+    b.add_dataset('rv', times=np.linspace(0, 1, 5), dataset='rv01')
+    b.add_spot(component='primary', feature='spot01')
+
+    for kwargs in [{'qualifier': 'times'},
+                   {'context': 'component', 'component': 'primary'},
+                   {'dataset': 'rv01', 'component': 'secondary'},
+                   {'feature': 'spot01'}]:
+        assert _uniqueids(b, **kwargs) == _expected_uniqueids(b, **kwargs)
+
+    # kind is case-insensitive, lists and wildcards are supported
+    assert _uniqueids(b, kind='LC') == _uniqueids(b, kind='lc')
+    assert sorted(_uniqueids(b, dataset=['lc01', 'rv01'])) == sorted(_uniqueids(b, dataset='lc01') + _uniqueids(b, dataset='rv01'))
+    assert _uniqueids(b, dataset='*01') == _uniqueids(b, dataset=['lc01', 'rv01'])
+
+    # twigs
+    assert b.get_parameter('incl@binary').uniqueid == _expected_uniqueids(b, qualifier='incl', component='binary', context='component')[0]
+    assert b['value@incl@binary@component'] == 90
+    assert len(b.filter('times[1]@lc01')) == 1
+
+    # appending parameters extends the index
+    b.add_dataset('lc', times=[0, 1], dataset='lc02')
+    assert _uniqueids(b, dataset='lc02') == _expected_uniqueids(b, dataset='lc02')
+
+    # renaming changes the tags of indexed parameters
+    b.rename_dataset('lc02', 'lc03')
+    assert len(_uniqueids(b, dataset='lc02')) == 0
+    assert _uniqueids(b, dataset='lc03') == _expected_uniqueids(b, dataset='lc03')
+
+    # removing parameters replaces the index
+    b.remove_dataset('lc03')
+    assert len(_uniqueids(b, dataset='lc03')) == 0
+    assert _uniqueids(b, qualifier='times') == _expected_uniqueids(b, qualifier='times')
+
+    return b
+
+def _assert_visibility_consistent(b):
+    for param in b.to_list():
+        if param.context == 'constraint':
+            continue
+        assert param.is_visible == param._is_visible(), param.twig
+
+
+def test_visible_if_cache(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0, 1, 5), dataset='lc01')
+    b.add_spot(component='primary', feature='spot01')
+    _assert_visibility_consistent(b)
+
+    # changing the value of a parameter referenced by visible_if
+    assert len(b.filter(qualifier='ld_coeffs', component='primary', dataset='lc01')) == 0
+    b.set_value('ld_mode', component='primary', dataset='lc01', value='manual')
+    assert len(b.filter(qualifier='ld_coeffs', component='primary', dataset='lc01')) == 1
+    _assert_visibility_consistent(b)
+
+    b.set_value('irrad_method@phoebe01', 'none')
+    _assert_visibility_consistent(b)
+
+    b.set_value('enabled@spot01@phoebe01', False)
+    _assert_visibility_consistent(b)
+
+    # attaching, renaming, and removing parameters
+    b.add_dataset('rv', times=[0, 1], dataset='rv01')
+    b.rename_dataset('lc01', 'lc02')
+    _assert_visibility_consistent(b)
+    b.remove_dataset('rv01')
+    _assert_visibility_consistent(b)
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_tag_index(verbose=True)
+    b = test_visible_if_cache(verbose=True)
@@ -44,7 +44,41 @@ def test_binary(plot=False):
 
     return b
 
+def test_integration(plot=False):
+    b = phoebe.default_binary()
+    b.set_value_all('ntriangles', 500)
+    exptime = 0.05
+    # back-to-back exposures through ingress of the primary eclipse
+    times = np.arange(-0.25, 0.0, exptime)
+    b.add_dataset('lc', times=times, exptime=exptime*u.d, dataset='lc01')
+    b.set_value_all('irrad_method', 'none')
+
+    # reference: average over a fine grid computed without fti
+    oversample = 41
+    times_fine = np.linspace(-exptime/2., exptime/2., oversample)[np.newaxis, :] + times[:, np.newaxis]
+    b.run_compute(fti_method='none', times=times_fine.flatten(), model='reference')
+    fluxes_fine = b.get_value(qualifier='fluxes', model='reference').reshape(times_fine.shape)
+    fluxes_ref = np.trapz(fluxes_fine, axis=1) / (oversample - 1)
+
+    b.run_compute(fti_method='oversample', fti_oversample=5, fti_integration='mean', model='mean')
+    fluxes_mean = b.get_value(qualifier='fluxes', model='mean')
+    b.run_compute(fti_method='oversample', fti_oversample=5, fti_integration='gauss-legendre', model='gauss_legendre')
+    fluxes_gauss = b.get_value(qualifier='fluxes', model='gauss_legendre')
+
+    # mean should match averaging over the same 5 samples
+    b.run_compute(fti_method='none', times=times_fine[:, ::10].flatten(), model='oversampled')
+    fluxes_samples = b.get_value(qualifier='fluxes', model='oversampled').reshape((len(times), 5))
+    assert np.allclose(fluxes_mean, fluxes_samples.mean(axis=1), rtol=1e-10, atol=0)
+
+    if plot:
+        print("mean: {}, gauss-legendre: {}".format(abs(fluxes_mean-fluxes_ref).max(), abs(fluxes_gauss-fluxes_ref).max()))
+
+    assert abs(fluxes_gauss-fluxes_ref).max() < abs(fluxes_mean-fluxes_ref).max()
+
+    return b
+
 if __name__ == '__main__':
     logger = phoebe.logger(clevel='INFO')
 
     b = test_binary(plot=True)
+    b = test_integration(plot=True)
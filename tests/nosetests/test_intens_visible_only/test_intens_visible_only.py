@@ -0,0 +1,31 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def test_intens_visible_only(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0,1,21))
+    b.add_dataset('rv', times=np.linspace(0,1,21))
+
+    for ld_mode in ['interp', 'lookup']:
+        b.set_value_all('ld_mode', ld_mode)
+
+        b.run_compute(model='all', overwrite=True)
+        b.run_compute(intens_visible_only=True, model='visible', overwrite=True)
+
+        for qualifier in ['fluxes', 'rvs']:
+            for param in b.filter(qualifier=qualifier, model='all').to_list():
+                visible_values = b.get_value(qualifier=qualifier, dataset=param.dataset, component=param.component, model='visible')
+                if verbose:
+                    print("ld_mode={} {}: max diff={}".format(ld_mode, param.twig, abs(param.get_value()-visible_values).max()))
+                assert(np.allclose(param.get_value(), visible_values, rtol=1e-12, atol=0))
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_intens_visible_only(verbose=True)
@@ -0,0 +1,41 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+import os
+import tempfile
+
+
+def test_lazy_load(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0, 1, 21), dataset='lc01')
+    b.run_compute(irrad_method='none', model='model01')
+    b.run_compute(irrad_method='none', model='model02')
+
+    filename = os.path.join(tempfile.mkdtemp(), 'test.bundle')
+    b.save(filename)
+
+    b2 = phoebe.open(filename, lazy_load=True)
+    assert b2.models == b.models
+    nparams = len(b2)
+
+    # only the parameters of the accessed model are created
+    assert np.allclose(b2.get_value(qualifier='fluxes', model='model02'), b.get_value(qualifier='fluxes', model='model02'))
+    assert nparams < len(b2) < len(b)
+    assert ('model', 'model01') in b2._lazy_params.keys()
+
+    # twigs match deferred parameters as well
+    assert b2.get_parameter('fluxes@model01').uniqueid == b.get_parameter('fluxes@model01').uniqueid
+
+    # saving includes all deferred parameters
+    b3 = phoebe.open(filename, lazy_load=['model'])
+    b3.save(filename)
+    assert len(phoebe.open(filename)) == len(b)
+
+    return b2
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_lazy_load(verbose=True)
@@ -0,0 +1,115 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import backends
+import numpy as np
+import logging
+
+
+def _spherical_binary():
+    b = phoebe.default_binary()
+    b.set_value('requiv', component='secondary', value=0.7)
+    b.set_value('teff', component='secondary', value=4500)
+    b.set_value('incl', component='binary', value=87)
+    b.set_value('ecc', component='binary', value=0.1)
+    b.add_dataset('lc', times=np.linspace(0, 1, 51), dataset='lc01')
+
+    b.set_value_all('distortion_method', 'sphere')
+    b.set_value_all('irrad_method', 'none')
+    b.set_value_all('atm', 'blackbody')
+    b.set_value_all('ld_mode', 'manual')
+    b.set_value_all('ld_func', 'quadratic')
+    b.set_value_all('ld_coeffs', [0.4, 0.2])
+    return b
+
+
+def test_binary(verbose=False):
+    b = _spherical_binary()
+
+    b.run_compute(model='numerical', ntriangles=5000)
+    b.set_value_all('lc_method', 'analytical')
+    b.run_compute(model='analytical')
+
+    fluxes_num = b.get_value('fluxes', model='numerical')
+    fluxes_an = b.get_value('fluxes', model='analytical')
+    if verbose:
+        print("max relative difference: {}".format(np.max(abs(fluxes_an-fluxes_num))/fluxes_num.max()))
+
+    # both eclipses should be found, and the remaining differences are due to
+    # the discretization of the meshes
+    assert fluxes_an.min() < 0.7*fluxes_an.max()
+    assert np.allclose(fluxes_an, fluxes_num, rtol=0, atol=2e-3*fluxes_num.max())
+
+    return b
+
+
+def test_interp(verbose=False):
+    b = _spherical_binary()
+    b.set_value_all('atm', 'ck2004')
+    b.set_value_all('ld_mode', 'interp')
+
+    b.run_compute(model='numerical', ntriangles=5000)
+    b.set_value_all('lc_method', 'analytical')
+    b.run_compute(model='analytical')
+
+    fluxes_num = b.get_value('fluxes', model='numerical')
+    fluxes_an = b.get_value('fluxes', model='analytical')
+    if verbose:
+        print("max relative difference: {}".format(np.max(abs(fluxes_an-fluxes_num))/fluxes_num.max()))
+
+    assert fluxes_an.min() < 0.7*fluxes_an.max()
+    assert np.allclose(fluxes_an, fluxes_num, rtol=0, atol=2e-3*fluxes_num.max())
+
+    return b
+
+
+class _WarningCounter(logging.Handler):
+    def __init__(self):
+        super(_WarningCounter, self).__init__(level=logging.WARNING)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_fallback(verbose=False):
+    b = _spherical_binary()
+    b.add_dataset('lc', times=np.linspace(0, 1, 11), dataset='lc02')
+    b.set_value_all('ld_mode', 'manual')
+    b.set_value_all('ld_func', 'quadratic')
+    b.set_value_all('ld_coeffs', [0.4, 0.2])
+    b.add_spot(component='primary', feature='spot01')
+
+    b.run_compute(model='numerical')
+    b.set_value_all('lc_method', 'analytical')
+    assert backends._analytical_lc_datasets(b, 'phoebe01') == []
+
+    handler = _WarningCounter()
+    backends.logger.addHandler(handler)
+    try:
+        b.run_compute(model='analytical')
+    finally:
+        backends.logger.removeHandler(handler)
+
+    # the fallback is decided (and reported) once per run, not per dataset
+    # and component
+    if verbose:
+        print("warnings: {}".format(handler.messages))
+    assert len([msg for msg in handler.messages if "lc_method='analytical'" in msg]) == 1
+
+    # spots require meshes, so the analytical request is ignored
+    assert np.allclose(b.get_value('fluxes', model='analytical', dataset='lc01'), b.get_value('fluxes', model='numerical', dataset='lc01'), rtol=0, atol=0)
+
+    b.remove_feature('spot01')
+    assert sorted(backends._analytical_lc_datasets(b, 'phoebe01')) == ['lc01', 'lc02']
+
+    return b
+
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_binary(verbose=True)
+    b = test_interp(verbose=True)
+    b = test_fallback(verbose=True)
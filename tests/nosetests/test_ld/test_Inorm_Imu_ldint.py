@@ -0,0 +1,47 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def test_Inorm_Imu_ldint(verbose=False):
+    pb = phoebe.get_passband('Johnson:V')
+
+    Teff = np.array([5000., 5772., 6500., 8000.])
+    logg = np.array([4.0, 4.43, 4.2, 3.8])
+    abun = np.zeros(4)
+    mu = np.array([0.1, 0.5, 0.9, 1.0])
+
+    for atm, ldatm, ld_func, ld_coeffs in [('ck2004', 'ck2004', 'interp', None),
+                                           ('ck2004', 'ck2004', 'quadratic', None),
+                                           ('blackbody', 'ck2004', 'linear', None),
+                                           ('blackbody', 'none', 'power', [0.2, 0.2, 0.2, 0.2])]:
+        for photon_weighted in [False, True]:
+            if verbose:
+                print("atm={}, ld_func={}, photon_weighted={}".format(atm, ld_func, photon_weighted))
+
+            Inorm, Imu, ldint = pb.Inorm_Imu_ldint(Teff=Teff, logg=logg, abun=abun, mu=mu.copy(),
+                                                   atm=atm, ldatm=ldatm,
+                                                   ld_func=ld_func, ld_coeffs=ld_coeffs,
+                                                   photon_weighted=photon_weighted)
+
+            exp_ldint = pb.ldint(Teff=Teff, logg=logg, abun=abun, ldatm=ldatm,
+                                 ld_func=ld_func, ld_coeffs=ld_coeffs,
+                                 photon_weighted=photon_weighted)
+            exp_Inorm = pb.Inorm(Teff=Teff, logg=logg, abun=abun, atm=atm, ldatm=ldatm,
+                                 ldint=exp_ldint, photon_weighted=photon_weighted)
+            exp_Imu = pb.Imu(Teff=Teff, logg=logg, abun=abun, mu=mu.copy(), atm=atm, ldatm=ldatm,
+                             ldint=exp_ldint, ld_func=ld_func, ld_coeffs=ld_coeffs,
+                             photon_weighted=photon_weighted)
+
+            assert np.allclose(ldint, exp_ldint, rtol=1e-12, atol=0)
+            assert np.allclose(Inorm, exp_Inorm, rtol=1e-12, atol=0)
+            assert np.allclose(Imu, exp_Imu, rtol=1e-12, atol=0)
+
+    return pb
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    pb = test_Inorm_Imu_ldint(verbose=True)
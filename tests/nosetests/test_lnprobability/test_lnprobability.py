@@ -0,0 +1,64 @@
+"""
+"""
+
+import phoebe
+from phoebe.solverbackends import solverbackends
+import numpy as np
+
+
+def test_worker_bundle(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('rv', times=np.linspace(0,1,11))
+    b.run_compute(irrad_method='none')
+    times = b.get_value(qualifier='times', context='model', component='primary')
+    rvs = b.get_value(qualifier='rvs', context='model', component='primary')
+    b.set_value(qualifier='rvs', context='dataset', component='primary', value=rvs)
+    b.set_value(qualifier='sigmas', context='dataset', component='primary', value=np.full_like(rvs, 1.0))
+    b.set_value(qualifier='rvs', context='dataset', component='secondary', value=-rvs)
+    b.set_value(qualifier='sigmas', context='dataset', component='secondary', value=np.full_like(rvs, 1.0))
+    b.set_value_all('rv_method', 'dynamical')
+
+    b.add_solver('sampler.emcee', solver='emcee_solver', compute='phoebe01')
+
+    models = b.models
+    bsolver = solverbackends._bsolver(b, 'emcee_solver', 'phoebe01', [])
+    params_uniqueids = [b.get_parameter(qualifier='incl', component='binary', context='component').uniqueid,
+                        b.get_parameter(qualifier='q', component='binary', context='component').uniqueid]
+    args = (params_uniqueids, 'phoebe01', [], 'and', 'emcee_sol')
+
+    pool, b_worker = solverbackends._worker_bundle_pool(phoebe.pool.SerialPool(), bsolver)
+    assert(b_worker is bsolver)
+
+    for sampled_values in [np.array([85., 0.9]), np.array([80., 1.1]), False]:
+        lnprob_copy = solverbackends._lnprobability(sampled_values, b, *args)
+        lnprob_worker = solverbackends._lnprobability(sampled_values, b_worker, *args)
+
+        if verbose:
+            print("sampled_values={}: lnprob_copy={} lnprob_worker={}".format(sampled_values, lnprob_copy, lnprob_worker))
+
+        assert(np.isclose(lnprob_copy, lnprob_worker, rtol=1e-12, atol=0))
+
+        # the sampled values are reset after every evaluation
+        assert(bsolver.get_value(qualifier='incl', component='binary', context='component') == b.get_value(qualifier='incl', component='binary', context='component'))
+        assert(bsolver.get_value(qualifier='q', component='binary', context='component') == b.get_value(qualifier='q', component='binary', context='component'))
+
+    # the original bundle is never changed
+    assert(b.models == models)
+
+    # a pool that was not created by the backend is never closed or replaced
+    mpool = phoebe.pool.MultiPool(processes=1)
+    try:
+        pool, b_worker = solverbackends._worker_bundle_pool(mpool, bsolver)
+        assert(pool is mpool)
+        assert(b_worker is bsolver)
+        assert(mpool.map(abs, [-1, -2]) == [1, 2])
+    finally:
+        mpool.close()
+        mpool.join()
+
+    return bsolver
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    bsolver = test_worker_bundle(verbose=True)
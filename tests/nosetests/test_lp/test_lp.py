@@ -0,0 +1,55 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import universe
+import numpy as np
+
+
+def test_depth(verbose=False):
+    rng = np.random.default_rng(0)
+    profile_rest, profile_sv = 550., 0.01
+    depth = lambda wavelengths: np.exp(-np.log(2)*((profile_rest-wavelengths)/(profile_sv/2))**2)
+
+    dls = rng.uniform(-0.1, 0.1, 5000)
+    weights = rng.uniform(0, 1, 5000)
+
+    for wavelengths in [np.linspace(549.5, 550.5, 1001),
+                        np.linspace(550.5, 549.5, 1001),
+                        np.sort(rng.uniform(549.5, 550.5, 300))]:
+        expected = np.array([np.sum(weights*depth(wavelength-dls)) for wavelength in wavelengths])/np.sum(weights)
+        avg_depth = universe._lp_depth(wavelengths, dls, weights, depth)
+
+        if verbose:
+            print("max difference: {}".format(np.max(abs(avg_depth-expected))))
+
+        assert np.allclose(avg_depth, expected, rtol=0, atol=1e-3*expected.max())
+
+def test_binary(verbose=False):
+    b = phoebe.default_binary()
+    b.add_dataset('lp', times=[0.25], wavelengths=np.linspace(549.5, 550.5, 501), profile_rest=550, profile_sv=0.01, dataset='lp01')
+    b.add_dataset('rv', times=[0.25], dataset='rv01')
+    b.set_value_all('ntriangles', 300)
+    b.run_compute(irrad_method='none', rv_method='flux-weighted', progressbar=False)
+
+    wavelengths = b.get_value(qualifier='wavelengths', context='model')
+    flux_densities = b.get_value(qualifier='flux_densities', context='model')
+    assert np.all(np.isfinite(flux_densities))
+    assert np.all(flux_densities <= 1)
+
+    # the line of each star should be shifted by its radial velocity
+    rvs = [b.get_value(qualifier='rvs', component=comp, context='model') for comp in ['primary', 'secondary']]
+    for rv in rvs:
+        dl = rv[0]*1e3/phoebe.c.c.si.value*550
+        ind = np.argmin(abs(wavelengths-550-dl))
+        if verbose:
+            print("rv={} dl={} flux_density={}".format(rv[0], dl, flux_densities[ind]))
+        assert flux_densities[ind] < 0.99
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    test_depth(verbose=True)
+    b = test_binary(verbose=True)
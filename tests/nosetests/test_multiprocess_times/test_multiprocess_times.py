@@ -0,0 +1,57 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def test_multiprocess_times(verbose=False):
+    phoebe.reset_settings()
+    phoebe.multiprocessing_set_nprocs(2)
+
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0,1,11))
+    b.add_dataset('rv', times=np.linspace(0,1,11))
+    b.set_value_all('irrad_method', 'none')
+
+    b.run_compute(model='serial')
+    b.run_compute(multiprocess_times=True, model='multiprocess')
+
+    for qualifier in ['fluxes', 'rvs']:
+        for param in b.filter(qualifier=qualifier, model='serial').to_list():
+            mp_values = b.get_value(qualifier=qualifier, dataset=param.dataset, component=param.component, model='multiprocess')
+            if verbose:
+                print("{}: max diff={}".format(param.twig, abs(param.get_value()-mp_values).max()))
+            assert(np.allclose(param.get_value(), mp_values, rtol=0, atol=1e-12))
+
+    phoebe.reset_settings()
+    return b
+
+def test_persistent_workers(verbose=False):
+    phoebe.reset_settings()
+    phoebe.multiprocessing_set_nprocs(2)
+
+    b = phoebe.default_binary()
+    b.add_dataset('lc', times=np.linspace(0,1,11))
+    b.set_value_all('irrad_method', 'none')
+
+    for teff in [6000, 6500, 6000]:
+        b.set_value('teff', component='primary', value=teff)
+        b.run_compute(model='serial', overwrite=True)
+        b.run_compute(multiprocess_times=True, persistent_workers=True, model='persistent', overwrite=True)
+
+        fluxes = b.get_value(qualifier='fluxes', model='serial')
+        fluxes_persistent = b.get_value(qualifier='fluxes', model='persistent')
+        if verbose:
+            print("teff={}: max diff={}".format(teff, abs(fluxes-fluxes_persistent).max()))
+        assert(np.allclose(fluxes, fluxes_persistent, rtol=0, atol=1e-12))
+
+    phoebe._backends._close_persistent_pool()
+    phoebe.reset_settings()
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_multiprocess_times(verbose=True)
+    b = test_persistent_workers(verbose=True)
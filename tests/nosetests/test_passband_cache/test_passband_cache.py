@@ -0,0 +1,74 @@
+"""
+"""
+
+import phoebe
+import os
+from phoebe.atmospheres import passbands
+import numpy as np
+import shutil
+import tempfile
+
+
+def test_passband_cache(verbose=False):
+    pb = phoebe.get_passband('Johnson:V', reload=True)
+
+    # grids are only loaded on first access, and then memory-mapped from the
+    # binary cache
+    assert '_ck2004_ldint_energy_grid' in pb._lazy_grids
+    grid = pb._ck2004_ldint_energy_grid
+    assert '_ck2004_ldint_energy_grid' not in pb._lazy_grids
+    assert isinstance(grid, np.memmap)
+    # the cache must not live within the passband directory (which is
+    # emptied file-by-file by uninstall_all_passbands)
+    assert not os.path.abspath(grid.filename).startswith(passbands._pbdir_local)
+
+    fits_pb = passbands.Passband.load(pb._archive)
+    passbands._pbcache_enabled = False
+    try:
+        fits_grid = fits_pb._ck2004_ldint_energy_grid
+    finally:
+        passbands._pbcache_enabled = True
+
+    assert not isinstance(fits_grid, np.memmap)
+    assert np.allclose(grid, fits_grid, equal_nan=True)
+
+    # only the requested grid is converted, others are added on demand
+    tmpdir = tempfile.mkdtemp()
+    _pbcache_dir = passbands._pbcache_dir
+    passbands._pbcache_dir = os.path.join(tmpdir, 'cache')
+    try:
+        pb1 = passbands.Passband.load(pb._archive)
+        grid1 = pb1._ck2004_ldint_energy_grid
+        cachedir1 = os.path.dirname(grid1.filename)
+        assert len(os.listdir(cachedir1)) == 1
+        pb1._ck2004_ldint_photon_grid
+        assert len(os.listdir(cachedir1)) == 2
+
+        # a passband with the same file name elsewhere (ie. a local copy of a
+        # global passband) gets its own cache and does not remove the other
+        os.makedirs(os.path.join(tmpdir, 'local'))
+        archive2 = os.path.join(tmpdir, 'local', os.path.basename(pb._archive))
+        shutil.copy(pb._archive, archive2)
+        pb2 = passbands.Passband.load(archive2)
+        grid2 = pb2._ck2004_ldint_energy_grid
+        cachedir2 = os.path.dirname(grid2.filename)
+        assert cachedir2 != cachedir1
+        assert os.path.isdir(cachedir1)
+        assert np.allclose(grid1, grid2, equal_nan=True)
+    finally:
+        passbands._pbcache_dir = _pbcache_dir
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    Teff = np.array([5772., 6000.])
+    logg = np.array([4.43, 4.0])
+    abun = np.array([0.0, 0.0])
+    ldint = pb.ldint(Teff=Teff, logg=logg, abun=abun, ldatm='ck2004', ld_func='interp')
+    if verbose:
+        print("ldint: {}".format(ldint))
+
+    return pb
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    pb = test_passband_cache(verbose=True)
@@ -19,8 +19,38 @@ def test_dataset_scaled(verbose=False, plot=False):
 
     return b
 
+def test_dataset_scaled_l3(verbose=False, plot=False):
+    b = phoebe.Bundle.default_binary()
+
+    times = np.linspace(0,1,11)
+    fluxes = 1 + 0.1*np.random.random(11)
+    sigmas = 0.01 + 0.02*np.random.random(11)
+    b.add_dataset('lc', times=times, fluxes=fluxes, sigmas=sigmas, pblum_mode='dataset-scaled', l3_mode='flux', l3=0.2, dataset='lc01')
+    b.add_dataset('lc', times=times, fluxes=fluxes, sigmas=sigmas, pblum_mode='dataset-coupled', pblum_dataset='lc01', l3_mode='fraction', l3_frac=0.1, dataset='lc02')
+    b.set_value_all('ntriangles', 300)
+
+    b.run_compute(irrad_method='none')
+
+    # the scale factor should minimize the chi2 over both datasets, so the
+    # (weighted) residuals must be orthogonal to the unscaled model
+    scale_factor = b.get_value(qualifier='flux_scale', dataset='lc01', context='model')
+    assert b.get_value(qualifier='flux_scale', dataset='lc02', context='model') == scale_factor
+    syn_lc01 = b.get_value(qualifier='fluxes', dataset='lc01', context='model')
+    syn_lc02 = b.get_value(qualifier='fluxes', dataset='lc02', context='model')
+    residuals = np.concatenate([fluxes - syn_lc01, fluxes - syn_lc02])
+    unscaled = np.concatenate([syn_lc01 - 0.2, syn_lc02]) / scale_factor
+    weights = 1./np.concatenate([sigmas, sigmas])**2
+
+    if verbose:
+        print("scale_factor={} orthogonality={}".format(scale_factor, np.sum(weights*residuals*unscaled)))
+
+    assert abs(np.sum(weights*residuals*unscaled)) < 1e-8 * np.sum(weights*np.abs(residuals*unscaled))
+
+    return b
+
 if __name__ == '__main__':
     logger = phoebe.logger(clevel='INFO')
 
 
     b = test_dataset_scaled(verbose=True, plot=True)
+    b = test_dataset_scaled_l3(verbose=True, plot=True)
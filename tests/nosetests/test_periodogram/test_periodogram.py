@@ -0,0 +1,75 @@
+"""
+"""
+
+import phoebe
+from astropy.timeseries import BoxLeastSquares
+import numpy as np
+
+
+def _bundle_with_observations():
+    b = phoebe.default_binary()
+    b.set_value('period@binary@component', 1.7)
+
+    rng = np.random.default_rng(0)
+    times = np.sort(rng.uniform(0, 30, 300))
+    phases = (times / 1.7) % 1
+    # analytic eclipses and sinusoidal rvs are enough to test the periodograms
+    fluxes = 1 - 0.4*np.exp(-0.5*((phases-0.5+0.5)%1-0.5)**2/0.02**2) - 0.2*np.exp(-0.5*(phases-0.5)**2/0.02**2)
+    rvs = 50*np.sin(2*np.pi*phases)
+    sigmas = np.full_like(times, 0.01)
+
+    b.add_dataset('lc', times=times, fluxes=fluxes+rng.normal(0, 0.01, len(times)), sigmas=sigmas, dataset='lc01')
+    b.add_dataset('rv', times=times, rvs={'primary': rvs, 'secondary': -rvs}, sigmas=sigmas, dataset='rv01')
+    return b, times, fluxes, sigmas
+
+
+def test_chunks(verbose=False):
+    b, times, fluxes, sigmas = _bundle_with_observations()
+
+    for kind, algorithm in [('lc_periodogram', 'bls'), ('lc_periodogram', 'ls'), ('rv_periodogram', 'ls')]:
+        b.add_solver('estimator.{}'.format(kind), algorithm=algorithm, solver='pgram', overwrite=True)
+
+        b.run_solver('pgram', solution='pgram_sol', overwrite=True)
+        periods = b.get_value(qualifier='period', solution='pgram_sol')
+        powers = b.get_value(qualifier='power', solution='pgram_sol')
+        period = b.get_value(qualifier='fitted_values', solution='pgram_sol')[0]
+
+        if verbose:
+            print("{} {}: {} samples, period={}".format(kind, algorithm, len(periods), period))
+
+        # the period grid (not the frequency grid) is stored, and the
+        # estimated period is the true period or one of its harmonics
+        assert np.all(periods > 0)
+        assert np.any(np.isclose(period, 1.7 * np.array([0.5, 1, 2]), rtol=0.01))
+
+        # splitting the grid into chunks should not change the power spectrum
+        # (beyond the accuracy of the approximate "fast" lombscargle method)
+        b.run_solver('pgram', solution='pgram_chunked', chunk_size=len(periods)//7, overwrite=True)
+        assert np.allclose(b.get_value(qualifier='period', solution='pgram_chunked'), periods)
+        assert np.allclose(b.get_value(qualifier='power', solution='pgram_chunked'), powers, rtol=1e-6, atol=1e-8 if algorithm == 'bls' else 1e-2*powers.max())
+        assert b.get_value(qualifier='fitted_values', solution='pgram_chunked')[0] == period
+
+    # manual sampling matches astropy directly
+    sample_periods = np.linspace(1.0, 2.5, 500)
+    b.add_solver('estimator.lc_periodogram', algorithm='bls', sample_mode='manual', sample_periods=sample_periods, chunk_size=64, solver='pgram', overwrite=True)
+    b.run_solver('pgram', solution='pgram_sol', overwrite=True)
+    times, _, fluxes, sigmas = phoebe.solverbackends.solverbackends._get_combined_lc(b, ['lc01'], 'median', mask=False, normalize=True, phase_sorted=False)
+    expected = BoxLeastSquares(times, fluxes, dy=sigmas).power(sample_periods, 0.1, objective='likelihood').power
+    assert np.allclose(b.get_value(qualifier='power', solution='pgram_sol'), expected)
+
+    # chunks distributed over a multiprocessing pool are merged in order
+    nprocs = phoebe.conf._multiprocessing_nprocs
+    phoebe.multiprocessing_set_nprocs(2)
+    try:
+        b.run_solver('pgram', solution='pgram_sol', overwrite=True)
+    finally:
+        phoebe.conf._multiprocessing_nprocs = nprocs
+    assert np.allclose(b.get_value(qualifier='power', solution='pgram_sol'), expected)
+    assert b.get_value(qualifier='fitted_values', solution='pgram_sol')[0] == sample_periods[np.argmax(expected)]
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_chunks(verbose=True)
@@ -0,0 +1,55 @@
+"""
+"""
+
+import phoebe
+from phoebe.backend import backends
+import numpy as np
+
+
+def test_binary(verbose=False):
+    b = phoebe.default_binary()
+    b.set_value('ecc@binary@component', 0.2)
+    b.set_value('per0@binary@component', 60)
+    times = np.sort(np.random.RandomState(0).uniform(0, 5, 1500))
+    b.add_dataset('lc', times=times, dataset='lc01')
+    b.set_value_all('ntriangles', 300)
+    b.set_value('irrad_method', 'none')
+
+    # count the times actually computed by the backend
+    ncomputed = []
+    _run = backends.BaseBackendByTime.run
+    def run(self, b, compute, dataset=None, times=[], **kwargs):
+        ncomputed.append(sum([len(t) for t in kwargs.get('phase_grid_times', {}).values()]))
+        return _run(self, b, compute, dataset=dataset, times=times, **kwargs)
+
+    backends.BaseBackendByTime.run = run
+    try:
+        b.run_compute(model='phased', phase_grid='adaptive', phase_grid_tol=5e-3, progressbar=False)
+    finally:
+        backends.BaseBackendByTime.run = _run
+
+    if verbose:
+        print("computed {} phases for {} times".format(sum(ncomputed), len(times)))
+    assert np.allclose(b.get_value('times@phased@lc01'), times)
+    assert 0 < sum(ncomputed) < len(times)
+
+    # compare against computing directly at a subset of the times
+    inds = np.arange(0, len(times), 50)
+    b.run_compute(model='direct', times=times[inds], progressbar=False)
+    fluxes = b.get_value('fluxes@direct@lc01')
+    phased_fluxes = b.get_value('fluxes@phased@lc01')[inds]
+    if verbose:
+        print("max relative error: {}".format(np.max(np.abs(phased_fluxes - fluxes))/np.median(fluxes)))
+    assert np.allclose(phased_fluxes, fluxes, rtol=0, atol=5e-3*np.median(fluxes))
+
+    # time-dependent systems must be computed at all times
+    assert backends._phase_grid_datasets(b, 'phoebe01', phase_grid='adaptive') == ['lc01']
+    b.set_value('dpdt@binary@component', 0.01)
+    assert backends._phase_grid_datasets(b, 'phoebe01', phase_grid='adaptive') == []
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_binary(verbose=True)
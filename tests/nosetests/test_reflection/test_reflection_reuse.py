@@ -0,0 +1,46 @@
+"""
+"""
+
+import phoebe
+import numpy as np
+
+
+def test_reflection_reuse(verbose=False):
+    b = phoebe.default_binary()
+
+    b.set_value('sma', component='binary', value=3.0)
+    b.set_value('requiv', component='primary', value=0.5)
+    b.set_value('requiv', component='secondary', value=0.5)
+    b.set_value('ecc', value=0.1)
+    b.set_value_all('irrad_frac_refl_bol', 0.5)
+    # spheres keep the same mesh (and therefore number of vertices) at all
+    # times, which is required to reuse the matrix or warm-start the solver
+    b.set_value_all('distortion_method', 'sphere')
+
+    b.add_dataset('lc', times=np.linspace(0,1,41))
+
+    for irrad_method in ['wilson', 'horvat']:
+        b.run_compute(irrad_method=irrad_method, model='default', overwrite=True)
+        fluxes = b.get_value(qualifier='fluxes', model='default')
+
+        # warm-starting the solver should not change the converged solution
+        b.run_compute(irrad_method=irrad_method, irrad_warm_start=True, model='warm', overwrite=True)
+        fluxes_warm = b.get_value(qualifier='fluxes', model='warm')
+
+        # reusing the view-factors while the separation changes is an
+        # approximation
+        b.run_compute(irrad_method=irrad_method, irrad_warm_start=True, irrad_reuse_tol=0.002, model='reuse', overwrite=True)
+        fluxes_reuse = b.get_value(qualifier='fluxes', model='reuse')
+
+        if verbose:
+            print("irrad_method={} warm: max rel diff={}, reuse: max rel diff={}".format(irrad_method, abs(fluxes_warm/fluxes-1).max(), abs(fluxes_reuse/fluxes-1).max()))
+
+        assert(np.allclose(fluxes, fluxes_warm, rtol=1e-8, atol=0))
+        assert(np.allclose(fluxes, fluxes_reuse, rtol=1e-4, atol=0))
+
+    return b
+
+if __name__ == '__main__':
+    logger = phoebe.logger(clevel='INFO')
+
+    b = test_reflection_reuse(verbose=True)